@@ -4,7 +4,7 @@
 
 from fastapi import APIRouter
 
-from app.api.v1 import health, profiles, calculate
+from app.api.v1 import health, profiles, calculate, selection, moving_load, sweep, continuous_beam, reliability, jobs, steel_grades, load_combinations, sessions
 
 from fastapi import APIRouter
 
@@ -14,6 +14,15 @@ router = APIRouter()
 
 # Подключаем роутеры из модулей
 router.include_router(health.router)
+router.include_router(selection.router)
 router.include_router(profiles.router)
 router.include_router(calculate.router)
+router.include_router(sessions.router)
+router.include_router(moving_load.router)
+router.include_router(sweep.router)
+router.include_router(continuous_beam.router)
+router.include_router(load_combinations.router)
+router.include_router(reliability.router)
+router.include_router(jobs.router)
+router.include_router(steel_grades.router)
 # Здесь позже подключим calculate.router
@@ -1,26 +1,117 @@
 """
 API эндпоинты для расчёта балки.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
 
-from app.models.beam_calculation import BeamCalculationRequest, BeamCalculationResponse
-from app.services.calculator import BeamCalculator
-from app.core.dependencies import get_material_repository
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from pydantic import ValidationError
+
+from app.models.beam_calculation import (
+    BeamCalculationRequest,
+    BeamCalculationResponse,
+    BeamCalculationSummary,
+    BeamBatchRequest,
+    BeamBatchItemResult,
+    BeamBatchResponse,
+    REACTION_KEYS,
+    ResponseSelection
+)
+from app.services.result_cache import calculation_cache_key, etag_matches
+from app.core import serialization
+from app.core.execution import CLIENT_CLOSED_REQUEST, ClientDisconnected, check_cancelled
+from app.core.metrics import stage_timer
+from app.core.config import settings
+from app.core.dependencies import (
+    get_calculator,
+    get_executor,
+    get_material_repository,
+    get_result_cache
+)
 
 router = APIRouter(tags=["calculation"])
-calculator = BeamCalculator()
+
+# Суффикс ETag для каждого представления результата
+ETAG_SUFFIXES = {
+    serialization.JSON: "",
+    serialization.PACKED_JSON: "-packed",
+    serialization.MSGPACK: "-msgpack",
+}
+
+# Форматы ответа в документации OpenAPI
+PACKED_RESPONSES = {
+    serialization.PACKED_JSON: {},
+    serialization.MSGPACK: {},
+}
+
+
+def _render_calculation(result: BeamCalculationResponse, selection: ResponseSelection,
+                        media_type: str, headers: dict) -> Response:
+    """
+    Ответ с отобранными полями результата расчёта.
+    
+    Для упакованных форматов эпюры передаются массивами (n, 2).
+    """
+    import numpy as np
+    
+    fields = set(selection.output_fields())
+    if media_type == serialization.JSON or "diagram_data" not in fields:
+        return serialization.render_model(result, media_type, include=fields, headers=headers)
+    
+    fields.discard("diagram_data")
+    payload = result.model_dump(mode="json", include=fields)
+    payload["diagram_data"] = {
+        name: np.asarray(series, dtype=np.float64).reshape(-1, 2)
+        for name, series in result.diagram_data.items()
+    }
+    return serialization.render(payload, media_type, headers=headers)
 
 
-@router.post("/calculate", response_model=BeamCalculationResponse)
+@router.post(
+    "/calculate",
+    response_model=BeamCalculationResponse,
+    responses={
+        200: {"content": PACKED_RESPONSES},
+        304: {"description": "Результат не изменился (совпал If-None-Match)"},
+        406: {"description": "Запрошенный формат ответа не поддерживается"}
+    }
+)
 async def calculate_beam(
     request: BeamCalculationRequest,
-    repository = Depends(get_material_repository)
+    http_request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    include: Optional[str] = Query(
+        None,
+        description="Необязательные части ответа через запятую: "
+                    "input, profile, report, diagrams (пусто или none - ни одной)"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Поля ответа через запятую, например "
+                    "max_stress,is_strength_sufficient,is_stiffness_sufficient"
+    ),
+    repository = Depends(get_material_repository),
+    cache = Depends(get_result_cache),
+    calculator = Depends(get_calculator),
+    executor = Depends(get_executor)
 ):
     """
     Расчёт балки на прочность и жёсткость.
     
+    Результаты кэшируются по хэшу входных данных; хэш отдаётся как
+    сильный ETag, и повторный запрос с If-None-Match получает 304.
+    Формат ответа выбирается по заголовку Accept: JSON, JSON с эпюрами
+    в base64 (application/vnd.esc.packed+json) или MessagePack.
+    Параметры include и fields ограничивают ответ; не запрошенные
+    отчёт, эпюры и характеристики профиля не рассчитываются.
+    Трудоёмкие расчёты выполняются в пуле исполнителей и прерываются
+    при отключении клиента.
+    
     Args:
         request: Параметры расчёта балки
+        include: Необязательные части ответа
+        fields: Поля ответа
         
     Returns:
         Результаты расчёта с подробным отчётом
@@ -28,10 +119,15 @@ async def calculate_beam(
     Raises:
         HTTPException: 404 если профиль не найден
         HTTPException: 400 если данные некорректны
+        HTTPException: 406 если формат ответа не поддерживается
     """
+    media_type = serialization.negotiate(accept)
     try:
+        selection = ResponseSelection.parse(include, fields)
+        
         # Получаем профиль по имени
-        profile = repository.get_profile(request.profile_name)
+        with stage_timer("profile_lookup", request.support_type):
+            profile = repository.get_profile(request.profile_name)
         if not profile:
             raise HTTPException(
                 status_code=404,
@@ -39,11 +135,31 @@ async def calculate_beam(
                        f"Используйте GET /profiles для списка доступных."
             )
         
-        # Выполняем расчёт
-        result = calculator.calculate(request, profile)
+        # Результат однозначно определяется входными данными
+        cache_key = calculation_cache_key(request, profile, **selection.cache_extra())
+        etag = f'"{cache_key}{ETAG_SUFFIXES[media_type]}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        
+        result = cache.get(cache_key)
+        if result is None:
+            # Выполняем расчёт
+            result = await executor.run(
+                calculator.calculate, request, profile, selection.sections,
+                cost=calculator.estimate_cost(request, selection.sections, request.diagram_points),
+                request=http_request
+            )
+            cache.put(cache_key, result)
         
-        return result
+        with stage_timer("serialization", request.support_type):
+            return _render_calculation(result, selection, media_type, headers)
         
+    except HTTPException:
+        raise
+    except ClientDisconnected:
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент отключился")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -51,4 +167,246 @@ async def calculate_beam(
         raise HTTPException(
             status_code=500,
             detail=f"Внутренняя ошибка сервера: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/calculate/cache")
+async def get_cache_stats(cache = Depends(get_result_cache)):
+    """Счётчики кэша результатов расчёта."""
+    return cache.stats()
+
+
+@router.post(
+    "/calculate/batch",
+    response_model=BeamBatchResponse,
+    responses={
+        200: {"content": PACKED_RESPONSES},
+        406: {"description": "Запрошенный формат ответа не поддерживается"}
+    }
+)
+async def calculate_beam_batch(
+    request: BeamBatchRequest,
+    http_request: Request,
+    layout: Literal["rows", "columns"] = Query(
+        "rows",
+        description="rows - список результатов по элементам, "
+                    "columns - по массиву на каждую величину"
+    ),
+    accept: Optional[str] = Header(None),
+    repository = Depends(get_material_repository),
+    calculator = Depends(get_calculator),
+    executor = Depends(get_executor)
+):
+    """
+    Пакетный расчёт балок на прочность и жёсткость.
+    
+    Все элементы считаются одним векторизованным проходом
+    (крупные пакеты - в пуле исполнителей).
+    Элементы проверяются по отдельности: ошибка проверки или расчёта
+    одного элемента не прерывает расчёт остальных.
+    В колоночном представлении отсутствующие значения - NaN (null),
+    а для упакованных форматов колонки передаются двоичными массивами.
+    
+    Args:
+        request: Список параметров расчёта балок
+        layout: Представление результатов
+        
+    Returns:
+        Результаты и ошибки по каждому элементу
+        
+    Raises:
+        HTTPException: 400 если превышен размер пакета
+        HTTPException: 406 если формат ответа не поддерживается
+    """
+    media_type = serialization.negotiate(accept)
+    if len(request.items) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком много элементов в пакете: {len(request.items)}. "
+                   f"Максимум: {settings.BATCH_MAX_ITEMS}"
+        )
+    
+    items, invalid = _validate_batch_items(request.items)
+    with stage_timer("profile_lookup"):
+        profiles = [repository.get_profile(item.profile_name) if item else None for item in items]
+    try:
+        errors, summaries, valid_indices, columns = await executor.run(
+            _compute_batch, calculator, items, profiles,
+            cost=sum(calculator.estimate_cost(item, ()) for item in items if item),
+            request=http_request, cancellable=True
+        )
+    except ClientDisconnected:
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент отключился")
+    errors.update(invalid)
+    
+    if layout == "columns":
+        with stage_timer("serialization"):
+            payload = _batch_columns(items, errors, summaries, valid_indices, columns)
+            return serialization.render(payload, media_type)
+    
+    results = [BeamBatchItemResult(index=index, error=error) for index, error in errors.items()]
+    results += [BeamBatchItemResult(index=index, result=summary) for index, summary in summaries.items()]
+    
+    if valid_indices:
+        columns = {key: values.tolist() for key, values in columns.items()}
+        for row, index in enumerate(valid_indices):
+            keys = REACTION_KEYS[items[index].support_type]
+            reactions = {key: columns[key][row] for key in keys}
+            
+            results.append(BeamBatchItemResult(
+                index=index,
+                result=BeamCalculationSummary(
+                    reactions=reactions,
+                    max_moment=columns["max_moment"][row],
+                    max_deflection=columns["max_deflection"][row],
+                    max_stress=columns["max_stress"][row],
+                    is_strength_sufficient=columns["is_strength_sufficient"][row],
+                    is_stiffness_sufficient=columns["is_stiffness_sufficient"][row]
+                )
+            ))
+    
+    results.sort(key=lambda item: item.index)
+    response = BeamBatchResponse(
+        results=results,
+        succeeded=len(results) - len(errors),
+        failed=len(errors)
+    )
+    with stage_timer("serialization"):
+        return serialization.render_model(response, media_type)
+
+
+def _validate_batch_items(raw_items: list) -> tuple:
+    """
+    Поэлементная проверка пакета.
+    
+    Args:
+        raw_items: Элементы пакета в исходном виде
+        
+    Returns:
+        Кортеж (элементы по номерам, None - элемент некорректен;
+        ошибки проверки по номерам)
+    """
+    items = []
+    errors: dict[int, str] = {}
+    for index, raw in enumerate(raw_items):
+        try:
+            items.append(BeamCalculationRequest.model_validate(raw))
+        except ValidationError as e:
+            items.append(None)
+            errors[index] = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+                for error in e.errors(include_url=False)
+            )
+    return items, errors
+
+
+def _compute_batch(calculator, items: list, profiles: list, cancel=None) -> tuple:
+    """
+    Расчёт элементов пакета.
+    
+    Схемы с одной сосредоточенной силой считаются одним векторным
+    проходом, остальные - суперпозицией или МКЭ поэлементно; между
+    элементами проверяется флаг отмены.
+    
+    Args:
+        calculator: Калькулятор балки
+        items: Элементы пакета (None - элемент не прошёл проверку, пропускается)
+        profiles: Профили элементов (None - профиль не найден)
+        cancel: Флаг отмены (threading.Event)
+        
+    Returns:
+        Кортеж (ошибки по номерам, краткие результаты по номерам,
+        номера векторных элементов, колонки векторного расчёта)
+    """
+    errors: dict[int, str] = {}
+    summaries: dict[int, BeamCalculationSummary] = {}
+    valid_indices: list[int] = []
+    valid_profiles = []
+    valid_strengths = []
+    
+    for index, (item, profile) in enumerate(zip(items, profiles)):
+        if item is None:
+            continue
+        if not profile:
+            errors[index] = f"Профиль '{item.profile_name}' не найден"
+        elif item.single_point_load() is None:
+            check_cancelled(cancel)
+            try:
+                summaries[index] = calculator.calculate_summary(item, profile)
+            except ValueError as e:
+                errors[index] = str(e)
+        else:
+            try:
+                valid_strengths.append(calculator.design_strength(item.steel_grade))
+            except ValueError as e:
+                errors[index] = str(e)
+                continue
+            valid_indices.append(index)
+            valid_profiles.append(profile)
+    
+    columns = {}
+    if valid_indices:
+        vector_items = [items[i] for i in valid_indices]
+        loads = [item.single_point_load() for item in vector_items]
+        with stage_timer("batch"):
+            columns = calculator.calculate_batch(
+                length=[item.length for item in vector_items],
+                force=[force for force, _ in loads],
+                force_position=[position for _, position in loads],
+                support_type=[item.support_type for item in vector_items],
+                moment_of_inertia=[p.moment_of_inertia_ix_cm4 for p in valid_profiles],
+                moment_of_resistance=[p.moment_of_resistance_wx_cm3 for p in valid_profiles],
+                design_strength=valid_strengths
+            )
+    
+    return errors, summaries, valid_indices, columns
+
+
+# Колонки числовых результатов пакетного расчёта
+BATCH_VALUE_COLUMNS = ("R_a", "R_b", "M_a", "M_b", "max_moment", "max_deflection", "max_stress")
+BATCH_VERDICT_COLUMNS = ("is_strength_sufficient", "is_stiffness_sufficient")
+
+
+def _batch_columns(items: list, errors: dict, summaries: dict,
+                   valid_indices: list, columns: dict) -> dict:
+    """
+    Колоночное представление пакетного расчёта.
+    
+    Значения, не определённые для элемента (ошибка или реакция,
+    отсутствующая у данного типа опор), заполняются NaN.
+    """
+    import numpy as np
+    
+    count = len(items)
+    values = {name: np.full(count, np.nan) for name in BATCH_VALUE_COLUMNS}
+    verdicts = {name: [None] * count for name in BATCH_VERDICT_COLUMNS}
+    
+    if valid_indices:
+        rows = np.asarray(valid_indices)
+        for name in ("R_a", "R_b", "M_a", "M_b"):
+            present = np.array([name in REACTION_KEYS[items[i].support_type] for i in valid_indices])
+            values[name][rows[present]] = columns[name][present]
+        for name in ("max_moment", "max_deflection", "max_stress"):
+            values[name][rows] = columns[name]
+        for name in BATCH_VERDICT_COLUMNS:
+            for row, flag in zip(valid_indices, columns[name].tolist()):
+                verdicts[name][row] = flag
+    
+    for index, summary in summaries.items():
+        for name, reaction in summary.reactions.items():
+            if name in values:
+                values[name][index] = reaction
+        for name in ("max_moment", "max_deflection", "max_stress"):
+            values[name][index] = getattr(summary, name)
+        for name in BATCH_VERDICT_COLUMNS:
+            verdicts[name][index] = getattr(summary, name)
+    
+    return {
+        "layout": "columns",
+        "count": count,
+        "succeeded": count - len(errors),
+        "failed": len(errors),
+        "errors": [{"index": index, "error": error} for index, error in sorted(errors.items())],
+        **values,
+        **verdicts,
+    }
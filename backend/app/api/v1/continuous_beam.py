@@ -0,0 +1,55 @@
+"""
+API эндпоинты для расчёта неразрезной многопролётной балки.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.models.continuous_beam import ContinuousBeamRequest, ContinuousBeamResponse
+from app.core.dependencies import get_continuous_beam_analyzer, get_executor, get_material_repository
+from app.core.execution import CLIENT_CLOSED_REQUEST, ClientDisconnected
+
+router = APIRouter(tags=["continuous-beam"])
+
+
+@router.post("/continuous-beam", response_model=ContinuousBeamResponse)
+async def calculate_continuous_beam(
+    request: ContinuousBeamRequest,
+    http_request: Request,
+    repository = Depends(get_material_repository),
+    analyzer = Depends(get_continuous_beam_analyzer),
+    executor = Depends(get_executor)
+):
+    """
+    Опорные моменты, реакции и огибающие неразрезной балки.
+    
+    Огибающие строятся по расстановкам временной нагрузки по пролётам.
+    Расчёт выполняется в пуле исполнителей и прерывается
+    при отключении клиента.
+    
+    Args:
+        request: Пролёты, нагрузки и условия на концах
+        
+    Returns:
+        Опорные моменты, реакции, огибающие и проверки
+        
+    Raises:
+        HTTPException: 404 если профиль не найден
+        HTTPException: 400 если марки стали нет в каталоге
+    """
+    profile = repository.get_profile(request.profile_name)
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Профиль '{request.profile_name}' не найден"
+        )
+    
+    cases = 1 + sum(1 for span in request.spans if span.live_load > 0)
+    cost = len(request.spans) * request.diagram_points * cases
+    try:
+        return await executor.run(
+            analyzer.analyze, request, profile, cost=cost, request=http_request,
+            cancellable=True
+        )
+    except ClientDisconnected:
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент отключился")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,115 @@
+"""
+API эндпоинты фоновых заданий (длительные переборы, расчёты надёжности,
+проверки по всему каталогу).
+
+Обработчики синхронные: обращения к SQLite (и ожидание блокировки
+записи, пока исполнитель пишет блок результата) идут в пуле потоков,
+а не в цикле событий.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.models.jobs import JobRequest, JobResultsPage, JobStatus
+from app.core.config import settings
+from app.core.dependencies import get_job_manager, get_material_repository
+
+router = APIRouter(tags=["jobs"])
+
+
+def _required_profiles(job) -> list:
+    """Профили, которые задание берёт из каталога по имени."""
+    if job.kind == "sweep":
+        return job.request.profile_names
+    if job.kind == "reliability":
+        return [job.request.profile_name]
+    return []
+
+
+def _status_or_404(status):
+    """Состояние задания или HTTP 404."""
+    if status is None:
+        raise HTTPException(status_code=404, detail="Задание не найдено")
+    return status
+
+
+@router.post("/jobs", response_model=JobStatus, status_code=202)
+def submit_job(
+    job: JobRequest,
+    repository = Depends(get_material_repository),
+    manager = Depends(get_job_manager)
+):
+    """
+    Постановка задания в очередь.
+    
+    Задание выполняется локальным пулом исполнителей, результаты
+    блоками пишутся в SQLite.
+    
+    Args:
+        job: Вид задания (sweep, reliability, catalog_check) и параметры
+        
+    Returns:
+        Состояние поставленного задания
+        
+    Raises:
+        HTTPException: 404 если профиль не найден
+    """
+    for name in _required_profiles(job):
+        if not repository.get_profile(name):
+            raise HTTPException(status_code=404, detail=f"Профиль '{name}' не найден")
+    return manager.submit(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatus)
+def get_job(job_id: str, manager = Depends(get_job_manager)):
+    """
+    Состояние и ход выполнения задания.
+    
+    Raises:
+        HTTPException: 404 если задания нет
+    """
+    return _status_or_404(manager.status(job_id))
+
+
+@router.get("/jobs/{job_id}/results", response_model=JobResultsPage)
+def get_job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0, description="Номер первой строки"),
+    limit: int = Query(settings.JOB_RESULTS_PAGE_SIZE, ge=1, le=settings.JOB_RESULTS_PAGE_MAX,
+                       description="Число строк на странице"),
+    manager = Depends(get_job_manager)
+):
+    """
+    Страница результата задания (доступна и до его завершения).
+    
+    Raises:
+        HTTPException: 404 если задания нет
+    """
+    return _status_or_404(manager.results(job_id, offset, limit))
+
+
+@router.get(
+    "/jobs/{job_id}/results/stream",
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+def stream_job_results(job_id: str, manager = Depends(get_job_manager)):
+    """
+    Все записанные строки результата потоком NDJSON.
+    
+    Строки читаются из SQLite страницами и в памяти целиком не держатся.
+    
+    Raises:
+        HTTPException: 404 если задания нет
+    """
+    _status_or_404(manager.status(job_id))
+    return StreamingResponse(manager.stream_results(job_id), media_type="application/x-ndjson")
+
+
+@router.delete("/jobs/{job_id}", response_model=JobStatus)
+def cancel_job(job_id: str, manager = Depends(get_job_manager)):
+    """
+    Отмена задания; уже записанные строки результата остаются доступны.
+    
+    Raises:
+        HTTPException: 404 если задания нет
+    """
+    return _status_or_404(manager.cancel(job_id))
@@ -0,0 +1,52 @@
+"""
+API эндпоинты для расчёта балки на сочетания нагрузок.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.models.load_combination import LoadCombinationRequest, LoadCombinationResponse
+from app.core.dependencies import get_executor, get_load_combination_analyzer, get_material_repository
+from app.core.execution import CLIENT_CLOSED_REQUEST, ClientDisconnected
+
+router = APIRouter(tags=["load-combinations"])
+
+
+@router.post("/load-combinations", response_model=LoadCombinationResponse)
+async def calculate_load_combinations(
+    request: LoadCombinationRequest,
+    http_request: Request,
+    repository = Depends(get_material_repository),
+    analyzer = Depends(get_load_combination_analyzer),
+    executor = Depends(get_executor)
+):
+    """
+    Расчёт на сочетания нагрузок и определяющие сочетания.
+    
+    Каждое основное загружение рассчитывается один раз (поля кэшируются),
+    сочетания получаются суперпозицией с коэффициентами. Без списка
+    сочетаний они строятся по видам нагрузок.
+    
+    Args:
+        request: Схема балки, загружения и сочетания
+    
+    Returns:
+        Определяющие сочетания по прочности и жёсткости и результаты по всем сочетаниям
+    
+    Raises:
+        HTTPException: 404 если профиль не найден, 400 если марки стали нет
+            в каталоге или сочетаний слишком много
+    """
+    profile = repository.get_profile(request.profile_name)
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Профиль '{request.profile_name}' не найден"
+        )
+    
+    try:
+        return await executor.run(
+            analyzer.analyze, request, profile, cost=analyzer.estimate_cost(request), request=http_request
+        )
+    except ClientDisconnected:
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент отключился")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,53 @@
+"""
+API эндпоинты для расчёта балки на подвижную нагрузку.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.models.moving_load import MovingLoadRequest, MovingLoadResponse
+from app.core.dependencies import get_executor, get_material_repository, get_moving_load_analyzer
+from app.core.execution import CLIENT_CLOSED_REQUEST, ClientDisconnected
+
+router = APIRouter(tags=["moving-load"])
+
+
+@router.post("/moving-load", response_model=MovingLoadResponse)
+async def calculate_moving_load(
+    request: MovingLoadRequest,
+    http_request: Request,
+    repository = Depends(get_material_repository),
+    analyzer = Depends(get_moving_load_analyzer),
+    executor = Depends(get_executor)
+):
+    """
+    Линии влияния и огибающие для подвижной нагрузки (поезда осей).
+    
+    Расчёт выполняется в пуле исполнителей и прерывается
+    при отключении клиента.
+    
+    Args:
+        request: Параметры подвижной нагрузки
+        
+    Returns:
+        Линии влияния, огибающие, положение поезда и проверки
+        
+    Raises:
+        HTTPException: 404 если профиль не найден
+        HTTPException: 400 если марки стали нет в каталоге
+    """
+    profile = repository.get_profile(request.profile_name)
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Профиль '{request.profile_name}' не найден"
+        )
+    
+    cost = request.positions * request.sections * len(request.axle_loads)
+    try:
+        return await executor.run(
+            analyzer.analyze, request, profile, cost=cost, request=http_request,
+            cancellable=True
+        )
+    except ClientDisconnected:
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент отключился")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,9 +1,11 @@
 """
 API эндпоинты для работы с профилями материалов.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
 
-from app.models.material_profile import MaterialProfile, MaterialProfileList
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.models.material_profile import MaterialProfile, MaterialProfileList, ProfileQuery, ProfileSortField
 from app.core.dependencies import get_material_repository
 
 router = APIRouter(tags=["profiles"])
@@ -11,16 +13,53 @@ router = APIRouter(tags=["profiles"])
 
 @router.get("/profiles", response_model=MaterialProfileList)
 async def get_all_profiles(
+    name: Optional[str] = Query(None, description="Начала слов наименования"),
+    standard: Optional[str] = Query(None, description="Стандарт (ГОСТ)"),
+    min_wx: Optional[float] = Query(None, description="Минимальный Wx, см³"),
+    max_wx: Optional[float] = Query(None, description="Максимальный Wx, см³"),
+    min_ix: Optional[float] = Query(None, description="Минимальный Ix, см⁴"),
+    max_ix: Optional[float] = Query(None, description="Максимальный Ix, см⁴"),
+    min_height: Optional[float] = Query(None, description="Минимальная высота, мм"),
+    max_height: Optional[float] = Query(None, description="Максимальная высота, мм"),
+    min_mass: Optional[float] = Query(None, description="Минимальная масса 1 м, кг"),
+    max_mass: Optional[float] = Query(None, description="Максимальная масса 1 м, кг"),
+    sort: Optional[ProfileSortField] = Query(None, description="Поле сортировки"),
+    order: Literal["asc", "desc"] = Query("asc", description="Направление сортировки"),
+    limit: Optional[int] = Query(None, gt=0, le=1000, description="Размер страницы"),
+    cursor: Optional[str] = Query(None, description="Курсор следующей страницы"),
     repository = Depends(get_material_repository)
 ):
     """
-    Получить все доступные стальные профили.
+    Получить стальные профили с фильтрами, сортировкой и пагинацией.
+    
+    Без параметров возвращает все профили в порядке каталога.
     
     Returns:
-        Список всех профилей с геометрическими характеристиками
+        Страница профилей, общее количество и курсор следующей страницы
+        
+    Raises:
+        HTTPException: 400 если курсор некорректен
     """
-    profiles = repository.get_all_profiles()
-    return MaterialProfileList(profiles=profiles)
+    query = ProfileQuery(
+        name=name,
+        standard=standard,
+        min_wx=min_wx,
+        max_wx=max_wx,
+        min_ix=min_ix,
+        max_ix=max_ix,
+        min_height=min_height,
+        max_height=max_height,
+        min_mass=min_mass,
+        max_mass=max_mass,
+        sort=sort,
+        order=order,
+        limit=limit,
+        cursor=cursor
+    )
+    try:
+        return repository.query_profiles(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/profiles/{profile_key}", response_model=MaterialProfile)
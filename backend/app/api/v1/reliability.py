@@ -0,0 +1,52 @@
+"""
+API эндпоинты для вероятностного расчёта надёжности балки.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.models.reliability import ReliabilityRequest, ReliabilityResponse
+from app.core.dependencies import get_executor, get_material_repository, get_reliability_analyzer
+from app.core.execution import CLIENT_CLOSED_REQUEST, ClientDisconnected
+
+router = APIRouter(tags=["reliability"])
+
+
+@router.post("/reliability", response_model=ReliabilityResponse)
+async def calculate_reliability(
+    request: ReliabilityRequest,
+    http_request: Request,
+    repository = Depends(get_material_repository),
+    analyzer = Depends(get_reliability_analyzer),
+    executor = Depends(get_executor)
+):
+    """
+    Вероятности отказа по прочности и жёсткости методом Монте-Карло.
+    
+    Расчёт с заданным seed воспроизводим. Расчёт выполняется в пуле
+    исполнителей и прерывается при отключении клиента.
+    
+    Args:
+        request: Распределения параметров и настройки расчёта
+        
+    Returns:
+        Вероятности отказа, доверительные интервалы и индексы надёжности
+        
+    Raises:
+        HTTPException: 404 если профиль не найден
+        HTTPException: 400 если марки стали нет в каталоге
+    """
+    profile = repository.get_profile(request.profile_name)
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Профиль '{request.profile_name}' не найден"
+        )
+    
+    try:
+        return await executor.run(
+            analyzer.analyze, request, profile, cost=request.samples, request=http_request,
+            cancellable=True
+        )
+    except ClientDisconnected:
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Клиент отключился")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
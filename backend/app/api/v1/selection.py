@@ -0,0 +1,32 @@
+"""
+API эндпоинты для подбора сечения балки.
+"""
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.models.profile_selection import ProfileSelectionRequest, ProfileSelectionResponse
+from app.core.dependencies import get_section_selector
+
+router = APIRouter(tags=["selection"])
+
+
+@router.post("/profiles/select", response_model=ProfileSelectionResponse)
+async def select_profile(
+    request: ProfileSelectionRequest,
+    selector = Depends(get_section_selector)
+):
+    """
+    Подбор самого лёгкого профиля по прочности и жёсткости.
+    
+    Args:
+        request: Расчётная схема балки без профиля
+        
+    Returns:
+        Самый лёгкий подходящий профиль и следующие альтернативы
+        
+    Raises:
+        HTTPException: 400 если марки стали нет в каталоге
+    """
+    try:
+        return selector.select(request, alternatives=request.alternatives)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
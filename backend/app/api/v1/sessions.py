@@ -0,0 +1,156 @@
+"""
+API эндпоинты сессий пересчёта балки.
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from starlette.concurrency import run_in_threadpool
+
+from app.models.beam_calculation import BeamCalculationRequest, ResponseSelection
+from app.models.calculation_session import (
+    CalculationSessionDelta,
+    CalculationSessionResponse,
+    CalculationSessionUpdate
+)
+from app.core.dependencies import get_material_repository, get_session_manager
+
+router = APIRouter(tags=["sessions"])
+
+
+def _get_profile_or_404(repository, profile_name: str):
+    """Профиль по имени или HTTP 404."""
+    profile = repository.get_profile(profile_name)
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Профиль '{profile_name}' не найден. "
+                   f"Используйте GET /profiles для списка доступных."
+        )
+    return profile
+
+
+def _session_not_found(session_id: str) -> HTTPException:
+    """Ошибка HTTP 404 для отсутствующей сессии."""
+    return HTTPException(status_code=404, detail=f"Сессия '{session_id}' не найдена")
+
+
+def _session_response(session) -> CalculationSessionResponse:
+    """Состояние сессии с полным результатом."""
+    return CalculationSessionResponse(
+        session_id=session.session_id,
+        version=session.version,
+        sections=sorted(session.sections),
+        result=session.result()
+    )
+
+
+@router.post("/sessions", response_model=CalculationSessionResponse, status_code=201)
+async def create_session(
+    request: BeamCalculationRequest,
+    include: Optional[str] = Query(
+        None,
+        description="Необязательные части ответа через запятую: "
+                    "input, profile, report, diagrams (пусто или none - ни одной)"
+    ),
+    repository = Depends(get_material_repository),
+    manager = Depends(get_session_manager)
+):
+    """
+    Создание сессии пересчёта с полным расчётом балки.
+    
+    Сессия хранит результаты всех этапов расчёта; последующие
+    изменения параметров (PATCH) пересчитывают только зависящие
+    от них этапы. Расчёт выполняется в пуле потоков: сессии
+    хранятся в памяти процесса.
+    
+    Args:
+        request: Параметры расчёта балки
+        include: Необязательные части ответа, рассчитываемые в сессии
+    
+    Returns:
+        Идентификатор сессии и результат расчёта
+    
+    Raises:
+        HTTPException: 404 если профиль не найден
+        HTTPException: 400 если данные некорректны
+    """
+    profile = _get_profile_or_404(repository, request.profile_name)
+    try:
+        sections = ResponseSelection.parse(include).sections
+        session = await run_in_threadpool(manager.create, request, profile, sections)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _session_response(session)
+
+
+@router.get("/sessions/{session_id}", response_model=CalculationSessionResponse)
+async def get_session(session_id: str, manager = Depends(get_session_manager)):
+    """
+    Текущие параметры сессии и полный результат расчёта.
+    
+    Raises:
+        HTTPException: 404 если сессии нет (удалена или истекла)
+    """
+    session = manager.get(session_id)
+    if session is None:
+        raise _session_not_found(session_id)
+    return _session_response(session)
+
+
+@router.patch("/sessions/{session_id}", response_model=CalculationSessionDelta)
+async def update_session(
+    session_id: str,
+    update: CalculationSessionUpdate,
+    repository = Depends(get_material_repository),
+    manager = Depends(get_session_manager)
+):
+    """
+    Изменение параметров расчёта в сессии.
+    
+    Пересчитываются только этапы, зависящие от изменённых полей;
+    в ответе - пересчитанные этапы и изменившиеся поля результата.
+    Например, при перемещении силы профиль и его характеристики
+    не пересчитываются, а при смене марки стали - усилия и эпюры.
+    
+    Args:
+        session_id: Идентификатор сессии
+        update: Новые значения полей запроса расчёта
+    
+    Returns:
+        Номер версии, пересчитанные этапы и изменения результата
+    
+    Raises:
+        HTTPException: 404 если сессии или профиля нет
+        HTTPException: 400 если параметры некорректны (сессия не меняется)
+    """
+    profile = None
+    if "profile_name" in update.changes:
+        profile = _get_profile_or_404(repository, str(update.changes["profile_name"]))
+    
+    try:
+        updated = await run_in_threadpool(manager.update, session_id, update.changes, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if updated is None:
+        raise _session_not_found(session_id)
+    
+    version, recomputed, changed = updated
+    return CalculationSessionDelta(
+        session_id=session_id,
+        version=version,
+        recomputed=recomputed,
+        changed=changed
+    )
+
+
+@router.delete("/sessions/{session_id}", status_code=204)
+async def delete_session(session_id: str, manager = Depends(get_session_manager)):
+    """
+    Удаление сессии.
+    
+    Raises:
+        HTTPException: 404 если сессии нет
+    """
+    if not manager.delete(session_id):
+        raise _session_not_found(session_id)
+    return Response(status_code=204)
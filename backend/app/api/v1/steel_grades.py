@@ -0,0 +1,63 @@
+"""
+API эндпоинты для марок стали и таблицы несущей способности.
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.models.steel_grade import CapacityPair, CapacityQueryResponse, SteelGradeList
+from app.core.dependencies import get_capacity_table, get_steel_grades
+
+router = APIRouter(tags=["steel-grades"])
+
+
+@router.get("/steel-grades", response_model=SteelGradeList)
+async def get_steel_grades_list(grades = Depends(get_steel_grades)):
+    """
+    Получить марки стали каталога.
+    
+    Returns:
+        Марки с нормативным и расчётным сопротивлением
+    """
+    return SteelGradeList(grades=grades.grades)
+
+
+@router.get("/capacity", response_model=CapacityQueryResponse)
+async def query_capacity(
+    moment: float = Query(..., description="Требуемый изгибающий момент, кН·м"),
+    steel_grade: Optional[str] = Query(None, description="Ключ марки стали"),
+    min_stiffness: Optional[float] = Query(None, description="Минимальная жёсткость EI, кН·м²"),
+    limit: Optional[int] = Query(100, gt=0, le=10_000, description="Наибольшее число пар"),
+    table = Depends(get_capacity_table)
+):
+    """
+    Пары «марка стали × профиль», воспринимающие заданный момент.
+    
+    Returns:
+        Пары по возрастанию предельного момента и их общее число
+    
+    Raises:
+        HTTPException: 400 если марки стали нет в каталоге
+    """
+    try:
+        return table.pairs_for_moment(moment, steel_grade, min_stiffness, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/capacity/{steel_grade}/{profile_key}", response_model=CapacityPair)
+async def get_capacity(
+    steel_grade: str,
+    profile_key: str,
+    table = Depends(get_capacity_table)
+):
+    """
+    Предельный момент и жёсткость одной пары «марка × профиль».
+    
+    Raises:
+        HTTPException: 404 если марки или профиля нет в таблице
+    """
+    try:
+        return table.capacity(steel_grade, profile_key)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,85 @@
+"""
+API эндпоинты для параметрического перебора расчётных схем.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.models.sweep import SweepRequest
+from app.core.config import settings
+from app.core.dependencies import get_calculator, get_material_repository
+
+router = APIRouter(tags=["sweep"])
+
+
+@router.post(
+    "/sweep",
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}}
+)
+async def run_sweep(
+    sweep_request: SweepRequest,
+    http_request: Request,
+    repository = Depends(get_material_repository),
+    calculator = Depends(get_calculator)
+):
+    """
+    Перебор декартова произведения параметров с потоковой выдачей.
+    
+    Комбинации считаются векторными блоками по chunk_size и отдаются
+    по мере расчёта (NDJSON или CSV). В NDJSON с layout=columns
+    каждый блок выдаётся одной строкой с массивами. При отключении клиента
+    расчёт останавливается.
+    
+    Args:
+        sweep_request: Оси перебора и параметры вывода
+        
+    Returns:
+        Поток результатов, по строке на комбинацию
+        
+    Raises:
+        HTTPException: 404 если профиль не найден
+        HTTPException: 400 если перебор слишком велик или марки стали нет в каталоге
+    """
+    # Сервис перебора (и NumPy) загружается при первом переборе
+    from app.services.sweep import ParameterSweep, format_csv, format_ndjson, format_ndjson_columns
+    
+    profiles = []
+    for name in sweep_request.profile_names:
+        profile = repository.get_profile(name)
+        if not profile:
+            raise HTTPException(status_code=404, detail=f"Профиль '{name}' не найден")
+        profiles.append(profile)
+    
+    try:
+        sweep = ParameterSweep(sweep_request, profiles, calculator)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if sweep.total > settings.SWEEP_MAX_COMBINATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком много комбинаций: {sweep.total}. "
+                   f"Максимум: {settings.SWEEP_MAX_COMBINATIONS}"
+        )
+    
+    is_csv = sweep_request.format == "csv"
+    
+    async def stream():
+        for begin in range(0, sweep.total, sweep_request.chunk_size):
+            if await http_request.is_disconnected():
+                break
+            end = min(begin + sweep_request.chunk_size, sweep.total)
+            # Расчёт и форматирование блока не блокируют цикл событий
+            columns = await run_in_threadpool(sweep.compute_chunk, begin, end)
+            if is_csv:
+                text = await run_in_threadpool(format_csv, columns, begin == 0)
+            elif sweep_request.layout == "columns":
+                text = await run_in_threadpool(format_ndjson_columns, columns, begin)
+            else:
+                text = await run_in_threadpool(format_ndjson, columns)
+            yield text.encode("utf-8")
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/csv" if is_csv else "application/x-ndjson",
+        headers={"X-Sweep-Total": str(sweep.total)}
+    )
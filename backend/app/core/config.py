@@ -2,7 +2,7 @@
 Модуль конфигурации приложения.
 Все настройки выносятся сюда, а не хардкодятся.
 """
-from typing import List
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -24,6 +24,77 @@ class Settings(BaseSettings):
     ALLOWABLE_STRESS: float = 240.0  # МПа, сталь С245
     ALLOWABLE_DEFLECTION_RATIO: float = 1/250  # L/250
     
+    # Каталог профилей (по умолчанию - файл app/data/profiles.json)
+    PROFILE_CATALOG_PATH: Optional[str] = None
+    
+    # Каталог марок стали (по умолчанию - файл app/data/steel_grades.json);
+    # марка задаётся в запросе, без неё действует ALLOWABLE_STRESS
+    STEEL_GRADES_PATH: Optional[str] = None
+    
+    # Хранилище профилей: catalog - каталог в памяти, sqlite - база
+    # MATERIAL_DB_PATH (по умолчанию - esc-profiles.sqlite3 во временной
+    # папке; строится из каталога, если файла нет или версия устарела)
+    MATERIAL_REPOSITORY: Literal["catalog", "sqlite"] = "catalog"
+    MATERIAL_DB_PATH: Optional[str] = None
+    MATERIAL_DB_POOL_SIZE: int = 4
+    
+    # Кэш результатов расчёта (0 - кэш отключён)
+    RESULT_CACHE_MAX_SIZE: int = 1024
+    RESULT_CACHE_TTL_SECONDS: float = 600.0
+    
+    # Пакетный расчёт
+    BATCH_MAX_ITEMS: int = 10000
+    
+    # Параметрический перебор: максимальное число комбинаций
+    SWEEP_MAX_COMBINATIONS: int = 100_000_000
+    
+    # Подвижная нагрузка: размер блока «положения × сечения × оси»
+    MOVING_LOAD_CHUNK_CELLS: int = 2_000_000
+    
+    # Неразрезная балка: размер блока «пролёты × сечения × загружения»
+    # при построении огибающих временной нагрузки
+    CONTINUOUS_BEAM_CHUNK_CELLS: int = 2_000_000
+    
+    # Сочетания нагрузок: число схем, поля загружений которых хранятся в кэше
+    LOAD_COMBINATION_CACHE_SIZE: int = 256
+    
+    # Сессии пересчёта: наибольшее число сессий в памяти процесса
+    # и время жизни сессии без обращений
+    SESSION_MAX_COUNT: int = 1000
+    SESSION_TTL_SECONDS: float = 1800.0
+    
+    # Надёжность (Монте-Карло): наибольшее число процессов одного расчёта
+    RELIABILITY_MAX_WORKERS: int = 8
+    
+    # Фоновые задания: файл SQLite (по умолчанию - esc-jobs.sqlite3
+    # во временной папке), число одновременно выполняемых заданий,
+    # размер страницы результата, срок аренды задания процессом
+    # и продолжение заданий из очереди и прерванных (при первом
+    # обращении к заданиям и затем периодически; False - отключить)
+    JOB_DB_PATH: Optional[str] = None
+    JOB_MAX_WORKERS: int = 2
+    JOB_RESULTS_PAGE_SIZE: int = 1000
+    JOB_RESULTS_PAGE_MAX: int = 10_000
+    JOB_LEASE_SECONDS: float = 60.0
+    JOB_RESUME: bool = True
+    
+    # Исполнение расчётов: inline, thread или process.
+    # Расчёты с оценкой трудоёмкости ниже порога выполняются без пула.
+    EXECUTOR_KIND: Literal["inline", "thread", "process"] = "thread"
+    EXECUTOR_MAX_WORKERS: Optional[int] = None
+    EXECUTOR_INLINE_COST: int = 50_000
+    
+    # Метрики Prometheus (/metrics) и замеры этапов расчёта
+    METRICS_ENABLED: bool = True
+    
+    # Построение каталога и индексов при старте (иначе - при первом запросе)
+    STARTUP_WARMUP: bool = False
+    
+    # Профили запросов с X-Debug-Profile (только при DEBUG и PROFILING_ENABLED);
+    # по умолчанию - esc-profiles во временной папке
+    PROFILING_ENABLED: bool = False
+    PROFILE_DIR: Optional[str] = None
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,16 +1,278 @@
 ﻿"""
 Зависимости (Dependency Injection) для приложения.
+
+Сервисы и их тяжёлые зависимости (NumPy, каталог профилей)
+импортируются и создаются при первом обращении, а не при импорте
+приложения.
 """
-from app.repositories.material_repository import MaterialRepository, MaterialRepositoryStub
+import os
+import tempfile
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+from app.core.execution import CalculationExecutor
+from app.core.metrics import metrics, stats_collector
+from app.services.result_cache import ResultCache
+
+if TYPE_CHECKING:
+    from app.repositories.material_repository import MaterialRepository
+    from app.repositories.steel_grades import SteelGradeCatalog
+    from app.services.calculation_session import CalculationSessionManager
+    from app.services.calculator import BeamCalculator
+    from app.services.capacity_table import CapacityTable
+    from app.services.continuous_beam import ContinuousBeamAnalyzer
+    from app.services.jobs import JobManager
+    from app.services.load_combinations import LoadCombinationAnalyzer
+    from app.services.moving_load import MovingLoadAnalyzer
+    from app.services.reliability import ReliabilityAnalyzer
+    from app.services.section_selector import SectionSelector
 
 
-def get_material_repository() -> MaterialRepository:
+@lru_cache(maxsize=1)
+def get_material_repository() -> "MaterialRepository":
     """
     Фабрика для получения репозитория материалов.
     
+    Репозиторий создаётся один раз на процесс поверх каталога профилей
+    или базы SQLite (settings.MATERIAL_REPOSITORY), поэтому стоимость
+    зависимости в запросе не зависит от размера каталога. База SQLite
+    пересобирается, если её версия отличается от версии каталога.
+    
     Returns:
         MaterialRepository: Экземпляр репозитория
     """
-    # В MVP возвращаем заглушку
-    # В будущем можно заменить на реализацию с БД
-    return MaterialRepositoryStub()
+    from app.repositories.material_repository import CatalogMaterialRepository
+    from app.repositories.profile_catalog import load_profile_catalog
+    
+    if settings.MATERIAL_REPOSITORY == "sqlite":
+        from app.repositories.sqlite_repository import SQLiteMaterialRepository
+        
+        path = settings.MATERIAL_DB_PATH or os.path.join(tempfile.gettempdir(), "esc-profiles.sqlite3")
+        pool_size = settings.MATERIAL_DB_POOL_SIZE
+        catalog = load_profile_catalog()
+        repository = SQLiteMaterialRepository(path, pool_size=pool_size) if os.path.exists(path) else None
+        if repository is None or repository.version != catalog.version:
+            if repository is not None:
+                repository.close()
+            SQLiteMaterialRepository.build(path, catalog.profiles, catalog.version)
+            repository = SQLiteMaterialRepository(path, pool_size=pool_size)
+        return repository
+    
+    return CatalogMaterialRepository(load_profile_catalog())
+
+
+@lru_cache(maxsize=1)
+def get_section_selector() -> "SectionSelector":
+    """
+    Фабрика для получения сервиса подбора сечения.
+    
+    Индекс каталога строится один раз на процесс.
+    
+    Returns:
+        SectionSelector: Экземпляр сервиса подбора
+    """
+    from app.repositories.profile_catalog import load_profile_catalog
+    from app.services.section_selector import SectionSelector
+    
+    return SectionSelector(load_profile_catalog())
+
+
+@lru_cache(maxsize=1)
+def get_steel_grades() -> "SteelGradeCatalog":
+    """
+    Фабрика для получения каталога марок стали.
+    
+    Returns:
+        SteelGradeCatalog: Каталог процесса
+    """
+    from app.repositories.steel_grades import load_steel_grades
+    
+    return load_steel_grades()
+
+
+@lru_cache(maxsize=1)
+def get_capacity_table() -> "CapacityTable":
+    """
+    Фабрика для получения таблицы несущей способности «марка × профиль».
+    
+    Таблица строится один раз на процесс (с STARTUP_WARMUP - при старте).
+    
+    Returns:
+        CapacityTable: Таблица процесса
+    """
+    from app.repositories.profile_catalog import load_profile_catalog
+    from app.services.capacity_table import CapacityTable
+    
+    return CapacityTable(load_profile_catalog(), get_steel_grades())
+
+
+@lru_cache(maxsize=1)
+def get_calculator() -> "BeamCalculator":
+    """
+    Фабрика для получения калькулятора балки.
+    
+    Returns:
+        BeamCalculator: Экземпляр калькулятора
+    """
+    from app.services.calculator import BeamCalculator
+    
+    return BeamCalculator()
+
+
+@lru_cache(maxsize=1)
+def get_moving_load_analyzer() -> "MovingLoadAnalyzer":
+    """
+    Фабрика для получения сервиса расчёта на подвижную нагрузку.
+    
+    Returns:
+        MovingLoadAnalyzer: Экземпляр сервиса
+    """
+    from app.services.moving_load import MovingLoadAnalyzer
+    
+    return MovingLoadAnalyzer(get_calculator())
+
+
+@lru_cache(maxsize=1)
+def get_continuous_beam_analyzer() -> "ContinuousBeamAnalyzer":
+    """
+    Фабрика для получения сервиса расчёта неразрезной балки.
+    
+    Returns:
+        ContinuousBeamAnalyzer: Экземпляр сервиса
+    """
+    from app.services.continuous_beam import ContinuousBeamAnalyzer
+    
+    return ContinuousBeamAnalyzer(get_calculator())
+
+
+@lru_cache(maxsize=1)
+def get_load_combination_analyzer() -> "LoadCombinationAnalyzer":
+    """
+    Фабрика для получения сервиса расчёта на сочетания нагрузок.
+    
+    Кэш полей загружений общий для всех запросов процесса,
+    его счётчики публикуются в метриках.
+    
+    Returns:
+        LoadCombinationAnalyzer: Экземпляр сервиса
+    """
+    from app.services.load_combinations import LoadCombinationAnalyzer
+    
+    analyzer = LoadCombinationAnalyzer(get_calculator())
+    metrics.add_collector("esc_load_case_cache", stats_collector(
+        "esc_load_case_cache",
+        "Кэш полей загружений для сочетаний нагрузок",
+        analyzer.cache.stats,
+        counters=("hits", "misses", "evictions", "expirations")
+    ))
+    return analyzer
+
+
+@lru_cache(maxsize=1)
+def get_session_manager() -> "CalculationSessionManager":
+    """
+    Фабрика для получения хранилища сессий пересчёта.
+    
+    Сессии хранятся в памяти процесса; их число публикуется в метриках.
+    
+    Returns:
+        CalculationSessionManager: Экземпляр хранилища
+    """
+    from app.services.calculation_session import CalculationSessionManager
+    
+    manager = CalculationSessionManager(
+        get_calculator(),
+        max_sessions=settings.SESSION_MAX_COUNT,
+        ttl_seconds=settings.SESSION_TTL_SECONDS
+    )
+    metrics.add_collector("esc_calculation_sessions", stats_collector(
+        "esc_calculation_sessions",
+        "Сессии пересчёта балки",
+        manager.store.stats,
+        counters=("hits", "misses", "evictions", "expirations")
+    ))
+    return manager
+
+
+@lru_cache(maxsize=1)
+def get_reliability_analyzer() -> "ReliabilityAnalyzer":
+    """
+    Фабрика для получения сервиса расчёта надёжности.
+    
+    Returns:
+        ReliabilityAnalyzer: Экземпляр сервиса
+    """
+    from app.services.reliability import ReliabilityAnalyzer
+    
+    return ReliabilityAnalyzer(get_calculator())
+
+
+@lru_cache(maxsize=1)
+def get_job_manager() -> "JobManager":
+    """
+    Фабрика для получения диспетчера фоновых заданий.
+    
+    Хранилище заданий - файл SQLite из настроек (по умолчанию
+    во временной папке), пул исполнителей создаётся один раз на процесс.
+    С JOB_RESUME задания из очереди и прерванные остановкой процессов
+    забираются сразу и затем периодически; повторное выполнение
+    исключает аренда заданий в хранилище.
+    
+    Returns:
+        JobManager: Диспетчер заданий
+    """
+    from app.repositories.job_store import JobStore
+    from app.services.jobs import JobManager
+    
+    path = settings.JOB_DB_PATH or os.path.join(tempfile.gettempdir(), "esc-jobs.sqlite3")
+    manager = JobManager(
+        JobStore(path, lease_seconds=settings.JOB_LEASE_SECONDS),
+        get_material_repository,
+        max_workers=settings.JOB_MAX_WORKERS,
+        auto_resume=settings.JOB_RESUME
+    )
+    if settings.JOB_RESUME:
+        manager.resume()
+    return manager
+
+
+@lru_cache(maxsize=1)
+def get_result_cache() -> ResultCache:
+    """
+    Фабрика для получения кэша результатов расчёта.
+    
+    Размер и время жизни записей берутся из настроек,
+    счётчики кэша публикуются в метриках.
+    
+    Returns:
+        ResultCache: Кэш процесса
+    """
+    cache = ResultCache(
+        max_size=settings.RESULT_CACHE_MAX_SIZE,
+        ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS
+    )
+    metrics.add_collector("esc_result_cache", stats_collector(
+        "esc_result_cache",
+        "Кэш результатов расчёта",
+        cache.stats,
+        counters=("hits", "misses", "evictions", "expirations")
+    ))
+    return cache
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> CalculationExecutor:
+    """
+    Фабрика для получения диспетчера расчётов.
+    
+    Вид и размер пула и порог исполнения без пула берутся из настроек.
+    
+    Returns:
+        CalculationExecutor: Диспетчер процесса
+    """
+    return CalculationExecutor(
+        kind=settings.EXECUTOR_KIND,
+        max_workers=settings.EXECUTOR_MAX_WORKERS,
+        inline_cost=settings.EXECUTOR_INLINE_COST
+    )
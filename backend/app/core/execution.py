@@ -0,0 +1,168 @@
+"""
+Исполнение вычислительно ёмких расчётов вне цикла событий.
+
+Расчёты дороже порога выполняются в пуле потоков или процессов
+(вид и размер пула - в настройках), дешёвые - сразу в обработчике,
+чтобы не платить за передачу задачи в пул.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import multiprocessing
+import threading
+from typing import Any, Callable, Literal, Optional
+
+from starlette.requests import Request
+
+from app.core.profiling import is_profiling
+
+
+ExecutorKind = Literal["inline", "thread", "process"]
+
+# Код ответа для запроса, прерванного клиентом (nginx: 499 Client Closed Request)
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnected(Exception):
+    """Клиент отключился, не дождавшись результата расчёта."""
+
+
+class CalculationCancelled(Exception):
+    """Расчёт прерван по флагу отмены: результат больше не нужен."""
+
+
+def check_cancelled(cancel: Optional[threading.Event]) -> None:
+    """
+    Проверка флага отмены между блоками расчёта.
+    
+    Raises:
+        CalculationCancelled: Если флаг установлен
+    """
+    if cancel is not None and cancel.is_set():
+        raise CalculationCancelled()
+
+
+class CalculationExecutor:
+    """
+    Диспетчер расчётов по пулу потоков или процессов.
+    
+    Пул создаётся при первой задаче. Пока задача выполняется,
+    отслеживается отключение клиента: задача, ещё не начатая пулом,
+    снимается из очереди, а ожидающий обработчик получает
+    ClientDisconnected. Начатой задаче с cancellable=True передаётся
+    флаг отмены cancel: он устанавливается, и расчёт прерывается
+    на ближайшей границе блоков. Остальные задачи дорабатывают в пуле,
+    их результат отбрасывается.
+    """
+    
+    def __init__(self, kind: ExecutorKind = "thread", max_workers: Optional[int] = None,
+                 inline_cost: int = 0, poll_interval: float = 0.05):
+        """
+        Args:
+            kind: Вид пула (inline - без пула)
+            max_workers: Размер пула (None - по числу процессоров)
+            inline_cost: Порог трудоёмкости, ниже которого расчёт выполняется сразу
+            poll_interval: Период проверки отключения клиента, с
+        """
+        if kind not in ("inline", "thread", "process"):
+            raise ValueError(f"Неизвестный вид пула: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.inline_cost = inline_cost
+        self.poll_interval = poll_interval
+        self._pool: Optional[concurrent.futures.Executor] = None
+        self._manager = None
+        self._lock = threading.Lock()
+    
+    def _get_pool(self) -> concurrent.futures.Executor:
+        """Пул исполнителей (создаётся лениво)."""
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    self._pool = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+                else:
+                    self._pool = concurrent.futures.ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="calculation"
+                    )
+            return self._pool
+    
+    def _new_event(self) -> threading.Event:
+        """Флаг отмены задачи (для пула процессов - через процесс-менеджер)."""
+        if self.kind != "process":
+            return threading.Event()
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.Manager()
+            return self._manager.Event()
+    
+    def runs_inline(self, cost: int) -> bool:
+        """
+        Выполняется ли расчёт данной трудоёмкости без пула.
+        
+        Профилируемый запрос считается в потоке профилировщика.
+        """
+        return self.kind == "inline" or cost < self.inline_cost or is_profiling()
+    
+    async def run(self, func: Callable[..., Any], *args: Any, cost: int = 0,
+                  request: Optional[Request] = None, cancellable: bool = False,
+                  **kwargs: Any) -> Any:
+        """
+        Выполнение расчёта.
+        
+        Для пула процессов функция и аргументы должны сериализоваться pickle.
+        
+        Args:
+            func: Функция расчёта
+            *args: Позиционные аргументы функции
+            cost: Оценка трудоёмкости расчёта
+            request: HTTP-запрос для отслеживания отключения клиента
+            cancellable: Функция принимает флаг отмены cancel
+                и проверяет его между блоками расчёта
+            **kwargs: Именованные аргументы функции
+            
+        Returns:
+            Результат функции
+            
+        Raises:
+            ClientDisconnected: Если клиент отключился до завершения расчёта
+        """
+        if self.runs_inline(cost):
+            return func(*args, **kwargs)
+        
+        cancel = self._new_event() if cancellable else None
+        if cancel is not None:
+            kwargs["cancel"] = cancel
+        call = functools.partial(func, *args, **kwargs)
+        if self.kind == "thread":
+            # Контекст запроса (замеры этапов) переносится в поток пула
+            call = functools.partial(contextvars.copy_context().run, call)
+        future = self._get_pool().submit(call)
+        task = asyncio.wrap_future(future)
+        try:
+            if request is None:
+                return await task
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.poll_interval)
+                if done:
+                    return task.result()
+                if await request.is_disconnected():
+                    raise ClientDisconnected()
+        except BaseException:
+            # Отмена обработчика или отключение клиента: задача снимается
+            # из очереди пула, начатая прерывается по флагу отмены,
+            # поздний результат отбрасывается
+            task.cancel()
+            if cancel is not None:
+                cancel.set()
+            raise
+    
+    def shutdown(self) -> None:
+        """Остановка пула без ожидания задач из очереди."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
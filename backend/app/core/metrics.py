@@ -0,0 +1,379 @@
+"""
+Метрики приложения в текстовом формате Prometheus.
+
+Реестр без внешних зависимостей: счётчики, гистограммы и сборщики,
+читающие значения при выдаче /metrics. При выключенных метриках
+таймеры этапов возвращают общий пустой контекст, а запись значений
+сводится к одной проверке флага.
+
+Метрики собираются в пределах процесса: при пуле процессов расчёты
+в рабочих процессах в метриках этапов не учитываются.
+"""
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.profiling import current_timings
+
+
+# Границы корзин гистограмм длительности, с
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Выборка сборщика: (имя, тип, описание, [(метки, значение)])
+Sample = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Метки в формате {name="value",...}."""
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Число в формате Prometheus."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Монотонный счётчик с метками."""
+    
+    kind = "counter"
+    
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str,
+                 labelnames: Sequence[str] = ()):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Увеличение счётчика (значения меток - в порядке labelnames)."""
+        if not self._registry.enabled:
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+    
+    def value(self, *labels: str) -> float:
+        """Текущее значение."""
+        return self._values.get(labels, 0.0)
+    
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Гистограмма с метками (корзины, сумма и число наблюдений)."""
+    
+    kind = "histogram"
+    
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str,
+                 labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Для набора меток: [счётчики корзин (последняя - +Inf), сумма]
+        self._values: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float, *labels: str) -> None:
+        """Добавление наблюдения (значения меток - в порядке labelnames)."""
+        if not self._registry.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+    
+    def count(self, *labels: str) -> int:
+        """Число наблюдений."""
+        state = self._values.get(labels)
+        return sum(state[0]) if state else 0
+    
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(state[0]), state[1])) for labels, state in self._values.items())
+        lines = []
+        names = self.labelnames + ("le",)
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _StageTimer:
+    """
+    Замер длительности этапа в гистограмму и/или в замеры запроса.
+    
+    Имя этапа для замеров запроса - первая метка.
+    """
+    
+    __slots__ = ("_histogram", "_labels", "_timings", "_started")
+    
+    def __init__(self, histogram: Optional[Histogram], labels: tuple, timings=None):
+        self._histogram = histogram
+        self._labels = labels
+        self._timings = timings
+    
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self._started
+        if self._histogram is not None:
+            self._histogram.observe(duration, *self._labels)
+        if self._timings is not None:
+            self._timings.add(self._labels[0], self._started, duration)
+        return False
+
+
+class _NullTimer:
+    """Пустой таймер для выключенных метрик."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Реестр метрик процесса."""
+    
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: Запись метрик включена
+        """
+        self.enabled = enabled
+        self._metrics: Dict[str, object] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Счётчик (повторный вызов с тем же именем возвращает существующий)."""
+        return self._register(Counter(self, name, documentation, labelnames))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Гистограмма (повторный вызов с тем же именем возвращает существующую)."""
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+    
+    def add_collector(self, name: str, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Сборщик значений, вычисляемых при выдаче метрик.
+        
+        Сборщик с тем же именем заменяется: фабрика, пересоздавшая
+        объект (например, после cache_clear), публикует его вместо прежнего.
+        """
+        with self._lock:
+            self._collectors[name] = collector
+    
+    def timer(self, histogram: Histogram, *labels: str):
+        """Контекст замера длительности в гистограмму."""
+        if not self.enabled:
+            return NULL_TIMER
+        return _StageTimer(histogram, labels)
+    
+    def render(self) -> str:
+        """Все метрики в текстовом формате Prometheus."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collector in list(self._collectors.values()):
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(
+                        f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} "
+                        f"{_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+    
+    def clear(self) -> None:
+        """Сброс накопленных значений (метрики и сборщики сохраняются)."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+
+def stats_collector(prefix: str, documentation: str, stats: Callable[[], Dict[str, float]],
+                    counters: Sequence[str] = ()) -> Callable[[], List[Sample]]:
+    """
+    Сборщик метрик из словаря счётчиков объекта (например, ResultCache.stats).
+    
+    Args:
+        prefix: Префикс имён метрик
+        documentation: Описание источника
+        stats: Функция, возвращающая словарь значений
+        counters: Ключи, экспортируемые как счётчики (с суффиксом _total);
+            остальные - как gauge
+    """
+    def collect() -> List[Sample]:
+        samples = []
+        for key, value in stats().items():
+            if key in counters:
+                samples.append((f"{prefix}_{key}_total", "counter", f"{documentation}: {key}", [({}, value)]))
+            else:
+                samples.append((f"{prefix}_{key}", "gauge", f"{documentation}: {key}", [({}, value)]))
+        return samples
+    return collect
+
+
+metrics = MetricsRegistry(enabled=settings.METRICS_ENABLED)
+
+STAGE_SECONDS = metrics.histogram(
+    "esc_calculation_stage_seconds",
+    "Длительность этапов расчёта балки",
+    ("stage", "support_type")
+)
+
+CALCULATIONS = metrics.counter(
+    "esc_calculations_total",
+    "Число расчётов балки",
+    ("support_type",)
+)
+
+REQUEST_SECONDS = metrics.histogram(
+    "esc_http_request_duration_seconds",
+    "Длительность обработки HTTP-запросов",
+    ("method", "endpoint")
+)
+
+REQUESTS = metrics.counter(
+    "esc_http_requests_total",
+    "Число HTTP-запросов",
+    ("method", "endpoint", "status")
+)
+
+
+def stage_timer(stage: str, support_type: str = ""):
+    """
+    Контекст замера этапа расчёта.
+    
+    Замер попадает в метрики (если включены) и в заголовок
+    Server-Timing профилируемого запроса.
+    
+    Args:
+        stage: Имя этапа
+        support_type: Тип опор расчётной схемы
+    """
+    timings = current_timings()
+    if timings is None:
+        return metrics.timer(STAGE_SECONDS, stage, support_type)
+    histogram = STAGE_SECONDS if metrics.enabled else None
+    return _StageTimer(histogram, (stage, support_type), timings)
+
+
+def _route_template(scope) -> str:
+    """
+    Шаблон маршрута запроса с префиксом подключённого роутера.
+    
+    Шаблон маршрута хранится без префикса include_router, поэтому
+    префикс восстанавливается как часть пути перед совпавшим шаблоном.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+    path = scope["path"]
+    regex = getattr(route, "path_regex", None)
+    if regex is not None and not regex.match(path):
+        for index in range(1, len(path)):
+            if path[index] == "/" and regex.match(path[index:]):
+                return path[:index] + template
+    return template
+
+
+class MetricsMiddleware:
+    """
+    ASGI-прослойка: длительность и число запросов по шаблонам маршрутов.
+    
+    Шаблон маршрута (например, /api/v1/profiles/{profile_key}) берётся
+    после маршрутизации, поэтому число рядов метрик не зависит от
+    параметров пути. Длительность потоковых ответов - до отправки
+    последнего блока.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        status = "500"
+        
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            endpoint = _route_template(scope)
+            REQUEST_SECONDS.observe(time.perf_counter() - started, scope["method"], endpoint)
+            REQUESTS.inc(scope["method"], endpoint, status)
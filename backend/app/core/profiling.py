@@ -0,0 +1,257 @@
+"""
+Профилирование отдельных запросов в отладочном режиме.
+
+При Settings.DEBUG запрос с заголовком X-Debug-Timing получает
+заголовок Server-Timing с длительностями этапов: разбор и проверка
+запроса, поиск профиля, этапы расчёта, сериализация. Если включено
+ещё и Settings.PROFILING_ENABLED, с заголовком X-Debug-Profile:
+pstats | speedscope профиль запроса сохраняется в Settings.PROFILE_DIR,
+имя файла - в заголовке X-Debug-Profile-File.
+
+Этапы записываются теми же таймерами, что и метрики (stage_timer),
+через контекстную переменную запроса. Профилировщик работает в потоке
+цикла событий, поэтому на время профилирования расчёты выполняются
+без пула. Профилируемые запросы выполняются по одному, но профиль
+охватывает весь поток цикла событий: в него попадают и обычные
+запросы, идущие одновременно (заголовок X-Debug-Profile-Scope: process).
+"""
+import asyncio
+import contextvars
+import cProfile
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+
+TIMING_HEADER = b"x-debug-timing"
+PROFILE_HEADER = b"x-debug-profile"
+PROFILE_FORMATS = ("pstats", "speedscope")
+# Профиль снимается со всего потока цикла событий, а не с одного запроса
+PROFILE_SCOPE = b"process"
+
+
+class RequestTimings:
+    """Длительности этапов одного запроса."""
+    
+    def __init__(self, profiling: bool = False):
+        """
+        Args:
+            profiling: Для запроса снимается профиль
+        """
+        self.started = time.perf_counter()
+        self.profiling = profiling
+        self.first_stage_at: Optional[float] = None
+        self.stages: Dict[str, List[float]] = {}
+    
+    def add(self, stage: str, started: float, duration: float) -> None:
+        """Добавление замера этапа (повторные замеры суммируются)."""
+        if self.first_stage_at is None or started < self.first_stage_at:
+            self.first_stage_at = started
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [duration, 1]
+        else:
+            entry[0] += duration
+            entry[1] += 1
+    
+    def server_timing(self, finished: float) -> str:
+        """
+        Значение заголовка Server-Timing.
+        
+        Время до первого замеренного этапа относится к разбору
+        и проверке запроса (validation). Значение заголовка - ASCII,
+        поэтому этапы передаются по именам, повторные - с числом замеров.
+        """
+        entries = []
+        if self.first_stage_at is not None:
+            entries.append(("validation", self.first_stage_at - self.started, 1))
+        entries += [(stage, total, count) for stage, (total, count) in self.stages.items()]
+        entries.append(("total", finished - self.started, 1))
+        
+        parts = []
+        for stage, duration, count in entries:
+            part = f"{stage};dur={duration * 1000:.3f}"
+            if count > 1:
+                part += f';desc="x{count}"'
+            parts.append(part)
+        return ", ".join(parts)
+
+
+_current_timings: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Замеры текущего запроса (None - запрос не профилируется)."""
+    return _current_timings.get()
+
+
+def is_profiling() -> bool:
+    """Для текущего запроса снимается профиль."""
+    timings = _current_timings.get()
+    return timings is not None and timings.profiling
+
+
+class StackSampler:
+    """
+    Выборочный профилировщик потока: стек снимается с заданным периодом.
+    
+    Результат сохраняется в формате speedscope (sampled profile).
+    """
+    
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        """
+        Args:
+            thread_id: Идентификатор профилируемого потока
+            interval: Период выборки, с
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.frames: List[dict] = []
+        self._frame_index: Dict[tuple, int] = {}
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+    
+    def start(self) -> None:
+        """Запуск потока выборки стека."""
+        self._started = self._last = time.perf_counter()
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Остановка выборки с ожиданием завершения потока."""
+        self._stop.set()
+        self._thread.join()
+        self._finished = time.perf_counter()
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_name, code.co_filename, code.co_firstlineno)
+                index = self._frame_index.get(key)
+                if index is None:
+                    index = self._frame_index[key] = len(self.frames)
+                    self.frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                stack.append(index)
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(stack)
+            self.weights.append(now - self._last)
+            self._last = now
+    
+    def speedscope(self, name: str) -> dict:
+        """Профиль в формате speedscope."""
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": self.frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self._finished - self._started,
+                "samples": self.samples,
+                "weights": self.weights,
+            }],
+            "name": name,
+            "exporter": settings.APP_NAME,
+        }
+
+
+def profile_directory() -> str:
+    """Папка профилей (создаётся при необходимости)."""
+    directory = settings.PROFILE_DIR or os.path.join(tempfile.gettempdir(), "esc-profiles")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def _profile_path(scope, extension: str) -> str:
+    """Уникальное имя файла профиля по времени и пути запроса."""
+    slug = scope["path"].strip("/").replace("/", "_") or "root"
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method'].lower()}-{slug}-{uuid.uuid4().hex[:8]}"
+    return os.path.join(profile_directory(), f"{name}.{extension}")
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI-прослойка отладочных замеров и профилирования запросов.
+    
+    Активна только при Settings.DEBUG, профилирование - ещё и при
+    Settings.PROFILING_ENABLED; без отладочных заголовков запрос
+    проходит без изменений.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+        # Профилируемые запросы выполняются по одному
+        self._profile_lock = asyncio.Lock()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.DEBUG:
+            await self.app(scope, receive, send)
+            return
+        
+        headers = dict(scope.get("headers") or ())
+        profile_format = headers.get(PROFILE_HEADER, b"").decode("latin-1").strip().lower()
+        if profile_format not in PROFILE_FORMATS or not settings.PROFILING_ENABLED:
+            profile_format = None
+        if TIMING_HEADER not in headers and profile_format is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if profile_format is None:
+            await self._measure(scope, receive, send, None)
+            return
+        async with self._profile_lock:
+            await self._measure(scope, receive, send, profile_format)
+    
+    async def _measure(self, scope, receive, send, profile_format: Optional[str]) -> None:
+        """Выполнение запроса с замерами этапов и, при profile_format, с профилем."""
+        timings = RequestTimings(profiling=profile_format is not None)
+        profile_path = _profile_path(scope, "pstats" if profile_format == "pstats" else "speedscope.json") \
+            if profile_format else None
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                extra = [(b"server-timing", timings.server_timing(time.perf_counter()).encode("utf-8"))]
+                if profile_path:
+                    extra.append((b"x-debug-profile-file", os.path.basename(profile_path).encode("latin-1")))
+                    extra.append((b"x-debug-profile-scope", PROFILE_SCOPE))
+                message = {**message, "headers": list(message.get("headers", [])) + extra}
+            await send(message)
+        
+        profiler = sampler = None
+        if profile_format == "pstats":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        elif profile_format == "speedscope":
+            sampler = StackSampler(threading.get_ident())
+            sampler.start()
+        
+        token = _current_timings.set(timings)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_timings.reset(token)
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(profile_path)
+            if sampler is not None:
+                sampler.stop()
+                with open(profile_path, "w", encoding="utf-8") as file:
+                    json.dump(sampler.speedscope(f"{scope['method']} {scope['path']} (весь процесс)"), file)
@@ -0,0 +1,186 @@
+"""
+Сериализация ответов API с выбором формата по заголовку Accept.
+
+Поддерживаемые форматы:
+- application/json - JSON (через orjson, если установлен);
+- application/vnd.esc.packed+json - JSON, в котором числовые ряды
+  упакованы в base64 little-endian float64;
+- application/msgpack - MessagePack, числовые ряды - сырые байты
+  little-endian float64.
+
+Упакованный ряд имеет вид {"dtype": "<f8", "shape": [...], "data": ...}.
+
+NumPy и MessagePack при импорте модуля не загружаются: массивы
+NumPy могут встретиться только если NumPy уже загружен расчётом.
+"""
+import base64
+import importlib.util
+import json
+import sys
+from typing import AbstractSet, Any, Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен
+    orjson = None
+
+# msgpack необязателен
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+
+
+JSON = "application/json"
+PACKED_JSON = "application/vnd.esc.packed+json"
+MSGPACK = "application/msgpack"
+
+# Синонимы типов из заголовка Accept
+_MEDIA_TYPES = {
+    "application/json": JSON,
+    "application/vnd.esc.packed+json": PACKED_JSON,
+    "application/msgpack": MSGPACK,
+    "application/x-msgpack": MSGPACK,
+}
+
+
+def available_media_types() -> list:
+    """Форматы, доступные при установленных зависимостях."""
+    types = [JSON, PACKED_JSON]
+    if HAS_MSGPACK:
+        types.append(MSGPACK)
+    return types
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Выбор формата ответа по заголовку Accept (с учётом q-параметров).
+    
+    Args:
+        accept: Значение заголовка Accept
+        
+    Returns:
+        Один из JSON, PACKED_JSON, MSGPACK
+        
+    Raises:
+        HTTPException: 406 если ни один из запрошенных форматов не поддерживается
+    """
+    if not accept:
+        return JSON
+    
+    available = available_media_types()
+    candidates = []
+    for position, item in enumerate(accept.split(",")):
+        parts = [part.strip() for part in item.split(";")]
+        media_type, quality = parts[0].lower(), 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality <= 0:
+            continue
+        if media_type in ("*/*", "application/*"):
+            candidates.append((quality, -position, JSON))
+        elif _MEDIA_TYPES.get(media_type) in available:
+            candidates.append((quality, -position, _MEDIA_TYPES[media_type]))
+    
+    if not candidates:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Поддерживаемые форматы: {', '.join(available)}"
+        )
+    return max(candidates)[2]
+
+
+def pack_array(values, text: bool) -> Dict[str, Any]:
+    """Упаковка числового массива в little-endian float64 (сырые байты или base64)."""
+    import numpy as np
+    
+    array = np.ascontiguousarray(values, dtype="<f8")
+    data = array.tobytes()
+    return {
+        "dtype": "<f8",
+        "shape": list(array.shape),
+        "data": base64.b64encode(data).decode("ascii") if text else data,
+    }
+
+
+def _converter(media_type: str):
+    """
+    Преобразование значений, которые сериализатор не поддерживает сам.
+    
+    Вызывается сериализатором только для массивов и скаляров NumPy,
+    поэтому обычные списки и словари не обходятся повторно.
+    """
+    def convert(value: Any) -> Any:
+        np = sys.modules.get("numpy")
+        if np is None:
+            raise TypeError(f"Тип {type(value).__name__} не сериализуется")
+        if isinstance(value, np.ndarray):
+            if media_type != JSON and value.dtype.kind == "f":
+                return pack_array(value, text=media_type == PACKED_JSON)
+            if value.dtype.kind == "f":
+                # NaN в JSON недопустим - передаётся как null
+                return np.where(np.isnan(value), None, value).tolist()
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Тип {type(value).__name__} не сериализуется")
+    return convert
+
+
+def encode(payload: Any, media_type: str) -> bytes:
+    """
+    Сериализация данных в выбранный формат.
+    
+    Args:
+        payload: Словари, списки, скаляры и массивы NumPy
+        media_type: Формат из negotiate()
+    """
+    convert = _converter(media_type)
+    if media_type == MSGPACK:
+        import msgpack
+        return msgpack.packb(payload, use_bin_type=True, default=convert)
+    if orjson is not None:
+        # Для JSON массивы NumPy сериализует сам orjson (NaN - null)
+        option = orjson.OPT_SERIALIZE_NUMPY if media_type == JSON else 0
+        return orjson.dumps(payload, option=option, default=convert)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"),
+                      default=convert).encode("utf-8")
+
+
+def render(payload: Any, media_type: str, status_code: int = 200,
+           headers: Optional[Dict[str, str]] = None) -> Response:
+    """Ответ в выбранном формате с заголовком Vary: Accept."""
+    return Response(
+        content=encode(payload, media_type),
+        status_code=status_code,
+        media_type=media_type,
+        headers={"Vary": "Accept", **(headers or {})}
+    )
+
+
+def render_model(model: BaseModel, media_type: str, include: Optional[AbstractSet[str]] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Ответ с моделью pydantic в выбранном формате.
+    
+    JSON формируется сериализатором pydantic напрямую, без
+    промежуточных словарей.
+    
+    Args:
+        model: Модель ответа
+        media_type: Формат из negotiate()
+        include: Поля верхнего уровня (None - все)
+        headers: Дополнительные заголовки
+    """
+    if media_type == JSON:
+        return Response(
+            content=model.model_dump_json(include=include),
+            media_type=media_type,
+            headers={"Vary": "Accept", **(headers or {})}
+        )
+    return render(model.model_dump(mode="json", include=include), media_type, headers=headers)
@@ -2,11 +2,39 @@
 Основной модуль FastAPI приложения.
 Здесь создается и настраивается экземпляр приложения.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 from app.api.v1 import router as api_v1_router
 from app.core.config import settings
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, metrics
+from app.core.profiling import ServerTimingMiddleware
+from app.core.dependencies import (
+    get_capacity_table, get_executor, get_job_manager, get_material_repository, get_section_selector
+)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """
+    Жизненный цикл приложения.
+    
+    Каталог профилей, индексы и таблица несущей способности строятся при первом обращении;
+    с STARTUP_WARMUP - при старте, до приёма запросов. Хранилище
+    фоновых заданий открывается при первом обращении к заданиям
+    (тогда же продолжаются прерванные задания).
+    """
+    if settings.STARTUP_WARMUP:
+        get_material_repository()
+        get_section_selector()
+        get_capacity_table()
+    yield
+    get_executor().shutdown()
+    if get_job_manager.cache_info().currsize:
+        get_job_manager().shutdown()
 
 
 def create_application() -> FastAPI:
@@ -17,6 +45,7 @@ def create_application() -> FastAPI:
         version="1.0.0",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        lifespan=lifespan,
     )
     
     # Настраиваем CORS
@@ -28,6 +57,13 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Длительность и число запросов по маршрутам
+    application.add_middleware(MetricsMiddleware)
+    
+    # Server-Timing и профили отдельных запросов (только при DEBUG,
+    # профили - ещё и с PROFILING_ENABLED)
+    application.add_middleware(ServerTimingMiddleware)
+    
     # Подключаем маршруты API
     application.include_router(api_v1_router, prefix="/api/v1")
     
@@ -51,4 +87,12 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Эндпоинт для проверки здоровья сервиса."""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Метрики процесса в текстовом формате Prometheus."""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Метрики отключены")
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
@@ -3,18 +3,133 @@
 """
 
 from .beam_calculation import (
+    PointLoad,
+    DistributedLoad,
+    AppliedMoment,
+    Support,
+    BeamLoadCase,
     BeamCalculationRequest,
-    BeamCalculationResponse
+    BeamCalculationResponse,
+    BeamCalculationSummary,
+    BeamBatchRequest,
+    BeamBatchItemResult,
+    BeamBatchResponse,
+    ResponseSelection
 )
 
 from .material_profile import (
     MaterialProfile,
-    MaterialProfileList
+    MaterialProfileList,
+    ProfileQuery
+)
+
+from .profile_selection import (
+    ProfileSelectionRequest,
+    ProfileSelectionCandidate,
+    ProfileSelectionResponse
+)
+
+from .moving_load import (
+    MovingLoadRequest,
+    MovingLoadResponse
+)
+
+from .continuous_beam import (
+    ContinuousSpan,
+    ContinuousBeamRequest,
+    ContinuousSpanResult,
+    ContinuousBeamResponse
+)
+
+from .load_combination import (
+    BasicLoadCase,
+    LoadCombination,
+    LoadCombinationRequest,
+    CombinationResult,
+    LoadCombinationResponse
+)
+
+from .calculation_session import (
+    CalculationSessionUpdate,
+    CalculationSessionResponse,
+    CalculationSessionDelta
+)
+
+from .reliability import (
+    Distribution,
+    ReliabilityRequest,
+    FailureEstimate,
+    ReliabilityResponse
+)
+
+from .jobs import (
+    SweepJob,
+    ReliabilityJob,
+    CatalogCheckJob,
+    JobRequest,
+    JobStatus,
+    JobResultsPage
+)
+
+from .steel_grade import (
+    SteelGrade,
+    SteelGradeList,
+    CapacityPair,
+    CapacityQueryResponse
+)
+
+from .sweep import (
+    SweepRange,
+    SweepRequest
 )
 
 __all__ = [
+    "PointLoad",
+    "DistributedLoad",
+    "AppliedMoment",
+    "Support",
+    "BeamLoadCase",
     "BeamCalculationRequest",
     "BeamCalculationResponse",
+    "BeamCalculationSummary",
+    "BeamBatchRequest",
+    "BeamBatchItemResult",
+    "BeamBatchResponse",
+    "ResponseSelection",
     "MaterialProfile",
-    "MaterialProfileList"
+    "MaterialProfileList",
+    "ProfileQuery",
+    "ProfileSelectionRequest",
+    "ProfileSelectionCandidate",
+    "ProfileSelectionResponse",
+    "MovingLoadRequest",
+    "MovingLoadResponse",
+    "ContinuousSpan",
+    "ContinuousBeamRequest",
+    "ContinuousSpanResult",
+    "ContinuousBeamResponse",
+    "BasicLoadCase",
+    "LoadCombination",
+    "LoadCombinationRequest",
+    "CombinationResult",
+    "LoadCombinationResponse",
+    "CalculationSessionUpdate",
+    "CalculationSessionResponse",
+    "CalculationSessionDelta",
+    "Distribution",
+    "ReliabilityRequest",
+    "FailureEstimate",
+    "ReliabilityResponse",
+    "SweepJob",
+    "ReliabilityJob",
+    "CatalogCheckJob",
+    "JobRequest",
+    "JobStatus",
+    "JobResultsPage",
+    "SteelGrade",
+    "SteelGradeList",
+    "CapacityPair",
+    "CapacityQueryResponse",
+    "SweepRange",
+    "SweepRequest"
 ]
\ No newline at end of file
@@ -2,12 +2,149 @@
 Pydantic-схемы для расчёта балки.
 Содержит модели запроса и ответа API.
 """
-from typing import Literal, Dict, List, Optional
-from pydantic import BaseModel, Field, confloat, conlist
+from typing import Any, Literal, Dict, FrozenSet, List, Optional, Tuple
+from pydantic import BaseModel, Field, confloat, conlist, model_validator
 
 
-class BeamCalculationRequest(BaseModel):
-    """Модель запроса на расчёт балки."""
+# Разрешение эпюр по умолчанию и максимальное
+DEFAULT_DIAGRAM_POINTS = 101
+MAX_DIAGRAM_POINTS = 100_000
+
+# Наибольшее число опор схемы support_type='custom'
+MAX_SUPPORTS = 10_000
+
+# Необязательные части ответа расчёта и соответствующие поля ответа
+RESPONSE_SECTIONS = {
+    "input": "input_data",
+    "profile": "profile_properties",
+    "report": "report_sections",
+    "diagrams": "diagram_data",
+}
+
+# Реакции, возвращаемые для стандартных типов опор
+REACTION_KEYS = {
+    "hinged": ("R_a", "R_b"),
+    "cantilever": ("R_a", "M_a"),
+    "fixed": ("R_a", "M_a", "R_b", "M_b"),
+}
+
+
+class PointLoad(BaseModel):
+    """Сосредоточенная сила."""
+    
+    force: float = Field(
+        ...,
+        description="Величина силы, кН (вниз положительна)",
+        example=50.0
+    )
+    
+    position: confloat(ge=0, le=1) = Field(
+        ...,
+        description="Координата приложения (доля от длины, 0..1)",
+        example=0.25
+    )
+
+
+class DistributedLoad(BaseModel):
+    """Равномерно или линейно распределённая нагрузка на участке пролёта."""
+    
+    q_start: float = Field(
+        ...,
+        description="Интенсивность в начале участка, кН/м (вниз положительна)",
+        example=10.0
+    )
+    
+    q_end: Optional[float] = Field(
+        None,
+        description="Интенсивность в конце участка, кН/м (None - равномерная)",
+        example=None
+    )
+    
+    start: confloat(ge=0, le=1) = Field(
+        0.0,
+        description="Начало участка (доля от длины, 0..1)",
+        example=0.0
+    )
+    
+    end: confloat(ge=0, le=1) = Field(
+        1.0,
+        description="Конец участка (доля от длины, 0..1)",
+        example=1.0
+    )
+    
+    @model_validator(mode="after")
+    def _check_interval(self):
+        if self.end <= self.start:
+            raise ValueError("Конец участка нагрузки должен быть больше начала")
+        return self
+
+
+class AppliedMoment(BaseModel):
+    """Сосредоточенный изгибающий момент."""
+    
+    moment: float = Field(
+        ...,
+        description="Величина момента, кН·м (по часовой стрелке положителен)",
+        example=20.0
+    )
+    
+    position: confloat(ge=0, le=1) = Field(
+        ...,
+        description="Координата приложения (доля от длины, 0..1)",
+        example=0.5
+    )
+
+
+class Support(BaseModel):
+    """Опора в произвольном сечении балки (support_type='custom')."""
+    
+    type: Literal["pin", "roller", "fixed", "free", "spring"] = Field(
+        ...,
+        description="Тип опоры: pin/roller - шарнир (в изгибе одинаковы), "
+                    "fixed - заделка, free - свободный конец, spring - упругая опора",
+        example="pin"
+    )
+    
+    position: confloat(ge=0, le=1) = Field(
+        ...,
+        description="Координата опоры (доля от длины, 0..1)",
+        example=0.0
+    )
+    
+    stiffness: Optional[confloat(gt=0)] = Field(
+        None,
+        description="Жёсткость упругой опоры на смещение, кН/м",
+        example=None
+    )
+    
+    rotational_stiffness: Optional[confloat(gt=0)] = Field(
+        None,
+        description="Жёсткость упругой опоры на поворот, кН·м/рад",
+        example=None
+    )
+    
+    @model_validator(mode="after")
+    def _check_stiffness(self):
+        has_stiffness = self.stiffness is not None or self.rotational_stiffness is not None
+        if self.type == "spring" and not has_stiffness:
+            raise ValueError("Для упругой опоры задаётся stiffness или rotational_stiffness")
+        if self.type != "spring" and has_stiffness:
+            raise ValueError("Жёсткости задаются только для упругой опоры (type='spring')")
+        return self
+    
+    @property
+    def restrains_deflection(self) -> bool:
+        """Опора воспринимает поперечную силу."""
+        return self.type in ("pin", "roller", "fixed") or self.stiffness is not None
+    
+    @property
+    def restrains_rotation(self) -> bool:
+        """Опора воспринимает момент."""
+        return self.type == "fixed" or self.rotational_stiffness is not None
+
+
+class BeamLoadCase(BaseModel):
+    """Расчётная схема балки: пролёт, опоры и нагрузка (без профиля)."""
     
     length: confloat(gt=0) = Field(
         ...,
@@ -16,27 +153,106 @@ class BeamCalculationRequest(BaseModel):
         gt=0
     )
     
-    support_type: Literal["hinged", "cantilever", "fixed"] = Field(
+    support_type: Literal["hinged", "cantilever", "fixed", "custom"] = Field(
         ...,
-        description="Тип опор балки",
+        description="Тип опор балки (custom - опоры из списка supports)",
         example="hinged"
     )
     
-    force: confloat(gt=0) = Field(
-        ...,
+    supports: List[Support] = Field(
+        default_factory=list,
+        description="Опоры в произвольных сечениях (только для support_type='custom')",
+        max_length=MAX_SUPPORTS
+    )
+    
+    force: Optional[confloat(gt=0)] = Field(
+        None,
         description="Величина сосредоточенной силы (F), кН",
-        example=100.0,
-        gt=0
+        example=100.0
     )
     
-    force_position: confloat(ge=0, le=1) = Field(
-        ...,
+    force_position: Optional[confloat(ge=0, le=1)] = Field(
+        None,
         description="Координата приложения силы (доля от длины, 0..1)",
-        example=0.5,
-        ge=0,
-        le=1
+        example=0.5
     )
     
+    point_loads: List[PointLoad] = Field(
+        default_factory=list,
+        description="Дополнительные сосредоточенные силы"
+    )
+    
+    distributed_loads: List[DistributedLoad] = Field(
+        default_factory=list,
+        description="Распределённые нагрузки"
+    )
+    
+    applied_moments: List[AppliedMoment] = Field(
+        default_factory=list,
+        description="Сосредоточенные моменты"
+    )
+    
+    steel_grade: Optional[str] = Field(
+        None,
+        description="Ключ марки стали из каталога (/steel-grades); "
+                    "None - расчётное сопротивление из настроек (С245, 240 МПа)",
+        example="C255"
+    )
+    
+    @model_validator(mode="after")
+    def _check_loads(self):
+        if (self.force is None) != (self.force_position is None):
+            raise ValueError("force и force_position задаются вместе")
+        if self.force is None and not (self.point_loads or self.distributed_loads or self.applied_moments):
+            raise ValueError("Не задано ни одной нагрузки")
+        return self
+    
+    @model_validator(mode="after")
+    def _check_supports(self):
+        if (self.support_type == "custom") != bool(self.supports):
+            raise ValueError("Список supports задаётся вместе с support_type='custom'")
+        positions = [support.position for support in self.supports]
+        if len(set(positions)) != len(positions):
+            raise ValueError("Опоры должны стоять в разных сечениях")
+        if self.supports:
+            # Балка неподвижна, если смещение закреплено в двух сечениях
+            # или в одном сечении вместе с поворотом
+            pinned = {s.position for s in self.supports if s.restrains_deflection}
+            clamped = any(s.restrains_rotation for s in self.supports)
+            if not pinned or (len(pinned) < 2 and not clamped):
+                raise ValueError("Схема опор геометрически изменяема: "
+                                 "нужны две опоры или опора с заделкой")
+        return self
+    
+    def has_elastic_supports(self) -> bool:
+        """
+        Есть упругие опоры (type='spring').
+        
+        В таких схемах усилия зависят от жёсткости балки EI, а прогиб
+        не обратно пропорционален Ix, поэтому расчёт при Ix = 1 см⁴
+        нельзя пересчитать на другой профиль.
+        """
+        return any(support.type == "spring" for support in self.supports)
+    
+    def single_point_load(self) -> Optional[Tuple[float, float]]:
+        """
+        Единственная сосредоточенная сила (F, доля длины), если других нагрузок нет.
+        
+        Такие схемы считаются по замкнутым формулам, остальные - суперпозицией
+        или методом конечных элементов (support_type='custom').
+        """
+        if self.supports or self.distributed_loads or self.applied_moments:
+            return None
+        if self.force is not None:
+            return None if self.point_loads else (self.force, self.force_position)
+        if len(self.point_loads) == 1 and self.point_loads[0].force > 0:
+            return self.point_loads[0].force, self.point_loads[0].position
+        return None
+
+
+class BeamCalculationRequest(BeamLoadCase):
+    """Модель запроса на расчёт балки."""
+    
     profile_name: str = Field(
         ...,
         description="Наименование стального профиля",
@@ -44,6 +260,21 @@ class BeamCalculationRequest(BaseModel):
         min_length=1
     )
     
+    diagram_points: int = Field(
+        DEFAULT_DIAGRAM_POINTS,
+        description="Число точек расчётной сетки эпюр",
+        example=101,
+        ge=2,
+        le=MAX_DIAGRAM_POINTS
+    )
+    
+    diagram_max_points: Optional[int] = Field(
+        None,
+        description="Прореживание эпюр до заданного числа точек (LTTB)",
+        example=500,
+        ge=3
+    )
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -56,12 +287,105 @@ class BeamCalculationRequest(BaseModel):
         }
 
 
+class BeamCalculationSummary(BaseModel):
+    """Краткие результаты расчёта балки (без отчёта и эпюр)."""
+    
+    reactions: Dict[str, float] = Field(
+        ...,
+        description="Реакции опор, кН",
+        example={"R_a": 50.0, "R_b": 50.0}
+    )
+    
+    max_moment: float = Field(
+        ...,
+        description="Максимальный изгибающий момент (M_max), кН·м",
+        example=125.0
+    )
+    
+    max_deflection: float = Field(
+        ...,
+        description="Максимальный прогиб (f_max), мм",
+        example=12.5
+    )
+    
+    max_stress: float = Field(
+        ...,
+        description="Максимальное нормальное напряжение (σ_max), МПа",
+        example=150.0
+    )
+    
+    is_strength_sufficient: bool = Field(
+        ...,
+        description="Вердикт по прочности",
+        example=True
+    )
+    
+    is_stiffness_sufficient: bool = Field(
+        ...,
+        description="Вердикт по жёсткости",
+        example=True
+    )
+
+
+class BeamBatchRequest(BaseModel):
+    """Модель запроса на пакетный расчёт балок."""
+    
+    items: List[Any] = Field(
+        ...,
+        description="Список расчётов балок (элемент - BeamCalculationRequest). "
+                    "Элементы проверяются по отдельности: некорректный элемент "
+                    "получает ошибку в результатах, остальные рассчитываются",
+        min_length=1
+    )
+
+
+class BeamBatchItemResult(BaseModel):
+    """Результат одного элемента пакетного расчёта."""
+    
+    index: int = Field(
+        ...,
+        description="Порядковый номер элемента в запросе",
+        example=0
+    )
+    
+    result: Optional[BeamCalculationSummary] = Field(
+        None,
+        description="Результаты расчёта (если расчёт выполнен)"
+    )
+    
+    error: Optional[str] = Field(
+        None,
+        description="Описание ошибки (если расчёт не выполнен)"
+    )
+
+
+class BeamBatchResponse(BaseModel):
+    """Модель ответа пакетного расчёта балок."""
+    
+    results: List[BeamBatchItemResult] = Field(
+        ...,
+        description="Результаты в порядке элементов запроса"
+    )
+    
+    succeeded: int = Field(
+        ...,
+        description="Количество успешно рассчитанных элементов",
+        example=1
+    )
+    
+    failed: int = Field(
+        ...,
+        description="Количество элементов с ошибкой",
+        example=0
+    )
+
+
 class BeamCalculationResponse(BaseModel):
     """Модель ответа с результатами расчёта балки."""
     
-    input_data: BeamCalculationRequest = Field(
-        ...,
-        description="Исходные данные расчёта"
+    input_data: Optional[BeamCalculationRequest] = Field(
+        None,
+        description="Исходные данные расчёта (include=input)"
     )
     
     reactions: Dict[str, float] = Field(
@@ -100,26 +424,29 @@ class BeamCalculationResponse(BaseModel):
         example=True
     )
     
-    profile_properties: Dict[str, float] = Field(
-        ...,
-        description="Геометрические характеристики профиля",
+    profile_properties: Optional[Dict[str, float]] = Field(
+        None,
+        description="Геометрические характеристики профиля (include=profile)",
         example={
-            "moment_of_inertia_ix_cm4": 1840.0,
-            "moment_of_resistance_wx_cm3": 184.0
+            "moment_of_inertia_ix_cm4": 1943.0,
+            "moment_of_resistance_wx_cm3": 194.3
         }
     )
     
-    report_sections: List[Dict[str, str]] = Field(
-        default_factory=list,
-        description="Текстовые блоки для отчёта"
+    report_sections: Optional[List[Dict[str, str]]] = Field(
+        None,
+        description="Текстовые блоки для отчёта (include=report)"
     )
     
-    diagram_data: Dict[str, List[List[float]]] = Field(
-        ...,
-        description="Данные для построения эпюр",
+    diagram_data: Optional[Dict[str, List[List[float]]]] = Field(
+        None,
+        description="Данные для построения эпюр: shear (кН), moments (кН·м), "
+                    "slopes (рад), positions (прогибы, мм) (include=diagrams)",
         example={
+            "shear": [[0.0, 50.0], [2.5, -50.0], [5.0, -50.0]],
             "moments": [[0.0, 0.0], [2.5, 125.0], [5.0, 0.0]],
-            "positions": [[0.0, 0.0], [5.0, 0.0]]
+            "slopes": [[0.0, 0.0404], [2.5, 0.0], [5.0, -0.0404]],
+            "positions": [[0.0, 0.0], [2.5, 67.396], [5.0, 0.0]]
         }
     )
     
@@ -140,16 +467,92 @@ class BeamCalculationResponse(BaseModel):
                 "is_strength_sufficient": True,
                 "is_stiffness_sufficient": True,
                 "profile_properties": {
-                    "moment_of_inertia_ix_cm4": 1840.0,
-                    "moment_of_resistance_wx_cm3": 184.0
+                    "moment_of_inertia_ix_cm4": 1943.0,
+                    "moment_of_resistance_wx_cm3": 194.3
                 },
                 "report_sections": [
                     {"title": "Исходные данные", "content": "Длина: 5.0 м"},
                     {"title": "Результаты", "content": "Момент: 125.0 кН·м"}
                 ],
                 "diagram_data": {
+                    "shear": [[0.0, 50.0], [2.5, -50.0], [5.0, -50.0]],
                     "moments": [[0.0, 0.0], [2.5, 125.0], [5.0, 0.0]],
-                    "positions": [[0.0, 0.0], [5.0, 0.0]]
+                    "slopes": [[0.0, 0.0404], [2.5, 0.0], [5.0, -0.0404]],
+                    "positions": [[0.0, 0.0], [2.5, 67.396], [5.0, 0.0]]
                 }
             }
-        }
\ No newline at end of file
+        }
+
+class ResponseSelection(BaseModel):
+    """
+    Выбор частей ответа расчёта (параметры include= и fields=).
+    
+    Необязательные части (RESPONSE_SECTIONS) рассчитываются только
+    если они включены в include и не отброшены списком fields.
+    """
+    
+    sections: FrozenSet[str] = Field(
+        frozenset(RESPONSE_SECTIONS),
+        description="Рассчитываемые необязательные части ответа"
+    )
+    
+    fields: Optional[FrozenSet[str]] = Field(
+        None,
+        description="Поля ответа (None - все поля)"
+    )
+    
+    @classmethod
+    def parse(cls, include: Optional[str] = None, fields: Optional[str] = None) -> "ResponseSelection":
+        """
+        Разбор параметров запроса.
+        
+        Args:
+            include: Части ответа через запятую (None - все, "" или "none" - ни одной)
+            fields: Поля ответа через запятую (None - все)
+            
+        Raises:
+            ValueError: Если указана неизвестная часть или поле
+        """
+        sections = frozenset(RESPONSE_SECTIONS)
+        if include is not None:
+            sections = frozenset(_split(include)) - {"none"}
+            unknown = sections - RESPONSE_SECTIONS.keys()
+            if unknown:
+                raise ValueError(
+                    f"Неизвестные части ответа: {', '.join(sorted(unknown))}. "
+                    f"Доступны: {', '.join(RESPONSE_SECTIONS)}"
+                )
+        
+        selected = None
+        if fields is not None:
+            selected = frozenset(_split(fields))
+            unknown = selected - BeamCalculationResponse.model_fields.keys()
+            if unknown:
+                raise ValueError(f"Неизвестные поля ответа: {', '.join(sorted(unknown))}")
+            sections = frozenset(
+                name for name in sections if RESPONSE_SECTIONS[name] in selected
+            )
+        
+        return cls(sections=sections, fields=selected)
+    
+    @property
+    def is_default(self) -> bool:
+        """Полный ответ без отбора."""
+        return self.fields is None and self.sections == frozenset(RESPONSE_SECTIONS)
+    
+    def output_fields(self) -> FrozenSet[str]:
+        """Поля, попадающие в ответ."""
+        selected = self.fields or frozenset(BeamCalculationResponse.model_fields)
+        skipped = {field for name, field in RESPONSE_SECTIONS.items() if name not in self.sections}
+        return selected - skipped
+    
+    def cache_extra(self) -> Dict[str, List[str]]:
+        """Параметры отбора для ключа кэша (пусто для полного ответа)."""
+        if self.is_default:
+            return {}
+        return {"sections": sorted(self.sections), "fields": sorted(self.output_fields())}
+
+
+def _split(value: str) -> List[str]:
+    """Список непустых имён из строки через запятую."""
+    return [part.strip() for part in value.split(",") if part.strip()]
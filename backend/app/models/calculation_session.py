@@ -0,0 +1,54 @@
+"""
+Pydantic-схемы для сессий пересчёта балки.
+"""
+from typing import Any, Dict, List
+from pydantic import BaseModel, Field
+
+from app.models.beam_calculation import BeamCalculationResponse
+
+
+class CalculationSessionUpdate(BaseModel):
+    """Изменение параметров расчёта в сессии."""
+    
+    changes: Dict[str, Any] = Field(
+        ...,
+        description="Новые значения полей запроса расчёта (остальные поля не меняются)",
+        example={"force_position": 0.35},
+        min_length=1
+    )
+
+
+class CalculationSessionResponse(BaseModel):
+    """Состояние сессии с полным результатом расчёта."""
+    
+    session_id: str = Field(..., description="Идентификатор сессии", example="3f2b9c0d4e5a4b6c8d7e9f0a1b2c3d4e")
+    
+    version: int = Field(..., description="Номер версии параметров (0 - при создании)", example=0)
+    
+    sections: List[str] = Field(
+        ...,
+        description="Рассчитываемые необязательные части ответа",
+        example=["diagrams", "report"]
+    )
+    
+    result: BeamCalculationResponse = Field(..., description="Результат расчёта для текущих параметров")
+
+
+class CalculationSessionDelta(BaseModel):
+    """Изменения результата после обновления параметров сессии."""
+    
+    session_id: str = Field(..., description="Идентификатор сессии", example="3f2b9c0d4e5a4b6c8d7e9f0a1b2c3d4e")
+    
+    version: int = Field(..., description="Номер версии параметров после обновления", example=1)
+    
+    recomputed: List[str] = Field(
+        ...,
+        description="Пересчитанные этапы в порядке расчёта",
+        example=["load_case", "internal_forces", "reactions", "max_moment", "max_deflection"]
+    )
+    
+    changed: Dict[str, Any] = Field(
+        ...,
+        description="Изменившиеся поля результата (BeamCalculationResponse) с новыми значениями",
+        example={"reactions": {"R_a": 65.0, "R_b": 35.0}, "max_moment": 113.75}
+    )
@@ -0,0 +1,208 @@
+"""
+Pydantic-схемы для расчёта неразрезной многопролётной балки.
+"""
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, confloat, model_validator
+
+from app.models.beam_calculation import AppliedMoment, DistributedLoad, PointLoad
+
+
+# Наибольшее число пролётов неразрезной балки
+MAX_SPANS = 1000
+
+
+class ContinuousSpan(BaseModel):
+    """Пролёт неразрезной балки; координаты нагрузок - доли длины пролёта."""
+    
+    length: confloat(gt=0) = Field(
+        ...,
+        description="Длина пролёта, м",
+        example=6.0
+    )
+    
+    point_loads: List[PointLoad] = Field(
+        default_factory=list,
+        description="Постоянные сосредоточенные силы"
+    )
+    
+    distributed_loads: List[DistributedLoad] = Field(
+        default_factory=list,
+        description="Постоянные распределённые нагрузки"
+    )
+    
+    applied_moments: List[AppliedMoment] = Field(
+        default_factory=list,
+        description="Постоянные сосредоточенные моменты"
+    )
+    
+    live_load: confloat(ge=0) = Field(
+        0.0,
+        description="Временная равномерная нагрузка на весь пролёт, кН/м",
+        example=5.0
+    )
+
+
+class ContinuousBeamRequest(BaseModel):
+    """Модель запроса на расчёт неразрезной балки."""
+    
+    spans: List[ContinuousSpan] = Field(
+        ...,
+        description="Пролёты слева направо",
+        min_length=1,
+        max_length=MAX_SPANS
+    )
+    
+    left_end: Literal["pinned", "fixed"] = Field(
+        "pinned",
+        description="Крайняя левая опора: шарнир или заделка",
+        example="pinned"
+    )
+    
+    right_end: Literal["pinned", "fixed"] = Field(
+        "pinned",
+        description="Крайняя правая опора: шарнир или заделка",
+        example="pinned"
+    )
+    
+    profile_name: str = Field(
+        ...,
+        description="Наименование стального профиля",
+        example="I-beam_30B1",
+        min_length=1
+    )
+    
+    pattern_loading: bool = Field(
+        True,
+        description="Огибающие по всем расстановкам временной нагрузки по пролётам "
+                    "(иначе временная нагрузка во всех пролётах сразу)",
+        example=True
+    )
+    
+    diagram_points: int = Field(
+        51,
+        description="Число сечений в каждом пролёте (плюс точки приложения нагрузок)",
+        example=51,
+        ge=2,
+        le=1001
+    )
+    
+    steel_grade: Optional[str] = Field(
+        None,
+        description="Ключ марки стали (None - расчётное сопротивление из настроек)",
+        example="C255"
+    )
+    
+    @model_validator(mode="after")
+    def _check_loads(self):
+        loaded = any(
+            span.point_loads or span.distributed_loads or span.applied_moments or span.live_load
+            for span in self.spans
+        )
+        if not loaded:
+            raise ValueError("Не задано ни одной нагрузки")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "spans": [
+                    {"length": 6.0, "distributed_loads": [{"q_start": 10.0}], "live_load": 5.0},
+                    {"length": 6.0, "distributed_loads": [{"q_start": 10.0}], "live_load": 5.0},
+                    {"length": 4.5, "point_loads": [{"force": 40.0, "position": 0.5}]}
+                ],
+                "left_end": "pinned",
+                "right_end": "pinned",
+                "profile_name": "I-beam_30B1",
+                "pattern_loading": True,
+                "diagram_points": 51,
+                "steel_grade": "C245"
+            }
+        }
+
+
+class ContinuousSpanResult(BaseModel):
+    """Результаты по пролёту (огибающие по расстановкам временной нагрузки)."""
+    
+    length: float = Field(..., description="Длина пролёта, м", example=6.0)
+    
+    max_moment: float = Field(
+        ...,
+        description="Наибольший момент в пролёте (растянуты нижние волокна), кН·м",
+        example=38.4
+    )
+    
+    min_moment: float = Field(
+        ...,
+        description="Наименьший момент в пролёте (отрицательный - растянуты верхние волокна), кН·м",
+        example=-56.25
+    )
+    
+    max_deflection: float = Field(
+        ...,
+        description="Наибольший по модулю прогиб в пролёте, мм",
+        example=4.1
+    )
+    
+    is_stiffness_sufficient: bool = Field(
+        ...,
+        description="Вердикт по жёсткости (прогиб не более доли длины пролёта)",
+        example=True
+    )
+
+
+class ContinuousBeamResponse(BaseModel):
+    """Модель ответа расчёта неразрезной балки."""
+    
+    support_moments: List[float] = Field(
+        ...,
+        description="Опорные моменты при временной нагрузке во всех пролётах, кН·м "
+                    "(по опорам слева направо; отрицательные - растянуты верхние волокна)",
+        example=[0.0, -56.25, 0.0]
+    )
+    
+    reactions: List[float] = Field(
+        ...,
+        description="Реакции опор при временной нагрузке во всех пролётах, кН (вверх положительны)",
+        example=[33.75, 112.5, 33.75]
+    )
+    
+    spans: List[ContinuousSpanResult] = Field(
+        ...,
+        description="Результаты по пролётам"
+    )
+    
+    envelopes: Dict[str, List[List[float]]] = Field(
+        ...,
+        description="Огибающие по длине балки: moment_max/min (кН·м), "
+                    "shear_max/min (кН), deflection_max/min (мм)"
+    )
+    
+    max_moment: float = Field(
+        ...,
+        description="Максимальный по модулю изгибающий момент, кН·м",
+        example=56.25
+    )
+    
+    max_deflection: float = Field(
+        ...,
+        description="Максимальный по модулю прогиб, мм",
+        example=4.1
+    )
+    
+    max_stress: float = Field(
+        ...,
+        description="Максимальное нормальное напряжение (σ_max), МПа",
+        example=118.92
+    )
+    
+    is_strength_sufficient: bool = Field(
+        ...,
+        description="Вердикт по прочности",
+        example=True
+    )
+    
+    is_stiffness_sufficient: bool = Field(
+        ...,
+        description="Вердикт по жёсткости (во всех пролётах)",
+        example=True
+    )
@@ -0,0 +1,90 @@
+"""
+Pydantic-схемы для фоновых заданий (длительные расчёты).
+"""
+from datetime import datetime
+from typing import Annotated, Any, List, Literal, Optional, Union
+from pydantic import BaseModel, Field
+
+from app.models.beam_calculation import BeamLoadCase
+from app.models.reliability import ReliabilityRequest
+from app.models.sweep import SweepRequest
+
+
+# Состояния задания; завершённые состояния не меняются
+JobState = Literal["queued", "running", "completed", "failed", "cancelled"]
+FINISHED_STATES = ("completed", "failed", "cancelled")
+
+
+class SweepJob(BaseModel):
+    """Параметрический перебор: строка результата на комбинацию."""
+    
+    kind: Literal["sweep"] = "sweep"
+    request: SweepRequest
+
+
+class ReliabilityJob(BaseModel):
+    """Расчёт надёжности: одна строка результата (ReliabilityResponse)."""
+    
+    kind: Literal["reliability"] = "reliability"
+    request: ReliabilityRequest
+
+
+class CatalogCheckJob(BaseModel):
+    """Проверка схемы со всеми профилями каталога: строка на профиль."""
+    
+    kind: Literal["catalog_check"] = "catalog_check"
+    request: BeamLoadCase
+
+
+JobRequest = Annotated[
+    Union[SweepJob, ReliabilityJob, CatalogCheckJob],
+    Field(discriminator="kind")
+]
+
+
+class JobStatus(BaseModel):
+    """Состояние и ход выполнения задания."""
+    
+    id: str = Field(..., description="Идентификатор задания", example="9f1c2e6b0d3a4c5e8f7a6b5c4d3e2f1a")
+    
+    kind: str = Field(..., description="Вид задания", example="sweep")
+    
+    state: JobState = Field(..., description="Состояние задания", example="running")
+    
+    done: int = Field(..., description="Выполнено единиц работы", example=40_000)
+    
+    total: Optional[int] = Field(
+        None,
+        description="Всего единиц работы (комбинации, испытания, профили); None - ещё не известно",
+        example=100_000
+    )
+    
+    progress: float = Field(..., description="Доля выполненной работы, 0..1", example=0.4)
+    
+    rows: int = Field(..., description="Число записанных строк результата", example=40_000)
+    
+    error: Optional[str] = Field(None, description="Текст ошибки для state='failed'")
+    
+    created_at: datetime = Field(..., description="Время постановки в очередь")
+    
+    started_at: Optional[datetime] = Field(None, description="Время первого запуска")
+    
+    finished_at: Optional[datetime] = Field(None, description="Время завершения")
+
+
+class JobResultsPage(BaseModel):
+    """Страница строк результата задания."""
+    
+    job_id: str = Field(..., description="Идентификатор задания")
+    
+    state: JobState = Field(..., description="Состояние задания на момент чтения")
+    
+    offset: int = Field(..., description="Номер первой строки страницы", example=0)
+    
+    rows: List[Any] = Field(..., description="Строки результата")
+    
+    next_offset: Optional[int] = Field(
+        None,
+        description="Номер строки следующей страницы; None - записанные строки закончились",
+        example=1000
+    )
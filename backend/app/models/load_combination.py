@@ -0,0 +1,270 @@
+"""
+Pydantic-схемы для расчёта балки на сочетания нагрузок.
+"""
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, confloat, model_validator
+
+from app.models.beam_calculation import AppliedMoment, BeamLoadCase, DistributedLoad, PointLoad, Support
+
+
+# Наибольшее число загружений и сочетаний в одном запросе
+MAX_LOAD_CASES = 50
+MAX_COMBINATIONS = 10_000
+
+# Вид нагрузки: permanent - постоянная, остальные - временные
+LoadCategory = Literal["permanent", "live", "snow", "wind", "other"]
+
+# Коэффициенты надёжности по нагрузке по умолчанию
+DEFAULT_PARTIAL_FACTORS = {"permanent": 1.1, "live": 1.2, "snow": 1.4, "wind": 1.4, "other": 1.2}
+
+# Коэффициенты сочетаний для сопутствующих временных нагрузок по умолчанию
+DEFAULT_COMPANION_FACTOR = 0.9
+
+# Коэффициент надёжности постоянной нагрузки, уменьшающей усилия, по умолчанию
+DEFAULT_FAVOURABLE_FACTOR = 0.9
+
+# Предельное состояние: uls - по прочности, sls - по жёсткости
+LimitState = Literal["uls", "sls"]
+
+
+class BasicLoadCase(BaseModel):
+    """Основное загружение: нагрузки одного вида с нормативными значениями."""
+    
+    name: str = Field(
+        ...,
+        description="Уникальное имя загружения",
+        example="snow",
+        min_length=1
+    )
+    
+    category: LoadCategory = Field(
+        ...,
+        description="Вид нагрузки (permanent - постоянная)",
+        example="snow"
+    )
+    
+    point_loads: List[PointLoad] = Field(
+        default_factory=list,
+        description="Сосредоточенные силы"
+    )
+    
+    distributed_loads: List[DistributedLoad] = Field(
+        default_factory=list,
+        description="Распределённые нагрузки"
+    )
+    
+    applied_moments: List[AppliedMoment] = Field(
+        default_factory=list,
+        description="Сосредоточенные моменты"
+    )
+    
+    partial_factor: Optional[confloat(gt=0)] = Field(
+        None,
+        description="Коэффициент надёжности по нагрузке γf (None - по виду нагрузки)",
+        example=1.4
+    )
+    
+    companion_factor: confloat(ge=0, le=1) = Field(
+        DEFAULT_COMPANION_FACTOR,
+        description="Коэффициент сочетаний ψ временной нагрузки, когда она не основная",
+        example=0.9
+    )
+    
+    favourable_factor: confloat(gt=0) = Field(
+        DEFAULT_FAVOURABLE_FACTOR,
+        description="Коэффициент надёжности постоянной нагрузки, уменьшающей усилия",
+        example=0.9
+    )
+    
+    @model_validator(mode="after")
+    def _check_loads(self):
+        if not (self.point_loads or self.distributed_loads or self.applied_moments):
+            raise ValueError(f"В загружении '{self.name}' нет нагрузок")
+        return self
+    
+    @property
+    def design_factor(self) -> float:
+        """Коэффициент γf с учётом значения по умолчанию для вида нагрузки."""
+        if self.partial_factor is not None:
+            return self.partial_factor
+        return DEFAULT_PARTIAL_FACTORS[self.category]
+
+
+class LoadCombination(BaseModel):
+    """Сочетание: коэффициенты к нормативным значениям загружений."""
+    
+    name: str = Field(
+        ...,
+        description="Имя сочетания",
+        example="1.1·dead + 1.4·snow + 0.84·wind"
+    )
+    
+    limit_state: LimitState = Field(
+        ...,
+        description="Предельное состояние: uls - прочность, sls - жёсткость",
+        example="uls"
+    )
+    
+    factors: Dict[str, float] = Field(
+        ...,
+        description="Коэффициенты по именам загружений (не указанные - 0)",
+        example={"dead": 1.1, "snow": 1.4, "wind": 0.84}
+    )
+
+
+class LoadCombinationRequest(BaseModel):
+    """Модель запроса на расчёт балки на сочетания нагрузок."""
+    
+    length: confloat(gt=0) = Field(
+        ...,
+        description="Длина пролёта (L), м",
+        example=6.0
+    )
+    
+    support_type: Literal["hinged", "cantilever", "fixed", "custom"] = Field(
+        ...,
+        description="Тип опор балки (custom - опоры из списка supports)",
+        example="hinged"
+    )
+    
+    supports: List[Support] = Field(
+        default_factory=list,
+        description="Опоры в произвольных сечениях (только для support_type='custom')"
+    )
+    
+    profile_name: str = Field(
+        ...,
+        description="Наименование стального профиля",
+        example="I-beam_30B1",
+        min_length=1
+    )
+    
+    steel_grade: Optional[str] = Field(
+        None,
+        description="Ключ марки стали (None - расчётное сопротивление из настроек)",
+        example="C255"
+    )
+    
+    load_cases: List[BasicLoadCase] = Field(
+        ...,
+        description="Основные загружения (нормативные значения)",
+        min_length=1,
+        max_length=MAX_LOAD_CASES
+    )
+    
+    combinations: List[LoadCombination] = Field(
+        default_factory=list,
+        description="Сочетания; пустой список - сочетания строятся по видам нагрузок "
+                    "и коэффициентам загружений",
+        max_length=MAX_COMBINATIONS
+    )
+    
+    include_results: bool = Field(
+        True,
+        description="Возвращать результаты по всем сочетаниям (иначе - только определяющие)",
+        example=True
+    )
+    
+    @model_validator(mode="after")
+    def _check_cases(self):
+        names = [case.name for case in self.load_cases]
+        if len(set(names)) != len(names):
+            raise ValueError("Имена загружений должны быть уникальными")
+        for combination in self.combinations:
+            unknown = set(combination.factors) - set(names)
+            if unknown:
+                raise ValueError(f"Сочетание '{combination.name}' ссылается на неизвестные "
+                                 f"загружения: {', '.join(sorted(unknown))}")
+        # Проверка схемы опор - та же, что у обычного расчёта
+        self.beam_load_case(self.load_cases[0])
+        return self
+    
+    def beam_load_case(self, case: BasicLoadCase) -> BeamLoadCase:
+        """Расчётная схема одного загружения (нормативные нагрузки)."""
+        return BeamLoadCase(
+            length=self.length,
+            support_type=self.support_type,
+            supports=self.supports,
+            point_loads=case.point_loads,
+            distributed_loads=case.distributed_loads,
+            applied_moments=case.applied_moments,
+            steel_grade=self.steel_grade
+        )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "length": 6.0,
+                "support_type": "hinged",
+                "profile_name": "I-beam_30B1",
+                "load_cases": [
+                    {"name": "dead", "category": "permanent", "distributed_loads": [{"q_start": 4.0}]},
+                    {"name": "snow", "category": "snow", "distributed_loads": [{"q_start": 6.0}]},
+                    {"name": "hoist", "category": "live", "point_loads": [{"force": 20.0, "position": 0.3}]}
+                ],
+                "combinations": []
+            }
+        }
+
+
+class CombinationResult(BaseModel):
+    """Результаты расчёта на одно сочетание."""
+    
+    name: str = Field(..., description="Имя сочетания")
+    
+    limit_state: LimitState = Field(..., description="Предельное состояние", example="uls")
+    
+    factors: Dict[str, float] = Field(..., description="Коэффициенты по загружениям")
+    
+    reactions: Dict[str, float] = Field(..., description="Реакции опор, кН и кН·м")
+    
+    max_moment: float = Field(..., description="Максимальный по модулю момент, кН·м", example=54.3)
+    
+    max_deflection: float = Field(..., description="Максимальный по модулю прогиб, мм", example=14.2)
+    
+    max_stress: float = Field(..., description="Максимальное нормальное напряжение, МПа", example=114.6)
+    
+    is_strength_sufficient: Optional[bool] = Field(
+        None,
+        description="Вердикт по прочности (только для uls)"
+    )
+    
+    is_stiffness_sufficient: Optional[bool] = Field(
+        None,
+        description="Вердикт по жёсткости (только для sls)"
+    )
+
+
+class LoadCombinationResponse(BaseModel):
+    """Модель ответа расчёта на сочетания нагрузок."""
+    
+    load_cases: List[str] = Field(..., description="Имена загружений в порядке запроса")
+    
+    combinations: int = Field(..., description="Число рассчитанных сочетаний", example=14)
+    
+    design_strength: float = Field(..., description="Расчётное сопротивление стали Ry, МПа", example=240.0)
+    
+    governing_strength: Optional[CombinationResult] = Field(
+        None,
+        description="Определяющее сочетание по прочности (наибольший момент среди uls)"
+    )
+    
+    governing_stiffness: Optional[CombinationResult] = Field(
+        None,
+        description="Определяющее сочетание по жёсткости (наибольший прогиб среди sls)"
+    )
+    
+    is_strength_sufficient: Optional[bool] = Field(
+        None,
+        description="Прочность обеспечена при всех сочетаниях uls (None - сочетаний uls нет)"
+    )
+    
+    is_stiffness_sufficient: Optional[bool] = Field(
+        None,
+        description="Жёсткость обеспечена при всех сочетаниях sls (None - сочетаний sls нет)"
+    )
+    
+    results: Optional[List[CombinationResult]] = Field(
+        None,
+        description="Результаты по всем сочетаниям в порядке расчёта"
+    )
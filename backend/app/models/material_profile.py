@@ -1,6 +1,7 @@
 """
 Pydantic-схемы для стальных профилей.
 """
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -28,14 +29,14 @@ class MaterialProfile(BaseModel):
     moment_of_inertia_ix_cm4: float = Field(
         ...,
         description="Момент инерции Ix, см⁴",
-        example=1840.0,
+        example=1943.0,
         gt=0
     )
     
     moment_of_resistance_wx_cm3: float = Field(
         ...,
         description="Момент сопротивления Wx, см³",
-        example=184.0,
+        example=194.3,
         gt=0
     )
     
@@ -56,7 +57,7 @@ class MaterialProfile(BaseModel):
     mass_kg_m: float = Field(
         ...,
         description="Масса 1 м, кг",
-        example=22.7,
+        example=22.4,
         gt=0
     )
     
@@ -66,11 +67,11 @@ class MaterialProfile(BaseModel):
                 "name": "Двутавр 20Б1",
                 "standard": "ГОСТ 26020-83",
                 "key": "I-beam_20B1",
-                "moment_of_inertia_ix_cm4": 1840.0,
-                "moment_of_resistance_wx_cm3": 184.0,
+                "moment_of_inertia_ix_cm4": 1943.0,
+                "moment_of_resistance_wx_cm3": 194.3,
                 "height_mm": 200.0,
                 "width_mm": 100.0,
-                "mass_kg_m": 22.7
+                "mass_kg_m": 22.4
             }
         }
 
@@ -81,4 +82,68 @@ class MaterialProfileList(BaseModel):
     profiles: list[MaterialProfile] = Field(
         ...,
         description="Список доступных профилей"
+    )
+    
+    total: Optional[int] = Field(
+        None,
+        description="Общее количество профилей, удовлетворяющих фильтрам",
+        example=7
+    )
+    
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Курсор следующей страницы (None - страниц больше нет)"
+    )
+
+
+ProfileSortField = Literal[
+    "name",
+    "height_mm",
+    "moment_of_inertia_ix_cm4",
+    "moment_of_resistance_wx_cm3",
+    "mass_kg_m",
+]
+
+
+class ProfileQuery(BaseModel):
+    """Параметры фильтрации, сортировки и постраничного вывода профилей."""
+    
+    name: Optional[str] = Field(
+        None,
+        description="Начала слов наименования (например, '20б' или 'двут 30')"
+    )
+    
+    standard: Optional[str] = Field(
+        None,
+        description="Стандарт (ГОСТ), без учёта регистра"
+    )
+    
+    min_wx: Optional[float] = Field(None, description="Минимальный Wx, см³")
+    max_wx: Optional[float] = Field(None, description="Максимальный Wx, см³")
+    min_ix: Optional[float] = Field(None, description="Минимальный Ix, см⁴")
+    max_ix: Optional[float] = Field(None, description="Максимальный Ix, см⁴")
+    min_height: Optional[float] = Field(None, description="Минимальная высота, мм")
+    max_height: Optional[float] = Field(None, description="Максимальная высота, мм")
+    min_mass: Optional[float] = Field(None, description="Минимальная масса 1 м, кг")
+    max_mass: Optional[float] = Field(None, description="Максимальная масса 1 м, кг")
+    
+    sort: Optional[ProfileSortField] = Field(
+        None,
+        description="Поле сортировки (по умолчанию - порядок каталога)"
+    )
+    
+    order: Literal["asc", "desc"] = Field(
+        "asc",
+        description="Направление сортировки"
+    )
+    
+    limit: Optional[int] = Field(
+        None,
+        description="Размер страницы (по умолчанию - все профили)",
+        gt=0
+    )
+    
+    cursor: Optional[str] = Field(
+        None,
+        description="Курсор, полученный в next_cursor предыдущей страницы"
     )
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Pydantic-схемы для расчёта балки на подвижную нагрузку.
+"""
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, confloat, model_validator
+
+
+class MovingLoadRequest(BaseModel):
+    """Модель запроса на построение линий влияния и огибающих."""
+    
+    length: confloat(gt=0) = Field(
+        ...,
+        description="Длина пролёта (L), м",
+        example=6.0
+    )
+    
+    support_type: Literal["hinged", "cantilever", "fixed"] = Field(
+        ...,
+        description="Тип опор балки",
+        example="hinged"
+    )
+    
+    profile_name: str = Field(
+        ...,
+        description="Наименование стального профиля",
+        example="I-beam_30B1",
+        min_length=1
+    )
+    
+    axle_loads: List[confloat(gt=0)] = Field(
+        ...,
+        description="Нагрузки на оси, кН (первая - головная ось)",
+        example=[60.0, 60.0],
+        min_length=1,
+        max_length=50
+    )
+    
+    axle_spacings: List[confloat(gt=0)] = Field(
+        default_factory=list,
+        description="Расстояния между соседними осями, м (на одно меньше числа осей)",
+        example=[1.5]
+    )
+    
+    positions: int = Field(
+        201,
+        description="Число положений головной оси",
+        example=201,
+        ge=2,
+        le=2001
+    )
+    
+    sections: int = Field(
+        201,
+        description="Число расчётных сечений для огибающих",
+        example=201,
+        ge=2,
+        le=2001
+    )
+    
+    influence_section: confloat(ge=0, le=1) = Field(
+        0.5,
+        description="Сечение для линий влияния момента и прогиба (доля от длины)",
+        example=0.5
+    )
+    
+    steel_grade: Optional[str] = Field(
+        None,
+        description="Ключ марки стали (None - расчётное сопротивление из настроек)",
+        example="C255"
+    )
+    
+    @model_validator(mode="after")
+    def _check_spacings(self):
+        if len(self.axle_spacings) != len(self.axle_loads) - 1:
+            raise ValueError("Число расстояний между осями должно быть на одно меньше числа осей")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "length": 6.0,
+                "support_type": "hinged",
+                "profile_name": "I-beam_30B1",
+                "axle_loads": [60.0, 60.0],
+                "axle_spacings": [1.5],
+                "positions": 201,
+                "sections": 201,
+                "influence_section": 0.5,
+                "steel_grade": "C245"
+            }
+        }
+
+
+class MovingLoadResponse(BaseModel):
+    """Модель ответа с линиями влияния, огибающими и критическими значениями."""
+    
+    influence_lines: Dict[str, List[List[float]]] = Field(
+        ...,
+        description="Линии влияния от силы 1 кН: реакции (кН), "
+                    "moment (кН·м) и deflection (мм) в сечении influence_section"
+    )
+    
+    envelopes: Dict[str, List[List[float]]] = Field(
+        ...,
+        description="Огибающие по сечениям: moment_max/min (кН·м), "
+                    "shear_max/min (кН), deflection_max/min (мм)"
+    )
+    
+    governing_position_moment: float = Field(
+        ...,
+        description="Положение головной оси при максимальном моменте, м",
+        example=3.375
+    )
+    
+    governing_position_deflection: float = Field(
+        ...,
+        description="Положение головной оси при максимальном прогибе, м",
+        example=3.75
+    )
+    
+    critical_section: float = Field(
+        ...,
+        description="Сечение максимального момента, м",
+        example=3.375
+    )
+    
+    max_moment: float = Field(
+        ...,
+        description="Максимальный изгибающий момент (M_max), кН·м",
+        example=137.81
+    )
+    
+    max_deflection: float = Field(
+        ...,
+        description="Максимальный прогиб (f_max), мм",
+        example=37.14
+    )
+    
+    max_stress: float = Field(
+        ...,
+        description="Максимальное нормальное напряжение (σ_max), МПа",
+        example=322.74
+    )
+    
+    is_strength_sufficient: bool = Field(
+        ...,
+        description="Вердикт по прочности",
+        example=False
+    )
+    
+    is_stiffness_sufficient: bool = Field(
+        ...,
+        description="Вердикт по жёсткости",
+        example=False
+    )
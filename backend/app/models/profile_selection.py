@@ -0,0 +1,85 @@
+"""
+Pydantic-схемы для подбора сечения балки.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from app.models.beam_calculation import BeamLoadCase
+from app.models.material_profile import MaterialProfile
+
+
+class ProfileSelectionRequest(BeamLoadCase):
+    """Модель запроса на подбор профиля по прочности и жёсткости."""
+    
+    alternatives: int = Field(
+        3,
+        description="Количество альтернативных профилей в ответе",
+        example=3,
+        ge=0,
+        le=50
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "length": 5.0,
+                "support_type": "hinged",
+                "force": 100.0,
+                "force_position": 0.5,
+                "alternatives": 3
+            }
+        }
+
+
+class ProfileSelectionCandidate(BaseModel):
+    """Профиль, удовлетворяющий проверкам, с результатами расчёта."""
+    
+    profile: MaterialProfile = Field(
+        ...,
+        description="Данные профиля"
+    )
+    
+    max_stress: float = Field(
+        ...,
+        description="Максимальное нормальное напряжение (σ_max), МПа",
+        example=150.0
+    )
+    
+    max_deflection: float = Field(
+        ...,
+        description="Максимальный прогиб (f_max), мм",
+        example=12.5
+    )
+
+
+class ProfileSelectionResponse(BaseModel):
+    """Модель ответа с результатами подбора профиля."""
+    
+    max_moment: float = Field(
+        ...,
+        description="Максимальный изгибающий момент (M_max), кН·м; при упругих "
+                    "опорах зависит от профиля - для лучшего (или последнего проверенного) профиля",
+        example=125.0
+    )
+    
+    required_wx_cm3: Optional[float] = Field(
+        ...,
+        description="Требуемый момент сопротивления Wx, см³ (None при упругих опорах)",
+        example=520.8
+    )
+    
+    required_ix_cm4: Optional[float] = Field(
+        ...,
+        description="Требуемый момент инерции Ix, см⁴ (None при упругих опорах)",
+        example=6201.0
+    )
+    
+    best: Optional[ProfileSelectionCandidate] = Field(
+        None,
+        description="Самый лёгкий подходящий профиль (None, если такого нет)"
+    )
+    
+    alternatives: List[ProfileSelectionCandidate] = Field(
+        default_factory=list,
+        description="Следующие по массе подходящие профили"
+    )
@@ -0,0 +1,237 @@
+"""
+Pydantic-схемы для вероятностного расчёта надёжности балки (метод Монте-Карло).
+"""
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, confloat, model_validator
+
+
+# Наибольшее число испытаний Монте-Карло в одном расчёте
+MAX_SAMPLES = 100_000_000
+
+
+class Distribution(BaseModel):
+    """
+    Распределение случайной величины.
+    
+    Для normal и lognormal задаются среднее и стандартное отклонение
+    самой величины, для uniform - границы, для deterministic - значение mean.
+    """
+    
+    type: Literal["deterministic", "normal", "lognormal", "uniform"] = Field(
+        "normal",
+        description="Вид распределения",
+        example="lognormal"
+    )
+    
+    mean: Optional[float] = Field(
+        None,
+        description="Среднее значение (deterministic, normal, lognormal)",
+        example=80.0
+    )
+    
+    std: confloat(ge=0) = Field(
+        0.0,
+        description="Стандартное отклонение (normal, lognormal)",
+        example=12.0
+    )
+    
+    low: Optional[float] = Field(
+        None,
+        description="Нижняя граница (uniform)",
+        example=None
+    )
+    
+    high: Optional[float] = Field(
+        None,
+        description="Верхняя граница (uniform)",
+        example=None
+    )
+    
+    @model_validator(mode="after")
+    def _check_parameters(self):
+        if self.type == "uniform":
+            if self.low is None or self.high is None or self.high <= self.low:
+                raise ValueError("Для равномерного распределения нужны границы low < high")
+        elif self.mean is None:
+            raise ValueError(f"Для распределения '{self.type}' нужно среднее значение mean")
+        elif self.type == "lognormal" and self.mean <= 0:
+            raise ValueError("Среднее логнормального распределения должно быть положительным")
+        return self
+
+
+class ReliabilityRequest(BaseModel):
+    """
+    Модель запроса на расчёт вероятности отказа балки.
+    
+    Необязательные распределения по умолчанию детерминированы:
+    модуль упругости стали, расчётное сопротивление марки steel_grade
+    (без марки - ALLOWABLE_STRESS) и номинальные характеристики профиля
+    (множитель 1).
+    """
+    
+    length: confloat(gt=0) = Field(
+        ...,
+        description="Длина пролёта (L), м",
+        example=6.0
+    )
+    
+    support_type: Literal["hinged", "cantilever", "fixed"] = Field(
+        ...,
+        description="Тип опор балки",
+        example="hinged"
+    )
+    
+    profile_name: str = Field(
+        ...,
+        description="Наименование стального профиля",
+        example="I-beam_30B1",
+        min_length=1
+    )
+    
+    force: Distribution = Field(
+        ...,
+        description="Сосредоточенная сила, кН"
+    )
+    
+    force_position: Distribution = Field(
+        ...,
+        description="Координата приложения силы (доля от длины; выборка ограничивается 0..1)"
+    )
+    
+    elastic_modulus: Optional[Distribution] = Field(
+        None,
+        description="Модуль упругости, ГПа"
+    )
+    
+    yield_strength: Optional[Distribution] = Field(
+        None,
+        description="Предел текучести (сопротивление), МПа"
+    )
+    
+    steel_grade: Optional[str] = Field(
+        None,
+        description="Ключ марки стали: сопротивление, если yield_strength не задан "
+                    "(None - расчётное сопротивление из настроек)",
+        example="C255"
+    )
+    
+    moment_of_inertia_factor: Optional[Distribution] = Field(
+        None,
+        description="Множитель к моменту инерции профиля Ix"
+    )
+    
+    moment_of_resistance_factor: Optional[Distribution] = Field(
+        None,
+        description="Множитель к моменту сопротивления профиля Wx"
+    )
+    
+    samples: int = Field(
+        1_000_000,
+        description="Число испытаний",
+        example=1_000_000,
+        ge=1,
+        le=MAX_SAMPLES
+    )
+    
+    chunk_size: int = Field(
+        100_000,
+        description="Число испытаний в одном векторном блоке (ограничивает память)",
+        example=100_000,
+        ge=1,
+        le=1_000_000
+    )
+    
+    seed: Optional[int] = Field(
+        None,
+        description="Зерно генератора; None - случайное (возвращается в ответе)",
+        example=42,
+        ge=0
+    )
+    
+    workers: int = Field(
+        1,
+        description="Число процессов для параллельного расчёта блоков",
+        example=1,
+        ge=1,
+        le=64
+    )
+    
+    confidence: confloat(gt=0, lt=1) = Field(
+        0.95,
+        description="Доверительная вероятность интервалов",
+        example=0.95
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "length": 6.0,
+                "support_type": "hinged",
+                "profile_name": "I-beam_30B1",
+                "force": {"type": "lognormal", "mean": 80.0, "std": 12.0},
+                "force_position": {"type": "uniform", "low": 0.3, "high": 0.7},
+                "elastic_modulus": {"type": "normal", "mean": 210.0, "std": 6.3},
+                "yield_strength": {"type": "lognormal", "mean": 275.0, "std": 19.0},
+                "samples": 1_000_000,
+                "seed": 42
+            }
+        }
+
+
+class FailureEstimate(BaseModel):
+    """Оценка вероятности отказа по одному предельному состоянию."""
+    
+    failures: int = Field(..., description="Число испытаний с отказом", example=1234)
+    
+    probability: float = Field(
+        ...,
+        description="Оценка вероятности отказа",
+        example=0.001234
+    )
+    
+    confidence_low: float = Field(
+        ...,
+        description="Нижняя граница доверительного интервала (Уилсона)",
+        example=0.001166
+    )
+    
+    confidence_high: float = Field(
+        ...,
+        description="Верхняя граница доверительного интервала (Уилсона)",
+        example=0.001306
+    )
+    
+    reliability_index: Optional[float] = Field(
+        None,
+        description="Индекс надёжности β = -Φ⁻¹(P); None при P = 0 или P = 1",
+        example=3.029
+    )
+
+
+class ReliabilityResponse(BaseModel):
+    """Модель ответа расчёта надёжности."""
+    
+    samples: int = Field(..., description="Число испытаний", example=1_000_000)
+    
+    seed: int = Field(
+        ...,
+        description="Зерно генератора (повторный запрос с ним даёт тот же результат)",
+        example=42
+    )
+    
+    confidence: float = Field(..., description="Доверительная вероятность", example=0.95)
+    
+    strength: FailureEstimate = Field(
+        ...,
+        description="Отказ по прочности: σ_max больше предела текучести"
+    )
+    
+    stiffness: FailureEstimate = Field(
+        ...,
+        description="Отказ по жёсткости: прогиб больше допустимого"
+    )
+    
+    combined: FailureEstimate = Field(
+        ...,
+        description="Отказ хотя бы по одному предельному состоянию"
+    )
@@ -0,0 +1,79 @@
+"""
+Pydantic-схемы для марок стали и таблицы несущей способности.
+"""
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class SteelGrade(BaseModel):
+    """Марка стали с расчётным сопротивлением."""
+    
+    key: str = Field(
+        ...,
+        description="Уникальный ключ марки",
+        example="C255"
+    )
+    
+    name: str = Field(
+        ...,
+        description="Наименование марки",
+        example="С255"
+    )
+    
+    standard: str = Field(
+        ...,
+        description="Стандарт (ГОСТ)",
+        example="ГОСТ 27772-2015"
+    )
+    
+    yield_strength_mpa: float = Field(
+        ...,
+        description="Нормативное сопротивление по пределу текучести Ryn, МПа",
+        example=255.0,
+        gt=0
+    )
+    
+    design_strength_mpa: float = Field(
+        ...,
+        description="Расчётное сопротивление по пределу текучести Ry, МПа",
+        example=250.0,
+        gt=0
+    )
+
+
+class SteelGradeList(BaseModel):
+    """Марки стали каталога."""
+    
+    grades: List[SteelGrade] = Field(..., description="Марки в порядке каталога")
+
+
+class CapacityPair(BaseModel):
+    """Пара «марка стали × профиль» из таблицы несущей способности."""
+    
+    steel_grade: str = Field(..., description="Ключ марки стали", example="C255")
+    
+    profile_name: str = Field(..., description="Ключ профиля", example="I-beam_20B1")
+    
+    allowable_moment: float = Field(
+        ...,
+        description="Предельный изгибающий момент M = Ry·Wx, кН·м",
+        example=46.0
+    )
+    
+    stiffness: float = Field(..., description="Изгибная жёсткость EI, кН·м²", example=3864.0)
+    
+    mass_kg_m: float = Field(..., description="Масса 1 м профиля, кг", example=22.4)
+
+
+class CapacityQueryResponse(BaseModel):
+    """Пары «марка × профиль», воспринимающие заданный момент."""
+    
+    moment: float = Field(..., description="Требуемый момент, кН·м", example=40.0)
+    
+    total: int = Field(..., description="Число подходящих пар (без учёта limit)", example=120)
+    
+    pairs: List[CapacityPair] = Field(
+        ...,
+        description="Подходящие пары по возрастанию предельного момента "
+                    "(первой идёт пара с наименьшим запасом)"
+    )
@@ -0,0 +1,107 @@
+"""
+Pydantic-схемы для параметрического перебора расчётных схем.
+"""
+from typing import List, Literal, Optional, Union
+from pydantic import BaseModel, Field, model_validator
+
+
+class SweepRange(BaseModel):
+    """Равномерный диапазон значений (как numpy.linspace)."""
+    
+    start: float = Field(..., description="Начальное значение", example=3.0)
+    stop: float = Field(..., description="Конечное значение (включительно)", example=12.0)
+    num: int = Field(..., description="Число значений", example=10, ge=1, le=1_000_000)
+    
+    def values(self) -> List[float]:
+        """Значения диапазона."""
+        if self.num == 1:
+            return [self.start]
+        step = (self.stop - self.start) / (self.num - 1)
+        return [self.start + i * step for i in range(self.num - 1)] + [self.stop]
+
+
+SweepAxis = Union[SweepRange, List[float]]
+
+
+class SweepRequest(BaseModel):
+    """
+    Модель запроса на перебор декартова произведения параметров.
+    
+    Каждый числовой параметр задаётся списком значений или диапазоном.
+    Порядок результатов - лексикографический по осям в порядке полей
+    (последним меняется профиль).
+    """
+    
+    length: SweepAxis = Field(
+        ...,
+        description="Длины пролётов, м",
+        example={"start": 3.0, "stop": 12.0, "num": 10}
+    )
+    
+    force: SweepAxis = Field(
+        ...,
+        description="Сосредоточенные силы, кН",
+        example=[50.0, 100.0]
+    )
+    
+    force_position: SweepAxis = Field(
+        ...,
+        description="Координаты приложения силы (доли от длины, 0..1)",
+        example={"start": 0.0, "stop": 1.0, "num": 5}
+    )
+    
+    support_types: List[Literal["hinged", "cantilever", "fixed"]] = Field(
+        ["hinged"],
+        description="Типы опор",
+        min_length=1
+    )
+    
+    profile_names: List[str] = Field(
+        ...,
+        description="Наименования профилей",
+        example=["I-beam_20B1", "I-beam_30B1"],
+        min_length=1
+    )
+    
+    steel_grade: Optional[str] = Field(
+        None,
+        description="Ключ марки стали (None - расчётное сопротивление из настроек)",
+        example="C255"
+    )
+    
+    chunk_size: int = Field(
+        10_000,
+        description="Число комбинаций в одном векторном блоке",
+        ge=1,
+        le=1_000_000
+    )
+    
+    format: Literal["ndjson", "csv"] = Field(
+        "ndjson",
+        description="Формат потока результатов"
+    )
+    
+    layout: Literal["rows", "columns"] = Field(
+        "rows",
+        description="NDJSON: объект на комбинацию (rows) или на блок колонок (columns)"
+    )
+    
+    def axis_values(self, name: str) -> List[float]:
+        """Значения числовой оси перебора."""
+        axis = getattr(self, name)
+        return axis.values() if isinstance(axis, SweepRange) else list(axis)
+    
+    @model_validator(mode="after")
+    def _check_axes(self):
+        checks = {
+            "length": lambda v: v > 0,
+            "force": lambda v: v > 0,
+            "force_position": lambda v: 0 <= v <= 1,
+        }
+        for name, check in checks.items():
+            values = self.axis_values(name)
+            if not values:
+                raise ValueError(f"Ось '{name}' не содержит значений")
+            if not all(check(v) for v in values):
+                raise ValueError(f"Недопустимые значения на оси '{name}'")
+        return self
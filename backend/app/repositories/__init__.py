@@ -4,10 +4,19 @@
 
 from .material_repository import (
     MaterialRepository,
+    CatalogMaterialRepository,
     MaterialRepositoryStub
 )
 
+from .profile_catalog import (
+    ProfileCatalog,
+    load_profile_catalog
+)
+
 __all__ = [
     "MaterialRepository",
-    "MaterialRepositoryStub"
+    "CatalogMaterialRepository",
+    "MaterialRepositoryStub",
+    "ProfileCatalog",
+    "load_profile_catalog"
 ]
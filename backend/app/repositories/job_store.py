@@ -0,0 +1,337 @@
+"""
+Хранилище фоновых заданий и их результатов в SQLite.
+
+Результаты пишутся блоками вместе с контрольной точкой задания
+в одной транзакции, поэтому после перезапуска задание продолжается
+с последнего записанного блока без потерь и повторов строк.
+
+Выполняемое задание закреплено за исполнителем (owner) до момента
+lease_until; исполнитель продлевает аренду, пока задание выполняется.
+Другой процесс с тем же файлом забирает задание, только когда аренда
+истекла (исполнитель остановился аварийно).
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from app.models.jobs import FINISHED_STATES, JobStatus
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    state TEXT NOT NULL,
+    request TEXT NOT NULL,
+    checkpoint TEXT,
+    done INTEGER NOT NULL DEFAULT 0,
+    total INTEGER,
+    rows INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    owner TEXT,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, created_at);
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+) WITHOUT ROWID;
+"""
+
+# Столбцы, добавленные после первой версии схемы
+MIGRATIONS = {
+    "owner": "ALTER TABLE jobs ADD COLUMN owner TEXT",
+    "lease_until": "ALTER TABLE jobs ADD COLUMN lease_until REAL",
+}
+
+# Задание можно забрать: в очереди или выполнялось, но аренда истекла
+# (NULL - аренда снята остановкой исполнителя или файл старой схемы)
+CLAIMABLE = "(state = 'queued' OR (state = 'running' AND (lease_until IS NULL OR lease_until < ?)))"
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    """Время из секунд эпохи (UTC)."""
+    return None if value is None else datetime.fromtimestamp(value, timezone.utc)
+
+
+class JobStore:
+    """
+    Задания и строки их результатов в файле SQLite.
+    
+    Соединение открывается на каждую операцию: SQLite в режиме WAL
+    допускает одновременное чтение страниц результата и запись
+    новых блоков из потоков исполнителя.
+    """
+    
+    def __init__(self, path: str, busy_timeout: float = 30.0, lease_seconds: float = 60.0):
+        """
+        Открытие (и при необходимости создание) хранилища.
+        
+        Args:
+            path: Путь к файлу базы данных
+            busy_timeout: Ожидание блокировки записи, с
+            lease_seconds: Срок аренды задания исполнителем, с
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.lease_seconds = lease_seconds
+        # Запись сериализуется внутри процесса, чтобы не упираться в busy_timeout
+        self._write_lock = threading.Lock()
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    connection.execute(statement)
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Соединение на одну операцию (транзакция фиксируется при выходе)."""
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+    
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Пишущая транзакция."""
+        with self._write_lock, self._connect() as connection:
+            yield connection
+    
+    def create(self, kind: str, request: Dict[str, Any]) -> str:
+        """
+        Постановка задания в очередь.
+        
+        Args:
+            kind: Вид задания
+            request: Параметры задания (JSON-совместимые)
+        
+        Returns:
+            Идентификатор задания
+        """
+        job_id = uuid.uuid4().hex
+        with self._write() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, kind, state, request, created_at) VALUES (?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(request, ensure_ascii=False), time.time())
+            )
+        return job_id
+    
+    def status(self, job_id: str) -> Optional[JobStatus]:
+        """Состояние задания или None, если задания нет."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT id, kind, state, done, total, rows, error, created_at, started_at, finished_at "
+                "FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        job_id, kind, state, done, total, rows, error, created, started, finished = row
+        if state == "completed":
+            progress = 1.0
+        else:
+            progress = min(1.0, done / total) if total else 0.0
+        return JobStatus(
+            id=job_id,
+            kind=kind,
+            state=state,
+            done=done,
+            total=total,
+            progress=progress,
+            rows=rows,
+            error=error,
+            created_at=_timestamp(created),
+            started_at=_timestamp(started),
+            finished_at=_timestamp(finished)
+        )
+    
+    def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Вид, параметры и контрольная точка задания."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT kind, request, checkpoint FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        kind, request, checkpoint = row
+        return {
+            "kind": kind,
+            "request": json.loads(request),
+            "checkpoint": json.loads(checkpoint) if checkpoint else None,
+        }
+    
+    def claimable(self) -> List[str]:
+        """
+        Задания в очереди и прерванные (аренда истекла или снята),
+        в порядке постановки. Выполняемые другими процессами не входят.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT id FROM jobs WHERE {CLAIMABLE} ORDER BY created_at", (time.time(),)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def start(self, job_id: str, owner: str) -> bool:
+        """
+        Атомарный захват задания исполнителем и перевод в состояние running.
+        
+        Args:
+            job_id: Идентификатор задания
+            owner: Идентификатор исполнителя
+        
+        Returns:
+            False, если задание завершено, отменено или выполняется
+            другим исполнителем с действующей арендой
+        """
+        now = time.time()
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET state = 'running', owner = ?, lease_until = ?, "
+                f"started_at = COALESCE(started_at, ?) WHERE id = ? AND {CLAIMABLE}",
+                (owner, now + self.lease_seconds, now, job_id, now)
+            )
+        return cursor.rowcount == 1
+    
+    def renew(self, job_id: str, owner: str) -> bool:
+        """
+        Продление аренды выполняемого задания.
+        
+        Returns:
+            False, если задание завершено, отменено или перешло
+            к другому исполнителю
+        """
+        with self._write() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND state = 'running' AND owner = ?",
+                (time.time() + self.lease_seconds, job_id, owner)
+            )
+        return cursor.rowcount == 1
+    
+    def release(self, job_id: str, owner: str) -> None:
+        """
+        Снятие аренды с выполняемого задания (остановка исполнителя):
+        задание остаётся running и сразу доступно для продолжения.
+        """
+        with self._write() as connection:
+            connection.execute(
+                "UPDATE jobs SET owner = NULL, lease_until = NULL "
+                "WHERE id = ? AND state = 'running' AND owner = ?",
+                (job_id, owner)
+            )
+    
+    def save_chunk(self, job_id: str, owner: str, rows: Sequence[Any], checkpoint: Dict[str, Any],
+                   done: int, total: Optional[int]) -> bool:
+        """
+        Запись блока результатов и контрольной точки одной транзакцией
+        с продлением аренды.
+        
+        Args:
+            job_id: Идентификатор задания
+            owner: Идентификатор исполнителя
+            rows: Строки результата (JSON-совместимые)
+            checkpoint: Состояние, с которого продолжается задание
+            done: Выполнено единиц работы
+            total: Всего единиц работы
+        
+        Returns:
+            False, если задание отменено или перешло к другому
+            исполнителю (блок не записывается)
+        """
+        payloads = [json.dumps(row, ensure_ascii=False) for row in rows]
+        with self._write() as connection:
+            current = connection.execute(
+                "SELECT rows FROM jobs WHERE id = ? AND state = 'running' AND owner = ?", (job_id, owner)
+            ).fetchone()
+            if current is None:
+                return False
+            start = current[0]
+            connection.executemany(
+                "INSERT INTO job_results (job_id, seq, payload) VALUES (?, ?, ?)",
+                ((job_id, start + i, payload) for i, payload in enumerate(payloads))
+            )
+            connection.execute(
+                "UPDATE jobs SET checkpoint = ?, done = ?, total = ?, rows = ?, lease_until = ? WHERE id = ?",
+                (json.dumps(checkpoint), done, total, start + len(payloads),
+                 time.time() + self.lease_seconds, job_id)
+            )
+        return True
+    
+    def finish(self, job_id: str, state: str, error: Optional[str] = None,
+               owner: Optional[str] = None) -> bool:
+        """
+        Завершение задания (completed, failed или cancelled).
+        
+        Args:
+            job_id: Идентификатор задания
+            state: Конечное состояние
+            error: Текст ошибки
+            owner: Исполнитель, владеющий арендой (None - отмена извне)
+        
+        Returns:
+            False, если задание уже было завершено или перешло
+            к другому исполнителю
+        """
+        if state not in FINISHED_STATES:
+            raise ValueError(f"Недопустимое конечное состояние: '{state}'")
+        query = (
+            "UPDATE jobs SET state = ?, error = ?, finished_at = ?, owner = NULL, lease_until = NULL "
+            "WHERE id = ? AND state IN ('queued', 'running')"
+        )
+        params = (state, error, time.time(), job_id)
+        if owner is not None:
+            query += " AND owner = ?"
+            params += (owner,)
+        with self._write() as connection:
+            cursor = connection.execute(query, params)
+        return cursor.rowcount == 1
+    
+    def results(self, job_id: str, offset: int = 0, limit: int = 1000) -> List[Any]:
+        """
+        Страница строк результата.
+        
+        Args:
+            job_id: Идентификатор задания
+            offset: Номер первой строки
+            limit: Наибольшее число строк
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT payload FROM job_results WHERE job_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                (job_id, offset, limit)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def iter_payloads(self, job_id: str, page_size: int = 1000) -> Iterator[List[str]]:
+        """
+        Все строки результата страницами JSON-текстов (без разбора JSON).
+        
+        Args:
+            job_id: Идентификатор задания
+            page_size: Число строк на странице
+        """
+        offset = 0
+        while True:
+            with self._connect() as connection:
+                page = [row[0] for row in connection.execute(
+                    "SELECT payload FROM job_results WHERE job_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                    (job_id, offset, page_size)
+                )]
+            if not page:
+                return
+            yield page
+            offset += len(page)
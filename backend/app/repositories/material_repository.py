@@ -1,6 +1,8 @@
 ﻿from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.models.material_profile import MaterialProfile
+from app.models.material_profile import MaterialProfile, MaterialProfileList, ProfileQuery
+from app.repositories.profile_catalog import ProfileCatalog, load_profile_catalog
+from app.repositories.profile_index import ProfileSearchIndex
 
 
 class MaterialRepository(ABC):
@@ -41,110 +43,65 @@ class MaterialRepository(ABC):
             Список подходящих профилей
         """
         pass
+    
+    @abstractmethod
+    def query_profiles(self, query: ProfileQuery) -> MaterialProfileList:
+        """
+        Фильтрация, сортировка и постраничный вывод профилей.
+        
+        Args:
+            query: Параметры фильтров, сортировки и пагинации
+            
+        Returns:
+            Страница профилей с общим количеством и курсором
+            
+        Raises:
+            ValueError: Если курсор некорректен
+        """
+        pass
 
 
-class MaterialRepositoryStub(MaterialRepository):
+class CatalogMaterialRepository(MaterialRepository):
     """
-    Заглушка репозитория материалов для MVP.
-    Хранит данные в памяти.
+    Репозиторий материалов поверх каталога профилей в памяти.
+    Поиск по ключу - обращение к словарю каталога,
+    поиск и фильтры - через индекс, построенный при создании.
     """
     
-    def __init__(self):
-        """Инициализация с тестовыми данными ГОСТ профилей."""
-        self._profiles: dict[str, MaterialProfile] = {}
-        self._initialize_data()
-    
-    def _initialize_data(self):
-        """Инициализация тестовых данных."""
-        profiles_data = [
-            {
-                "name": "Двутавр 10Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_10B1",
-                "moment_of_inertia_ix_cm4": 198.0,
-                "moment_of_resistance_wx_cm3": 39.7,
-                "height_mm": 100.0,
-                "width_mm": 55.0,
-                "mass_kg_m": 8.1
-            },
-            {
-                "name": "Двутавр 14Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_14B1",
-                "moment_of_inertia_ix_cm4": 572.0,
-                "moment_of_resistance_wx_cm3": 81.7,
-                "height_mm": 140.0,
-                "width_mm": 73.0,
-                "mass_kg_m": 12.3
-            },
-            {
-                "name": "Двутавр 20Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_20B1",
-                "moment_of_inertia_ix_cm4": 1840.0,
-                "moment_of_resistance_wx_cm3": 184.0,
-                "height_mm": 200.0,
-                "width_mm": 100.0,
-                "mass_kg_m": 22.7
-            },
-            {
-                "name": "Двутавр 30Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_30B1",
-                "moment_of_inertia_ix_cm4": 6320.0,
-                "moment_of_resistance_wx_cm3": 422.0,
-                "height_mm": 300.0,
-                "width_mm": 140.0,
-                "mass_kg_m": 39.2
-            },
-            {
-                "name": "Двутавр 40Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_40B1",
-                "moment_of_inertia_ix_cm4": 15760.0,
-                "moment_of_resistance_wx_cm3": 788.0,
-                "height_mm": 400.0,
-                "width_mm": 155.0,
-                "mass_kg_m": 57.0
-            },
-            {
-                "name": "Двутавр 50Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_50B1",
-                "moment_of_inertia_ix_cm4": 39727.0,
-                "moment_of_resistance_wx_cm3": 1589.0,
-                "height_mm": 500.0,
-                "width_mm": 180.0,
-                "mass_kg_m": 89.8
-            },
-            {
-                "name": "Двутавр 60Б1",
-                "standard": "ГОСТ 26020-83",
-                "key": "I-beam_60B1",
-                "moment_of_inertia_ix_cm4": 76806.0,
-                "moment_of_resistance_wx_cm3": 2560.0,
-                "height_mm": 600.0,
-                "width_mm": 190.0,
-                "mass_kg_m": 108.0
-            }
-        ]
+    def __init__(self, catalog: Optional[ProfileCatalog] = None):
+        """
+        Инициализация репозитория.
         
-        for data in profiles_data:
-            profile = MaterialProfile(**data)
-            self._profiles[profile.key] = profile
+        Args:
+            catalog: Каталог профилей (по умолчанию - каталог процесса)
+        """
+        self._catalog = catalog if catalog is not None else load_profile_catalog()
+        self._index = ProfileSearchIndex(self._catalog)
+    
+    @property
+    def catalog(self) -> ProfileCatalog:
+        """Каталог профилей репозитория."""
+        return self._catalog
     
     def get_profile(self, profile_key: str) -> Optional[MaterialProfile]:
         """Получить профиль по ключу."""
-        return self._profiles.get(profile_key)
+        return self._catalog.get(profile_key)
     
     def get_all_profiles(self) -> List[MaterialProfile]:
         """Получить все доступные профили."""
-        return list(self._profiles.values())
+        return list(self._catalog.profiles)
     
     def search_profiles(self, name_part: str) -> List[MaterialProfile]:
         """Поиск профилей по части названия."""
-        name_part_lower = name_part.lower()
-        return [
-            profile for profile in self._profiles.values()
-            if name_part_lower in profile.name.lower()
-        ]
+        return self._index.search(name_part)
+    
+    def query_profiles(self, query: ProfileQuery) -> MaterialProfileList:
+        """Фильтрация, сортировка и постраничный вывод профилей."""
+        return self._index.query(query)
+
+
+class MaterialRepositoryStub(CatalogMaterialRepository):
+    """
+    Заглушка репозитория материалов для MVP.
+    Сохранена для совместимости, данные берутся из каталога профилей.
+    """
@@ -0,0 +1,122 @@
+"""
+Каталог стальных профилей, загружаемый из файла данных.
+Строится один раз на процесс и используется всеми запросами.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.models.material_profile import MaterialProfile
+from app.core.config import settings
+
+
+# Файл сортамента, поставляемый вместе с пакетом
+DEFAULT_CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "profiles.json"
+
+# Числовые характеристики, хранящиеся в колоночном виде
+NUMERIC_COLUMNS = (
+    "moment_of_inertia_ix_cm4",
+    "moment_of_resistance_wx_cm3",
+    "height_mm",
+    "width_mm",
+    "mass_kg_m",
+)
+
+
+class ProfileCatalog:
+    """
+    Неизменяемый каталог профилей.
+    
+    Хранит профили в порядке файла, словарь по ключу и колоночную
+    копию числовых характеристик в массивах NumPy.
+    """
+    
+    def __init__(self, profiles: Sequence[MaterialProfile], version: int = 0):
+        """
+        Построение каталога.
+        
+        Args:
+            profiles: Профили каталога
+            version: Версия файла данных
+            
+        Raises:
+            ValueError: Если ключи профилей повторяются
+        """
+        self.version = version
+        self._profiles: List[MaterialProfile] = list(profiles)
+        self._by_key: Dict[str, MaterialProfile] = {}
+        self._index: Dict[str, int] = {}
+        
+        for i, profile in enumerate(self._profiles):
+            if profile.key in self._index:
+                raise ValueError(f"Повторяющийся ключ профиля: '{profile.key}'")
+            self._by_key[profile.key] = profile
+            self._index[profile.key] = i
+        
+        self._columns: Dict[str, np.ndarray] = {}
+        for name in NUMERIC_COLUMNS:
+            column = np.array([getattr(p, name) for p in self._profiles], dtype=np.float64)
+            column.setflags(write=False)
+            self._columns[name] = column
+    
+    @classmethod
+    def from_file(cls, path: Path) -> "ProfileCatalog":
+        """
+        Загрузка каталога из JSON-файла сортамента.
+        
+        Args:
+            path: Путь к файлу данных
+            
+        Returns:
+            Каталог профилей
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        
+        profiles = [MaterialProfile(**row) for row in data["profiles"]]
+        return cls(profiles, version=data.get("version", 0))
+    
+    def __len__(self) -> int:
+        return len(self._profiles)
+    
+    @property
+    def profiles(self) -> List[MaterialProfile]:
+        """Профили в порядке каталога."""
+        return self._profiles
+    
+    @property
+    def keys(self) -> List[str]:
+        """Ключи профилей в порядке каталога."""
+        return list(self._index)
+    
+    def get(self, profile_key: str) -> Optional[MaterialProfile]:
+        """Профиль по ключу или None."""
+        return self._by_key.get(profile_key)
+    
+    def index_of(self, profile_key: str) -> Optional[int]:
+        """Позиция профиля в колонках или None."""
+        return self._index.get(profile_key)
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        Колонка числовой характеристики (только для чтения).
+        
+        Args:
+            name: Имя поля MaterialProfile, например 'moment_of_resistance_wx_cm3'
+        """
+        return self._columns[name]
+
+
+@lru_cache(maxsize=1)
+def load_profile_catalog() -> ProfileCatalog:
+    """
+    Каталог профилей процесса.
+    
+    Файл читается при первом обращении, дальше возвращается тот же объект.
+    Путь можно переопределить через settings.PROFILE_CATALOG_PATH.
+    """
+    path = Path(settings.PROFILE_CATALOG_PATH) if settings.PROFILE_CATALOG_PATH else DEFAULT_CATALOG_PATH
+    return ProfileCatalog.from_file(path)
@@ -0,0 +1,201 @@
+"""
+Поисковый индекс каталога профилей.
+Строится один раз и обслуживает поиск, фильтры, сортировку и пагинацию.
+"""
+import base64
+import json
+import re
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from app.models.material_profile import MaterialProfile, MaterialProfileList, ProfileQuery
+from app.repositories.profile_catalog import ProfileCatalog
+
+
+# Максимальная длина n-граммы для поиска подстрок
+NGRAM_SIZE = 3
+
+# Поля с отсортированными числовыми индексами и соответствующие фильтры
+RANGE_FILTERS = {
+    "height_mm": ("min_height", "max_height"),
+    "moment_of_inertia_ix_cm4": ("min_ix", "max_ix"),
+    "moment_of_resistance_wx_cm3": ("min_wx", "max_wx"),
+    "mass_kg_m": ("min_mass", "max_mass"),
+}
+
+_TOKEN_SPLIT = re.compile(r"[^\w]+")
+
+
+def normalize_text(text: str) -> str:
+    """Нормализация строки для поиска: регистр, 'ё', пробелы."""
+    return " ".join(text.lower().replace("ё", "е").split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Разбиение нормализованной строки на слова."""
+    return [token for token in _TOKEN_SPLIT.split(normalize_text(text)) if token]
+
+
+class ProfileSearchIndex:
+    """
+    Индекс каталога профилей.
+    
+    Содержит:
+    - префиксы слов наименования (автодополнение),
+    - n-граммы наименований длиной до 3 (поиск подстроки),
+    - отсортированные числовые индексы по высоте, Ix, Wx и массе,
+    - ранги профилей для каждого поля сортировки (курсорная пагинация).
+    """
+    
+    def __init__(self, catalog: ProfileCatalog):
+        """
+        Построение индекса.
+        
+        Args:
+            catalog: Каталог профилей
+        """
+        self._catalog = catalog
+        self._profiles: List[MaterialProfile] = catalog.profiles
+        size = len(self._profiles)
+        
+        self._names: List[str] = [normalize_text(p.name) for p in self._profiles]
+        self._prefixes: Dict[str, Set[int]] = {}
+        self._ngrams: Dict[str, Set[int]] = {}
+        self._standards: Dict[str, Set[int]] = {}
+        
+        for i, (profile, name) in enumerate(zip(self._profiles, self._names)):
+            for token in tokenize(name):
+                for end in range(1, len(token) + 1):
+                    self._prefixes.setdefault(token[:end], set()).add(i)
+            for n in range(1, NGRAM_SIZE + 1):
+                for start in range(len(name) - n + 1):
+                    self._ngrams.setdefault(name[start:start + n], set()).add(i)
+            self._standards.setdefault(normalize_text(profile.standard), set()).add(i)
+        
+        # Отсортированные числовые индексы: порядок и значения
+        self._sorted: Dict[str, tuple] = {}
+        for field in RANGE_FILTERS:
+            values = catalog.column(field)
+            order = np.argsort(values, kind="stable")
+            self._sorted[field] = (order, values[order])
+        
+        # Ранги для сортировки: при равных значениях - порядок каталога
+        self._ranks: Dict[Optional[str], np.ndarray] = {None: np.arange(size)}
+        name_order = sorted(range(size), key=lambda i: (self._names[i], i))
+        self._ranks["name"] = self._rank_from_order(np.array(name_order, dtype=np.int64))
+        for field, (order, _) in self._sorted.items():
+            self._ranks[field] = self._rank_from_order(order)
+    
+    @staticmethod
+    def _rank_from_order(order: np.ndarray) -> np.ndarray:
+        """Обратная перестановка: позиция профиля в отсортированном порядке."""
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        return ranks
+    
+    def search(self, name_part: str) -> List[MaterialProfile]:
+        """
+        Поиск профилей, наименование которых содержит подстроку.
+        
+        Args:
+            name_part: Часть названия профиля
+            
+        Returns:
+            Подходящие профили в порядке каталога
+        """
+        needle = normalize_text(name_part)
+        if not needle:
+            return list(self._profiles)
+        
+        if len(needle) <= NGRAM_SIZE:
+            matches = self._ngrams.get(needle, set())
+        else:
+            # Пересечение постингов всех n-грамм, затем точная проверка
+            grams = [needle[i:i + NGRAM_SIZE] for i in range(len(needle) - NGRAM_SIZE + 1)]
+            postings = sorted((self._ngrams.get(g, set()) for g in grams), key=len)
+            matches = set.intersection(*postings) if postings[0] else set()
+            matches = {i for i in matches if needle in self._names[i]}
+        
+        return [self._profiles[i] for i in sorted(matches)]
+    
+    def query(self, query: ProfileQuery) -> MaterialProfileList:
+        """
+        Фильтрация, сортировка и постраничный вывод профилей.
+        
+        Args:
+            query: Параметры запроса
+            
+        Returns:
+            Страница профилей с общим количеством и курсором следующей страницы
+            
+        Raises:
+            ValueError: Если курсор некорректен или не соответствует сортировке
+        """
+        mask = np.ones(len(self._profiles), dtype=bool)
+        
+        if query.name:
+            for token in tokenize(query.name):
+                mask &= self._mask_from(self._prefixes.get(token, ()))
+        
+        if query.standard:
+            mask &= self._mask_from(self._standards.get(normalize_text(query.standard), ()))
+        
+        for field, (min_name, max_name) in RANGE_FILTERS.items():
+            low, high = getattr(query, min_name), getattr(query, max_name)
+            if low is None and high is None:
+                continue
+            order, values = self._sorted[field]
+            start = 0 if low is None else np.searchsorted(values, low, side="left")
+            stop = len(values) if high is None else np.searchsorted(values, high, side="right")
+            in_range = np.zeros(len(self._profiles), dtype=bool)
+            in_range[order[start:stop]] = True
+            mask &= in_range
+        
+        ranks = self._ranks[query.sort]
+        if query.order == "desc":
+            ranks = len(ranks) - 1 - ranks
+        
+        matched = np.flatnonzero(mask)
+        total = len(matched)
+        matched = matched[np.argsort(ranks[matched])]
+        
+        if query.cursor:
+            last_rank = self._decode_cursor(query.cursor, query)
+            matched = matched[ranks[matched] > last_rank]
+        
+        next_cursor = None
+        if query.limit is not None and len(matched) > query.limit:
+            matched = matched[:query.limit]
+            next_cursor = self._encode_cursor(int(ranks[matched[-1]]), query)
+        
+        return MaterialProfileList(
+            profiles=[self._profiles[i] for i in matched],
+            total=total,
+            next_cursor=next_cursor
+        )
+    
+    def _mask_from(self, indices) -> np.ndarray:
+        """Булева маска по множеству индексов профилей."""
+        mask = np.zeros(len(self._profiles), dtype=bool)
+        mask[list(indices)] = True
+        return mask
+    
+    def _encode_cursor(self, rank: int, query: ProfileQuery) -> str:
+        """Курсор: ранг последнего профиля страницы в выбранной сортировке."""
+        payload = {"r": rank, "s": query.sort, "o": query.order, "v": self._catalog.version}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    
+    def _decode_cursor(self, cursor: str, query: ProfileQuery) -> int:
+        """Разбор курсора с проверкой сортировки и версии каталога."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            rank = int(payload["r"])
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Некорректный курсор")
+        
+        if (payload.get("s"), payload.get("o"), payload.get("v")) != (query.sort, query.order, self._catalog.version):
+            raise ValueError("Курсор не соответствует сортировке или версии каталога")
+        return rank
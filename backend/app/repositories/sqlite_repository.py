@@ -0,0 +1,295 @@
+"""
+Репозиторий материалов поверх базы SQLite.
+
+Профили хранятся в таблице с индексами по ключу, нормализованному
+наименованию, стандарту, Ix, Wx, высоте и массе; фильтры, сортировка
+и пагинация выполняются запросами к базе, поэтому в память попадает
+только запрошенная страница, а не весь сортамент.
+"""
+import base64
+import json
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from app.models.material_profile import MaterialProfile, MaterialProfileList, ProfileQuery
+from app.repositories.material_repository import MaterialRepository
+from app.repositories.profile_index import RANGE_FILTERS, normalize_text, tokenize
+
+
+SCHEMA = """
+CREATE TABLE profiles (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    standard TEXT NOT NULL,
+    name_normalized TEXT NOT NULL,
+    name_tokens TEXT NOT NULL,
+    standard_normalized TEXT NOT NULL,
+    moment_of_inertia_ix_cm4 REAL NOT NULL,
+    moment_of_resistance_wx_cm3 REAL NOT NULL,
+    height_mm REAL NOT NULL,
+    width_mm REAL NOT NULL,
+    mass_kg_m REAL NOT NULL
+);
+CREATE INDEX profiles_name ON profiles (name_normalized, id);
+CREATE INDEX profiles_standard ON profiles (standard_normalized, id);
+CREATE INDEX profiles_ix ON profiles (moment_of_inertia_ix_cm4, id);
+CREATE INDEX profiles_wx ON profiles (moment_of_resistance_wx_cm3, id);
+CREATE INDEX profiles_height ON profiles (height_mm, id);
+CREATE INDEX profiles_mass ON profiles (mass_kg_m, id);
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Колонки профиля в порядке полей MaterialProfile
+PROFILE_COLUMNS = (
+    "name",
+    "standard",
+    "key",
+    "moment_of_inertia_ix_cm4",
+    "moment_of_resistance_wx_cm3",
+    "height_mm",
+    "width_mm",
+    "mass_kg_m",
+)
+
+_SELECT = f"SELECT {', '.join(PROFILE_COLUMNS)} FROM profiles"
+
+# Постоянные тексты запросов: модуль sqlite3 кэширует подготовленные
+# выражения по тексту запроса в каждом соединении
+GET_PROFILE_SQL = f"{_SELECT} WHERE key = ?"
+ALL_PROFILES_SQL = f"{_SELECT} ORDER BY id"
+SEARCH_SQL = f"{_SELECT} WHERE name_normalized LIKE ? ESCAPE '\\' ORDER BY id"
+
+# Колонки сортировки (при равных значениях - порядок каталога)
+SORT_COLUMNS = {
+    None: "id",
+    "name": "name_normalized",
+    "height_mm": "height_mm",
+    "moment_of_inertia_ix_cm4": "moment_of_inertia_ix_cm4",
+    "moment_of_resistance_wx_cm3": "moment_of_resistance_wx_cm3",
+    "mass_kg_m": "mass_kg_m",
+}
+
+
+def _like_escape(text: str) -> str:
+    """Экранирование служебных символов шаблона LIKE."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _profile(row: tuple) -> MaterialProfile:
+    """Профиль из строки таблицы."""
+    return MaterialProfile(**dict(zip(PROFILE_COLUMNS, row)))
+
+
+class SQLiteMaterialRepository(MaterialRepository):
+    """
+    Репозиторий материалов в файле SQLite.
+    
+    Чтение идёт через пул соединений только для чтения (по соединению
+    на одновременный запрос); база заполняется методом build.
+    """
+    
+    def __init__(self, path: str, pool_size: int = 4):
+        """
+        Открытие базы профилей.
+        
+        Args:
+            path: Путь к файлу базы, созданному методом build
+            pool_size: Число соединений только для чтения
+        
+        Raises:
+            FileNotFoundError: Если файла базы нет
+        """
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"База профилей не найдена: {path}")
+        self.path = path
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+        for _ in range(pool_size):
+            self._pool.put(sqlite3.connect(uri, uri=True, check_same_thread=False))
+        with self._connection() as connection:
+            row = connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        self.version = int(row[0]) if row else 0
+    
+    @classmethod
+    def build(cls, path: str, profiles: Iterable[MaterialProfile], version: int = 0) -> None:
+        """
+        Создание базы из профилей (существующий файл заменяется).
+        
+        Args:
+            path: Путь к файлу базы
+            profiles: Профили в порядке каталога
+            version: Версия данных сортамента
+        
+        Raises:
+            ValueError: Если ключи профилей повторяются
+        """
+        target = Path(path)
+        # Своё имя у каждого процесса: несколько рабочих процессов
+        # могут пересобирать базу одновременно
+        staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        staging.unlink(missing_ok=True)
+        connection = sqlite3.connect(staging)
+        try:
+            connection.executescript(SCHEMA)
+            rows = (
+                (
+                    i, p.key, p.name, p.standard,
+                    normalize_text(p.name), " ".join(tokenize(p.name)), normalize_text(p.standard),
+                    p.moment_of_inertia_ix_cm4, p.moment_of_resistance_wx_cm3,
+                    p.height_mm, p.width_mm, p.mass_kg_m
+                )
+                for i, p in enumerate(profiles)
+            )
+            try:
+                connection.executemany(
+                    "INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            except sqlite3.IntegrityError as e:
+                raise ValueError(f"Повторяющийся ключ профиля: {e}")
+            connection.execute("INSERT INTO meta VALUES ('version', ?)", (str(version),))
+            connection.commit()
+            connection.execute("ANALYZE")
+        finally:
+            connection.close()
+        # Читатели видят либо старую, либо полностью построенную базу
+        staging.replace(target)
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Соединение из пула на время запроса."""
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+    
+    def close(self) -> None:
+        """Закрытие соединений пула."""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+    
+    def get_profile(self, profile_key: str) -> Optional[MaterialProfile]:
+        """Получить профиль по ключу."""
+        with self._connection() as connection:
+            row = connection.execute(GET_PROFILE_SQL, (profile_key,)).fetchone()
+        return _profile(row) if row else None
+    
+    def get_all_profiles(self) -> List[MaterialProfile]:
+        """Получить все доступные профили."""
+        with self._connection() as connection:
+            rows = connection.execute(ALL_PROFILES_SQL).fetchall()
+        return [_profile(row) for row in rows]
+    
+    def search_profiles(self, name_part: str) -> List[MaterialProfile]:
+        """Поиск профилей по части названия."""
+        needle = normalize_text(name_part)
+        with self._connection() as connection:
+            rows = connection.execute(SEARCH_SQL, (f"%{_like_escape(needle)}%",)).fetchall()
+        return [_profile(row) for row in rows]
+    
+    def query_profiles(self, query: ProfileQuery) -> MaterialProfileList:
+        """
+        Фильтрация, сортировка и постраничный вывод профилей.
+        
+        Диапазоны по Ix, Wx, высоте и массе и сортировка по ним идут
+        по индексам; курсор хранит значение поля сортировки и номер
+        последнего профиля страницы (keyset-пагинация).
+        
+        Raises:
+            ValueError: Если курсор некорректен или не соответствует сортировке
+        """
+        where, params = self._filters(query)
+        sort_column = SORT_COLUMNS[query.sort]
+        direction = "DESC" if query.order == "desc" else "ASC"
+        where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+        
+        page_where, page_params = list(where), list(params)
+        if query.cursor:
+            value, last_id = self._decode_cursor(query.cursor, query)
+            comparison = "<" if query.order == "desc" else ">"
+            if sort_column == "id":
+                page_where.append(f"id {comparison} ?")
+                page_params.append(last_id)
+            else:
+                page_where.append(f"({sort_column}, id) {comparison} (?, ?)")
+                page_params.extend((value, last_id))
+        page_sql = f" WHERE {' AND '.join(page_where)}" if page_where else ""
+        
+        order_sql = f" ORDER BY {sort_column} {direction}"
+        if sort_column != "id":
+            order_sql += f", id {direction}"
+        limit_sql = ""
+        if query.limit is not None:
+            # Лишняя строка показывает, есть ли следующая страница
+            limit_sql = " LIMIT ?"
+            page_params.append(query.limit + 1)
+        
+        with self._connection() as connection:
+            total = connection.execute(f"SELECT COUNT(*) FROM profiles{where_sql}", params).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT {', '.join(PROFILE_COLUMNS)}, {sort_column}, id FROM profiles"
+                f"{page_sql}{order_sql}{limit_sql}",
+                page_params
+            ).fetchall()
+        
+        next_cursor = None
+        if query.limit is not None and len(rows) > query.limit:
+            rows = rows[:query.limit]
+            next_cursor = self._encode_cursor(rows[-1][-2], rows[-1][-1], query)
+        
+        return MaterialProfileList(
+            profiles=[_profile(row[:len(PROFILE_COLUMNS)]) for row in rows],
+            total=total,
+            next_cursor=next_cursor
+        )
+    
+    def _filters(self, query: ProfileQuery) -> Tuple[List[str], List[object]]:
+        """Условия WHERE и параметры для фильтров запроса."""
+        where: List[str] = []
+        params: List[object] = []
+        
+        if query.name:
+            # Каждое слово запроса - начало одного из слов наименования
+            for token in tokenize(query.name):
+                where.append("(' ' || name_tokens) LIKE ? ESCAPE '\\'")
+                params.append(f"% {_like_escape(token)}%")
+        
+        if query.standard:
+            where.append("standard_normalized = ?")
+            params.append(normalize_text(query.standard))
+        
+        for field, (min_name, max_name) in RANGE_FILTERS.items():
+            low, high = getattr(query, min_name), getattr(query, max_name)
+            if low is not None:
+                where.append(f"{field} >= ?")
+                params.append(low)
+            if high is not None:
+                where.append(f"{field} <= ?")
+                params.append(high)
+        
+        return where, params
+    
+    def _encode_cursor(self, value, last_id: int, query: ProfileQuery) -> str:
+        """Курсор: значение поля сортировки и номер последнего профиля страницы."""
+        payload = {"k": [value, last_id], "s": query.sort, "o": query.order, "v": self.version}
+        raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    
+    def _decode_cursor(self, cursor: str, query: ProfileQuery) -> tuple:
+        """Разбор курсора с проверкой сортировки и версии данных."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            value, last_id = payload["k"]
+            last_id = int(last_id)
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Некорректный курсор")
+        
+        if (payload.get("s"), payload.get("o"), payload.get("v")) != (query.sort, query.order, self.version):
+            raise ValueError("Курсор не соответствует сортировке или версии каталога")
+        return value, last_id
@@ -0,0 +1,123 @@
+"""
+Каталог марок стали, загружаемый из файла данных.
+Строится один раз на процесс и используется всеми запросами.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.models.steel_grade import SteelGrade
+from app.core.config import settings
+
+
+# Файл марок стали, поставляемый вместе с пакетом
+DEFAULT_GRADES_PATH = Path(__file__).resolve().parent.parent / "data" / "steel_grades.json"
+
+
+class SteelGradeCatalog:
+    """
+    Неизменяемый каталог марок стали.
+    
+    Хранит марки в порядке файла, словарь по ключу и массив
+    расчётных сопротивлений в том же порядке.
+    """
+    
+    def __init__(self, grades: Sequence[SteelGrade], version: int = 0):
+        """
+        Построение каталога.
+        
+        Args:
+            grades: Марки стали
+            version: Версия файла данных
+        
+        Raises:
+            ValueError: Если ключи марок повторяются
+        """
+        self.version = version
+        self._grades: List[SteelGrade] = list(grades)
+        self._index: Dict[str, int] = {}
+        
+        for i, grade in enumerate(self._grades):
+            if grade.key in self._index:
+                raise ValueError(f"Повторяющийся ключ марки стали: '{grade.key}'")
+            self._index[grade.key] = i
+        
+        self._design_strength = np.array([g.design_strength_mpa for g in self._grades], dtype=np.float64)
+        self._design_strength.setflags(write=False)
+    
+    @classmethod
+    def from_file(cls, path: Path) -> "SteelGradeCatalog":
+        """
+        Загрузка каталога из JSON-файла марок стали.
+        
+        Args:
+            path: Путь к файлу данных
+        
+        Returns:
+            Каталог марок
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        
+        grades = [SteelGrade(**row) for row in data["grades"]]
+        return cls(grades, version=data.get("version", 0))
+    
+    def __len__(self) -> int:
+        return len(self._grades)
+    
+    @property
+    def grades(self) -> List[SteelGrade]:
+        """Марки в порядке каталога."""
+        return self._grades
+    
+    @property
+    def keys(self) -> List[str]:
+        """Ключи марок в порядке каталога."""
+        return list(self._index)
+    
+    @property
+    def design_strengths(self) -> np.ndarray:
+        """Расчётные сопротивления Ry марок, МПа (только для чтения)."""
+        return self._design_strength
+    
+    def get(self, grade_key: str) -> Optional[SteelGrade]:
+        """Марка по ключу или None."""
+        index = self._index.get(grade_key)
+        return None if index is None else self._grades[index]
+    
+    def index_of(self, grade_key: str) -> Optional[int]:
+        """Позиция марки в массиве сопротивлений или None."""
+        return self._index.get(grade_key)
+    
+    def design_strength(self, grade_key: str) -> float:
+        """
+        Расчётное сопротивление марки.
+        
+        Args:
+            grade_key: Ключ марки, например 'C255'
+        
+        Returns:
+            Ry, МПа
+        
+        Raises:
+            ValueError: Если марки нет в каталоге
+        """
+        index = self._index.get(grade_key)
+        if index is None:
+            raise ValueError(f"Марка стали '{grade_key}' не найдена")
+        return float(self._design_strength[index])
+
+
+@lru_cache(maxsize=1)
+def load_steel_grades() -> SteelGradeCatalog:
+    """
+    Каталог марок стали процесса.
+    
+    Файл читается при первом обращении, дальше возвращается тот же объект.
+    Путь можно переопределить через settings.STEEL_GRADES_PATH.
+    """
+    path = Path(settings.STEEL_GRADES_PATH) if settings.STEEL_GRADES_PATH else DEFAULT_GRADES_PATH
+    return SteelGradeCatalog.from_file(path)
@@ -0,0 +1,213 @@
+"""
+Точные поля усилий и перемещений однопролётной балки.
+
+Нагрузки задаются слагаемыми Маколея c·<x - p>ⁿ / n! в изгибающем
+моменте от сил слева от сечения (n = 0 - сосредоточенный момент,
+1 - сила, 2 и 3 - распределённые нагрузки). Реакции и константы
+интегрирования находятся из граничных условий для каждого типа опор,
+все поля вычисляются векторно по сетке сечений.
+
+Знаки: нагрузка вниз положительна, момент положителен при растяжении
+нижних волокон, прогиб положителен вниз.
+"""
+from typing import Dict
+
+import numpy as np
+
+
+# Факториалы для слагаемых Маколея (порядок до 3, плюс два интегрирования)
+_FACTORIALS = np.array([1.0, 1.0, 2.0, 6.0, 24.0, 120.0])
+
+
+def _bracket(d: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Скобка Маколея <d>ⁿ / n! (при n < 0 - ноль)."""
+    order = np.broadcast_to(order, d.shape)
+    valid = order >= 0
+    safe_order = np.where(valid, order, 0)
+    with np.errstate(invalid="ignore"):
+        value = np.power(np.maximum(d, 0.0), safe_order) / _FACTORIALS[safe_order]
+    return np.where(valid & (d >= 0), value, 0.0)
+
+
+def point_load_terms(force, position):
+    """
+    Слагаемые Маколея для сосредоточенной силы.
+    
+    Args:
+        force: Сила, кН (вниз положительна)
+        position: Координата приложения, м
+        
+    Returns:
+        Кортеж (coef, position, order) массивов формы (..., 1)
+    """
+    force = np.asarray(force, dtype=np.float64)[..., None]
+    position = np.asarray(position, dtype=np.float64)[..., None]
+    order = np.ones(force.shape, dtype=np.int64)
+    return -force, position, order
+
+
+def load_terms(point_forces=(), point_positions=(),
+               q_start=(), q_end=(), q_from=(), q_to=(),
+               moments=(), moment_positions=()):
+    """
+    Слагаемые Маколея для набора нагрузок.
+    
+    Все аргументы - одномерные массивы координат в метрах. Распределённая
+    нагрузка с интенсивностью от q_start до q_end на участке [q_from, q_to]
+    даёт четыре слагаемых (ступень и наклон в начале и в конце участка),
+    поэтому число слагаемых линейно по числу нагрузок.
+    
+    Args:
+        point_forces: Сосредоточенные силы, кН
+        point_positions: Координаты сил, м
+        q_start: Интенсивности в начале участков, кН/м
+        q_end: Интенсивности в конце участков, кН/м
+        q_from: Начала участков, м
+        q_to: Концы участков, м
+        moments: Сосредоточенные моменты, кН·м (по часовой стрелке)
+        moment_positions: Координаты моментов, м
+        
+    Returns:
+        Кортеж (coef, position, order) одномерных массивов
+    """
+    as_array = lambda values: np.asarray(values, dtype=np.float64).ravel()
+    point_forces, point_positions = as_array(point_forces), as_array(point_positions)
+    q_start, q_end = as_array(q_start), as_array(q_end)
+    q_from, q_to = as_array(q_from), as_array(q_to)
+    moments, moment_positions = as_array(moments), as_array(moment_positions)
+    
+    slope = (q_end - q_start) / (q_to - q_from)
+    
+    coef = np.concatenate((-point_forces, -q_start, -slope, q_end, slope, moments))
+    position = np.concatenate((point_positions, q_from, q_from, q_to, q_to, moment_positions))
+    order = np.concatenate((
+        np.full(len(point_forces), 1),
+        np.full(len(q_start), 2),
+        np.full(len(q_start), 3),
+        np.full(len(q_start), 2),
+        np.full(len(q_start), 3),
+        np.full(len(moments), 0),
+    )).astype(np.int64)
+    
+    return coef, position, order
+
+
+def beam_fields(length: float, support_type: str, coef, position, order, x, ei: float) -> Dict[str, np.ndarray]:
+    """
+    Поперечная сила, момент, угол поворота и прогиб балки.
+    
+    Слагаемые могут иметь ведущие размерности (пакет вариантов
+    нагружения); результат имеет форму (..., len(x)). Пакет может
+    состоять и из пролётов разной длины: тогда length имеет форму (...),
+    а x - (..., P) (свои сечения у каждого пролёта).
+    
+    Args:
+        length: Длина пролёта, м
+        support_type: Тип опор ('hinged', 'cantilever', 'fixed')
+        coef: Коэффициенты слагаемых, форма (..., T)
+        position: Координаты слагаемых, м, форма (..., T)
+        order: Порядки слагаемых, форма (..., T)
+        x: Координаты сечений, м
+        ei: Изгибная жёсткость EI, кН·м²
+        
+    Returns:
+        Словарь: shear (кН), moment (кН·м), slope (рад), deflection (мм)
+        и реакции R_a, M_a, R_b, M_b (кН, кН·м) формы (...);
+        опорные моменты положительны, если в заделке растянуты верхние волокна
+        
+    Raises:
+        ValueError: Если тип опор не поддерживается
+    """
+    coef = np.asarray(coef, dtype=np.float64)
+    position = np.asarray(position, dtype=np.float64)
+    order = np.asarray(order, dtype=np.int64)
+    x = np.asarray(x, dtype=np.float64)
+    L = np.asarray(length, dtype=np.float64)
+    
+    def at(points, shift):
+        """Сумма слагаемых, продифференцированных (shift < 0) или проинтегрированных."""
+        d = points[..., None] - position[..., None, :]
+        return (coef[..., None, :] * _bracket(d, order[..., None, :] + shift)).sum(axis=-1)
+    
+    end = L[..., None]
+    s_shear = at(end, -1)[..., 0]
+    s_moment = at(end, 0)[..., 0]
+    s_slope = at(end, 1)[..., 0]
+    s_deflection = at(end, 2)[..., 0]
+    
+    zeros = np.zeros_like(s_moment)
+    
+    if support_type == "hinged":
+        # M(0) = M(L) = 0, w(0) = w(L) = 0
+        M0 = zeros
+        V0 = -s_moment / L
+        C1 = (V0 * L ** 3 / 6 + s_deflection) / L
+    elif support_type == "cantilever":
+        # Заделка в x = 0: w(0) = θ(0) = 0; свободный конец: M(L) = V(L) = 0
+        V0 = -s_shear
+        M0 = -V0 * L - s_moment
+        C1 = zeros
+    elif support_type == "fixed":
+        # Заделки с обеих сторон: w = θ = 0 при x = 0 и x = L
+        V0 = 12 * s_deflection / L ** 3 - 6 * s_slope / L ** 2
+        M0 = -(V0 * L ** 2 / 2 + s_slope) / L
+        C1 = zeros
+    else:
+        raise ValueError(f"Неподдерживаемый тип опор: '{support_type}'")
+    
+    M0_x = M0[..., None]
+    V0_x = V0[..., None]
+    
+    shear = V0_x + at(x, -1)
+    moment = M0_x + V0_x * x + at(x, 0)
+    slope = (-(M0_x * x + V0_x * x ** 2 / 2 + at(x, 1)) + C1[..., None]) / ei
+    deflection = (-(M0_x * x ** 2 / 2 + V0_x * x ** 3 / 6 + at(x, 2)) + C1[..., None] * x) / ei
+    
+    return {
+        "shear": shear,
+        "moment": moment,
+        "slope": slope,
+        "deflection": deflection * 1000,  # м → мм
+        "R_a": V0,
+        "M_a": -M0,
+        "R_b": -(V0 + s_shear),
+        "M_b": -(M0 + V0 * L + s_moment),
+    }
+
+
+def diagram_grid(length: float, points: int, breakpoints=()) -> np.ndarray:
+    """
+    Равномерная сетка сечений с добавленными точками приложения нагрузок.
+    
+    Args:
+        length: Длина пролёта, м
+        points: Число точек равномерной сетки
+        breakpoints: Координаты, которые должны попасть в сетку (пики эпюр)
+    """
+    grid = np.linspace(0.0, length, points)
+    extra = np.asarray(breakpoints, dtype=np.float64).ravel()
+    extra = extra[(extra >= 0) & (extra <= length)]
+    if extra.size:
+        # Точки, совпадающие с узлами сетки с точностью округления, не дублируем
+        nearest = np.rint(extra / length * (points - 1)) * length / (points - 1)
+        extra = extra[np.abs(extra - nearest) > 1e-9 * length]
+        grid = np.union1d(grid, extra)
+    return grid
+
+
+def extrema_grid(x: np.ndarray, fields: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Сетка x с добавленными нулями поперечной силы и угла поворота.
+    
+    Args:
+        x: Координаты сечений, м
+        fields: Поля на сетке x (нужны shear и slope)
+    """
+    extra = []
+    for name in ("shear", "slope"):
+        values = fields[name]
+        crossing = np.flatnonzero(np.sign(values[:-1]) * np.sign(values[1:]) < 0)
+        x0, x1 = x[crossing], x[crossing + 1]
+        v0, v1 = values[crossing], values[crossing + 1]
+        extra.append(x0 - v0 * (x1 - x0) / (v1 - v0))
+    return np.union1d(x, np.concatenate(extra))
@@ -0,0 +1,332 @@
+"""
+Сессии пересчёта балки: этапы расчёта как граф зависимостей.
+
+Этапы BeamCalculator.calculate (усилия, напряжение, проверки, эпюры,
+отчёт) хранятся в сессии вместе с результатами. При изменении
+параметров пересчитываются только этапы, зависящие от изменённых
+полей, а этап, результат которого не изменился, дальше изменение
+не передаёт.
+"""
+import threading
+import uuid
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Collection, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.models.beam_calculation import (
+    BeamCalculationRequest,
+    BeamCalculationResponse,
+    BeamLoadCase,
+    RESPONSE_SECTIONS
+)
+from app.models.material_profile import MaterialProfile
+from app.services.calculator import BeamCalculator
+from app.services.result_cache import ResultCache
+from app.core.metrics import stage_timer
+
+
+# Поля запроса, задающие расчётную схему (без марки стали)
+LOAD_FIELDS = tuple(name for name in BeamLoadCase.model_fields if name != "steel_grade")
+
+# Входы графа: поля запроса и профиль, найденный по profile_name
+REQUEST_FIELDS = tuple(BeamCalculationRequest.model_fields)
+INPUTS = REQUEST_FIELDS + ("profile",)
+
+
+class Stage(NamedTuple):
+    """
+    Этап расчёта.
+    
+    compute получает калькулятор и значения входов этапа
+    (поля запроса или результаты других этапов) по именам.
+    """
+    name: str
+    inputs: Tuple[str, ...]
+    compute: Callable[..., Any]
+    section: Optional[str] = None  # Необязательная часть ответа (RESPONSE_SECTIONS)
+    timer: Optional[str] = None  # Имя этапа в метриках stage_timer
+
+
+def _profile_properties(calc: BeamCalculator, profile: MaterialProfile) -> Dict[str, float]:
+    """Характеристики профиля для ответа (как в BeamCalculator.calculate)."""
+    return {
+        "moment_of_inertia_ix_cm4": profile.moment_of_inertia_ix_cm4,
+        "moment_of_resistance_wx_cm3": profile.moment_of_resistance_wx_cm3,
+        "height_mm": profile.height_mm,
+        "width_mm": profile.width_mm,
+        "mass_kg_m": profile.mass_kg_m
+    }
+
+
+def _report_sections(calc: BeamCalculator, load_case: BeamLoadCase, profile: MaterialProfile,
+                     steel_grade: Optional[str], design_strength: float, **results: Any) -> List[Dict[str, str]]:
+    """Текстовые блоки отчёта по результатам этапов сессии."""
+    return calc._generate_report_sections(
+        load_case.model_copy(update={"steel_grade": steel_grade}),
+        profile,
+        results["reactions"],
+        results["max_moment"],
+        results["max_deflection"],
+        results["max_stress"],
+        results["is_strength_sufficient"],
+        results["is_stiffness_sufficient"],
+        design_strength
+    )
+
+
+# Этапы расчёта; порядок вычисления определяется зависимостями
+STAGES: Dict[str, Stage] = {stage.name: stage for stage in (
+    Stage("load_case", LOAD_FIELDS,
+          lambda calc, **fields: BeamLoadCase(**fields)),
+    Stage("moment_of_inertia", ("profile",),
+          lambda calc, profile: profile.moment_of_inertia_ix_cm4),
+    Stage("moment_of_resistance", ("profile",),
+          lambda calc, profile: profile.moment_of_resistance_wx_cm3),
+    Stage("design_strength", ("steel_grade",),
+          lambda calc, steel_grade: calc.design_strength(steel_grade)),
+    Stage("internal_forces", ("load_case", "moment_of_inertia"),
+          lambda calc, load_case, moment_of_inertia: calc._calculate_internal_forces(load_case, moment_of_inertia)),
+    Stage("reactions", ("internal_forces",),
+          lambda calc, internal_forces: internal_forces[0]),
+    Stage("max_moment", ("internal_forces",),
+          lambda calc, internal_forces: internal_forces[1]),
+    Stage("max_deflection", ("internal_forces",),
+          lambda calc, internal_forces: internal_forces[2]),
+    Stage("max_stress", ("max_moment", "moment_of_resistance"),
+          lambda calc, max_moment, moment_of_resistance: calc._calculate_max_stress(max_moment, moment_of_resistance),
+          timer="stress"),
+    Stage("is_strength_sufficient", ("max_stress", "design_strength"),
+          lambda calc, max_stress, design_strength: calc._check_strength(max_stress, design_strength),
+          timer="checks"),
+    Stage("is_stiffness_sufficient", ("max_deflection", "length"),
+          lambda calc, max_deflection, length: calc._check_stiffness(max_deflection, length),
+          timer="checks"),
+    Stage("diagram_data", ("load_case", "moment_of_inertia", "diagram_points", "diagram_max_points"),
+          lambda calc, load_case, moment_of_inertia, diagram_points, diagram_max_points:
+              calc._generate_diagram_data(load_case, moment_of_inertia, diagram_points, diagram_max_points),
+          section="diagrams", timer="diagrams"),
+    Stage("report_sections", ("load_case", "profile", "steel_grade", "design_strength", "reactions",
+                              "max_moment", "max_deflection", "max_stress",
+                              "is_strength_sufficient", "is_stiffness_sufficient"),
+          _report_sections, section="report", timer="report"),
+    Stage("profile_properties", ("profile",), _profile_properties, section="profile"),
+    Stage("input_data", REQUEST_FIELDS,
+          lambda calc, **fields: BeamCalculationRequest(**fields),
+          section="input"),
+)}
+
+# Топологический порядок этапов (ValueError при цикле зависимостей)
+STAGE_ORDER = tuple(
+    name
+    for name in TopologicalSorter({
+        stage.name: [dep for dep in stage.inputs if dep in STAGES]
+        for stage in STAGES.values()
+    }).static_order()
+)
+
+# Результаты этапов, входящие в ответ расчёта
+OUTPUTS = tuple(name for name in STAGE_ORDER if name in BeamCalculationResponse.model_fields)
+
+
+class CalculationSession:
+    """
+    Сессия пересчёта одной балки.
+    
+    Хранит параметры расчёта, профиль и результаты всех этапов.
+    Обновления одной сессии выполняются по очереди.
+    """
+    
+    def __init__(self, calculator: BeamCalculator, request: BeamCalculationRequest,
+                 profile: MaterialProfile, sections: Optional[Collection[str]] = None,
+                 session_id: Optional[str] = None):
+        """
+        Создание сессии с полным расчётом.
+        
+        Args:
+            calculator: Калькулятор балки
+            request: Параметры расчёта
+            profile: Профиль request.profile_name
+            sections: Необязательные части ответа (None - все)
+            session_id: Идентификатор (None - случайный)
+        
+        Raises:
+            ValueError: Если марки стали нет в каталоге
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self.sections = frozenset(RESPONSE_SECTIONS if sections is None else sections)
+        self.version = 0
+        self.request = request
+        self.profile = profile
+        # Число вычислений каждого этапа за время жизни сессии
+        self.evaluations: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self._calculator = calculator
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        
+        self._values.update(self._inputs(request, profile))
+        self._evaluate(self._values, INPUTS)
+    
+    @staticmethod
+    def _inputs(request: BeamCalculationRequest, profile: MaterialProfile) -> Dict[str, Any]:
+        """Значения входов графа."""
+        inputs = {name: getattr(request, name) for name in REQUEST_FIELDS}
+        inputs["profile"] = profile
+        return inputs
+    
+    def _evaluate(self, values: Dict[str, Any], changed: Collection[str]) -> Tuple[List[str], List[str]]:
+        """
+        Пересчёт этапов, зависящих от изменённых входов.
+        
+        Этап пересчитывается, если изменился хотя бы один его вход;
+        если его результат совпал с прежним, зависимые этапы
+        пересчитывать не нужно.
+        
+        Args:
+            values: Значения входов и этапов (изменяются на месте)
+            changed: Изменённые входы
+        
+        Returns:
+            Пересчитанные этапы и этапы с изменившимся результатом
+        """
+        dirty = set(changed)
+        recomputed = []
+        updated = []
+        support = values["support_type"]
+        
+        for name in STAGE_ORDER:
+            stage = STAGES[name]
+            if stage.section is not None and stage.section not in self.sections:
+                continue
+            if not dirty.intersection(stage.inputs):
+                continue
+            
+            arguments = {dep: values[dep] for dep in stage.inputs}
+            if stage.timer is None:
+                value = stage.compute(self._calculator, **arguments)
+            else:
+                with stage_timer(stage.timer, support):
+                    value = stage.compute(self._calculator, **arguments)
+            self.evaluations[name] += 1
+            recomputed.append(name)
+            
+            if name not in values or values[name] != value:
+                values[name] = value
+                dirty.add(name)
+                updated.append(name)
+        
+        return recomputed, updated
+    
+    def result(self) -> BeamCalculationResponse:
+        """Полный результат для текущих параметров."""
+        with self._lock:
+            return BeamCalculationResponse(**{name: self._values.get(name) for name in OUTPUTS})
+    
+    def update(self, changes: Mapping[str, Any],
+               profile: Optional[MaterialProfile] = None) -> Tuple[int, List[str], Dict[str, Any]]:
+        """
+        Изменение параметров с пересчётом зависящих от них этапов.
+        
+        При ошибке (неверные параметры, неизвестная марка стали)
+        сессия остаётся в прежнем состоянии.
+        
+        Args:
+            changes: Новые значения полей запроса
+            profile: Профиль для нового profile_name (обязателен, если
+                profile_name изменился)
+        
+        Returns:
+            Номер новой версии, пересчитанные этапы и изменившиеся поля
+            результата с новыми значениями
+        
+        Raises:
+            ValueError: Если поле неизвестно или параметры некорректны
+        """
+        unknown = set(changes) - set(REQUEST_FIELDS)
+        if unknown:
+            raise ValueError(f"Неизвестные параметры расчёта: {', '.join(sorted(unknown))}")
+        
+        with self._lock:
+            try:
+                request = BeamCalculationRequest(**{**self.request.model_dump(), **changes})
+            except ValidationError as e:
+                raise ValueError(str(e)) from None
+            if profile is None:
+                if request.profile_name != self.request.profile_name:
+                    raise ValueError("Для нового profile_name нужен профиль")
+                profile = self.profile
+            
+            inputs = self._inputs(request, profile)
+            changed = [name for name in INPUTS if inputs[name] != self._values[name]]
+            
+            # Расчёт на копии: при ошибке этапа сессия не меняется
+            values = {**self._values, **inputs}
+            recomputed, updated = self._evaluate(values, changed)
+            
+            self._values = values
+            self.request = request
+            self.profile = profile
+            self.version += 1
+            
+            delta = {name: values[name] for name in updated if name in OUTPUTS}
+            return self.version, recomputed, delta
+
+
+class CalculationSessionManager:
+    """
+    Хранилище сессий пересчёта в памяти процесса.
+    
+    Число сессий ограничено (вытесняются давно не использованные),
+    сессия без обращений удаляется по истечении времени жизни.
+    """
+    
+    def __init__(self, calculator: BeamCalculator, max_sessions: int = 1000,
+                 ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            calculator: Калькулятор балки
+            max_sessions: Наибольшее число сессий (0 - сессии не хранятся)
+            ttl_seconds: Время жизни сессии без обращений, с (None - без ограничения)
+        """
+        self.calculator = calculator
+        self.store = ResultCache(max_sessions, ttl_seconds)
+    
+    def create(self, request: BeamCalculationRequest, profile: MaterialProfile,
+               sections: Optional[Collection[str]] = None) -> CalculationSession:
+        """
+        Создание сессии с полным расчётом.
+        
+        Raises:
+            ValueError: Если марки стали нет в каталоге
+        """
+        session = CalculationSession(self.calculator, request, profile, sections)
+        self.store.put(session.session_id, session)
+        return session
+    
+    def get(self, session_id: str) -> Optional[CalculationSession]:
+        """Сессия по идентификатору или None (время жизни продлевается)."""
+        session = self.store.get(session_id)
+        if session is not None:
+            self.store.put(session_id, session)
+        return session
+    
+    def update(self, session_id: str, changes: Mapping[str, Any],
+               profile: Optional[MaterialProfile] = None) -> Optional[Tuple[int, List[str], Dict[str, Any]]]:
+        """
+        Изменение параметров сессии (см. CalculationSession.update).
+        
+        Returns:
+            Номер версии, пересчитанные этапы и изменения результата
+            или None, если сессии нет
+        
+        Raises:
+            ValueError: Если параметры некорректны
+        """
+        session = self.get(session_id)
+        if session is None:
+            return None
+        return session.update(changes, profile)
+    
+    def delete(self, session_id: str) -> bool:
+        """Удаление сессии; False, если её не было."""
+        return self.store.delete(session_id)
@@ -2,12 +2,26 @@
 Сервис расчета балки на прочность и жёсткость.
 Ядро бизнес-логики приложения.
 """
-from typing import Dict, List, Tuple
-from math import pow
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+from math import pow, sqrt
 
-from app.models.beam_calculation import BeamCalculationRequest, BeamCalculationResponse
+import numpy as np
+
+from app.models.beam_calculation import (
+    BeamLoadCase,
+    BeamCalculationRequest,
+    BeamCalculationResponse,
+    BeamCalculationSummary,
+    REACTION_KEYS,
+    RESPONSE_SECTIONS
+)
 from app.models.material_profile import MaterialProfile
+from app.repositories.steel_grades import SteelGradeCatalog, load_steel_grades
+from app.services.beam_fields import beam_fields, diagram_grid, extrema_grid, load_terms
+from app.services.fem import SupportSpec, solve_beam
+from app.services.downsampling import lttb
 from app.core.config import settings
+from app.core.metrics import CALCULATIONS, stage_timer
 
 
 class BeamCalculator:
@@ -15,101 +29,375 @@ class BeamCalculator:
     
     # Модуль упругости стали, МПа
     STEEL_ELASTIC_MODULUS: float = 2.1e11  # 210,000 МПа = 2.1 × 10¹¹ Па
-
-
     
-    def __init__(self):
-        """Инициализация калькулятора."""
-        pass
+    # Число точек сетки для поиска максимумов при нескольких нагрузках
+    ANALYSIS_POINTS: int = 1001
+    
+    # Число конечных элементов для схем с произвольными опорами
+    FEM_ELEMENTS: int = 256
+    
+    def __init__(self, steel_grades: Optional[SteelGradeCatalog] = None):
+        """
+        Инициализация калькулятора.
+        
+        Args:
+            steel_grades: Каталог марок стали (None - каталог процесса,
+                загружается при первом расчёте с маркой)
+        """
+        self._steel_grades = steel_grades
+    
+    def design_strength(self, steel_grade: Optional[str] = None) -> float:
+        """
+        Расчётное сопротивление стали для проверки прочности.
+        
+        Args:
+            steel_grade: Ключ марки стали (None - settings.ALLOWABLE_STRESS)
+            
+        Returns:
+            Ry, МПа
+            
+        Raises:
+            ValueError: Если марки нет в каталоге
+        """
+        if steel_grade is None:
+            return settings.ALLOWABLE_STRESS
+        if self._steel_grades is None:
+            self._steel_grades = load_steel_grades()
+        return self._steel_grades.design_strength(steel_grade)
     
-    def calculate(self, request: BeamCalculationRequest, profile: MaterialProfile) -> BeamCalculationResponse:
+    def calculate(self, request: BeamCalculationRequest, profile: MaterialProfile,
+                  sections: Optional[Collection[str]] = None) -> BeamCalculationResponse:
         """
         Основной метод расчёта балки.
         
         Args:
             request: Параметры расчёта балки
             profile: Данные стального профиля
+            sections: Необязательные части ответа (ключи RESPONSE_SECTIONS),
+                None - все; остальные части не рассчитываются
             
         Returns:
             Результаты расчёта
         """
-        # 1. Расчёт реакций опор
-        reactions = self._calculate_reactions(
-            request.length, 
-            request.force, 
-            request.force_position,
-            request.support_type
-        )
-        
-        # 2. Расчёт максимального момента
-        max_moment = self._calculate_max_moment(
-            request.length,
-            request.force,
-            request.force_position,
-            request.support_type
-        )
+        if sections is None:
+            sections = RESPONSE_SECTIONS.keys()
+        support = request.support_type
+        design_strength = self.design_strength(request.steel_grade)
+        CALCULATIONS.inc(support)
         
-        # 3. Расчёт максимального прогиба
-        max_deflection = self._calculate_max_deflection(
-            request.length,
-            request.force,
-            request.force_position,
-            request.support_type,
+        # 1-3. Реакции, максимальный момент и прогиб
+        reactions, max_moment, max_deflection = self._calculate_internal_forces(
+            request,
             profile.moment_of_inertia_ix_cm4
         )
         
         # 4. Расчёт максимального напряжения
-        max_stress = self._calculate_max_stress(
-            max_moment,
-            profile.moment_of_resistance_wx_cm3
-        )
+        with stage_timer("stress", support):
+            max_stress = self._calculate_max_stress(
+                max_moment,
+                profile.moment_of_resistance_wx_cm3
+            )
         
         # 5. Проверка по прочности и жёсткости
-        is_strength_sufficient = self._check_strength(max_stress)
-        is_stiffness_sufficient = self._check_stiffness(
-            max_deflection,
-            request.length
-        )
+        with stage_timer("checks", support):
+            is_strength_sufficient = self._check_strength(max_stress, design_strength)
+            is_stiffness_sufficient = self._check_stiffness(
+                max_deflection,
+                request.length
+            )
         
         # 6. Формирование данных для эпюр
-        diagram_data = self._generate_diagram_data(
-            request.length,
-            request.force,
-            request.force_position,
-            request.support_type
-        )
+        diagram_data = None
+        if "diagrams" in sections:
+            with stage_timer("diagrams", support):
+                diagram_data = self._generate_diagram_data(
+                    request,
+                    profile.moment_of_inertia_ix_cm4,
+                    request.diagram_points,
+                    request.diagram_max_points
+                )
         
         # 7. Формирование отчёта
-        report_sections = self._generate_report_sections(
-            request,
-            profile,
-            reactions,
-            max_moment,
-            max_deflection,
-            max_stress,
-            is_strength_sufficient,
-            is_stiffness_sufficient
-        )
+        report_sections = None
+        if "report" in sections:
+            with stage_timer("report", support):
+                report_sections = self._generate_report_sections(
+                    request,
+                    profile,
+                    reactions,
+                    max_moment,
+                    max_deflection,
+                    max_stress,
+                    is_strength_sufficient,
+                    is_stiffness_sufficient,
+                    design_strength
+                )
         
-        return BeamCalculationResponse(
-            input_data=request,
-            reactions=reactions,
-            max_moment=max_moment,
-            max_deflection=max_deflection,
-            max_stress=max_stress,
-            is_strength_sufficient=is_strength_sufficient,
-            is_stiffness_sufficient=is_stiffness_sufficient,
-            profile_properties={
+        profile_properties = None
+        if "profile" in sections:
+            profile_properties = {
                 "moment_of_inertia_ix_cm4": profile.moment_of_inertia_ix_cm4,
                 "moment_of_resistance_wx_cm3": profile.moment_of_resistance_wx_cm3,
                 "height_mm": profile.height_mm,
                 "width_mm": profile.width_mm,
                 "mass_kg_m": profile.mass_kg_m
-            },
-            report_sections=report_sections,
-            diagram_data=diagram_data
+            }
+        
+        with stage_timer("assembly", support):
+            return BeamCalculationResponse(
+                input_data=request if "input" in sections else None,
+                reactions=reactions,
+                max_moment=max_moment,
+                max_deflection=max_deflection,
+                max_stress=max_stress,
+                is_strength_sufficient=is_strength_sufficient,
+                is_stiffness_sufficient=is_stiffness_sufficient,
+                profile_properties=profile_properties,
+                report_sections=report_sections,
+                diagram_data=diagram_data
+            )
+    
+    def calculate_summary(self, load_case: BeamLoadCase, profile: MaterialProfile) -> BeamCalculationSummary:
+        """
+        Расчёт балки без отчёта и эпюр.
+        
+        Args:
+            load_case: Расчётная схема балки
+            profile: Данные стального профиля
+            
+        Returns:
+            Реакции, максимумы и вердикты проверок
+            
+        Raises:
+            ValueError: Если марки стали нет в каталоге
+        """
+        design_strength = self.design_strength(load_case.steel_grade)
+        reactions, max_moment, max_deflection = self._calculate_internal_forces(
+            load_case,
+            profile.moment_of_inertia_ix_cm4
+        )
+        max_stress = self._calculate_max_stress(max_moment, profile.moment_of_resistance_wx_cm3)
+        
+        return BeamCalculationSummary(
+            reactions=reactions,
+            max_moment=max_moment,
+            max_deflection=max_deflection,
+            max_stress=max_stress,
+            is_strength_sufficient=self._check_strength(max_stress, design_strength),
+            is_stiffness_sufficient=self._check_stiffness(max_deflection, load_case.length)
         )
     
+    def estimate_cost(self, load_case: BeamLoadCase,
+                      sections: Optional[Collection[str]] = None,
+                      diagram_points: int = 0) -> int:
+        """
+        Оценка трудоёмкости расчёта: число вычислений «нагрузка × сечение».
+        
+        Используется для выбора между расчётом в обработчике и в пуле.
+        
+        Args:
+            load_case: Расчётная схема
+            sections: Необязательные части ответа (None - все)
+            diagram_points: Число точек эпюр (учитывается, если эпюры запрошены)
+        """
+        terms = (
+            (load_case.force is not None)
+            + len(load_case.point_loads)
+            + 2 * len(load_case.distributed_loads)
+            + len(load_case.applied_moments)
+        )
+        # Одна сила считается по замкнутым формулам
+        points = 1 if load_case.single_point_load() is not None else self.ANALYSIS_POINTS
+        if load_case.supports:
+            points += self.FEM_ELEMENTS
+        if sections is None or "diagrams" in sections:
+            points += diagram_points
+        return terms * points
+    
+    def _calculate_internal_forces(self, load_case: BeamLoadCase,
+                                   moment_of_inertia: float) -> Tuple[Dict[str, float], float, float]:
+        """
+        Реакции, максимальный момент и прогиб схемы.
+        
+        Единственная сосредоточенная сила на стандартных опорах считается
+        по замкнутым формулам, несколько нагрузок - суперпозицией,
+        произвольные опоры - методом конечных элементов.
+        """
+        single_load = load_case.single_point_load()
+        support = load_case.support_type
+        
+        if single_load is not None:
+            force, force_position = single_load
+            
+            # 1. Расчёт реакций опор
+            with stage_timer("reactions", support):
+                reactions = self._calculate_reactions(
+                    load_case.length, 
+                    force, 
+                    force_position,
+                    support
+                )
+            
+            # 2. Расчёт максимального момента
+            with stage_timer("moment", support):
+                max_moment = self._calculate_max_moment(
+                    load_case.length,
+                    force,
+                    force_position,
+                    support
+                )
+            
+            # 3. Расчёт максимального прогиба
+            with stage_timer("deflection", support):
+                max_deflection = self._calculate_max_deflection(
+                    load_case.length,
+                    force,
+                    force_position,
+                    support,
+                    moment_of_inertia
+                )
+        else:
+            # 1-3. Реакции, момент и прогиб суперпозицией всех нагрузок
+            # (или по решению МКЭ для произвольных опор)
+            with stage_timer("fem" if load_case.supports else "superposition", support):
+                reactions, max_moment, max_deflection = self._analyze_loads(
+                    load_case,
+                    moment_of_inertia
+                )
+        
+        return reactions, max_moment, max_deflection
+    
+    def calculate_batch(self, length, force, force_position, support_type,
+                        moment_of_inertia, moment_of_resistance,
+                        design_strength=None) -> Dict[str, np.ndarray]:
+        """
+        Пакетный расчёт балок операциями над массивами NumPy.
+        
+        Повторяет этапы метода calculate (реакции, момент, прогиб,
+        напряжение, проверки) по колонкам и даёт те же значения,
+        включая округление.
+        
+        Args:
+            length: Длины пролётов, м
+            force: Величины сил, кН
+            force_position: Координаты приложения сил (доля от длины)
+            support_type: Типы опор
+            moment_of_inertia: Моменты инерции профилей Ix, см⁴
+            moment_of_resistance: Моменты сопротивления профилей Wx, см³
+            design_strength: Расчётные сопротивления стали, МПа
+                (None - settings.ALLOWABLE_STRESS)
+            
+        Returns:
+            Словарь массивов: R_a, R_b, M_a, M_b, max_moment, max_deflection,
+            max_stress, is_strength_sufficient, is_stiffness_sufficient
+        """
+        # 1-3. Реакции, максимальный момент и прогиб
+        extrema = self.batch_extrema(length, force, force_position, support_type, moment_of_inertia)
+        max_moment = _round_array(extrema["max_moment"], 2)
+        max_deflection = _round_array(extrema["max_deflection"], 3)
+        length = np.asarray(length, dtype=np.float64)
+        moment_of_resistance = np.asarray(moment_of_resistance, dtype=np.float64)
+        
+        # 4. Максимальное напряжение
+        Wx = moment_of_resistance * 1e-6
+        max_stress = _round_array(max_moment * 1000 / Wx / 1e6, 2)
+        
+        # 5. Проверки
+        if design_strength is None:
+            design_strength = settings.ALLOWABLE_STRESS
+        is_strength_sufficient = max_stress <= np.asarray(design_strength, dtype=np.float64)
+        allowable_deflection = length * 1000 * settings.ALLOWABLE_DEFLECTION_RATIO
+        is_stiffness_sufficient = max_deflection <= allowable_deflection
+        
+        return {
+            "R_a": _round_array(extrema["R_a"], 2),
+            "R_b": _round_array(extrema["R_b"], 2),
+            "M_a": _round_array(extrema["M_a"], 2),
+            "M_b": _round_array(extrema["M_b"], 2),
+            "max_moment": max_moment,
+            "max_deflection": max_deflection,
+            "max_stress": max_stress,
+            "is_strength_sufficient": is_strength_sufficient,
+            "is_stiffness_sufficient": is_stiffness_sufficient
+        }
+    
+    def batch_extrema(self, length, force, force_position, support_type,
+                      moment_of_inertia, elastic_modulus=None) -> Dict[str, np.ndarray]:
+        """
+        Реакции, максимальный момент и прогиб по колонкам без округления.
+        
+        Аргументы транслируются по правилам NumPy, поэтому любая из
+        величин может быть скаляром или выборкой (например, в расчёте
+        надёжности методом Монте-Карло).
+        
+        Args:
+            length: Длины пролётов, м
+            force: Величины сил, кН
+            force_position: Координаты приложения сил (доля от длины)
+            support_type: Типы опор
+            moment_of_inertia: Моменты инерции профилей Ix, см⁴
+            elastic_modulus: Модули упругости, Па (None - STEEL_ELASTIC_MODULUS)
+            
+        Returns:
+            Словарь массивов: R_a, R_b, M_a, M_b (кН, кН·м),
+            max_moment (кН·м), max_deflection (мм)
+        """
+        length = np.asarray(length, dtype=np.float64)
+        force = np.asarray(force, dtype=np.float64)
+        force_position = np.asarray(force_position, dtype=np.float64)
+        support_type = np.asarray(support_type)
+        moment_of_inertia = np.asarray(moment_of_inertia, dtype=np.float64)
+        
+        hinged = support_type == "hinged"
+        cantilever = support_type == "cantilever"
+        fixed = support_type == "fixed"
+        
+        a = force_position * length
+        b = length - a
+        
+        # 1. Реакции опор
+        R_a = np.where(hinged, force * b / length,
+                       np.where(cantilever, force,
+                                np.where(fixed, force * b ** 2 * (3 * a + b) / length ** 3, 0.0)))
+        R_b = np.where(hinged, force * a / length,
+                       np.where(fixed, force * a ** 2 * (a + 3 * b) / length ** 3, 0.0))
+        M_fixed_a = force * a * b ** 2 / length ** 2
+        M_fixed_b = force * a ** 2 * b / length ** 2
+        M_a = np.where(cantilever, force * force_position * length,
+                       np.where(fixed, M_fixed_a, 0.0))
+        M_b = np.where(fixed, M_fixed_b, 0.0)
+        
+        # 2. Максимальный момент
+        M_fixed = np.maximum(np.maximum(M_fixed_a, M_fixed_b), 2 * force * a ** 2 * b ** 2 / length ** 3)
+        max_moment = np.where(hinged, force * a * (length - a) / length,
+                              np.where(cantilever, force * a,
+                                       np.where(fixed, M_fixed, 0.0)))
+        
+        # 3. Максимальный прогиб
+        Ix = moment_of_inertia * 1e-8
+        P = force * 1000
+        E = self.STEEL_ELASTIC_MODULUS if elastic_modulus is None else np.asarray(elastic_modulus, dtype=np.float64)
+        short, long = np.minimum(a, b), np.maximum(a, b)
+        d = length ** 2 - short ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_center = (P * length ** 3) / (48 * E * Ix)
+            f_offset = (P * short * d * np.sqrt(d)) / (9 * sqrt(3) * E * Ix * length)
+            f_cantilever = (P * a ** 2 * (3 * length - a)) / (6 * E * Ix)
+            f_fixed = (2 * P * long ** 3 * short ** 2) / (3 * E * Ix * (3 * long + short) ** 2)
+        f_hinged = np.where(np.abs(a - b) < 1e-6, f_center, f_offset)
+        f_max_m = np.where(hinged, f_hinged,
+                           np.where(cantilever, f_cantilever,
+                                    np.where(fixed, f_fixed, 0.0)))
+        
+        return {
+            "R_a": R_a,
+            "R_b": R_b,
+            "M_a": M_a,
+            "M_b": M_b,
+            "max_moment": max_moment,
+            "max_deflection": f_max_m * 1000,  # м → мм
+        }
+    
     def _calculate_reactions(self, length: float, force: float, 
                            force_position: float, support_type: str) -> Dict[str, float]:
         """Расчёт реакций опор."""
@@ -127,12 +415,18 @@ class BeamCalculator:
         elif support_type == "cantilever":
             return {"R_a": round(force, 2), "M_a": round(force * force_position * length, 2)}
         
-        # Для жёсткой заделки
+        # Для балки с заделками по обоим концам
         elif support_type == "fixed":
             a = force_position * length
-            R_a = force
-            M_a = force * a
-            return {"R_a": round(R_a, 2), "M_a": round(M_a, 2)}
+            b = length - a
+            
+            R_a = force * b ** 2 * (3 * a + b) / length ** 3
+            R_b = force * a ** 2 * (a + 3 * b) / length ** 3
+            M_a = force * a * b ** 2 / length ** 2
+            M_b = force * a ** 2 * b / length ** 2
+            
+            return {"R_a": round(R_a, 2), "M_a": round(M_a, 2),
+                    "R_b": round(R_b, 2), "M_b": round(M_b, 2)}
         
         return {"R_a": 0.0, "R_b": 0.0}
     
@@ -152,9 +446,12 @@ class BeamCalculator:
             return round(M_max, 2)
         
         elif support_type == "fixed":
-            # Упрощённо - момент под силой
-            M_max = force * a * (length - a) / length
-            return round(M_max, 2)
+            # Наибольший из опорных моментов и момента под силой
+            b = length - a
+            M_a = force * a * b ** 2 / length ** 2
+            M_b = force * a ** 2 * b / length ** 2
+            M_load = 2 * force * a ** 2 * b ** 2 / length ** 3
+            return round(max(M_a, M_b, M_load), 2)
         
         return 0.0
     
@@ -162,33 +459,47 @@ class BeamCalculator:
                                 force_position: float, support_type: str,
                                 moment_of_inertia: float) -> float:
         """Расчёт максимального прогиба."""
-        if support_type != "hinged":
-            # Для MVP считаем только шарнирно-опёртую балку
-            return 0.0
-        
         # Переводим момент инерции из см⁴ в м⁴
         Ix = moment_of_inertia * 1e-8  # 1 см⁴ = 1e-8 м⁴
         
         # Переводим силу из кН в Н
         P = force * 1000  # кН → Н
+        E = self.STEEL_ELASTIC_MODULUS
         
         a = force_position * length
         b = length - a
         
-        # Проверяем, находится ли сила посередине (с небольшой погрешностью)
-        if abs(a - b) < 1e-6:  # a примерно равно b
-            # Формула для силы посередине: f_max = (P * L³) / (48 * E * I)
-            f_max_m = (P * length ** 3) / (48 * self.STEEL_ELASTIC_MODULUS * Ix)
+        if support_type == "hinged":
+            # Проверяем, находится ли сила посередине (с небольшой погрешностью)
+            if abs(a - b) < 1e-6:  # a примерно равно b
+                # Формула для силы посередине: f_max = (P * L³) / (48 * E * I)
+                f_max_m = (P * length ** 3) / (48 * E * Ix)
+            else:
+                # Максимум на большем участке, c - меньший из a и b:
+                # f_max = P * c * (L² - c²)^(3/2) / (9√3 * E * I * L)
+                c = min(a, b)
+                d = length ** 2 - c ** 2
+                f_max_m = (P * c * d * sqrt(d)) / (9 * sqrt(3) * E * Ix * length)
+        
+        elif support_type == "cantilever":
+            # Прогиб свободного конца: f_max = P * a² * (3L - a) / (6 * E * I)
+            f_max_m = (P * a ** 2 * (3 * length - a)) / (6 * E * Ix)
+        
+        elif support_type == "fixed":
+            # Максимум на большем участке, c - больший, d - меньший из a и b:
+            # f_max = 2 * P * c³ * d² / (3 * E * I * (3c + d)²)
+            c, d = max(a, b), min(a, b)
+            f_max_m = (2 * P * c ** 3 * d ** 2) / (3 * E * Ix * (3 * c + d) ** 2)
+        
         else:
-            # Формула для силы не по центру: f_max = (P * a² * b²) / (3 * E * I * L)
-            f_max_m = (P * a ** 2 * b ** 2) / (3 * self.STEEL_ELASTIC_MODULUS * Ix * length)
+            return 0.0
         
         # Переводим в миллиметры
         f_max_mm = f_max_m * 1000
         
         return round(f_max_mm, 3)
-
-
+    
+    
     def _calculate_max_stress(self, max_moment: float, 
                             moment_of_resistance: float) -> float:
         """Расчёт максимального нормального напряжения."""
@@ -204,60 +515,170 @@ class BeamCalculator:
         
         return round(stress_mpa, 2)
     
-    def _check_strength(self, max_stress: float) -> bool:
+    def _check_strength(self, max_stress: float, design_strength: Optional[float] = None) -> bool:
         """Проверка по прочности."""
-        return max_stress <= settings.ALLOWABLE_STRESS
+        if design_strength is None:
+            design_strength = settings.ALLOWABLE_STRESS
+        return max_stress <= design_strength
     
     def _check_stiffness(self, max_deflection: float, length: float) -> bool:
         """Проверка по жёсткости."""
         allowable_deflection = length * 1000 * settings.ALLOWABLE_DEFLECTION_RATIO  # мм
         return max_deflection <= allowable_deflection
     
-    def _generate_diagram_data(self, length: float, force: float,
-                             force_position: float, support_type: str) -> Dict[str, List[List[float]]]:
-        """Генерация данных для построения эпюр."""
-        # Упрощённые данные для MVP
-        # В post-MVP сделаем точный расчёт точек
+    def _generate_diagram_data(self, load_case: BeamLoadCase, moment_of_inertia: float,
+                             points: int = 101,
+                             max_points: Optional[int] = None) -> Dict[str, List[List[float]]]:
+        """
+        Генерация данных для построения эпюр.
         
-        a = force_position * length
+        Поперечная сила, момент, угол поворота и прогиб вычисляются точно
+        на равномерной сетке из points точек (плюс точки приложения нагрузок).
+        При заданном max_points каждая эпюра прореживается алгоритмом LTTB.
+        """
+        x = diagram_grid(load_case.length, points, self._load_breakpoints(load_case))
         
-        if support_type == "hinged":
-            moments = [
-                [0.0, 0.0],
-                [a, force * a * (length - a) / length],
-                [length, 0.0]
+        fields_at, _ = self._fields_function(load_case, moment_of_inertia)
+        fields = fields_at(x)
+        
+        series = {
+            "shear": fields["shear"],
+            "moments": fields["moment"],
+            "slopes": fields["slope"],
+            "positions": fields["deflection"],
+        }
+        
+        diagram_data = {}
+        for name, values in series.items():
+            xs, ys = x, values
+            if max_points is not None and max_points < len(x):
+                selected = lttb(x, values, max_points)
+                xs, ys = x[selected], values[selected]
+            diagram_data[name] = np.column_stack((xs, ys)).tolist()
+        
+        return diagram_data
+    
+    def _analyze_loads(self, load_case: BeamLoadCase,
+                       moment_of_inertia: float) -> Tuple[Dict[str, float], float, float]:
+        """
+        Реакции, максимальный момент и прогиб суперпозицией всех нагрузок.
+        
+        Вклады нагрузок складываются векторно по сетке сечений, дополненной
+        точками нулевой поперечной силы и нулевого угла поворота.
+        
+        Returns:
+            Кортеж (реакции, M_max по модулю в кН·м, f_max по модулю в мм)
+        """
+        fields_at, reaction_keys = self._fields_function(load_case, moment_of_inertia)
+        x = diagram_grid(load_case.length, self.ANALYSIS_POINTS, self._load_breakpoints(load_case))
+        x = extrema_grid(x, fields_at(x))
+        fields = fields_at(x)
+        
+        reactions = {key: round(float(fields[key]), 2) for key in reaction_keys}
+        
+        max_moment = round(float(np.abs(fields["moment"]).max()), 2)
+        max_deflection = round(float(np.abs(fields["deflection"]).max()), 3)
+        
+        return reactions, max_moment, max_deflection
+    
+    def _fields_function(self, load_case: BeamLoadCase,
+                         moment_of_inertia: float) -> Tuple[Callable, Tuple[str, ...]]:
+        """
+        Функция полей схемы по координатам сечений и ключи её реакций.
+        
+        Стандартные опоры считаются точными формулами суперпозиции,
+        произвольные - решением МКЭ (одно решение на все сечения).
+        """
+        ei = self._flexural_rigidity(moment_of_inertia)
+        loads = self._load_arrays(load_case)
+        
+        if load_case.supports:
+            L = load_case.length
+            supports = [
+                SupportSpec(s.type, s.position * L, s.stiffness, s.rotational_stiffness)
+                for s in load_case.supports
             ]
-        else:
-            moments = [[0.0, 0.0], [length, 0.0]]
+            solution = solve_beam(L, ei, supports, elements=self.FEM_ELEMENTS, **loads)
+            return solution.fields, tuple(solution.reactions)
         
-        positions = [[0.0, 0.0], [length, 0.0]]
+        terms = load_terms(**loads)
+        fields_at = lambda x: beam_fields(load_case.length, load_case.support_type, *terms, x, ei)
+        return fields_at, REACTION_KEYS[load_case.support_type]
+    
+    def _load_arrays(self, load_case: BeamLoadCase) -> Dict[str, List[float]]:
+        """Нагрузки схемы списками (аргументы load_terms и solve_beam, координаты в метрах)."""
+        L = load_case.length
+        forces = [p.force for p in load_case.point_loads]
+        positions = [p.position * L for p in load_case.point_loads]
+        if load_case.force is not None:
+            forces.insert(0, load_case.force)
+            positions.insert(0, load_case.force_position * L)
         
-        return {
-            "moments": moments,
-            "positions": positions
-        }
+        distributed = load_case.distributed_loads
+        return dict(
+            point_forces=forces,
+            point_positions=positions,
+            q_start=[q.q_start for q in distributed],
+            q_end=[q.q_start if q.q_end is None else q.q_end for q in distributed],
+            q_from=[q.start * L for q in distributed],
+            q_to=[q.end * L for q in distributed],
+            moments=[m.moment for m in load_case.applied_moments],
+            moment_positions=[m.position * L for m in load_case.applied_moments]
+        )
+    
+    def _load_breakpoints(self, load_case: BeamLoadCase) -> List[float]:
+        """Координаты приложения нагрузок, границ участков и опор, м."""
+        L = load_case.length
+        points = [p.position * L for p in load_case.point_loads]
+        points += [s.position * L for s in load_case.supports]
+        points += [m.position * L for m in load_case.applied_moments]
+        for q in load_case.distributed_loads:
+            points += [q.start * L, q.end * L]
+        if load_case.force is not None:
+            points.append(load_case.force_position * L)
+        return points
+    
+    def _flexural_rigidity(self, moment_of_inertia: float) -> float:
+        """Изгибная жёсткость EI, кН·м² (Ix в см⁴)."""
+        return self.STEEL_ELASTIC_MODULUS * moment_of_inertia * 1e-8 / 1000
     
     def _generate_report_sections(self, request: BeamCalculationRequest,
                                 profile: MaterialProfile, reactions: Dict[str, float],
                                 max_moment: float, max_deflection: float,
                                 max_stress: float, is_strength_sufficient: bool,
-                                is_stiffness_sufficient: bool) -> List[Dict[str, str]]:
+                                is_stiffness_sufficient: bool,
+                                design_strength: Optional[float] = None) -> List[Dict[str, str]]:
         """Формирование текстовых блоков отчёта."""
+        if design_strength is None:
+            design_strength = self.design_strength(request.steel_grade)
         # Словарь для перевода типов опор
         support_type_translation = {
             "hinged": "шарнирно-опёртая",
             "cantilever": "консоль",
-            "fixed": "жёсткая заделка"
+            "fixed": "жёсткая заделка",
+            "custom": "произвольные опоры"
         }
         support_type_ru = support_type_translation.get(request.support_type, request.support_type)
         
+        single_load = request.single_point_load()
+        if single_load is not None:
+            force, force_position = single_load
+            loads_text = (f"Сила: {force} кН\n"
+                          f"Положение силы: {force_position * 100}% длины\n")
+        else:
+            loads_text = "".join(self._describe_loads(request))
+        
+        steel_text = ""
+        if request.steel_grade is not None:
+            steel_text = f"Марка стали: {self._steel_grades.get(request.steel_grade).name}\n"
+        
         sections = [
             {
                 "title": "Исходные данные",
                 "content": f"Длина пролёта: {request.length} м\n"
                         f"Тип опор: {support_type_ru}\n"  # <-- ИСПРАВЛЕНО
-                        f"Сила: {request.force} кН\n"
-                        f"Положение силы: {request.force_position * 100}% длины\n"
+                        f"{''.join(self._describe_supports(request))}"
+                        f"{loads_text}"
                         f"Профиль: {profile.name}"
             },
             {
@@ -273,10 +694,61 @@ class BeamCalculator:
             {
                 "title": "Проверка по нормам",
                 "content": f"Прочность: {'✅ обеспечена' if is_strength_sufficient else '❌ не обеспечена'}\n"
-                        f"Допустимое напряжение: {settings.ALLOWABLE_STRESS} МПа\n"
+                        f"{steel_text}"
+                        f"Допустимое напряжение: {design_strength} МПа\n"
                         f"Жёсткость: {'✅ обеспечена' if is_stiffness_sufficient else '❌ не обеспечена'}\n"
                         f"Допустимый прогиб: L/{int(1/settings.ALLOWABLE_DEFLECTION_RATIO)}"
             }
         ]
         
         return sections
+
+    
+    def _describe_supports(self, load_case: BeamLoadCase) -> List[str]:
+        """Строки отчёта с перечнем произвольных опор."""
+        names = {
+            "pin": "шарнирно-неподвижная",
+            "roller": "шарнирно-подвижная",
+            "fixed": "заделка",
+            "free": "свободный конец",
+            "spring": "упругая"
+        }
+        lines = []
+        for support in load_case.supports:
+            stiffness = ""
+            if support.stiffness is not None:
+                stiffness += f", k = {support.stiffness} кН/м"
+            if support.rotational_stiffness is not None:
+                stiffness += f", kφ = {support.rotational_stiffness} кН·м/рад"
+            lines.append(f"Опора: {names[support.type]} в {support.position * 100}% длины{stiffness}\n")
+        return lines
+    
+    def _describe_loads(self, load_case: BeamLoadCase) -> List[str]:
+        """Строки отчёта с перечнем нагрузок."""
+        lines = []
+        if load_case.force is not None:
+            lines.append(f"Сила: {load_case.force} кН в {load_case.force_position * 100}% длины\n")
+        for load in load_case.point_loads:
+            lines.append(f"Сила: {load.force} кН в {load.position * 100}% длины\n")
+        for load in load_case.distributed_loads:
+            q_end = load.q_start if load.q_end is None else load.q_end
+            lines.append(f"Распределённая нагрузка: {load.q_start}…{q_end} кН/м "
+                         f"на участке {load.start * 100}–{load.end * 100}% длины\n")
+        for load in load_case.applied_moments:
+            lines.append(f"Момент: {load.moment} кН·м в {load.position * 100}% длины\n")
+        return lines
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Округление массива с тем же результатом, что у встроенного round().
+    
+    np.round умножает на 10ⁿ и может ошибиться на половинных значениях,
+    поэтому такие элементы досчитываются через round().
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scaled = values * 10.0 ** ndigits
+    rounded = np.round(values, ndigits)
+    ambiguous = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(ambiguous):
+        rounded.flat[i] = round(float(values.flat[i]), ndigits)
+    return rounded
@@ -0,0 +1,173 @@
+"""
+Таблица несущей способности «марка стали × профиль».
+
+Предельный момент M = Ry·Wx и жёсткость EI всех пар считаются один
+раз при построении таблицы; проверка пары - обращение по индексу,
+отбор пар, воспринимающих заданный момент, - двоичный поиск.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.models.steel_grade import CapacityPair, CapacityQueryResponse
+from app.repositories.profile_catalog import ProfileCatalog
+from app.repositories.steel_grades import SteelGradeCatalog
+from app.services.calculator import BeamCalculator
+
+
+class CapacityTable:
+    """
+    Предвычисленные предельные моменты и жёсткости пар «марка × профиль».
+    
+    Моменты хранятся непрерывным массивом (марки × профили) и его
+    отсортированной копией: пары с M ≥ M_треб образуют хвост
+    отсортированного массива, начало которого находится searchsorted.
+    Внутри одной марки порядок профилей по M совпадает с порядком по Wx,
+    поэтому запрос по марке - двоичный поиск по Wx при Wx ≥ M / Ry.
+    """
+    
+    def __init__(self, catalog: ProfileCatalog, grades: SteelGradeCatalog,
+                 elastic_modulus: float = BeamCalculator.STEEL_ELASTIC_MODULUS):
+        """
+        Построение таблицы.
+        
+        Args:
+            catalog: Каталог профилей
+            grades: Каталог марок стали
+            elastic_modulus: Модуль упругости стали, Па
+        """
+        self._profile_keys = catalog.keys
+        self._profile_index = {key: i for i, key in enumerate(self._profile_keys)}
+        self._grade_keys = grades.keys
+        self._grade_index = {key: i for i, key in enumerate(self._grade_keys)}
+        self._strength = grades.design_strengths
+        
+        wx = catalog.column("moment_of_resistance_wx_cm3")
+        ix = catalog.column("moment_of_inertia_ix_cm4")
+        self._mass = catalog.column("mass_kg_m")
+        
+        # M = Ry·Wx: МПа·см³ → кН·м
+        self.allowable_moment = np.ascontiguousarray(np.outer(self._strength, wx) / 1000)
+        self.allowable_moment.setflags(write=False)
+        # EI: Па·см⁴ → кН·м²
+        self.stiffness = np.ascontiguousarray(elastic_modulus * ix * 1e-8 / 1000)
+        self.stiffness.setflags(write=False)
+        
+        flat = self.allowable_moment.ravel()
+        self._order = np.argsort(flat, kind="stable")
+        self._sorted_moment = flat[self._order]
+        self._order_by_wx = np.argsort(wx, kind="stable")
+        self._sorted_wx = wx[self._order_by_wx]
+    
+    @property
+    def shape(self):
+        """Размер таблицы: (число марок, число профилей)."""
+        return self.allowable_moment.shape
+    
+    def capacity(self, steel_grade: str, profile_name: str) -> CapacityPair:
+        """
+        Предельный момент и жёсткость пары.
+        
+        Args:
+            steel_grade: Ключ марки стали
+            profile_name: Ключ профиля
+        
+        Returns:
+            Характеристики пары
+        
+        Raises:
+            ValueError: Если марки или профиля нет в таблице
+        """
+        g, p = self._position(steel_grade, profile_name)
+        return self._pair(g, p)
+    
+    def check_strength(self, steel_grade: str, profile_name: str, moment: float) -> bool:
+        """
+        Проверка прочности по таблице: |M| ≤ Ry·Wx.
+        
+        Args:
+            steel_grade: Ключ марки стали
+            profile_name: Ключ профиля
+            moment: Расчётный изгибающий момент, кН·м
+        
+        Raises:
+            ValueError: Если марки или профиля нет в таблице
+        """
+        g, p = self._position(steel_grade, profile_name)
+        return abs(moment) <= self.allowable_moment[g, p]
+    
+    def pairs_for_moment(self, moment: float, steel_grade: Optional[str] = None,
+                         min_stiffness: Optional[float] = None,
+                         limit: Optional[int] = None) -> CapacityQueryResponse:
+        """
+        Пары «марка × профиль», воспринимающие момент.
+        
+        Args:
+            moment: Требуемый момент, кН·м (учитывается по модулю)
+            steel_grade: Ограничиться одной маркой
+            min_stiffness: Наименьшая жёсткость EI, кН·м²
+            limit: Наибольшее число пар в ответе
+        
+        Returns:
+            Пары по возрастанию предельного момента и их общее число
+        
+        Raises:
+            ValueError: Если марки нет в таблице
+        """
+        moment = abs(moment)
+        n_profiles = len(self._profile_keys)
+        
+        if steel_grade is not None:
+            g = self._grade(steel_grade)
+            # Ry·Wx ≥ M ⇔ Wx ≥ M / Ry (сравнение - по самим моментам,
+            # чтобы пограничные профили совпадали с check_strength)
+            row = self.allowable_moment[g]
+            start = np.searchsorted(self._sorted_wx, moment * 1000 / self._strength[g], side="left")
+            while start > 0 and row[self._order_by_wx[start - 1]] >= moment:
+                start -= 1
+            while start < n_profiles and row[self._order_by_wx[start]] < moment:
+                start += 1
+            profiles = self._order_by_wx[start:]
+            grades = np.full(len(profiles), g)
+        else:
+            start = np.searchsorted(self._sorted_moment, moment, side="left")
+            flat = self._order[start:]
+            grades, profiles = np.divmod(flat, n_profiles)
+        
+        if min_stiffness is not None:
+            mask = self.stiffness[profiles] >= min_stiffness
+            grades, profiles = grades[mask], profiles[mask]
+        
+        total = len(profiles)
+        if limit is not None:
+            grades, profiles = grades[:limit], profiles[:limit]
+        
+        return CapacityQueryResponse(
+            moment=moment,
+            total=total,
+            pairs=[self._pair(int(g), int(p)) for g, p in zip(grades, profiles)]
+        )
+    
+    def _grade(self, steel_grade: str) -> int:
+        """Строка таблицы для марки."""
+        index = self._grade_index.get(steel_grade)
+        if index is None:
+            raise ValueError(f"Марка стали '{steel_grade}' не найдена")
+        return index
+    
+    def _position(self, steel_grade: str, profile_name: str) -> Tuple[int, int]:
+        """Строка и столбец таблицы для пары."""
+        profile = self._profile_index.get(profile_name)
+        if profile is None:
+            raise ValueError(f"Профиль '{profile_name}' не найден")
+        return self._grade(steel_grade), profile
+    
+    def _pair(self, g: int, p: int) -> CapacityPair:
+        """Характеристики пары по позиции в таблице."""
+        return CapacityPair(
+            steel_grade=self._grade_keys[g],
+            profile_name=self._profile_keys[p],
+            allowable_moment=round(float(self.allowable_moment[g, p]), 3),
+            stiffness=round(float(self.stiffness[p]), 3),
+            mass_kg_m=float(self._mass[p])
+        )
@@ -0,0 +1,430 @@
+"""
+Сервис расчёта неразрезной многопролётной балки.
+Опорные моменты - по уравнениям трёх моментов, поля пролётов -
+по замкнутым формулам шарнирно-опёртой балки.
+"""
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.models.continuous_beam import ContinuousBeamRequest, ContinuousBeamResponse, ContinuousSpan, ContinuousSpanResult
+from app.models.material_profile import MaterialProfile
+from app.services.beam_fields import beam_fields, diagram_grid, load_terms
+from app.services.calculator import BeamCalculator
+from app.core.config import settings
+from app.core.execution import check_cancelled
+
+
+def solve_tridiagonal(lower, diagonal, upper, rhs) -> np.ndarray:
+    """
+    Решение трёхдиагональной системы методом прогонки (алгоритм Томаса).
+    
+    Прямой ход по матрице не зависит от правой части, поэтому несколько
+    правых частей (столбцы rhs) решаются за один проход, O(n · k).
+    Матрица уравнений трёх моментов имеет диагональное преобладание,
+    выбор ведущего элемента не нужен.
+    
+    Args:
+        lower: Поддиагональ, длина n - 1
+        diagonal: Диагональ, длина n
+        upper: Наддиагональ, длина n - 1
+        rhs: Правые части формы (n,) или (n, k)
+    
+    Returns:
+        Решение той же формы, что rhs
+    """
+    lower = np.asarray(lower, dtype=np.float64).tolist()
+    upper = np.asarray(upper, dtype=np.float64).tolist()
+    pivots = np.asarray(diagonal, dtype=np.float64).tolist()
+    d = np.array(rhs, dtype=np.float64)
+    n = len(pivots)
+    
+    for i in range(1, n):
+        factor = lower[i - 1] / pivots[i - 1]
+        pivots[i] -= factor * upper[i - 1]
+        d[i] -= factor * d[i - 1]
+    
+    x = np.empty_like(d)
+    x[-1] = d[-1] / pivots[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = (d[i] - upper[i] * x[i + 1]) / pivots[i]
+    return x
+
+
+def three_moment_system(lengths: np.ndarray, left_end: str = "pinned",
+                        right_end: str = "pinned") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Трёхдиагональная матрица уравнений трёх моментов (Клапейрона).
+    
+    Для промежуточной опоры i:
+    M[i-1]·L[i-1] + 2·M[i]·(L[i-1] + L[i]) + M[i+1]·L[i] = 6·EI·(θк[i-1] - θн[i]),
+    где θн, θк - углы поворота начала и конца пролёта как шарнирной балки.
+    Шарнирная крайняя опора даёт M = 0, заделка - условие θ = 0.
+    
+    Args:
+        lengths: Длины пролётов, м
+        left_end: Крайняя левая опора ('pinned' или 'fixed')
+        right_end: Крайняя правая опора ('pinned' или 'fixed')
+    
+    Returns:
+        Кортеж (поддиагональ, диагональ, наддиагональ) для N + 1 опоры
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    count = len(lengths)
+    
+    diagonal = np.ones(count + 1)
+    lower = np.zeros(count)
+    upper = np.zeros(count)
+    diagonal[1:-1] = 2 * (lengths[:-1] + lengths[1:])
+    lower[:-1] = lengths[:-1]
+    upper[1:] = lengths[1:]
+    
+    if left_end == "fixed":
+        diagonal[0] = 2 * lengths[0]
+        upper[0] = lengths[0]
+    if right_end == "fixed":
+        diagonal[-1] = 2 * lengths[-1]
+        lower[-1] = lengths[-1]
+    
+    return lower, diagonal, upper
+
+
+def three_moment_rhs(slope_start: np.ndarray, slope_end: np.ndarray,
+                     left_end: str = "pinned", right_end: str = "pinned") -> np.ndarray:
+    """
+    Правые части уравнений трёх моментов.
+    
+    Args:
+        slope_start: EI·θ в начале каждого пролёта как шарнирной балки, форма (N, ...)
+        slope_end: EI·θ в конце каждого пролёта, форма (N, ...)
+        left_end: Крайняя левая опора
+        right_end: Крайняя правая опора
+    
+    Returns:
+        Массив формы (N + 1, ...)
+    """
+    slope_start = np.asarray(slope_start, dtype=np.float64)
+    slope_end = np.asarray(slope_end, dtype=np.float64)
+    
+    rhs = np.zeros((len(slope_start) + 1,) + slope_start.shape[1:])
+    rhs[1:-1] = 6 * (slope_end[:-1] - slope_start[1:])
+    if left_end == "fixed":
+        rhs[0] = -6 * slope_start[0]
+    if right_end == "fixed":
+        rhs[-1] = 6 * slope_end[-1]
+    return rhs
+
+
+class ContinuousBeamAnalyzer:
+    """
+    Расчёт неразрезной балки постоянного сечения.
+    
+    Каждый пролёт - шарнирно-опёртая балка под своей нагрузкой и
+    опорными моментами. Постоянная нагрузка и временная нагрузка каждого
+    пролёта - отдельные правые части одной трёхдиагональной системы.
+    Огибающие по всем 2^N расстановкам временной нагрузки получаются
+    суперпозицией: в каждом сечении складываются только неблагоприятные
+    вклады пролётов.
+    """
+    
+    def __init__(self, calculator: BeamCalculator = None):
+        """
+        Инициализация.
+        
+        Args:
+            calculator: Калькулятор для жёсткости, напряжений и проверок
+        """
+        self._calculator = calculator or BeamCalculator()
+    
+    def analyze(self, request: ContinuousBeamRequest, profile: MaterialProfile,
+                cancel: Optional[threading.Event] = None) -> ContinuousBeamResponse:
+        """
+        Опорные моменты, реакции, огибающие и проверки неразрезной балки.
+        
+        Args:
+            request: Пролёты, нагрузки и условия на концах
+            profile: Данные стального профиля
+            cancel: Флаг отмены, проверяется между блоками пролётов
+        
+        Returns:
+            Результаты расчёта
+        
+        Raises:
+            ValueError: Если марки стали нет в каталоге
+            CalculationCancelled: Если расчёт отменён
+        """
+        calc = self._calculator
+        ei = calc._flexural_rigidity(profile.moment_of_inertia_ix_cm4)
+        design_strength = calc.design_strength(request.steel_grade)
+        spans = request.spans
+        count = len(spans)
+        lengths = np.array([span.length for span in spans])
+        live = np.array([span.live_load for span in spans])
+        L = lengths[:, None]
+        
+        # 1. Пролёты как шарнирные балки под постоянной нагрузкой
+        coef, position, order = self._span_terms(spans)
+        ends = np.column_stack((np.zeros(count), lengths))
+        at_ends = beam_fields(lengths, "hinged", coef, position, order, ends, 1.0)
+        
+        # 2. Опорные моменты: столбец постоянной нагрузки и по столбцу на каждый
+        #    пролёт с временной нагрузкой (EI·θ концов при q = 1: ±L³/24)
+        live_spans = np.flatnonzero(live > 0)
+        unit_slope = np.zeros((count, len(live_spans)))
+        unit_slope[live_spans, np.arange(len(live_spans))] = live[live_spans] * lengths[live_spans] ** 3 / 24
+        moments = solve_tridiagonal(
+            *three_moment_system(lengths, request.left_end, request.right_end),
+            three_moment_rhs(
+                np.column_stack((at_ends["slope"][:, 0], unit_slope)),
+                np.column_stack((at_ends["slope"][:, 1], -unit_slope)),
+                request.left_end,
+                request.right_end
+            )
+        )
+        dead_moments, live_moments = moments[:, 0], moments[:, 1:]
+        case_of_span = np.full(count, -1)
+        case_of_span[live_spans] = np.arange(len(live_spans))
+        
+        # 3. Поля пролёта линейны по опорным моментам слева и справа.
+        #    К сетке добавляются нули поперечной силы огибающих моментов
+        #    (экстремумы пролётов): между узлами она линейна при
+        #    равномерных нагрузках, поэтому нули находятся интерполяцией
+        fractions, valid = self._span_grid(spans, request.diagram_points)
+        x, dead, basis, own_live = self._span_fields(lengths, coef, position, order, fractions, ei)
+        slopes = self._moment_slopes(dead, basis, own_live, dead_moments, live_moments, live,
+                                     case_of_span, request.pattern_loading, cancel)
+        extra = [[] for _ in range(count)]
+        for slope in slopes:
+            for k, fraction in zip(*self._zero_crossings(fractions, slope, valid)):
+                extra[k].append(fraction)
+        fractions, valid = self._span_grid(spans, request.diagram_points, extra)
+        x, dead, basis, own_live = self._span_fields(lengths, coef, position, order, fractions, ei)
+        
+        envelopes = {
+            name: self._envelope(dead[name], left, right, dead_moments, live_moments,
+                                 own_live[name] * live[:, None], case_of_span,
+                                 request.pattern_loading, cancel)
+            for name, (left, right) in basis.items()
+        }
+        
+        # 4. Опорные моменты и реакции при временной нагрузке во всех пролётах
+        full_moments = dead_moments + live_moments.sum(axis=1)
+        jump = (full_moments[1:] - full_moments[:-1]) / lengths
+        reactions = np.zeros(count + 1)
+        reactions[:-1] += at_ends["R_a"] + live * lengths / 2 + jump
+        reactions[1:] += at_ends["R_b"] + live * lengths / 2 - jump
+        
+        # 5. Максимумы и проверки
+        moment_max, moment_min = envelopes["moment"]
+        deflection = np.maximum(np.abs(envelopes["deflection"][0]), np.abs(envelopes["deflection"][1]))
+        span_deflection = deflection.max(axis=1)
+        allowable = lengths * 1000 * settings.ALLOWABLE_DEFLECTION_RATIO
+        
+        span_results = [
+            ContinuousSpanResult(
+                length=float(lengths[k]),
+                max_moment=round(float(moment_max[k].max()), 2),
+                min_moment=round(float(moment_min[k].min()), 2),
+                max_deflection=round(float(span_deflection[k]), 3),
+                is_stiffness_sufficient=bool(round(float(span_deflection[k]), 3) <= allowable[k])
+            )
+            for k in range(count)
+        ]
+        
+        max_moment = round(float(max(np.abs(moment_max).max(), np.abs(moment_min).max())), 2)
+        max_deflection = round(float(span_deflection.max()), 3)
+        max_stress = calc._calculate_max_stress(max_moment, profile.moment_of_resistance_wx_cm3)
+        
+        offsets = np.concatenate(([0.0], np.cumsum(lengths)[:-1]))
+        global_x = (x + offsets[:, None])[valid]
+        series = {}
+        for name, (upper, lower) in envelopes.items():
+            series[f"{name}_max"] = self._series(global_x, upper[valid])
+            series[f"{name}_min"] = self._series(global_x, lower[valid])
+        
+        return ContinuousBeamResponse(
+            support_moments=np.round(full_moments, 2).tolist(),
+            reactions=np.round(reactions, 2).tolist(),
+            spans=span_results,
+            envelopes=series,
+            max_moment=max_moment,
+            max_deflection=max_deflection,
+            max_stress=max_stress,
+            is_strength_sufficient=calc._check_strength(max_stress, design_strength),
+            is_stiffness_sufficient=all(span.is_stiffness_sufficient for span in span_results)
+        )
+    
+    @staticmethod
+    def _span_fields(lengths: np.ndarray, coef: np.ndarray, position: np.ndarray, order: np.ndarray,
+                     fractions: np.ndarray, ei: float) -> Tuple[np.ndarray, Dict, Dict, Dict]:
+        """
+        Поля пролётов в сечениях fractions.
+        
+        Returns:
+            Кортеж (координаты сечений, поля шарнирных пролётов от постоянной
+            нагрузки, поля от единичных опорных моментов слева и справа,
+            поля от собственной временной нагрузки q = 1)
+        """
+        L = lengths[:, None]
+        x = fractions * L
+        dead = beam_fields(lengths, "hinged", coef, position, order, x, ei)
+        xi = x / L
+        basis = {
+            "moment": (1 - xi, xi),
+            "shear": (np.broadcast_to(-1 / L, x.shape), np.broadcast_to(1 / L, x.shape)),
+            "deflection": (x * (2 * L ** 2 - 3 * L * x + x ** 2) / (6 * L * ei) * 1000,
+                           x * (L ** 2 - x ** 2) / (6 * L * ei) * 1000),
+        }
+        own_live = {
+            "moment": x * (L - x) / 2,
+            "shear": L / 2 - x,
+            "deflection": x * (L ** 3 - 2 * L * x ** 2 + x ** 3) / (24 * ei) * 1000,
+        }
+        return x, dead, basis, own_live
+    
+    @classmethod
+    def _moment_slopes(cls, dead: Dict, basis: Dict, own_live: Dict,
+                       dead_moments: np.ndarray, live_moments: np.ndarray, live: np.ndarray,
+                       case_of_span: np.ndarray, pattern_loading: bool,
+                       cancel: Optional[threading.Event] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Производные огибающих момента по x (максимум, минимум).
+        
+        В каждом сечении это поперечная сила той расстановки временной
+        нагрузки, которая даёт огибающую: загружения, увеличивающие
+        (уменьшающие) момент в сечении.
+        """
+        (left_m, right_m), (left_v, right_v) = basis["moment"], basis["shear"]
+        shear = dead["shear"] + left_v * dead_moments[:-1, None] + right_v * dead_moments[1:, None]
+        upper, lower = shear.copy(), shear.copy()
+        moments = cls._contributions(left_m, right_m, live_moments, own_live["moment"] * live[:, None],
+                                     case_of_span, cancel)
+        shears = cls._contributions(left_v, right_v, live_moments, own_live["shear"] * live[:, None],
+                                    case_of_span)
+        for (rows, moment), (_, contribution) in zip(moments, shears):
+            if pattern_loading:
+                upper[rows] += np.where(moment > 0, contribution, 0.0).sum(axis=-1)
+                lower[rows] += np.where(moment < 0, contribution, 0.0).sum(axis=-1)
+            else:
+                both = contribution.sum(axis=-1)
+                upper[rows] += both
+                lower[rows] += both
+        return upper, lower
+    
+    @staticmethod
+    def _zero_crossings(fractions: np.ndarray, values: np.ndarray,
+                        valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Нули values между соседними значимыми сечениями: номера пролётов и доли длины."""
+        both = valid[:, :-1] & valid[:, 1:]
+        span, i = np.nonzero(both & (np.sign(values[:, :-1]) * np.sign(values[:, 1:]) < 0))
+        x0, x1 = fractions[span, i], fractions[span, i + 1]
+        v0, v1 = values[span, i], values[span, i + 1]
+        return span, x0 - v0 * (x1 - x0) / (v1 - v0)
+    
+    @staticmethod
+    def _contributions(left: np.ndarray, right: np.ndarray, live_moments: np.ndarray,
+                       own_live: np.ndarray, case_of_span: np.ndarray,
+                       cancel: Optional[threading.Event] = None) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Вклады загружений временной нагрузкой блоками пролётов
+        «пролёты × сечения × загружения», чтобы объём памяти был ограничен;
+        между блоками проверяется флаг отмены.
+        """
+        count, points = left.shape
+        cases = live_moments.shape[1]
+        chunk = max(1, settings.CONTINUOUS_BEAM_CHUNK_CELLS // (points * max(cases, 1)))
+        for start in range(0, count, chunk):
+            check_cancelled(cancel)
+            rows = slice(start, start + chunk)
+            contribution = (
+                left[rows, :, None] * live_moments[:-1][rows, None, :]
+                + right[rows, :, None] * live_moments[1:][rows, None, :]
+            )
+            own = np.flatnonzero(case_of_span[rows] >= 0)
+            contribution[own, :, case_of_span[rows][own]] += own_live[rows][own]
+            yield rows, contribution
+    
+    @classmethod
+    def _envelope(cls, dead: np.ndarray, left: np.ndarray, right: np.ndarray,
+                  dead_moments: np.ndarray, live_moments: np.ndarray,
+                  own_live: np.ndarray, case_of_span: np.ndarray,
+                  pattern_loading: bool,
+                  cancel: Optional[threading.Event] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Огибающие поля (максимум, минимум) по расстановкам временной нагрузки."""
+        total = dead + left * dead_moments[:-1, None] + right * dead_moments[1:, None]
+        upper, lower = total.copy(), total.copy()
+        if not live_moments.shape[1]:
+            return upper, lower
+        
+        for rows, contribution in cls._contributions(left, right, live_moments, own_live,
+                                                     case_of_span, cancel):
+            if pattern_loading:
+                upper[rows] += np.maximum(contribution, 0.0).sum(axis=-1)
+                lower[rows] += np.minimum(contribution, 0.0).sum(axis=-1)
+            else:
+                both = contribution.sum(axis=-1)
+                upper[rows] += both
+                lower[rows] += both
+        
+        return upper, lower
+    
+    @staticmethod
+    def _span_terms(spans: List[ContinuousSpan]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Слагаемые Маколея постоянных нагрузок пролётов, дополненные нулями до общей длины."""
+        terms = []
+        for span in spans:
+            L = span.length
+            distributed = span.distributed_loads
+            terms.append(load_terms(
+                point_forces=[p.force for p in span.point_loads],
+                point_positions=[p.position * L for p in span.point_loads],
+                q_start=[q.q_start for q in distributed],
+                q_end=[q.q_start if q.q_end is None else q.q_end for q in distributed],
+                q_from=[q.start * L for q in distributed],
+                q_to=[q.end * L for q in distributed],
+                moments=[m.moment for m in span.applied_moments],
+                moment_positions=[m.position * L for m in span.applied_moments]
+            ))
+        
+        width = max(1, max(len(c) for c, _, _ in terms))
+        coef = np.zeros((len(spans), width))
+        position = np.zeros((len(spans), width))
+        order = np.ones((len(spans), width), dtype=np.int64)
+        for i, (c, p, o) in enumerate(terms):
+            coef[i, :len(c)] = c
+            position[i, :len(c)] = p
+            order[i, :len(c)] = o
+        return coef, position, order
+    
+    @staticmethod
+    def _span_grid(spans: List[ContinuousSpan], points: int,
+                   extra: Optional[List[List[float]]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Сечения пролётов (доли длины) и маска значимых точек.
+        
+        К равномерной сетке добавляются точки приложения нагрузок
+        и точки extra (по списку долей на пролёт); короткие строки
+        дополняются концом пролёта и исключаются маской.
+        """
+        grids = []
+        for k, span in enumerate(spans):
+            breakpoints = list(extra[k]) if extra else []
+            breakpoints += [p.position for p in span.point_loads]
+            breakpoints += [m.position for m in span.applied_moments]
+            for q in span.distributed_loads:
+                breakpoints += [q.start, q.end]
+            grids.append(diagram_grid(1.0, points, breakpoints))
+        
+        width = max(len(grid) for grid in grids)
+        fractions = np.ones((len(spans), width))
+        valid = np.zeros((len(spans), width), dtype=bool)
+        for i, grid in enumerate(grids):
+            fractions[i, :len(grid)] = grid
+            valid[i, :len(grid)] = True
+        return fractions, valid
+    
+    @staticmethod
+    def _series(x: np.ndarray, values: np.ndarray) -> List[List[float]]:
+        """Ряд точек [x, значение] для ответа."""
+        return np.column_stack((x, values)).tolist()
@@ -0,0 +1,54 @@
+"""
+Прореживание рядов для построения графиков.
+"""
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Алгоритм Largest-Triangle-Three-Buckets.
+    
+    Сохраняет форму кривой (пики, изломы) при сокращении числа точек:
+    из каждой корзины выбирается точка, образующая наибольший треугольник
+    с предыдущей выбранной точкой и средним следующей корзины.
+    
+    Args:
+        x: Абсциссы (по возрастанию)
+        y: Ординаты
+        threshold: Требуемое число точек (не меньше 3)
+        
+    Returns:
+        Индексы выбранных точек по возрастанию
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    every = (n - 2) / (threshold - 2)
+    # Границы корзин для внутренних точек: [bounds[i], bounds[i + 1])
+    bounds = (np.floor(np.arange(threshold - 1) * every) + 1).astype(np.int64)
+    bounds[-1] = n - 1
+    
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    # Средние точки корзин (последняя "корзина" - крайняя точка ряда)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    next_start = bounds[1:]
+    next_stop = np.append(bounds[2:], n)
+    counts = next_stop - next_start
+    avg_x = (cum_x[next_stop] - cum_x[next_start]) / counts
+    avg_y = (cum_y[next_stop] - cum_y[next_start]) / counts
+    
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = bounds[i], bounds[i + 1]
+        xs = x[start:stop]
+        ys = y[start:stop]
+        area = np.abs((x[a] - avg_x[i]) * (ys - y[a]) - (x[a] - xs) * (avg_y[i] - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return selected
@@ -0,0 +1,482 @@
+"""
+Метод конечных элементов для балки Эйлера-Бернулли с произвольными опорами.
+
+Балка разбивается на двухузловые элементы (прогиб и угол поворота
+в узле). Матрица жёсткости хранится в ленточном виде (полуширина
+ленты 3) и решается ленточным разложением Холецкого, поэтому сборка
+и решение линейны по числу элементов. Опоры - шарниры, заделки,
+свободные концы и упругие опоры - ставятся в любых сечениях.
+
+Узловые нагрузки согласованы с функциями формы, поэтому перемещения
+в узлах точные; внутри элемента поля восстанавливаются точно: усилия
+из равновесия, прогиб - добавлением частного решения от нагрузки.
+
+Знаки те же, что в beam_fields: нагрузка вниз положительна, момент
+положителен при растяжении нижних волокон, прогиб положителен вниз,
+сосредоточенный момент положителен по часовой стрелке.
+"""
+import importlib.util
+from string import ascii_lowercase
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+# scipy.linalg.solveh_banded используется, если установлен
+HAS_SCIPY = importlib.util.find_spec("scipy") is not None
+
+# Полуширина ленты: 2 степени свободы в узле, элемент связывает 4
+BANDWIDTH = 3
+
+# Число элементов равномерной сетки по умолчанию. Узлы на нагрузках
+# и опорах уже дают точное решение; сгущение сетки нужно для частых
+# опор, а обусловленность матрицы ухудшается как (L / h)⁴
+DEFAULT_ELEMENTS = 256
+
+# Точки нагрузок и опор ближе этой доли шага сетки h к узлу или друг
+# к другу объединяются: жёсткость элемента растёт как 1 / l³, и короткие
+# элементы делают матрицу плохо обусловленной. Точка, совпавшая с узлом
+# равномерной сетки, заменяет его; при объединении двух точек нагрузка
+# смещается не более чем на SNAP_TOLERANCE · h
+SNAP_TOLERANCE = 0.05
+
+# Закрепления опор: (смещение, поворот)
+RESTRAINTS = {
+    "pin": (True, False),
+    "roller": (True, False),
+    "fixed": (True, True),
+    "free": (False, False),
+    "spring": (False, False),
+}
+
+# Стандартные схемы опор (координаты - доли длины)
+STANDARD_SUPPORTS = {
+    "hinged": (("pin", 0.0), ("roller", 1.0)),
+    "cantilever": (("fixed", 0.0), ("free", 1.0)),
+    "fixed": (("fixed", 0.0), ("fixed", 1.0)),
+}
+
+
+class SupportSpec(NamedTuple):
+    """Опора: тип, координата (м), жёсткости пружин (кН/м, кН·м/рад)."""
+    
+    kind: str
+    position: float
+    stiffness: Optional[float] = None
+    rotational_stiffness: Optional[float] = None
+
+
+def standard_supports(support_type: str, length: float) -> List[SupportSpec]:
+    """
+    Опоры стандартной схемы.
+    
+    Raises:
+        ValueError: Если тип опор не поддерживается
+    """
+    if support_type not in STANDARD_SUPPORTS:
+        raise ValueError(f"Неподдерживаемый тип опор: '{support_type}'")
+    return [SupportSpec(kind, position * length) for kind, position in STANDARD_SUPPORTS[support_type]]
+
+
+def support_label(index: int) -> str:
+    """Обозначение опоры по номеру: a..z, затем aa, ab, ..."""
+    label = ""
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, len(ascii_lowercase))
+        label = ascii_lowercase[rest] + label
+    return label
+
+
+def element_stiffness(lengths: np.ndarray, ei: float) -> np.ndarray:
+    """
+    Матрицы жёсткости элементов по степеням свободы (w1, θ1, w2, θ2).
+    
+    Args:
+        lengths: Длины элементов, м
+        ei: Изгибная жёсткость EI, кН·м²
+    
+    Returns:
+        Массив формы (элементов, 4, 4)
+    """
+    l1 = np.asarray(lengths, dtype=np.float64)
+    l2, l3 = l1 ** 2, l1 ** 3
+    k = np.empty((len(l1), 4, 4))
+    k[:, 0] = np.column_stack((12 / l3, 6 / l2, -12 / l3, 6 / l2))
+    k[:, 1] = np.column_stack((6 / l2, 4 / l1, -6 / l2, 2 / l1))
+    k[:, 2] = np.column_stack((-12 / l3, -6 / l2, 12 / l3, -6 / l2))
+    k[:, 3] = np.column_stack((6 / l2, 2 / l1, -6 / l2, 4 / l1))
+    return ei * k
+
+
+def assemble_banded(lengths: np.ndarray, ei: float) -> np.ndarray:
+    """
+    Матрица жёсткости балки в ленточном виде.
+    
+    Хранится верхний треугольник: ab[BANDWIDTH + i - j, j] = K[i, j]
+    при i <= j (формат scipy.linalg.solveh_banded).
+    
+    Args:
+        lengths: Длины элементов, м
+        ei: Изгибная жёсткость EI, кН·м²
+    
+    Returns:
+        Массив формы (BANDWIDTH + 1, 2 · (элементов + 1))
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    count = len(lengths)
+    l1, l2, l3 = lengths, lengths ** 2, lengths ** 3
+    
+    # Верхний треугольник матрицы элемента по парам (w1, θ1, w2, θ2)
+    k = {
+        (0, 0): 12 * ei / l3, (0, 1): 6 * ei / l2, (0, 2): -12 * ei / l3, (0, 3): 6 * ei / l2,
+        (1, 1): 4 * ei / l1, (1, 2): -6 * ei / l2, (1, 3): 2 * ei / l1,
+        (2, 2): 12 * ei / l3, (2, 3): -6 * ei / l2,
+        (3, 3): 4 * ei / l1,
+    }
+    
+    ab = np.zeros((BANDWIDTH + 1, 2 * count + 2))
+    for (p, q), values in k.items():
+        # Элемент e связывает степени свободы 2e..2e+3
+        ab[BANDWIDTH + p - q, q:q + 2 * count:2] += values
+    return ab
+
+
+def banded_matvec(ab: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Произведение симметричной ленточной матрицы (верхний треугольник) на вектор."""
+    width = ab.shape[0] - 1
+    y = ab[width] * u
+    for k in range(1, width + 1):
+        diagonal = ab[width - k, k:]
+        y[:-k] += diagonal * u[k:]
+        y[k:] += diagonal * u[:-k]
+    return y
+
+
+def solve_banded(ab: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Решение системы с симметричной положительно определённой ленточной матрицей.
+    
+    Args:
+        ab: Верхний треугольник матрицы в ленточном виде
+        rhs: Правая часть
+    
+    Raises:
+        ValueError: Если матрица вырождена (схема геометрически изменяема)
+    """
+    if HAS_SCIPY:
+        from scipy.linalg import solveh_banded
+        try:
+            return solveh_banded(ab, rhs, check_finite=False)
+        except np.linalg.LinAlgError:
+            raise ValueError("Матрица жёсткости вырождена: схема геометрически изменяема")
+    return _cholesky_banded_solve(ab, rhs)
+
+
+def _cholesky_banded_solve(ab: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Ленточное разложение Холецкого K = UᵀU и две подстановки.
+    
+    Работа O(n · w²) при полуширине ленты w; U записывается на место
+    верхнего треугольника в том же ленточном формате.
+    """
+    width = ab.shape[0] - 1
+    n = ab.shape[1]
+    band = [row.tolist() for row in ab]
+    diagonal = band[width]
+    
+    for j in range(n):
+        s = diagonal[j] - sum(band[width + k - j][j] ** 2 for k in range(max(0, j - width), j))
+        if s <= 1e-12 * abs(ab[width, j]):
+            raise ValueError("Матрица жёсткости вырождена: схема геометрически изменяема")
+        pivot = s ** 0.5
+        diagonal[j] = pivot
+        for i in range(j + 1, min(n, j + width + 1)):
+            s = band[width + j - i][i] - sum(
+                band[width + k - j][j] * band[width + k - i][i]
+                for k in range(max(0, i - width), j)
+            )
+            band[width + j - i][i] = s / pivot
+    
+    # Uᵀ y = b
+    y = [float(value) for value in rhs]
+    for i in range(n):
+        s = y[i] - sum(band[width + k - i][i] * y[k] for k in range(max(0, i - width), i))
+        y[i] = s / diagonal[i]
+    # U x = y
+    for i in reversed(range(n)):
+        s = y[i] - sum(band[width + i - k][k] * y[k] for k in range(i + 1, min(n, i + width + 1)))
+        y[i] = s / diagonal[i]
+    
+    return np.array(y)
+
+
+def mesh_nodes(length: float, elements: int, breakpoints=()) -> np.ndarray:
+    """
+    Узлы сетки: равномерная сетка и точки нагрузок и опор.
+    
+    Узел равномерной сетки ближе SNAP_TOLERANCE · h к точке нагрузки
+    заменяется этой точкой, близкие друг к другу точки объединяются,
+    точки у концов балки переносятся на концы. Так длина любого
+    элемента не меньше SNAP_TOLERANCE · h.
+    
+    Args:
+        length: Длина балки, м
+        elements: Число элементов равномерной сетки
+        breakpoints: Координаты, которые должны стать узлами, м
+    
+    Returns:
+        Возрастающие координаты узлов, м (первый - 0, последний - length)
+    """
+    grid = np.linspace(0.0, length, elements + 1)
+    tolerance = SNAP_TOLERANCE * length / elements
+    
+    extra = np.unique(np.asarray(breakpoints, dtype=np.float64).ravel())
+    extra = extra[(extra > tolerance) & (extra < length - tolerance)]
+    if not extra.size:
+        return grid
+    # Из группы близких точек остаётся первая
+    keep = np.concatenate(([True], np.diff(extra) >= tolerance))
+    extra = extra[keep]
+    
+    # Внутренние узлы равномерной сетки рядом с точками убираются
+    right = np.searchsorted(extra, grid)
+    distance = np.minimum(
+        np.abs(grid - extra[np.clip(right - 1, 0, len(extra) - 1)]),
+        np.abs(grid - extra[np.clip(right, 0, len(extra) - 1)])
+    )
+    near = distance < tolerance
+    near[[0, -1]] = False
+    return np.union1d(grid[~near], extra)
+
+
+def _node_index(nodes: np.ndarray, positions) -> np.ndarray:
+    """Номера ближайших узлов сетки."""
+    positions = np.asarray(positions, dtype=np.float64)
+    right = np.clip(np.searchsorted(nodes, positions), 1, len(nodes) - 1)
+    left = right - 1
+    return np.where(positions - nodes[left] <= nodes[right] - positions, left, right)
+
+
+class BeamSolution:
+    """
+    Решение конечно-элементной задачи.
+    
+    Хранит узловые перемещения, усилия в начале каждого элемента
+    и нагрузку на элементах; поля в любых сечениях вычисляются векторно.
+    """
+    
+    def __init__(self, nodes: np.ndarray, displacements: np.ndarray, ei: float,
+                 q_left: np.ndarray, q_right: np.ndarray,
+                 shear_left: np.ndarray, moment_left: np.ndarray,
+                 reactions: Dict[str, float]):
+        self.nodes = nodes
+        self.displacements = displacements
+        self.ei = ei
+        self.reactions = reactions
+        self._lengths = np.diff(nodes)
+        self._q_left = q_left
+        self._q_right = q_right
+        self._shear_left = shear_left
+        self._moment_left = moment_left
+    
+    @property
+    def elements(self) -> int:
+        """Число элементов."""
+        return len(self._lengths)
+    
+    def fields(self, x) -> Dict[str, np.ndarray]:
+        """
+        Поперечная сила, момент, угол поворота и прогиб в сечениях x.
+        
+        Args:
+            x: Координаты сечений, м
+        
+        Returns:
+            Словарь: shear (кН), moment (кН·м), slope (рад), deflection (мм)
+            и реакции опор (как в reactions)
+        """
+        x = np.asarray(x, dtype=np.float64)
+        e = np.clip(np.searchsorted(self.nodes, x, side="right") - 1, 0, self.elements - 1)
+        l = self._lengths[e]
+        s = x - self.nodes[e]
+        xi = s / l
+        ei = self.ei
+        
+        q1 = self._q_left[e]
+        dq = self._q_right[e] - q1
+        V0 = self._shear_left[e]
+        M0 = self._moment_left[e]
+        
+        shear = V0 - q1 * s - dq * s ** 2 / (2 * l)
+        moment = M0 + V0 * s - q1 * s ** 2 / 2 - dq * s ** 3 / (6 * l)
+        
+        u = self.displacements
+        w1, t1, w2, t2 = u[2 * e], u[2 * e + 1], u[2 * e + 2], u[2 * e + 3]
+        
+        # Эрмитовы функции формы и их производные по x
+        n1 = 1 - 3 * xi ** 2 + 2 * xi ** 3
+        n2 = l * (xi - 2 * xi ** 2 + xi ** 3)
+        n3 = 3 * xi ** 2 - 2 * xi ** 3
+        n4 = l * (xi ** 3 - xi ** 2)
+        d1 = 6 * (xi ** 2 - xi) / l
+        d2 = 1 - 4 * xi + 3 * xi ** 2
+        d3 = -d1
+        d4 = 3 * xi ** 2 - 2 * xi
+        
+        # Частное решение для элемента с заделанными концами:
+        # EI·w'''' = q1 + dq·s/l, w = w' = 0 на концах
+        deflection = (
+            n1 * w1 + n2 * t1 + n3 * w2 + n4 * t2
+            + q1 * s ** 2 * (l - s) ** 2 / (24 * ei)
+            + dq * s ** 2 * (s ** 3 - 3 * l ** 2 * s + 2 * l ** 3) / (120 * ei * l)
+        )
+        slope = (
+            d1 * w1 + d2 * t1 + d3 * w2 + d4 * t2
+            + q1 * s * (l - s) * (l - 2 * s) / (12 * ei)
+            + dq * (5 * s ** 4 - 9 * l ** 2 * s ** 2 + 4 * l ** 3 * s) / (120 * ei * l)
+        )
+        
+        return {
+            "shear": shear,
+            "moment": moment,
+            "slope": slope,
+            "deflection": deflection * 1000,  # м → мм
+            **self.reactions,
+        }
+
+
+def solve_beam(length: float, ei: float, supports: Iterable[SupportSpec],
+               point_forces=(), point_positions=(),
+               q_start=(), q_end=(), q_from=(), q_to=(),
+               moments=(), moment_positions=(),
+               elements: int = DEFAULT_ELEMENTS) -> BeamSolution:
+    """
+    Расчёт балки методом конечных элементов.
+    
+    Нагрузки задаются так же, как в load_terms (координаты в метрах).
+    Узлы сетки ставятся в точках приложения нагрузок, на границах
+    участков и на опорах (см. mesh_nodes), поэтому результат не зависит
+    от числа элементов; оно влияет только на время решения.
+    
+    Args:
+        length: Длина балки, м
+        ei: Изгибная жёсткость EI, кН·м²
+        supports: Опоры
+        point_forces: Сосредоточенные силы, кН
+        point_positions: Координаты сил, м
+        q_start: Интенсивности в начале участков, кН/м
+        q_end: Интенсивности в конце участков, кН/м
+        q_from: Начала участков, м
+        q_to: Концы участков, м
+        moments: Сосредоточенные моменты, кН·м (по часовой стрелке)
+        moment_positions: Координаты моментов, м
+        elements: Число элементов равномерной сетки
+    
+    Returns:
+        Решение; реакции R_a, R_b, ... (кН, вверх положительны) и M_a, ...
+        (кН·м) обозначаются по опорам слева направо (support_label),
+        свободные концы пропускаются. Опорный момент положителен, если в заделке растянуты
+        верхние волокна пролёта: на левом конце - против часовой стрелки,
+        в остальных сечениях - по часовой
+    
+    Raises:
+        ValueError: Если тип опоры не поддерживается или схема изменяема
+    """
+    as_array = lambda values: np.asarray(values, dtype=np.float64).ravel()
+    point_forces, point_positions = as_array(point_forces), as_array(point_positions)
+    q_start, q_end = as_array(q_start), as_array(q_end)
+    q_from, q_to = as_array(q_from), as_array(q_to)
+    moments, moment_positions = as_array(moments), as_array(moment_positions)
+    
+    supports = sorted(supports, key=lambda support: support.position)
+    for support in supports:
+        if support.kind not in RESTRAINTS:
+            raise ValueError(f"Неподдерживаемый тип опоры: '{support.kind}'")
+    
+    breakpoints = np.concatenate((
+        point_positions, q_from, q_to, moment_positions,
+        [support.position for support in supports]
+    ))
+    nodes = mesh_nodes(length, elements, breakpoints)
+    lengths = np.diff(nodes)
+    count = len(lengths)
+    
+    # Интенсивность нагрузки по концам элементов (линейная внутри элемента)
+    q_left = np.zeros(count)
+    q_right = np.zeros(count)
+    for q0, q1, start, end in zip(q_start, q_end, q_from, q_to):
+        first, last = _node_index(nodes, [start, end])
+        slope = (q1 - q0) / (end - start)
+        q_left[first:last] += q0 + slope * (nodes[first:last] - start)
+        q_right[first:last] += q0 + slope * (nodes[first + 1:last + 1] - start)
+    
+    # Согласованные узловые нагрузки элементов
+    l1, l2 = lengths, lengths ** 2
+    element_loads = np.column_stack((
+        l1 * (7 * q_left + 3 * q_right) / 20,
+        l2 * (3 * q_left + 2 * q_right) / 60,
+        l1 * (3 * q_left + 7 * q_right) / 20,
+        -l2 * (2 * q_left + 3 * q_right) / 60,
+    ))
+    loads = np.zeros(2 * count + 2)
+    for p in range(4):
+        loads[p:p + 2 * count:2] += element_loads[:, p]
+    np.add.at(loads, 2 * _node_index(nodes, point_positions), point_forces)
+    np.add.at(loads, 2 * _node_index(nodes, moment_positions) + 1, moments)
+    
+    stiffness = assemble_banded(lengths, ei)
+    system = stiffness.copy()
+    rhs = loads.copy()
+    
+    positions = np.array([support.position for support in supports], dtype=np.float64)
+    support_nodes = _node_index(nodes, positions)
+    fixed = np.array([RESTRAINTS[support.kind] for support in supports], dtype=bool).reshape(-1, 2)
+    springs = np.array(
+        [(support.stiffness or 0.0, support.rotational_stiffness or 0.0) for support in supports],
+        dtype=np.float64
+    ).reshape(-1, 2)
+    
+    # Пружины добавляются на диагональ
+    diagonal = system[BANDWIDTH]
+    np.add.at(diagonal, 2 * support_nodes, springs[:, 0])
+    np.add.at(diagonal, 2 * support_nodes + 1, springs[:, 1])
+    
+    # Закреплённые степени свободы: строка и столбец единичной матрицы
+    restrained = np.concatenate((2 * support_nodes[fixed[:, 0]], 2 * support_nodes[fixed[:, 1]] + 1))
+    size = len(rhs)
+    system[:, restrained] = 0.0
+    for k in range(1, BANDWIDTH + 1):
+        columns = restrained + k
+        system[BANDWIDTH - k, columns[columns < size]] = 0.0
+    system[BANDWIDTH, restrained] = 1.0
+    rhs[restrained] = 0.0
+    
+    displacements = solve_banded(system, rhs)
+    
+    # Реакции - невязка K·u - f без закреплений (для пружин это -k·u)
+    residual = banded_matvec(stiffness, displacements) - loads
+    carries_force = (fixed[:, 0] | (springs[:, 0] > 0)).tolist()
+    carries_moment = (fixed[:, 1] | (springs[:, 1] > 0)).tolist()
+    reactions = {}
+    index = 0
+    for support, node, force, moment in zip(supports, support_nodes.tolist(),
+                                            carries_force, carries_moment):
+        if support.kind == "free":
+            continue
+        label = support_label(index)
+        index += 1
+        if force:
+            reactions[f"R_{label}"] = -float(residual[2 * node])
+        if moment:
+            sign = -1.0 if node == 0 else 1.0
+            reactions[f"M_{label}"] = sign * float(residual[2 * node + 1])
+    
+    # Усилия в начале элементов: K_e·u_e - f_e
+    element_displacements = np.lib.stride_tricks.sliding_window_view(displacements, 4)[::2]
+    end_forces = np.einsum("eij,ej->ei", element_stiffness(lengths, ei)[:, :2], element_displacements)
+    end_forces -= element_loads[:, :2]
+    shear_left = -end_forces[:, 0]
+    moment_left = end_forces[:, 1]
+    
+    return BeamSolution(nodes, displacements, ei, q_left, q_right,
+                        shear_left, moment_left, reactions)
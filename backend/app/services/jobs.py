@@ -0,0 +1,317 @@
+"""
+Фоновые задания: очередь в SQLite и локальный пул исполнителей.
+
+Задание выполняется блоками; каждый блок результатов записывается
+вместе с контрольной точкой, поэтому после перезапуска процесса
+незавершённые задания продолжаются с места остановки. Внешний брокер
+(Redis и т.п.) не нужен: несколько процессов с общим файлом забирают
+задания через аренду в хранилище, и каждое выполняется одним из них.
+Пока задание выполняется, аренду продлевает фоновый поток диспетчера,
+поэтому длительный блок не отдаёт задание другому процессу.
+"""
+import os
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.models.beam_calculation import BeamLoadCase
+from app.models.jobs import JobRequest, JobResultsPage, JobStatus
+from app.models.reliability import ReliabilityRequest
+from app.models.sweep import SweepRequest
+from app.repositories.job_store import JobStore
+from app.repositories.material_repository import MaterialRepository
+from app.core.config import settings
+
+# Блок задания: строки результата, контрольная точка, выполнено, всего
+Chunk = Tuple[List[Any], Dict[str, Any], int, Optional[int]]
+
+# Модели параметров по видам заданий
+JOB_REQUESTS = {
+    "sweep": SweepRequest,
+    "reliability": ReliabilityRequest,
+    "catalog_check": BeamLoadCase,
+}
+
+
+class JobManager:
+    """
+    Постановка, выполнение, отмена и продолжение заданий.
+    
+    Одновременно выполняется не более max_workers заданий, остальные
+    ждут в очереди пула. Отмена и остановка проверяются между блоками.
+    С auto_resume диспетчер периодически забирает задания из очереди
+    и прерванные задания других процессов, аренда которых истекла.
+    """
+    
+    # Число профилей в одном блоке проверки каталога
+    CATALOG_CHUNK_SIZE: int = 1000
+    
+    def __init__(self, store: JobStore, repository_factory: Callable[[], MaterialRepository],
+                 calculator=None, max_workers: int = 2, auto_resume: bool = False):
+        """
+        Args:
+            store: Хранилище заданий и результатов
+            repository_factory: Фабрика репозитория профилей (вызывается
+                при первом задании, чтобы продолжение заданий при старте
+                не строило каталог раньше времени)
+            calculator: Калькулятор балки (None - создаётся при первом задании)
+            max_workers: Наибольшее число одновременно выполняемых заданий
+            auto_resume: Периодически вызывать resume (с продлением аренд)
+        """
+        self._store = store
+        # Владелец аренды заданий в хранилище: свой у каждого процесса и диспетчера
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._repository_factory = repository_factory
+        self._calculator = calculator
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="job")
+        self._stopping = threading.Event()
+        self._auto_resume = auto_resume
+        # Задания, поставленные в пул (ещё не выполнены), и захваченные этим диспетчером
+        self._lock = threading.Lock()
+        self._scheduled: set = set()
+        self._running: set = set()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._runners = {
+            "sweep": self._sweep_chunks,
+            "reliability": self._reliability_chunks,
+            "catalog_check": self._catalog_check_chunks,
+        }
+    
+    @property
+    def calculator(self):
+        """Калькулятор балки (NumPy загружается с первым заданием)."""
+        if self._calculator is None:
+            from app.services.calculator import BeamCalculator
+            self._calculator = BeamCalculator()
+        return self._calculator
+    
+    def submit(self, job: JobRequest) -> JobStatus:
+        """
+        Постановка задания в очередь.
+        
+        Args:
+            job: Вид и параметры задания
+        
+        Returns:
+            Состояние поставленного задания
+        """
+        job_id = self._store.create(job.kind, job.request.model_dump(mode="json"))
+        self._schedule(job_id)
+        return self._store.status(job_id)
+    
+    def status(self, job_id: str) -> Optional[JobStatus]:
+        """Состояние задания или None."""
+        return self._store.status(job_id)
+    
+    def results(self, job_id: str, offset: int = 0, limit: int = 1000) -> Optional[JobResultsPage]:
+        """
+        Страница строк результата (доступна и до завершения задания).
+        
+        Args:
+            job_id: Идентификатор задания
+            offset: Номер первой строки
+            limit: Наибольшее число строк
+        
+        Returns:
+            Страница результата или None, если задания нет
+        """
+        status = self._store.status(job_id)
+        if status is None:
+            return None
+        rows = self._store.results(job_id, offset, limit)
+        end = offset + len(rows)
+        return JobResultsPage(
+            job_id=job_id,
+            state=status.state,
+            offset=offset,
+            rows=rows,
+            next_offset=end if end < status.rows else None
+        )
+    
+    def stream_results(self, job_id: str) -> Iterator[str]:
+        """Записанные строки результата в формате NDJSON, страница за страницей."""
+        for page in self._store.iter_payloads(job_id, settings.JOB_RESULTS_PAGE_SIZE):
+            yield "".join(payload + "\n" for payload in page)
+    
+    def cancel(self, job_id: str) -> Optional[JobStatus]:
+        """
+        Отмена задания; записанные строки результата сохраняются.
+        
+        Returns:
+            Состояние задания или None, если задания нет
+        """
+        self._store.finish(job_id, "cancelled")
+        return self._store.status(job_id)
+    
+    def resume(self) -> int:
+        """
+        Постановка заданий из очереди и прерванных заданий, аренда
+        которых истекла или снята (после перезапуска). Задания,
+        выполняемые другими процессами, и уже поставленные этим
+        диспетчером не затрагиваются.
+        
+        Returns:
+            Число поставленных заданий
+        """
+        if self._auto_resume:
+            self._start_heartbeat()
+        return sum(self._schedule(job_id) for job_id in self._store.claimable())
+    
+    def shutdown(self) -> None:
+        """
+        Остановка пула: выполняемые задания прерываются после текущего
+        блока, снимают аренду и остаются в состоянии running до следующего resume.
+        """
+        with self._lock:
+            self._stopping.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _schedule(self, job_id: str) -> bool:
+        """Постановка задания в пул (False - уже поставлено или пул остановлен)."""
+        with self._lock:
+            if self._stopping.is_set() or job_id in self._scheduled:
+                return False
+            self._scheduled.add(job_id)
+            self._pool.submit(self._run, job_id)
+        self._start_heartbeat()
+        return True
+    
+    def _start_heartbeat(self) -> None:
+        """Запуск потока продления аренды (один на диспетчер)."""
+        with self._lock:
+            if self._heartbeat is None and not self._stopping.is_set():
+                self._heartbeat = threading.Thread(target=self._keep_leases, name="job-heartbeat", daemon=True)
+                self._heartbeat.start()
+    
+    def _keep_leases(self) -> None:
+        """
+        Продление аренды выполняемых заданий (трижды за срок аренды)
+        и, с auto_resume, постановка заданий, которые можно забрать.
+        """
+        interval = max(self._store.lease_seconds / 3, 0.01)
+        while not self._stopping.wait(interval):
+            with self._lock:
+                running = list(self._running)
+            try:
+                for job_id in running:
+                    self._store.renew(job_id, self._owner)
+                if self._auto_resume:
+                    self.resume()
+            except sqlite3.Error:
+                pass  # база занята - повтор на следующем шаге
+    
+    def _run(self, job_id: str) -> None:
+        """Выполнение задания с последней контрольной точки."""
+        try:
+            if self._stopping.is_set() or not self._store.start(job_id, self._owner):
+                return  # задание завершено или его выполняет другой процесс
+            with self._lock:
+                self._running.add(job_id)
+            self._execute(job_id)
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+                self._scheduled.discard(job_id)
+    
+    def _execute(self, job_id: str) -> None:
+        """Блоки захваченного задания до завершения, отмены или остановки."""
+        job = self._store.load(job_id)
+        try:
+            request = JOB_REQUESTS[job["kind"]](**job["request"])
+            for rows, checkpoint, done, total in self._runners[job["kind"]](request, job["checkpoint"]):
+                if not self._store.save_chunk(job_id, self._owner, rows, checkpoint, done, total):
+                    return  # задание отменено или аренда перешла к другому процессу
+                if self._stopping.is_set():
+                    self._store.release(job_id, self._owner)
+                    return  # продолжится после перезапуска
+            self._store.finish(job_id, "completed", owner=self._owner)
+        except Exception as error:
+            self._store.finish(job_id, "failed", f"{type(error).__name__}: {error}", owner=self._owner)
+    
+    def _profile(self, name: str):
+        """Профиль по ключу."""
+        profile = self._repository_factory().get_profile(name)
+        if profile is None:
+            raise ValueError(f"Профиль '{name}' не найден")
+        return profile
+    
+    def _sweep_chunks(self, request: SweepRequest, checkpoint: Optional[Dict[str, Any]]) -> Iterator[Chunk]:
+        """Параметрический перебор: строка на комбинацию."""
+        from app.services.sweep import SWEEP_COLUMNS, ParameterSweep, chunk_rows
+        
+        profiles = [self._profile(name) for name in request.profile_names]
+        sweep = ParameterSweep(request, profiles, self.calculator)
+        if sweep.total > settings.SWEEP_MAX_COMBINATIONS:
+            raise ValueError(f"Слишком много комбинаций: {sweep.total}")
+        
+        start = checkpoint["offset"] if checkpoint else 0
+        for begin in range(start, sweep.total, request.chunk_size):
+            end = min(begin + request.chunk_size, sweep.total)
+            columns = sweep.compute_chunk(begin, end)
+            rows = [dict(zip(SWEEP_COLUMNS, row)) for row in chunk_rows(columns)]
+            yield rows, {"offset": end}, end, sweep.total
+    
+    def _reliability_chunks(self, request: ReliabilityRequest,
+                            checkpoint: Optional[Dict[str, Any]]) -> Iterator[Chunk]:
+        """
+        Расчёт надёжности: счётчики отказов копятся в контрольной точке,
+        единственная строка результата пишется последним блоком.
+        """
+        from app.services.reliability import ReliabilityAnalyzer, simulate_chunk
+        
+        analyzer = ReliabilityAnalyzer(self.calculator)
+        checkpoint = checkpoint or {"next": 0, "counts": [0, 0, 0]}
+        if "seed" in checkpoint:
+            # Зерно фиксируется первым блоком: продолжение даёт тот же результат
+            request = request.model_copy(update={"seed": checkpoint["seed"]})
+        plan = analyzer.plan(request, self._profile(request.profile_name))
+        
+        counts = list(checkpoint["counts"])
+        for index in range(checkpoint["next"], plan.chunks):
+            counts = [int(a + b) for a, b in zip(counts, simulate_chunk(plan, self.calculator, index))]
+            done = min(plan.samples, (index + 1) * plan.chunk_size)
+            rows = []
+            if index == plan.chunks - 1:
+                rows = [analyzer.summarize(plan, counts, request.confidence).model_dump(mode="json")]
+            yield rows, {"seed": plan.entropy, "next": index + 1, "counts": counts}, done, plan.samples
+    
+    def _catalog_check_chunks(self, load_case: BeamLoadCase,
+                              checkpoint: Optional[Dict[str, Any]]) -> Iterator[Chunk]:
+        """
+        Проверка схемы со всеми профилями каталога: строка на профиль.
+        
+        Усилия от профиля не зависят, а прогиб обратно пропорционален Ix,
+        поэтому схема рассчитывается один раз при Ix = 1 см⁴. Схема
+        с упругими опорами рассчитывается для каждого профиля.
+        """
+        calc = self.calculator
+        profiles = self._repository_factory().get_all_profiles()
+        design_strength = calc.design_strength(load_case.steel_grade)
+        elastic = load_case.has_elastic_supports()
+        if not elastic:
+            _, max_moment, unit_deflection = calc._calculate_internal_forces(load_case, 1.0)
+        
+        start = checkpoint["offset"] if checkpoint else 0
+        for begin in range(start, len(profiles), self.CATALOG_CHUNK_SIZE):
+            end = min(begin + self.CATALOG_CHUNK_SIZE, len(profiles))
+            rows = []
+            for profile in profiles[begin:end]:
+                if elastic:
+                    _, max_moment, max_deflection = calc._calculate_internal_forces(
+                        load_case, profile.moment_of_inertia_ix_cm4
+                    )
+                else:
+                    max_deflection = round(unit_deflection / profile.moment_of_inertia_ix_cm4, 3)
+                max_stress = calc._calculate_max_stress(max_moment, profile.moment_of_resistance_wx_cm3)
+                rows.append({
+                    "profile_name": profile.key,
+                    "mass_kg_m": profile.mass_kg_m,
+                    "max_moment": max_moment,
+                    "max_stress": max_stress,
+                    "max_deflection": max_deflection,
+                    "is_strength_sufficient": calc._check_strength(max_stress, design_strength),
+                    "is_stiffness_sufficient": calc._check_stiffness(max_deflection, load_case.length),
+                })
+            yield rows, {"offset": end}, end, len(profiles)
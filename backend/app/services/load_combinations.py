@@ -0,0 +1,315 @@
+"""
+Сервис расчёта балки на сочетания нагрузок.
+
+Задача линейна: поля от сочетания - сумма полей основных загружений
+с коэффициентами. Каждое загружение рассчитывается один раз (результаты
+кэшируются), а все сочетания получаются одним матричным произведением
+таблицы коэффициентов на поля загружений.
+"""
+import hashlib
+import json
+from itertools import product
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from app.models.load_combination import (
+    MAX_COMBINATIONS,
+    BasicLoadCase,
+    CombinationResult,
+    LoadCombination,
+    LoadCombinationRequest,
+    LoadCombinationResponse,
+)
+from app.models.material_profile import MaterialProfile
+from app.services.beam_fields import diagram_grid
+from app.services.calculator import BeamCalculator
+from app.services.result_cache import ResultCache
+from app.core.config import settings
+from app.core.metrics import stage_timer
+
+
+class UnitResults(NamedTuple):
+    """Поля основных загружений на общей сетке сечений."""
+    x: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+    slope: np.ndarray
+    deflection: np.ndarray
+    reactions: np.ndarray
+    reaction_keys: Tuple[str, ...]
+    fields: Tuple[Callable, ...]
+
+
+def _format_factor(factor: float) -> str:
+    """Коэффициент для имени сочетания."""
+    return f"{round(factor, 4):g}"
+
+
+def _combination(limit_state: str, factors: Dict[str, float]) -> LoadCombination:
+    """Сочетание с именем из коэффициентов."""
+    name = " + ".join(f"{_format_factor(f)}·{case}" for case, f in factors.items())
+    return LoadCombination(name=f"{limit_state}: {name}", limit_state=limit_state, factors=factors)
+
+
+def generate_combinations(cases: Sequence[BasicLoadCase]) -> List[LoadCombination]:
+    """
+    Основные сочетания по видам нагрузок.
+    
+    Каждая временная нагрузка по очереди становится основной (коэффициент
+    γf), остальные входят с ψ·γf или не входят вовсе. Для прочности (uls)
+    постоянные нагрузки берутся с γf и с коэффициентом для нагрузки,
+    уменьшающей усилия; для жёсткости (sls) γf = 1.
+    
+    Args:
+        cases: Основные загружения
+    
+    Returns:
+        Сочетания uls, затем sls
+    
+    Raises:
+        ValueError: Если сочетаний больше MAX_COMBINATIONS
+    """
+    permanent = [case for case in cases if case.category == "permanent"]
+    variable = [case for case in cases if case.category != "permanent"]
+    
+    companions = max(len(variable) - 1, 0)
+    count = max(len(variable), 1) * 2 ** companions * (3 if variable and permanent else 2)
+    if count > MAX_COMBINATIONS:
+        raise ValueError(f"Слишком много сочетаний ({count}): задайте сочетания явно")
+    
+    combinations = []
+    for limit_state in ("uls", "sls"):
+        design = limit_state == "uls"
+        permanent_sets = [{case.name: case.design_factor if design else 1.0 for case in permanent}]
+        if design and permanent and variable:
+            permanent_sets.append({case.name: case.favourable_factor for case in permanent})
+        
+        for base in permanent_sets:
+            if not variable:
+                combinations.append(_combination(limit_state, base))
+            for leading in variable:
+                others = [case for case in variable if case is not leading]
+                for present in product((True, False), repeat=len(others)):
+                    factors = dict(base)
+                    factors[leading.name] = leading.design_factor if design else 1.0
+                    for case, used in zip(others, present):
+                        if used:
+                            gamma = case.design_factor if design else 1.0
+                            factors[case.name] = gamma * case.companion_factor
+                    combinations.append(_combination(limit_state, factors))
+    return combinations
+
+
+def factor_matrix(combinations: Sequence[LoadCombination], names: Sequence[str]) -> np.ndarray:
+    """
+    Таблица коэффициентов: строка на сочетание, столбец на загружение.
+    
+    Args:
+        combinations: Сочетания
+        names: Имена загружений в порядке столбцов
+    """
+    column = {name: i for i, name in enumerate(names)}
+    factors = np.zeros((len(combinations), len(names)))
+    for row, combination in enumerate(combinations):
+        for name, factor in combination.factors.items():
+            factors[row, column[name]] = factor
+    return factors
+
+
+class LoadCombinationAnalyzer:
+    """
+    Расчёт на сочетания нагрузок суперпозицией полей загружений.
+    
+    Поля загружений (реакции, поперечная сила, момент, угол поворота,
+    прогиб на сетке сечений) кэшируются по схеме, нагрузкам и профилю,
+    поэтому повторный расчёт с другими коэффициентами или сочетаниями
+    сводится к умножению матриц.
+    """
+    
+    def __init__(self, calculator: BeamCalculator = None, cache: ResultCache = None):
+        """
+        Инициализация.
+        
+        Args:
+            calculator: Калькулятор, рассчитывающий загружения
+            cache: Кэш полей загружений (None - свой кэш
+                на settings.LOAD_COMBINATION_CACHE_SIZE записей)
+        """
+        self._calculator = calculator or BeamCalculator()
+        self._cache = cache if cache is not None else ResultCache(settings.LOAD_COMBINATION_CACHE_SIZE)
+    
+    @property
+    def cache(self) -> ResultCache:
+        """Кэш полей загружений."""
+        return self._cache
+    
+    def estimate_cost(self, request: LoadCombinationRequest) -> int:
+        """Оценка трудоёмкости: сечения × загружения × сочетания."""
+        combinations = len(request.combinations) or 2 ** min(len(request.load_cases), 10)
+        return self._calculator.ANALYSIS_POINTS * len(request.load_cases) * (1 + combinations)
+    
+    def analyze(self, request: LoadCombinationRequest, profile: MaterialProfile) -> LoadCombinationResponse:
+        """
+        Расчёт на все сочетания и выбор определяющих.
+        
+        Args:
+            request: Схема балки, загружения и сочетания
+            profile: Данные стального профиля
+        
+        Returns:
+            Определяющие сочетания по прочности и жёсткости
+            и результаты по всем сочетаниям
+        
+        Raises:
+            ValueError: Если марки стали нет в каталоге или сочетаний слишком много
+        """
+        calc = self._calculator
+        design_strength = calc.design_strength(request.steel_grade)
+        combinations = request.combinations or generate_combinations(request.load_cases)
+        names = [case.name for case in request.load_cases]
+        
+        unit = self.unit_results(request, profile)
+        factors = factor_matrix(combinations, names)
+        
+        with stage_timer("combinations", request.support_type):
+            max_moment, max_deflection, reactions = self._extrema(unit, factors)
+        
+        # Округление и проверки - как в BeamCalculator.calculate
+        max_moment = [round(float(value), 2) for value in max_moment]
+        max_deflection = [round(float(value), 3) for value in max_deflection]
+        max_stress = [calc._calculate_max_stress(m, profile.moment_of_resistance_wx_cm3) for m in max_moment]
+        
+        def result(i: int) -> CombinationResult:
+            combination = combinations[i]
+            uls = combination.limit_state == "uls"
+            return CombinationResult(
+                name=combination.name,
+                limit_state=combination.limit_state,
+                factors=combination.factors,
+                reactions={key: round(float(value), 2) for key, value in zip(unit.reaction_keys, reactions[i])},
+                max_moment=max_moment[i],
+                max_deflection=max_deflection[i],
+                max_stress=max_stress[i],
+                is_strength_sufficient=calc._check_strength(max_stress[i], design_strength) if uls else None,
+                is_stiffness_sufficient=None if uls else calc._check_stiffness(max_deflection[i], request.length)
+            )
+        
+        uls = [i for i, c in enumerate(combinations) if c.limit_state == "uls"]
+        sls = [i for i, c in enumerate(combinations) if c.limit_state == "sls"]
+        governing_strength = governing_stiffness = None
+        is_strength_sufficient = is_stiffness_sufficient = None
+        if uls:
+            governing_strength = result(max(uls, key=max_moment.__getitem__))
+            is_strength_sufficient = all(calc._check_strength(max_stress[i], design_strength) for i in uls)
+        if sls:
+            governing_stiffness = result(max(sls, key=max_deflection.__getitem__))
+            is_stiffness_sufficient = all(calc._check_stiffness(max_deflection[i], request.length) for i in sls)
+        
+        return LoadCombinationResponse(
+            load_cases=names,
+            combinations=len(combinations),
+            design_strength=design_strength,
+            governing_strength=governing_strength,
+            governing_stiffness=governing_stiffness,
+            is_strength_sufficient=is_strength_sufficient,
+            is_stiffness_sufficient=is_stiffness_sufficient,
+            results=[result(i) for i in range(len(combinations))] if request.include_results else None
+        )
+    
+    def unit_results(self, request: LoadCombinationRequest, profile: MaterialProfile) -> UnitResults:
+        """
+        Поля основных загружений (из кэша или расчётом каждого загружения).
+        
+        Ключ кэша - схема опор, нагрузки загружений и Ix профиля;
+        коэффициенты и сочетания на поля не влияют и в ключ не входят.
+        """
+        key = self._cache_key(request, profile)
+        unit = self._cache.get(key)
+        if unit is None:
+            with stage_timer("load_cases", request.support_type):
+                unit = self._solve_cases(request, profile.moment_of_inertia_ix_cm4)
+            self._cache.put(key, unit)
+        return unit
+    
+    def _cache_key(self, request: LoadCombinationRequest, profile: MaterialProfile) -> str:
+        """Отпечаток данных, от которых зависят поля загружений."""
+        loads = {"point_loads", "distributed_loads", "applied_moments"}
+        payload = request.model_dump(
+            mode="json",
+            include={"length": True, "support_type": True, "supports": True,
+                     "load_cases": {"__all__": loads}}
+        )
+        payload["moment_of_inertia"] = profile.moment_of_inertia_ix_cm4
+        payload["elastic_modulus"] = self._calculator.STEEL_ELASTIC_MODULUS
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def _solve_cases(self, request: LoadCombinationRequest, moment_of_inertia: float) -> UnitResults:
+        """Расчёт каждого загружения на общей сетке сечений."""
+        calc = self._calculator
+        load_cases = [request.beam_load_case(case) for case in request.load_cases]
+        
+        breakpoints = [point for lc in load_cases for point in calc._load_breakpoints(lc)]
+        x = diagram_grid(request.length, calc.ANALYSIS_POINTS, breakpoints)
+        
+        functions = []
+        columns: Dict[str, List[np.ndarray]] = {"shear": [], "moment": [], "slope": [], "deflection": []}
+        reactions = []
+        for load_case in load_cases:
+            fields_at, reaction_keys = calc._fields_function(load_case, moment_of_inertia)
+            fields = fields_at(x)
+            for name, rows in columns.items():
+                rows.append(fields[name])
+            reactions.append([float(fields[key]) for key in reaction_keys])
+            functions.append(fields_at)
+        
+        return UnitResults(
+            x=x,
+            reactions=np.array(reactions),
+            reaction_keys=tuple(reaction_keys),
+            fields=tuple(functions),
+            **{name: np.vstack(rows) for name, rows in columns.items()}
+        )
+    
+    @staticmethod
+    def _extrema(unit: UnitResults, factors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Наибольшие по модулю момент и прогиб и реакции всех сочетаний.
+        
+        Поля сочетаний на сетке - произведение таблицы коэффициентов
+        на поля загружений. Экстремумы между узлами уточняются, как
+        в BeamCalculator: в нулях поперечной силы и угла поворота каждого
+        сочетания поля загружений вычисляются точно и суммируются
+        с коэффициентами этого сочетания.
+        
+        Returns:
+            Кортеж (M_max, кН·м; f_max, мм; реакции) с первым измерением
+            по сочетаниям
+        """
+        moment = np.abs(factors @ unit.moment).max(axis=1)
+        deflection = np.abs(factors @ unit.deflection).max(axis=1)
+        reactions = factors @ unit.reactions
+        
+        x = unit.x
+        rows, points = [], []
+        for name in ("shear", "slope"):
+            values = factors @ getattr(unit, name)
+            row, i = np.nonzero(np.sign(values[:, :-1]) * np.sign(values[:, 1:]) < 0)
+            v0, v1 = values[row, i], values[row, i + 1]
+            rows.append(row)
+            points.append(x[i] - v0 * (x[i + 1] - x[i]) / (v1 - v0))
+        rows = np.concatenate(rows)
+        points = np.concatenate(points)
+        
+        if points.size:
+            # Поля загружений в уточняющих точках и свёртка с коэффициентами
+            # своего сочетания: O(точки × загружения)
+            unique, inverse = np.unique(points, return_inverse=True)
+            evaluated = [fields_at(unique) for fields_at in unit.fields]
+            for name, target in (("moment", moment), ("deflection", deflection)):
+                exact = np.vstack([fields[name] for fields in evaluated])[:, inverse]
+                combined = np.abs(np.einsum("pk,kp->p", factors[rows], exact))
+                np.maximum.at(target, rows, combined)
+        
+        return moment, deflection, reactions
@@ -0,0 +1,187 @@
+"""
+Сервис расчёта балки на подвижную нагрузку.
+Линии влияния и огибающие по всем положениям поезда осей.
+"""
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from app.models.beam_calculation import REACTION_KEYS
+from app.models.material_profile import MaterialProfile
+from app.models.moving_load import MovingLoadRequest, MovingLoadResponse
+from app.services.beam_fields import beam_fields, point_load_terms
+from app.services.calculator import BeamCalculator
+from app.core.config import settings
+from app.core.execution import check_cancelled
+
+
+class MovingLoadAnalyzer:
+    """
+    Анализ подвижной нагрузки.
+    
+    Все положения головной оси считаются одним векторным проходом:
+    поля строятся как матрицы «положение × сечение», оси вне пролёта
+    получают нулевую нагрузку.
+    
+    Эпюра моментов от сосредоточенных сил линейна между осями, поэтому
+    максимальный момент ищется под осями и на опорах при каждом
+    положении, а положение головной оси уточняется около лучшего узла
+    сетки положений.
+    """
+    
+    # Уточнение положения головной оси: число точек и число проходов
+    REFINE_POINTS: int = 65
+    REFINE_PASSES: int = 3
+    
+    def __init__(self, calculator: BeamCalculator = None):
+        """
+        Инициализация.
+        
+        Args:
+            calculator: Калькулятор для жёсткости, напряжений и проверок
+        """
+        self._calculator = calculator or BeamCalculator()
+    
+    def analyze(self, request: MovingLoadRequest, profile: MaterialProfile,
+                cancel: Optional[threading.Event] = None) -> MovingLoadResponse:
+        """
+        Линии влияния, огибающие и проверки для поезда осей.
+        
+        Args:
+            request: Параметры подвижной нагрузки
+            profile: Данные стального профиля
+            cancel: Флаг отмены, проверяется между блоками положений
+            
+        Returns:
+            Результаты расчёта
+        
+        Raises:
+            ValueError: Если марки стали нет в каталоге
+            CalculationCancelled: Если расчёт отменён
+        """
+        calc = self._calculator
+        L = request.length
+        ei = calc._flexural_rigidity(profile.moment_of_inertia_ix_cm4)
+        design_strength = calc.design_strength(request.steel_grade)
+        
+        # Смещения осей относительно головной (поезд движется от 0 к L)
+        offsets = np.concatenate(([0.0], np.cumsum(request.axle_spacings)))
+        loads = np.asarray(request.axle_loads, dtype=np.float64)
+        
+        # 1. Линии влияния от силы 1 кН
+        unit_positions = np.linspace(0.0, L, request.positions)
+        section = request.influence_section * L
+        unit = beam_fields(
+            L,
+            request.support_type,
+            *point_load_terms(np.ones_like(unit_positions), unit_positions),
+            np.array([section]),
+            ei
+        )
+        influence_lines = {
+            key: self._series(unit_positions, unit[key])
+            for key in REACTION_KEYS[request.support_type]
+        }
+        influence_lines["moment"] = self._series(unit_positions, unit["moment"][:, 0])
+        influence_lines["deflection"] = self._series(unit_positions, unit["deflection"][:, 0])
+        
+        # 2. Поля для всех положений поезда: матрицы положение × сечение,
+        #    блоками по положениям, чтобы объём памяти был ограничен
+        lead = np.linspace(0.0, L + offsets[-1], request.positions)
+        x = np.linspace(0.0, L, request.sections)
+        chunk = max(1, settings.MOVING_LOAD_CHUNK_CELLS // (len(x) * len(loads)))
+        
+        envelope = {
+            "moment": [np.full(len(x), -np.inf), np.full(len(x), np.inf)],
+            "shear": [np.full(len(x), -np.inf), np.full(len(x), np.inf)],
+            "deflection": [np.full(len(x), -np.inf), np.full(len(x), np.inf)],
+        }
+        max_moment = max_deflection = -1.0
+        moment_position = deflection_position = 0
+        
+        for start in range(0, len(lead), chunk):
+            check_cancelled(cancel)
+            axle_positions = lead[start:start + chunk, None] - offsets[None, :]
+            on_beam = (axle_positions >= 0) & (axle_positions <= L)
+            coef = np.where(on_beam, -loads[None, :], 0.0)
+            order = np.ones_like(coef, dtype=np.int64)
+            fields = beam_fields(L, request.support_type, coef, np.clip(axle_positions, 0.0, L), order, x, ei)
+            
+            for name, (upper, lower) in envelope.items():
+                np.maximum(upper, fields[name].max(axis=0), out=upper)
+                np.minimum(lower, fields[name].min(axis=0), out=lower)
+            
+            peak, _ = self._peak_moments(request, offsets, loads, lead[start:start + chunk], ei)
+            i = int(np.argmax(peak))
+            if peak[i] > max_moment:
+                max_moment, moment_position = peak[i], start + i
+            
+            abs_deflection = np.abs(fields["deflection"])
+            i, j = np.unravel_index(np.argmax(abs_deflection), abs_deflection.shape)
+            if abs_deflection[i, j] > max_deflection:
+                max_deflection, deflection_position = abs_deflection[i, j], start + i
+        
+        envelopes = {}
+        for name, (upper, lower) in envelope.items():
+            envelopes[f"{name}_max"] = self._series(x, upper)
+            envelopes[f"{name}_min"] = self._series(x, lower)
+        
+        # 3. Критические значения: положение головной оси уточняется
+        #    между соседними узлами сетки положений
+        governing, critical_section = lead[moment_position], 0.0
+        low, high = lead[max(moment_position - 1, 0)], lead[min(moment_position + 1, len(lead) - 1)]
+        for _ in range(self.REFINE_PASSES):
+            candidates = np.linspace(low, high, self.REFINE_POINTS)
+            peak, sections = self._peak_moments(request, offsets, loads, candidates, ei)
+            i = int(np.argmax(peak))
+            if peak[i] >= max_moment:
+                max_moment, governing, critical_section = peak[i], candidates[i], sections[i]
+            step = candidates[1] - candidates[0]
+            low, high = max(candidates[i] - step, lead[0]), min(candidates[i] + step, lead[-1])
+        
+        max_moment = round(float(max_moment), 2)
+        max_deflection = round(float(max_deflection), 3)
+        max_stress = calc._calculate_max_stress(max_moment, profile.moment_of_resistance_wx_cm3)
+        
+        return MovingLoadResponse(
+            influence_lines=influence_lines,
+            envelopes=envelopes,
+            governing_position_moment=float(governing),
+            governing_position_deflection=float(lead[deflection_position]),
+            critical_section=float(critical_section),
+            max_moment=max_moment,
+            max_deflection=max_deflection,
+            max_stress=max_stress,
+            is_strength_sufficient=calc._check_strength(max_stress, design_strength),
+            is_stiffness_sufficient=calc._check_stiffness(max_deflection, L)
+        )
+    
+    @staticmethod
+    def _peak_moments(request: MovingLoadRequest, offsets: np.ndarray, loads: np.ndarray,
+                      lead: np.ndarray, ei: float):
+        """
+        Наибольший по модулю момент при каждом положении головной оси.
+        
+        Момент вычисляется под каждой осью и на опорах - там лежат
+        экстремумы кусочно-линейной эпюры от сосредоточенных сил.
+        
+        Returns:
+            Кортеж (|M|, кН·м; сечение, м) массивов длины len(lead)
+        """
+        L = request.length
+        axle_positions = np.clip(lead[:, None] - offsets[None, :], 0.0, L)
+        on_beam = (lead[:, None] - offsets[None, :] >= 0) & (lead[:, None] - offsets[None, :] <= L)
+        coef = np.where(on_beam, -loads[None, :], 0.0)
+        order = np.ones_like(coef, dtype=np.int64)
+        supports = np.broadcast_to([0.0, L], (len(lead), 2))
+        sections = np.concatenate((axle_positions, supports), axis=1)
+        moment = np.abs(beam_fields(L, request.support_type, coef, axle_positions, order, sections, ei)["moment"])
+        j = moment.argmax(axis=1)
+        rows = np.arange(len(lead))
+        return moment[rows, j], sections[rows, j]
+    
+    @staticmethod
+    def _series(x: np.ndarray, values: np.ndarray) -> List[List[float]]:
+        """Ряд точек [x, значение] для ответа."""
+        return np.column_stack((x, values)).tolist()
@@ -0,0 +1,257 @@
+"""
+Сервис вероятностного расчёта надёжности балки методом Монте-Карло.
+Испытания считаются векторными блоками; у каждого блока свой поток
+случайных чисел, поэтому результат не зависит от числа процессов.
+"""
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+from statistics import NormalDist
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from app.models.material_profile import MaterialProfile
+from app.models.reliability import Distribution, FailureEstimate, ReliabilityRequest, ReliabilityResponse
+from app.services.calculator import BeamCalculator
+from app.core.config import settings
+from app.core.execution import CalculationCancelled, check_cancelled
+from app.core.metrics import stage_timer
+
+
+class SimulationPlan(NamedTuple):
+    """Неизменяемые параметры расчёта, передаваемые в процессы пула."""
+    entropy: int
+    samples: int
+    chunk_size: int
+    length: float
+    support_type: str
+    moment_of_inertia: float
+    moment_of_resistance: float
+    allowable_deflection: float
+    force: Distribution
+    force_position: Distribution
+    elastic_modulus: Distribution
+    yield_strength: Distribution
+    moment_of_inertia_factor: Distribution
+    moment_of_resistance_factor: Distribution
+    
+    @property
+    def chunks(self) -> int:
+        """Число блоков испытаний."""
+        return -(-self.samples // self.chunk_size)
+
+
+def deterministic(value: float) -> Distribution:
+    """Детерминированная величина."""
+    return Distribution(type="deterministic", mean=value)
+
+
+def sample(distribution: Distribution, rng: np.random.Generator, size: int) -> np.ndarray:
+    """
+    Выборка из распределения.
+    
+    Args:
+        distribution: Распределение
+        rng: Генератор случайных чисел
+        size: Объём выборки
+    
+    Returns:
+        Массив значений
+    """
+    kind = distribution.type
+    if kind == "deterministic":
+        return np.full(size, distribution.mean)
+    if kind == "normal":
+        return rng.normal(distribution.mean, distribution.std, size)
+    if kind == "lognormal":
+        # Параметры логарифма по среднему и стандартному отклонению величины
+        sigma2 = log(1 + (distribution.std / distribution.mean) ** 2)
+        return rng.lognormal(log(distribution.mean) - sigma2 / 2, sqrt(sigma2), size)
+    return rng.uniform(distribution.low, distribution.high, size)
+
+
+def simulate_chunk(plan: SimulationPlan, calculator: BeamCalculator, index: int) -> np.ndarray:
+    """
+    Число отказов в блоке испытаний.
+    
+    Поток блока задаётся SeedSequence(entropy, spawn_key=(index,)) - это
+    index-й потомок SeedSequence(entropy).spawn(), но без построения
+    списка всех потомков.
+    
+    Args:
+        plan: Параметры расчёта
+        calculator: Калькулятор для пакетного расчёта
+        index: Номер блока
+    
+    Returns:
+        Массив [отказы по прочности, по жёсткости, хотя бы по одному]
+    """
+    begin = index * plan.chunk_size
+    size = min(plan.chunk_size, plan.samples - begin)
+    rng = np.random.default_rng(np.random.SeedSequence(plan.entropy, spawn_key=(index,)))
+    
+    # Порядок выборок фиксирован: от него зависит воспроизводимость
+    force = sample(plan.force, rng, size)
+    position = np.clip(sample(plan.force_position, rng, size), 0.0, 1.0)
+    elastic_modulus = sample(plan.elastic_modulus, rng, size) * 1e9  # ГПа → Па
+    yield_strength = sample(plan.yield_strength, rng, size)
+    ix = plan.moment_of_inertia * sample(plan.moment_of_inertia_factor, rng, size)
+    wx = plan.moment_of_resistance * sample(plan.moment_of_resistance_factor, rng, size)
+    
+    extrema = calculator.batch_extrema(
+        plan.length, force, position, plan.support_type, ix, elastic_modulus
+    )
+    stress = np.abs(extrema["max_moment"]) * 1000 / (wx * 1e-6) / 1e6  # МПа
+    strength = stress > yield_strength
+    stiffness = np.abs(extrema["max_deflection"]) > plan.allowable_deflection
+    
+    return np.array([
+        np.count_nonzero(strength),
+        np.count_nonzero(stiffness),
+        np.count_nonzero(strength | stiffness),
+    ], dtype=np.int64)
+
+
+def failure_estimate(failures: int, samples: int, confidence: float) -> FailureEstimate:
+    """
+    Оценка вероятности отказа с интервалом Уилсона и индексом надёжности.
+    
+    Интервал Уилсона остаётся осмысленным при нуле отказов, когда
+    нормальное приближение вырождается в точку.
+    
+    Args:
+        failures: Число отказов
+        samples: Число испытаний
+        confidence: Доверительная вероятность
+    """
+    normal = NormalDist()
+    p = failures / samples
+    z = normal.inv_cdf(0.5 + confidence / 2)
+    denominator = 1 + z ** 2 / samples
+    centre = (p + z ** 2 / (2 * samples)) / denominator
+    half_width = z * sqrt(p * (1 - p) / samples + z ** 2 / (4 * samples ** 2)) / denominator
+    
+    return FailureEstimate(
+        failures=failures,
+        probability=p,
+        confidence_low=max(0.0, centre - half_width) if failures > 0 else 0.0,
+        confidence_high=min(1.0, centre + half_width) if failures < samples else 1.0,
+        reliability_index=-normal.inv_cdf(p) if 0 < p < 1 else None
+    )
+
+
+class ReliabilityAnalyzer:
+    """
+    Вероятность отказа по прочности и жёсткости методом Монте-Карло.
+    
+    Память ограничена размером блока; блоки могут считаться в пуле
+    процессов. Сумма целых счётчиков отказов не зависит от порядка
+    блоков, поэтому результат для заданного зерна совпадает побитово
+    при любом числе процессов.
+    """
+    
+    def __init__(self, calculator: BeamCalculator = None):
+        """
+        Инициализация.
+        
+        Args:
+            calculator: Калькулятор для пакетного расчёта
+        """
+        self._calculator = calculator or BeamCalculator()
+    
+    def analyze(self, request: ReliabilityRequest, profile: MaterialProfile,
+                cancel: Optional[threading.Event] = None) -> ReliabilityResponse:
+        """
+        Оценка вероятностей отказа.
+        
+        Args:
+            request: Распределения параметров и настройки расчёта
+            profile: Данные стального профиля
+            cancel: Флаг отмены, проверяется между блоками испытаний
+        
+        Returns:
+            Вероятности отказа, доверительные интервалы и индексы надёжности
+        
+        Raises:
+            CalculationCancelled: Если расчёт отменён
+        """
+        plan = self.plan(request, profile)
+        workers = min(request.workers, settings.RELIABILITY_MAX_WORKERS, plan.chunks)
+        
+        with stage_timer("monte_carlo", request.support_type):
+            counts = self.simulate(plan, workers, cancel)
+        
+        return self.summarize(plan, counts, request.confidence)
+    
+    def summarize(self, plan: SimulationPlan, counts, confidence: float) -> ReliabilityResponse:
+        """
+        Ответ по суммарным счётчикам отказов.
+        
+        Args:
+            plan: Параметры расчёта
+            counts: Отказы по прочности, по жёсткости и хотя бы по одному
+            confidence: Доверительная вероятность
+        """
+        strength, stiffness, combined = (int(value) for value in counts)
+        return ReliabilityResponse(
+            samples=plan.samples,
+            seed=plan.entropy,
+            confidence=confidence,
+            strength=failure_estimate(strength, plan.samples, confidence),
+            stiffness=failure_estimate(stiffness, plan.samples, confidence),
+            combined=failure_estimate(combined, plan.samples, confidence)
+        )
+    
+    def plan(self, request: ReliabilityRequest, profile: MaterialProfile) -> SimulationPlan:
+        """Параметры расчёта; незаданные распределения - номинальные значения."""
+        entropy = request.seed if request.seed is not None else np.random.SeedSequence().entropy
+        return SimulationPlan(
+            entropy=int(entropy),
+            samples=request.samples,
+            chunk_size=request.chunk_size,
+            length=request.length,
+            support_type=request.support_type,
+            moment_of_inertia=profile.moment_of_inertia_ix_cm4,
+            moment_of_resistance=profile.moment_of_resistance_wx_cm3,
+            allowable_deflection=request.length * 1000 * settings.ALLOWABLE_DEFLECTION_RATIO,
+            force=request.force,
+            force_position=request.force_position,
+            elastic_modulus=request.elastic_modulus
+                or deterministic(self._calculator.STEEL_ELASTIC_MODULUS / 1e9),
+            yield_strength=request.yield_strength
+                or deterministic(self._calculator.design_strength(request.steel_grade)),
+            moment_of_inertia_factor=request.moment_of_inertia_factor or deterministic(1.0),
+            moment_of_resistance_factor=request.moment_of_resistance_factor or deterministic(1.0)
+        )
+    
+    def simulate(self, plan: SimulationPlan, workers: int = 1,
+                 cancel: Optional[threading.Event] = None) -> np.ndarray:
+        """
+        Суммарные счётчики отказов по всем блокам.
+        
+        Args:
+            plan: Параметры расчёта
+            workers: Число процессов (1 - в текущем потоке)
+            cancel: Флаг отмены, проверяется между блоками
+        """
+        chunk = functools.partial(simulate_chunk, plan, self._calculator)
+        counts = np.zeros(3, dtype=np.int64)
+        if workers <= 1:
+            for index in range(plan.chunks):
+                check_cancelled(cancel)
+                counts += chunk(index)
+            return counts
+        
+        chunksize = max(1, plan.chunks // (4 * workers))
+        with ProcessPoolExecutor(workers) as pool:
+            try:
+                for result in pool.map(chunk, range(plan.chunks), chunksize=chunksize):
+                    check_cancelled(cancel)
+                    counts += result
+            except CalculationCancelled:
+                # Блоки из очереди пула не запускаются
+                pool.shutdown(cancel_futures=True)
+                raise
+            return counts
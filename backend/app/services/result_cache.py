@@ -0,0 +1,130 @@
+"""
+Кэш результатов расчёта в памяти процесса.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+
+class ResultCache:
+    """
+    Ограниченный LRU-кэш с временем жизни записей.
+    
+    Потокобезопасен. Ведёт счётчики попаданий, промахов, вытеснений
+    (по размеру) и истечений (по времени жизни).
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        """
+        Инициализация кэша.
+        
+        Args:
+            max_size: Максимальное число записей (0 - кэш отключён)
+            ttl_seconds: Время жизни записи, с (None - без ограничения)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Значение по ключу или None (запись становится самой свежей)."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Сохранение значения с вытеснением самых старых записей."""
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def delete(self, key: Hashable) -> bool:
+        """Удаление записи; False, если её не было."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+    
+    def clear(self) -> None:
+        """Очистка кэша (счётчики сохраняются)."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def stats(self) -> Dict[str, int]:
+        """Счётчики кэша."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def calculation_cache_key(request: BaseModel, profile: BaseModel, **extra: Any) -> str:
+    """
+    Канонический хэш входных данных расчёта.
+    
+    Учитывает все поля запроса, данные профиля и настройки, от которых
+    зависит результат. Одинаковые входные данные дают одинаковый ключ
+    независимо от порядка полей в JSON запроса.
+    
+    Args:
+        request: Модель запроса
+        profile: Модель профиля
+        **extra: Дополнительные параметры, влияющие на результат
+    
+    Returns:
+        Шестнадцатеричный SHA-256
+    """
+    payload = {
+        "request": request.model_dump(mode="json"),
+        "profile": profile.model_dump(mode="json"),
+        "settings": {
+            "ALLOWABLE_STRESS": settings.ALLOWABLE_STRESS,
+            "ALLOWABLE_DEFLECTION_RATIO": settings.ALLOWABLE_DEFLECTION_RATIO,
+        },
+        "extra": extra,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Проверка заголовка If-None-Match против сильного ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
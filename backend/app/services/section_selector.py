@@ -0,0 +1,120 @@
+"""
+Сервис подбора сечения балки по каталогу профилей.
+Находит самый лёгкий профиль, проходящий проверки прочности и жёсткости.
+"""
+from typing import List, Optional
+
+import numpy as np
+
+from app.models.beam_calculation import BeamLoadCase
+from app.models.profile_selection import ProfileSelectionCandidate, ProfileSelectionResponse
+from app.repositories.profile_catalog import ProfileCatalog
+from app.services.calculator import BeamCalculator
+from app.core.config import settings
+
+
+class SectionSelector:
+    """
+    Подбор профиля по предвычисленному индексу каталога.
+    
+    Профили один раз сортируются по Wx и Ix, поэтому отбор кандидатов
+    сводится к двоичному поиску по требуемым Wx и Ix. Полный расчёт
+    выполняется только для самых лёгких кандидатов. Схемы с упругими
+    опорами проверяются полным расчётом без предварительного отбора.
+    """
+    
+    # Относительный запас при двоичном поиске: пограничные профили
+    # проверяются точным расчётом, а не отбрасываются по округлению
+    SEARCH_TOLERANCE: float = 1e-6
+    
+    def __init__(self, catalog: ProfileCatalog, calculator: Optional[BeamCalculator] = None):
+        """
+        Построение индекса каталога.
+        
+        Args:
+            catalog: Каталог профилей
+            calculator: Калькулятор для проверки кандидатов
+        """
+        self._profiles = catalog.profiles
+        self._calculator = calculator or BeamCalculator()
+        
+        wx = catalog.column("moment_of_resistance_wx_cm3")
+        ix = catalog.column("moment_of_inertia_ix_cm4")
+        mass = catalog.column("mass_kg_m")
+        
+        self._order_by_wx = np.argsort(wx, kind="stable")
+        self._sorted_wx = wx[self._order_by_wx]
+        self._order_by_ix = np.argsort(ix, kind="stable")
+        self._sorted_ix = ix[self._order_by_ix]
+        # Ранг профиля по массе (при равной массе - по порядку в каталоге)
+        self._mass_rank = np.empty(len(self._profiles), dtype=np.int64)
+        self._mass_rank[np.argsort(mass, kind="stable")] = np.arange(len(self._profiles))
+    
+    def select(self, load_case: BeamLoadCase, alternatives: int = 3) -> ProfileSelectionResponse:
+        """
+        Подбор самого лёгкого профиля и следующих альтернатив.
+        
+        Args:
+            load_case: Расчётная схема балки без профиля
+            alternatives: Количество альтернативных профилей
+            
+        Returns:
+            Результаты подбора
+        """
+        calc = self._calculator
+        
+        if load_case.has_elastic_supports():
+            # Усилия и прогиб зависят от EI: требуемые Wx и Ix не выводятся,
+            # каждый профиль по возрастанию массы проверяется полным расчётом
+            max_moment = None
+            required_wx = required_ix = None
+            candidates = np.argsort(self._mass_rank)
+        else:
+            # Прогиб обратно пропорционален Ix: считаем схему при Ix = 1 см⁴
+            _, max_moment, unit_deflection = calc._calculate_internal_forces(load_case, 1.0)
+            
+            # σ = M / W → W ≥ M / R (кН·м / МПа → см³)
+            required_wx = max_moment * 1000 / calc.design_strength(load_case.steel_grade)
+            
+            # f = f(Ix = 1 см⁴) / Ix → Ix ≥ f(Ix = 1 см⁴) / f_доп
+            allowable_deflection = load_case.length * 1000 * settings.ALLOWABLE_DEFLECTION_RATIO
+            required_ix = unit_deflection / allowable_deflection
+            
+            candidates = self._candidates(required_wx, required_ix)
+        
+        # Кандидаты уже упорядочены по массе: проверяем до нужного количества
+        passed: List[ProfileSelectionCandidate] = []
+        for index in candidates:
+            profile = self._profiles[index]
+            summary = calc.calculate_summary(load_case, profile)
+            if required_wx is None and not passed:
+                max_moment = summary.max_moment
+            if summary.is_strength_sufficient and summary.is_stiffness_sufficient:
+                passed.append(ProfileSelectionCandidate(
+                    profile=profile,
+                    max_stress=summary.max_stress,
+                    max_deflection=summary.max_deflection
+                ))
+                if len(passed) > alternatives:
+                    break
+        
+        return ProfileSelectionResponse(
+            max_moment=max_moment,
+            required_wx_cm3=None if required_wx is None else round(required_wx, 2),
+            required_ix_cm4=None if required_ix is None else round(required_ix, 2),
+            best=passed[0] if passed else None,
+            alternatives=passed[1:]
+        )
+    
+    def _candidates(self, required_wx: float, required_ix: float) -> np.ndarray:
+        """Индексы профилей с Wx и Ix не ниже требуемых, по возрастанию массы."""
+        slack = 1 - self.SEARCH_TOLERANCE
+        start_wx = np.searchsorted(self._sorted_wx, required_wx * slack, side="left")
+        start_ix = np.searchsorted(self._sorted_ix, required_ix * slack, side="left")
+        
+        enough_ix = np.zeros(len(self._profiles), dtype=bool)
+        enough_ix[self._order_by_ix[start_ix:]] = True
+        by_wx = self._order_by_wx[start_wx:]
+        candidates = by_wx[enough_ix[by_wx]]
+        
+        return candidates[np.argsort(self._mass_rank[candidates])]
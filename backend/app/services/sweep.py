@@ -0,0 +1,159 @@
+"""
+Сервис параметрического перебора расчётных схем.
+Декартово произведение раскрывается лениво и считается векторными блоками.
+"""
+import csv
+import io
+import json
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен
+    orjson = None
+
+from app.models.material_profile import MaterialProfile
+from app.models.sweep import SweepRequest
+from app.services.calculator import BeamCalculator
+
+
+# Колонки результата в порядке вывода
+SWEEP_COLUMNS = (
+    "length",
+    "force",
+    "force_position",
+    "support_type",
+    "profile_name",
+    "R_a",
+    "R_b",
+    "M_a",
+    "M_b",
+    "max_moment",
+    "max_deflection",
+    "max_stress",
+    "is_strength_sufficient",
+    "is_stiffness_sufficient",
+)
+
+
+class ParameterSweep:
+    """
+    Перебор декартова произведения параметров.
+    
+    Комбинации не материализуются: номер комбинации переводится
+    в индексы осей через numpy.unravel_index, поэтому память
+    ограничена размером блока независимо от размера перебора.
+    """
+    
+    def __init__(self, request: SweepRequest, profiles: Sequence[MaterialProfile],
+                 calculator: BeamCalculator = None):
+        """
+        Подготовка осей перебора.
+        
+        Args:
+            request: Параметры перебора
+            profiles: Профили в порядке request.profile_names
+            calculator: Калькулятор для пакетного расчёта
+        
+        Raises:
+            ValueError: Если марки стали нет в каталоге
+        """
+        self._calculator = calculator or BeamCalculator()
+        self._design_strength = self._calculator.design_strength(request.steel_grade)
+        self._chunk_size = request.chunk_size
+        
+        self._lengths = np.asarray(request.axis_values("length"), dtype=np.float64)
+        self._forces = np.asarray(request.axis_values("force"), dtype=np.float64)
+        self._positions = np.asarray(request.axis_values("force_position"), dtype=np.float64)
+        self._support_types = np.asarray(request.support_types)
+        self._profile_names = np.asarray([p.key for p in profiles])
+        self._ix = np.array([p.moment_of_inertia_ix_cm4 for p in profiles], dtype=np.float64)
+        self._wx = np.array([p.moment_of_resistance_wx_cm3 for p in profiles], dtype=np.float64)
+        
+        self.shape = (
+            len(self._lengths),
+            len(self._forces),
+            len(self._positions),
+            len(self._support_types),
+            len(self._profile_names),
+        )
+        self.total = int(np.prod(self.shape, dtype=np.int64))
+    
+    def chunks(self, start: int = 0) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Результаты перебора блоками колонок.
+        
+        Args:
+            start: Номер комбинации, с которой продолжить перебор
+        """
+        for begin in range(start, self.total, self._chunk_size):
+            yield self.compute_chunk(begin, min(begin + self._chunk_size, self.total))
+    
+    def compute_chunk(self, begin: int, end: int) -> Dict[str, np.ndarray]:
+        """Расчёт комбинаций с номерами [begin, end) одним векторным проходом."""
+        i_len, i_force, i_pos, i_support, i_profile = np.unravel_index(
+            np.arange(begin, end, dtype=np.int64), self.shape
+        )
+        
+        columns = {
+            "length": self._lengths[i_len],
+            "force": self._forces[i_force],
+            "force_position": self._positions[i_pos],
+            "support_type": self._support_types[i_support],
+            "profile_name": self._profile_names[i_profile],
+        }
+        columns.update(self._calculator.calculate_batch(
+            length=columns["length"],
+            force=columns["force"],
+            force_position=columns["force_position"],
+            support_type=columns["support_type"],
+            moment_of_inertia=self._ix[i_profile],
+            moment_of_resistance=self._wx[i_profile],
+            design_strength=self._design_strength
+        ))
+        return columns
+
+
+def chunk_rows(columns: Dict[str, np.ndarray]) -> List[tuple]:
+    """Строки блока в порядке SWEEP_COLUMNS."""
+    return list(zip(*(columns[name].tolist() for name in SWEEP_COLUMNS)))
+
+
+def _dumps(value) -> str:
+    """JSON-строка (через orjson, если установлен)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+
+def format_ndjson(columns: Dict[str, np.ndarray]) -> str:
+    """Блок результатов в формате NDJSON (объект на строку)."""
+    return "".join(
+        _dumps(dict(zip(SWEEP_COLUMNS, row))) + "\n"
+        for row in chunk_rows(columns)
+    )
+
+
+def format_ndjson_columns(columns: Dict[str, np.ndarray], offset: int) -> str:
+    """
+    Блок результатов одной строкой NDJSON в колоночном виде.
+    
+    Args:
+        columns: Колонки блока
+        offset: Номер первой комбинации блока
+    """
+    block = {"offset": offset, "count": len(columns[SWEEP_COLUMNS[0]])}
+    block.update((name, columns[name].tolist()) for name in SWEEP_COLUMNS)
+    return _dumps(block) + "\n"
+
+
+def format_csv(columns: Dict[str, np.ndarray], header: bool = False) -> str:
+    """Блок результатов в формате CSV."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(SWEEP_COLUMNS)
+    writer.writerows(chunk_rows(columns))
+    return buffer.getvalue()
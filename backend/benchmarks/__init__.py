@@ -0,0 +1,7 @@
+"""
+Микробенчмарки расчётного ядра и репозитория профилей.
+
+Запуск из папки backend:
+    python -m benchmarks run --output benchmarks/results.json
+    python -m benchmarks compare benchmarks/baseline.json benchmarks/results.json --threshold 10
+"""
@@ -0,0 +1,82 @@
+"""
+Командная строка микробенчмарков.
+
+    python -m benchmarks run [--filter ПОДСТРОКА] [--output ФАЙЛ] [--baseline ФАЙЛ]
+    python -m benchmarks compare БАЗА ТЕКУЩИЕ [--threshold %] [--metric median_ns]
+
+Код возврата 1 - есть бенчмарки, замедлившиеся больше порога.
+"""
+import argparse
+import sys
+
+from benchmarks.cases import collect_benchmarks
+from benchmarks.runner import (
+    METRICS,
+    compare_results,
+    format_duration,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def _print_comparison(rows, threshold: float) -> int:
+    """Таблица сравнения; возвращает код возврата."""
+    width = max((len(row["name"]) for row in rows), default=10)
+    for row in rows:
+        mark = "REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<{width}}  {format_duration(row['baseline']):>10}  "
+              f"{format_duration(row['current']):>10}  {row['change']:+7.1f}%  {mark}")
+    
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"\nЗамедление больше {threshold}%: {len(regressions)} из {len(rows)}")
+        return 1
+    print(f"\nРегрессий нет ({len(rows)} бенчмарков, порог {threshold}%)")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run = commands.add_parser("run", help="Замер бенчмарков")
+    run.add_argument("--filter", help="Подстрока имени бенчмарка")
+    run.add_argument("--repeat", type=int, default=5, help="Число серий")
+    run.add_argument("--min-time", type=float, default=0.2, help="Длительность серии, с")
+    run.add_argument("--output", help="JSON-файл результатов")
+    run.add_argument("--baseline", help="Сравнить с базовой линией после замера")
+    run.add_argument("--threshold", type=float, default=10.0, help="Допустимое замедление, %%")
+    run.add_argument("--metric", choices=METRICS, default="median_ns")
+    
+    compare = commands.add_parser("compare", help="Сравнение результатов с базовой линией")
+    compare.add_argument("baseline", help="JSON-файл базовой линии")
+    compare.add_argument("current", help="JSON-файл текущих результатов")
+    compare.add_argument("--threshold", type=float, default=10.0, help="Допустимое замедление, %%")
+    compare.add_argument("--metric", choices=METRICS, default="median_ns")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "compare":
+        rows = compare_results(load_results(args.baseline), load_results(args.current),
+                               args.threshold, args.metric)
+        return _print_comparison(rows, args.threshold)
+    
+    results = run_benchmarks(
+        collect_benchmarks(), args.filter, args.repeat, args.min_time,
+        progress=lambda name, result: print(
+            f"{name:<55} {format_duration(result['median_ns']):>10}", flush=True
+        )
+    )
+    if args.output:
+        save_results(results, args.output)
+    if args.baseline:
+        rows = compare_results(load_results(args.baseline), results, args.threshold, args.metric)
+        print()
+        return _print_comparison(rows, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
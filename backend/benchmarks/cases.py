@@ -0,0 +1,203 @@
+"""
+Набор микробенчмарков.
+
+Каждый бенчмарк - функция без аргументов; подготовка данных
+выполняется заранее и в замер не входит.
+"""
+from typing import Callable, Dict
+
+from app.models.beam_calculation import BeamCalculationRequest, BeamCalculationResponse
+from app.models.continuous_beam import ContinuousBeamRequest
+from app.models.load_combination import LoadCombinationRequest
+from app.models.reliability import ReliabilityRequest
+from app.models.material_profile import ProfileQuery
+from app.repositories.material_repository import MaterialRepositoryStub
+from app.repositories.profile_catalog import load_profile_catalog
+from app.repositories.steel_grades import load_steel_grades
+from app.services.calculator import BeamCalculator
+from app.services.capacity_table import CapacityTable
+from app.services.continuous_beam import ContinuousBeamAnalyzer
+from app.services.load_combinations import LoadCombinationAnalyzer
+from app.services.reliability import ReliabilityAnalyzer
+from app.services.fem import solve_beam, standard_supports
+
+
+SUPPORT_TYPES = ("hinged", "cantilever", "fixed")
+
+PROFILE_NAME = "I-beam_20B1"
+
+
+def _request(support_type: str, **overrides) -> BeamCalculationRequest:
+    """Типовой запрос расчёта."""
+    data = {
+        "length": 6.0,
+        "support_type": support_type,
+        "force": 80.0,
+        "force_position": 0.3,
+        "profile_name": PROFILE_NAME,
+    }
+    data.update(overrides)
+    return BeamCalculationRequest(**data)
+
+
+def calculator_benchmarks() -> Dict[str, Callable[[], object]]:
+    """BeamCalculator.calculate и его этапы для каждого типа опор."""
+    calculator = BeamCalculator()
+    profile = MaterialRepositoryStub().get_profile(PROFILE_NAME)
+    ix = profile.moment_of_inertia_ix_cm4
+    wx = profile.moment_of_resistance_wx_cm3
+    cases = {}
+    
+    for support in SUPPORT_TYPES:
+        request = _request(support)
+        multi_load = _request(
+            support, force=None, force_position=None,
+            point_loads=[{"force": 30.0, "position": 0.2}, {"force": 40.0, "position": 0.7}],
+            distributed_loads=[{"q_start": 5.0, "q_end": 10.0}]
+        )
+        reactions, max_moment, max_deflection = calculator._calculate_internal_forces(request, ix)
+        max_stress = calculator._calculate_max_stress(max_moment, wx)
+        strength = calculator._check_strength(max_stress)
+        stiffness = calculator._check_stiffness(max_deflection, request.length)
+        
+        stages = {
+            "calculate": lambda r=request: calculator.calculate(r, profile),
+            "calculate_multi_load": lambda r=multi_load: calculator.calculate(r, profile),
+            "calculate_summary": lambda r=request: calculator.calculate_summary(r, profile),
+            "internal_forces": lambda r=request: calculator._calculate_internal_forces(r, ix),
+            "reactions": lambda s=support: calculator._calculate_reactions(6.0, 80.0, 0.3, s),
+            "max_moment": lambda s=support: calculator._calculate_max_moment(6.0, 80.0, 0.3, s),
+            "max_deflection": lambda s=support: calculator._calculate_max_deflection(6.0, 80.0, 0.3, s, ix),
+            "max_stress": lambda m=max_moment: calculator._calculate_max_stress(m, wx),
+            "check_strength": lambda s=max_stress: calculator._check_strength(s),
+            "check_stiffness": lambda d=max_deflection: calculator._check_stiffness(d, 6.0),
+            "analyze_loads": lambda r=multi_load: calculator._analyze_loads(r, ix),
+            "diagram_data": lambda r=request: calculator._generate_diagram_data(r, ix),
+            "report_sections": lambda r=request, args=(reactions, max_moment, max_deflection,
+                                                       max_stress, strength, stiffness):
+                calculator._generate_report_sections(r, profile, *args),
+        }
+        for stage, func in stages.items():
+            cases[f"calculator.{stage}[{support}]"] = func
+    
+    return cases
+
+
+def fem_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Решение МКЭ на сетках разного размера (время должно расти линейно)."""
+    calculator = BeamCalculator()
+    profile = MaterialRepositoryStub().get_profile(PROFILE_NAME)
+    ei = calculator._flexural_rigidity(profile.moment_of_inertia_ix_cm4)
+    supports = standard_supports("fixed", 6.0)
+    loads = dict(point_forces=[80.0], point_positions=[1.8], q_start=[5.0], q_end=[10.0], q_from=[0.0], q_to=[6.0])
+    custom = _request(
+        "custom",
+        supports=[{"type": "pin", "position": 0.0}, {"type": "roller", "position": 0.5},
+                  {"type": "spring", "position": 1.0, "stiffness": 5000.0}]
+    )
+    
+    cases = {
+        f"fem.solve_beam[{elements}]": lambda n=elements: solve_beam(6.0, ei, supports, elements=n, **loads)
+        for elements in (1_000, 10_000, 100_000)
+    }
+    cases["calculator.calculate[custom]"] = lambda: calculator.calculate(custom, profile)
+    return cases
+
+
+def continuous_beam_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Неразрезная балка с расстановками временной нагрузки по всем пролётам."""
+    analyzer = ContinuousBeamAnalyzer()
+    profile = MaterialRepositoryStub().get_profile(PROFILE_NAME)
+    span = {"length": 4.0, "distributed_loads": [{"q_start": 5.0}], "live_load": 3.0}
+    
+    cases = {}
+    for count in (100, 500):
+        request = ContinuousBeamRequest(spans=[span] * count, profile_name=PROFILE_NAME, diagram_points=21)
+        cases[f"continuous_beam.analyze[{count}]"] = lambda r=request: analyzer.analyze(r, profile)
+    return cases
+
+
+def load_combination_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Сочетания нагрузок: 576 сочетаний семи загружений (поля загружений в кэше)."""
+    analyzer = LoadCombinationAnalyzer()
+    profile = MaterialRepositoryStub().get_profile(PROFILE_NAME)
+    cases = [{"name": "dead", "category": "permanent", "distributed_loads": [{"q_start": 4.0}]}]
+    cases += [
+        {"name": f"live{i}", "category": "live", "point_loads": [{"force": 10.0, "position": 0.1 + 0.13 * i}]}
+        for i in range(6)
+    ]
+    request = LoadCombinationRequest(length=6.0, support_type="hinged", profile_name=PROFILE_NAME,
+                                     load_cases=cases, include_results=False)
+    return {"load_combinations.analyze[576]": lambda: analyzer.analyze(request, profile)}
+
+
+def reliability_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Монте-Карло: миллион испытаний блоками по 100 тысяч."""
+    analyzer = ReliabilityAnalyzer()
+    profile = MaterialRepositoryStub().get_profile(PROFILE_NAME)
+    request = ReliabilityRequest(
+        length=6.0,
+        support_type="hinged",
+        profile_name=PROFILE_NAME,
+        force={"type": "lognormal", "mean": 40.0, "std": 8.0},
+        force_position={"type": "uniform", "low": 0.3, "high": 0.7},
+        elastic_modulus={"type": "normal", "mean": 210.0, "std": 6.3},
+        samples=1_000_000,
+        seed=1
+    )
+    return {"reliability.analyze[1e6]": lambda: analyzer.analyze(request, profile)}
+
+
+def capacity_table_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Таблица «марка × профиль»: построение, проверка пары и отбор по моменту."""
+    catalog = load_profile_catalog()
+    grades = load_steel_grades()
+    table = CapacityTable(catalog, grades)
+    return {
+        "capacity_table.build": lambda: CapacityTable(catalog, grades),
+        "capacity_table.check_strength": lambda: table.check_strength("C345", PROFILE_NAME, 40.0),
+        "capacity_table.pairs_for_moment": lambda: table.pairs_for_moment(40.0, limit=10),
+    }
+
+
+def repository_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Поиск профилей по ключу, по части названия и с фильтрами."""
+    repository = MaterialRepositoryStub()
+    query = ProfileQuery(min_wx=200.0, sort="mass_kg_m", limit=3)
+    return {
+        "repository.get_profile": lambda: repository.get_profile(PROFILE_NAME),
+        "repository.get_profile_missing": lambda: repository.get_profile("I-beam_missing"),
+        "repository.get_all_profiles": repository.get_all_profiles,
+        "repository.search_profiles": lambda: repository.search_profiles("30"),
+        "repository.query_profiles": lambda: repository.query_profiles(query),
+    }
+
+
+def model_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Построение, проверка и сериализация BeamCalculationResponse."""
+    calculator = BeamCalculator()
+    profile = MaterialRepositoryStub().get_profile(PROFILE_NAME)
+    response = calculator.calculate(_request("hinged"), profile)
+    data = response.model_dump()
+    text = response.model_dump_json()
+    return {
+        "model.request_validate": lambda: _request("hinged"),
+        "model.response_construct": lambda: BeamCalculationResponse(**data),
+        "model.response_validate_json": lambda: BeamCalculationResponse.model_validate_json(text),
+        "model.response_dump": response.model_dump,
+        "model.response_dump_json": response.model_dump_json,
+    }
+
+
+def collect_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Все бенчмарки по именам."""
+    cases = {}
+    cases.update(calculator_benchmarks())
+    cases.update(fem_benchmarks())
+    cases.update(continuous_beam_benchmarks())
+    cases.update(load_combination_benchmarks())
+    cases.update(reliability_benchmarks())
+    cases.update(capacity_table_benchmarks())
+    cases.update(repository_benchmarks())
+    cases.update(model_benchmarks())
+    return cases
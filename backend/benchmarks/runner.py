@@ -0,0 +1,147 @@
+"""
+Замер бенчмарков, сохранение результатов и сравнение с базовой линией.
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pydantic
+
+
+# Метрики результата, доступные для сравнения (нс на вызов)
+METRICS = ("min_ns", "median_ns", "mean_ns")
+
+
+def measure(func: Callable[[], object], repeat: int = 5,
+            min_time: float = 0.2) -> Dict[str, float]:
+    """
+    Замер времени одного вызова функции.
+    
+    Число вызовов в серии подбирается так, чтобы серия длилась
+    не меньше min_time; время вызова берётся по repeat сериям.
+    
+    Args:
+        func: Функция без аргументов
+        repeat: Число серий
+        min_time: Минимальная длительность серии, с
+        
+    Returns:
+        Словарь: число вызовов в серии, серий и min/median/mean в нс
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    
+    per_call = [elapsed * 1e9 / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(per_call),
+        "median_ns": statistics.median(per_call),
+        "mean_ns": statistics.fmean(per_call),
+    }
+
+
+def run_benchmarks(cases: Dict[str, Callable[[], object]], pattern: Optional[str] = None,
+                   repeat: int = 5, min_time: float = 0.2,
+                   progress: Optional[Callable[[str, Dict[str, float]], None]] = None) -> dict:
+    """
+    Замер набора бенчмарков.
+    
+    Args:
+        cases: Бенчмарки по именам
+        pattern: Подстрока имени для отбора бенчмарков
+        repeat: Число серий
+        min_time: Минимальная длительность серии, с
+        progress: Обратный вызов после каждого замера
+        
+    Returns:
+        Результаты с описанием окружения
+    """
+    results = {}
+    for name, func in cases.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(func, repeat, min_time)
+        if progress is not None:
+            progress(name, results[name])
+    
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "pydantic": pydantic.VERSION,
+        },
+        "benchmarks": results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 10.0,
+                    metric: str = "median_ns") -> List[dict]:
+    """
+    Сравнение результатов с базовой линией.
+    
+    Args:
+        baseline: Результаты базовой линии
+        current: Текущие результаты
+        threshold: Допустимое замедление, %
+        metric: Сравниваемая метрика (из METRICS)
+        
+    Returns:
+        Строки сравнения по общим бенчмаркам: name, baseline, current,
+        change (%), regression
+        
+    Raises:
+        ValueError: Если метрика неизвестна
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Неизвестная метрика: {metric}. Доступны: {', '.join(METRICS)}")
+    
+    rows = []
+    for name, result in current["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            continue
+        change = (result[metric] / reference[metric] - 1) * 100
+        rows.append({
+            "name": name,
+            "baseline": reference[metric],
+            "current": result[metric],
+            "change": change,
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def format_duration(nanoseconds: float) -> str:
+    """Время в удобных единицах."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:.2f} {unit}"
+    return f"{nanoseconds:.0f} ns"
+
+
+def load_results(path: str) -> dict:
+    """Чтение результатов из JSON-файла."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_results(results: dict, path: str) -> None:
+    """Запись результатов в JSON-файл."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2, sort_keys=True)
+        file.write("\n")
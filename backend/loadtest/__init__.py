@@ -0,0 +1,7 @@
+"""
+Нагрузочное тестирование API без внешних сервисов.
+
+Запуск из папки backend:
+    python -m loadtest --mode asgi --concurrency 32 --duration 10
+    python -m loadtest --mode uvicorn --workers 4 --mix calculate=8,profiles=2
+"""
@@ -0,0 +1,89 @@
+"""
+Командная строка нагрузочного теста.
+
+    python -m loadtest [--mode asgi|uvicorn] [--workers N] [--concurrency N]
+                       [--duration С] [--warmup С] [--mix calculate=8,profiles=2]
+                       [--unique] [--output ФАЙЛ]
+
+Код возврата 1 - доля ошибок выше --max-error-rate.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from loadtest.harness import run_load_test
+from loadtest.scenarios import SCENARIOS, parse_mix
+
+
+def _print_report(report: dict) -> None:
+    """Сводка отчёта в консоль."""
+    settings = report["settings"]
+    print(f"Режим: {settings['mode']}, клиентов: {settings['concurrency']}, "
+          f"замер: {report['duration_s']:.1f} с")
+    print(f"Запросов: {report['requests']}, RPS: {report['rps']:.1f}, "
+          f"ошибок: {report['errors']} ({report['error_rate']:.2%})\n")
+    
+    header = f"{'сценарий':<20} {'запросов':>9} {'RPS':>9} {'ошибок':>7} " \
+             f"{'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  (мс)"
+    print(header)
+    rows = list(report["scenarios"].items()) + [("ВСЕГО", report)]
+    for name, item in rows:
+        latency = item["latency_ms"]
+        if not latency:
+            continue
+        print(f"{name:<20} {item['requests']:>9} {item['rps']:>9.1f} {item['errors']:>7} "
+              f"{latency['p50']:>8.2f} {latency['p95']:>8.2f} {latency['p99']:>8.2f} "
+              f"{latency['max']:>8.2f}")
+    
+    print("\nГистограмма задержек, мс:")
+    peak = max((b["count"] for b in report["histogram_ms"]), default=0) or 1
+    for bucket in report["histogram_ms"]:
+        if bucket["count"]:
+            bar = "#" * max(1, round(40 * bucket["count"] / peak))
+            print(f"  <= {bucket['le']:>7}  {bucket['count']:>8}  {bar}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--workers", type=int, default=1, help="Рабочих процессов uvicorn")
+    parser.add_argument("--concurrency", type=int, default=16, help="Параллельных клиентов")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность замера, с")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Прогрев, с")
+    parser.add_argument("--mix", default="calculate=1,profiles=1",
+                        help=f"Веса сценариев: {', '.join(SCENARIOS)}")
+    parser.add_argument("--unique", action="store_true", help="Случайные параметры (мимо кэша)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON-файл отчёта")
+    parser.add_argument("--max-error-rate", type=float, default=0.0,
+                        help="Допустимая доля ошибок")
+    args = parser.parse_args(argv)
+    
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+    
+    report = asyncio.run(run_load_test(
+        mode=args.mode,
+        mix=mix,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        workers=args.workers,
+        seed=args.seed,
+        unique=args.unique,
+    ))
+    
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+            file.write("\n")
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
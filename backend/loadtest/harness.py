@@ -0,0 +1,271 @@
+"""
+Генератор нагрузки и статистика задержек.
+
+Приложение запускается либо в этом же процессе (ASGI-транспорт httpx,
+без сети), либо отдельным процессом uvicorn с N рабочими процессами
+на свободном локальном порту.
+"""
+import asyncio
+import contextlib
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from loadtest.scenarios import SCENARIOS
+
+
+# Границы корзин гистограммы задержек, мс (логарифмическая шкала)
+HISTOGRAM_BOUNDS_MS = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LatencyRecorder:
+    """Задержки и коды ответов по сценариям."""
+    
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+    
+    def record(self, scenario: str, latency: float, status: str) -> None:
+        """
+        Args:
+            scenario: Имя сценария
+            latency: Задержка, с
+            status: Код ответа или имя исключения
+        """
+        self.latencies.setdefault(scenario, []).append(latency)
+        counts = self.statuses.setdefault(scenario, {})
+        counts[status] = counts.get(status, 0) + 1
+
+
+def latency_stats(latencies: List[float]) -> Dict[str, float]:
+    """Перцентили, среднее и максимум задержки, мс."""
+    values = np.asarray(latencies, dtype=np.float64) * 1000
+    if values.size == 0:
+        return {}
+    stats = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+    stats.update(mean=float(values.mean()), max=float(values.max()), min=float(values.min()))
+    return stats
+
+
+def latency_histogram(latencies: List[float]) -> List[dict]:
+    """Число запросов по корзинам задержки (верхняя граница le, мс; inf - остаток)."""
+    values = np.asarray(latencies, dtype=np.float64) * 1000
+    edges = np.array(HISTOGRAM_BOUNDS_MS)
+    counts = np.bincount(np.searchsorted(edges, values, side="left"), minlength=len(edges) + 1)
+    bounds = list(HISTOGRAM_BOUNDS_MS) + [float("inf")]
+    return [{"le": bound, "count": int(count)} for bound, count in zip(bounds, counts)]
+
+
+def is_error(status: str) -> bool:
+    """Ошибка: исключение транспорта или код ответа 4xx/5xx."""
+    return not status.isdigit() or int(status) >= 400
+
+
+def build_report(recorder: LatencyRecorder, elapsed: float, settings: dict) -> dict:
+    """
+    Сводный отчёт нагрузочного теста.
+    
+    Args:
+        recorder: Собранные задержки
+        elapsed: Длительность замера, с
+        settings: Параметры запуска
+    """
+    scenarios = {}
+    for name, latencies in recorder.latencies.items():
+        statuses = recorder.statuses[name]
+        errors = sum(count for status, count in statuses.items() if is_error(status))
+        scenarios[name] = {
+            "requests": len(latencies),
+            "errors": errors,
+            "error_rate": errors / len(latencies),
+            "rps": len(latencies) / elapsed,
+            "statuses": statuses,
+            "latency_ms": latency_stats(latencies),
+        }
+    
+    all_latencies = [v for values in recorder.latencies.values() for v in values]
+    total = len(all_latencies)
+    errors = sum(item["errors"] for item in scenarios.values())
+    return {
+        "settings": settings,
+        "duration_s": elapsed,
+        "requests": total,
+        "errors": errors,
+        "error_rate": errors / total if total else 0.0,
+        "rps": total / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": latency_stats(all_latencies),
+        "histogram_ms": latency_histogram(all_latencies),
+        "scenarios": scenarios,
+    }
+
+
+async def _worker(client: httpx.AsyncClient, mix: Dict[str, float], rng: random.Random,
+                  unique: bool, deadline: float, measure_from: float,
+                  recorder: LatencyRecorder) -> None:
+    """Цикл запросов одного виртуального клиента до истечения времени."""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, body = SCENARIOS[name](rng, unique)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            await response.aread()
+            status = str(response.status_code)
+        except httpx.HTTPError as error:
+            status = type(error).__name__
+        finished = time.perf_counter()
+        if started >= measure_from:
+            recorder.record(name, finished - started, status)
+
+
+async def generate_load(client: httpx.AsyncClient, mix: Dict[str, float], concurrency: int,
+                        duration: float, warmup: float = 0.0, seed: int = 0,
+                        unique: bool = False) -> tuple:
+    """
+    Нагрузка на приложение параллельными клиентами.
+    
+    Args:
+        client: HTTP-клиент приложения
+        mix: Веса сценариев
+        concurrency: Число параллельных клиентов
+        duration: Длительность замера, с
+        warmup: Длительность прогрева (не входит в статистику), с
+        seed: Зерно генератора запросов
+        unique: Случайные параметры запросов (мимо кэша)
+        
+    Returns:
+        Кортеж (задержки, фактическая длительность замера в с)
+    """
+    recorder = LatencyRecorder()
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+    await asyncio.gather(*(
+        _worker(client, mix, random.Random(seed * 1_000_003 + i), unique,
+                deadline, measure_from, recorder)
+        for i in range(concurrency)
+    ))
+    return recorder, max(time.perf_counter() - measure_from, 1e-9)
+
+
+@contextlib.asynccontextmanager
+async def asgi_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Клиент приложения в этом же процессе (с обработкой lifespan)."""
+    from app.main import app
+    
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            yield client
+
+
+def _free_port() -> int:
+    """Свободный локальный TCP-порт."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.asynccontextmanager
+async def uvicorn_client(concurrency: int, workers: int = 1,
+                         startup_timeout: float = 30.0) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Клиент приложения, запущенного отдельным процессом uvicorn.
+    
+    Args:
+        concurrency: Число параллельных клиентов (размер пула соединений)
+        workers: Число рабочих процессов uvicorn
+        startup_timeout: Время ожидания готовности сервера, с
+    """
+    port = _free_port()
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app",
+         "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=backend_dir,
+    )
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits,
+                                     timeout=60.0) as client:
+            deadline = time.perf_counter() + startup_timeout
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"uvicorn завершился с кодом {process.returncode}")
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if time.perf_counter() > deadline:
+                    raise RuntimeError("uvicorn не запустился за отведённое время")
+                await asyncio.sleep(0.1)
+            yield client
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+async def run_load_test(mode: str = "asgi", mix: Optional[Dict[str, float]] = None,
+                        concurrency: int = 16, duration: float = 10.0, warmup: float = 1.0,
+                        workers: int = 1, seed: int = 0, unique: bool = False) -> dict:
+    """
+    Нагрузочный тест приложения.
+    
+    Args:
+        mode: asgi - в этом процессе, uvicorn - отдельным сервером
+        mix: Веса сценариев (по умолчанию calculate и profiles поровну)
+        concurrency: Число параллельных клиентов
+        duration: Длительность замера, с
+        warmup: Длительность прогрева, с
+        workers: Число рабочих процессов uvicorn
+        seed: Зерно генератора запросов
+        unique: Случайные параметры запросов (мимо кэша)
+        
+    Returns:
+        Отчёт (см. build_report)
+        
+    Raises:
+        ValueError: Если режим неизвестен
+    """
+    mix = mix or {"calculate": 1.0, "profiles": 1.0}
+    if mode == "asgi":
+        client_factory = asgi_client()
+    elif mode == "uvicorn":
+        client_factory = uvicorn_client(concurrency, workers)
+    else:
+        raise ValueError(f"Неизвестный режим: {mode}")
+    
+    async with client_factory as client:
+        recorder, elapsed = await generate_load(
+            client, mix, concurrency, duration, warmup, seed, unique
+        )
+    
+    settings = {
+        "mode": mode,
+        "mix": mix,
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "warmup_s": warmup,
+        "workers": workers if mode == "uvicorn" else None,
+        "seed": seed,
+        "unique": unique,
+    }
+    return build_report(recorder, elapsed, settings)
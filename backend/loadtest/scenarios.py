@@ -0,0 +1,96 @@
+"""
+Сценарии запросов нагрузочного теста.
+
+Сценарий - функция, возвращающая параметры очередного запроса
+(метод, путь, тело JSON). Генератор случайных чисел передаётся
+снаружи, поэтому последовательность запросов воспроизводима.
+"""
+import random
+from typing import Callable, Dict, Optional, Tuple
+
+
+RequestSpec = Tuple[str, str, Optional[dict]]
+
+PROFILE_NAMES = (
+    "I-beam_10B1",
+    "I-beam_20B1",
+    "I-beam_30B1",
+    "I-beam_40B1",
+)
+
+
+def calculate(rng: random.Random, unique: bool = False) -> RequestSpec:
+    """
+    Расчёт балки с одной силой.
+    
+    Args:
+        rng: Генератор случайных чисел
+        unique: Случайные размеры (мимо кэша результатов)
+    """
+    body = {
+        "length": 6.0,
+        "support_type": "hinged",
+        "force": 80.0,
+        "force_position": 0.5,
+        "profile_name": "I-beam_20B1",
+    }
+    if unique:
+        body.update(
+            length=round(rng.uniform(2.0, 12.0), 3),
+            force=round(rng.uniform(10.0, 200.0), 3),
+            force_position=round(rng.random(), 3),
+            support_type=rng.choice(("hinged", "cantilever", "fixed")),
+            profile_name=rng.choice(PROFILE_NAMES),
+        )
+    return "POST", "/api/v1/calculate", body
+
+
+def calculate_summary(rng: random.Random, unique: bool = False) -> RequestSpec:
+    """Расчёт балки без отчёта и эпюр (только вердикты)."""
+    method, path, body = calculate(rng, unique)
+    return method, path + "?fields=max_stress,is_strength_sufficient,is_stiffness_sufficient", body
+
+
+def profiles(rng: random.Random, unique: bool = False) -> RequestSpec:
+    """Список профилей."""
+    return "GET", "/api/v1/profiles", None
+
+
+def profiles_query(rng: random.Random, unique: bool = False) -> RequestSpec:
+    """Поиск профилей с фильтром и сортировкой."""
+    min_wx = rng.choice((50, 100, 200, 400)) if unique else 100
+    return "GET", f"/api/v1/profiles?min_wx={min_wx}&sort=mass_kg_m&limit=5", None
+
+
+def health(rng: random.Random, unique: bool = False) -> RequestSpec:
+    """Проверка состояния."""
+    return "GET", "/health", None
+
+
+SCENARIOS: Dict[str, Callable[[random.Random, bool], RequestSpec]] = {
+    "calculate": calculate,
+    "calculate_summary": calculate_summary,
+    "profiles": profiles,
+    "profiles_query": profiles_query,
+    "health": health,
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Разбор смеси запросов вида «calculate=8,profiles=2».
+    
+    Raises:
+        ValueError: Если сценарий неизвестен или вес некорректен
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Неизвестный сценарий: {name}. Доступны: {', '.join(SCENARIOS)}")
+        mix[name] = float(weight) if weight else 1.0
+        if mix[name] < 0:
+            raise ValueError(f"Отрицательный вес сценария: {name}")
+    if not any(mix.values()):
+        raise ValueError("Сумма весов сценариев должна быть положительной")
+    return mix
@@ -0,0 +1,96 @@
+"""
+Тесты для точных эпюр балки и прореживания рядов.
+"""
+import sys
+import os
+import numpy as np
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.beam_fields import beam_fields, diagram_grid, point_load_terms
+from app.services.downsampling import lttb
+
+
+L = 6.0
+P = 120.0
+A = 2.0
+B = L - A
+EI = 2.1e11 * 1840.0e-8 / 1000  # кН·м²
+
+
+def _fields(support_type: str, points: int = 601):
+    x = diagram_grid(L, points, [A])
+    return x, beam_fields(L, support_type, *point_load_terms(P, A), x, EI)
+
+
+class TestBeamFields:
+    """Сравнение с табличными формулами строительной механики."""
+    
+    def test_hinged(self):
+        """Шарнирно-опёртая балка."""
+        x, f = _fields("hinged")
+        at_load = np.searchsorted(x, A)
+        
+        assert f["R_a"] == pytest.approx(P * B / L)
+        assert f["R_b"] == pytest.approx(P * A / L)
+        assert f["moment"].max() == pytest.approx(P * A * B / L)
+        assert f["deflection"][at_load] == pytest.approx(P * A ** 2 * B ** 2 / (3 * EI * L) * 1000)
+        assert f["deflection"][[0, -1]] == pytest.approx([0.0, 0.0], abs=1e-9)
+        assert f["slope"][0] == pytest.approx(P * A * B * (L + B) / (6 * EI * L))
+    
+    def test_cantilever(self):
+        """Консоль с заделкой в начале пролёта."""
+        x, f = _fields("cantilever")
+        
+        assert f["R_a"] == pytest.approx(P)
+        assert f["M_a"] == pytest.approx(P * A)
+        assert f["moment"][0] == pytest.approx(-P * A)
+        tip = P * A ** 3 / (3 * EI) + P * A ** 2 / (2 * EI) * (L - A)
+        assert f["deflection"][-1] == pytest.approx(tip * 1000)
+        assert f["shear"][-1] == pytest.approx(0.0, abs=1e-9)
+    
+    def test_fixed(self):
+        """Балка с жёсткими заделками по обоим концам."""
+        x, f = _fields("fixed")
+        
+        assert f["M_a"] == pytest.approx(P * A * B ** 2 / L ** 2)
+        assert f["M_b"] == pytest.approx(P * A ** 2 * B / L ** 2)
+        assert f["R_a"] == pytest.approx(P * B ** 2 * (3 * A + B) / L ** 3)
+        assert f["R_a"] + f["R_b"] == pytest.approx(P)
+        assert f["slope"][[0, -1]] == pytest.approx([0.0, 0.0], abs=1e-12)
+        assert f["deflection"][[0, -1]] == pytest.approx([0.0, 0.0], abs=1e-9)
+    
+    def test_batched_loads(self):
+        """Пакет положений силы считается за один вызов."""
+        x = diagram_grid(L, 101)
+        positions = np.array([1.0, 3.0, 5.0])
+        batch = beam_fields(L, "hinged", *point_load_terms(np.full(3, P), positions), x, EI)
+        
+        for i, a in enumerate(positions):
+            single = beam_fields(L, "hinged", *point_load_terms(P, a), x, EI)
+            assert batch["moment"][i] == pytest.approx(single["moment"])
+            assert batch["R_a"][i] == pytest.approx(single["R_a"])
+
+
+class TestLttb:
+    """Тесты прореживания LTTB."""
+    
+    def test_keeps_ends_and_count(self):
+        """Сохраняются крайние точки и заданное число точек."""
+        x = np.linspace(0.0, 10.0, 10001)
+        y = np.sin(x)
+        
+        selected = lttb(x, y, 200)
+        
+        assert len(selected) == 200
+        assert selected[0] == 0 and selected[-1] == len(x) - 1
+        assert np.all(np.diff(selected) > 0)
+        assert y[selected].max() == pytest.approx(1.0, abs=1e-3)
+    
+    def test_short_series_unchanged(self):
+        """Короткий ряд не прореживается."""
+        x = np.arange(5.0)
+        
+        assert lttb(x, x, 10).tolist() == [0, 1, 2, 3, 4]
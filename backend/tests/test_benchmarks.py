@@ -0,0 +1,55 @@
+"""
+Тесты для набора микробенчмарков.
+"""
+import sys
+import os
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from benchmarks.cases import SUPPORT_TYPES, collect_benchmarks
+from benchmarks.runner import compare_results, measure, run_benchmarks
+
+
+def _results(**medians):
+    return {"benchmarks": {name: {"median_ns": value, "min_ns": value} for name, value in medians.items()}}
+
+
+class TestBenchmarks:
+    """Тесты набора и сравнения с базовой линией."""
+    
+    def test_cases_cover_support_types(self):
+        """Каждый бенчмарк выполняется, этапы покрыты для всех типов опор."""
+        cases = collect_benchmarks()
+        for support in SUPPORT_TYPES:
+            assert f"calculator.calculate[{support}]" in cases
+        for func in cases.values():
+            func()
+    
+    def test_measure(self):
+        """Замер возвращает согласованные метрики."""
+        result = measure(lambda: sum(range(10)), repeat=3, min_time=0.001)
+        assert result["number"] >= 1
+        assert 0 < result["min_ns"] <= result["median_ns"]
+    
+    def test_run_filter(self):
+        """Отбор бенчмарков по подстроке имени."""
+        results = run_benchmarks(collect_benchmarks(), "repository.get_profile", repeat=1, min_time=0.001)
+        assert set(results["benchmarks"]) == {"repository.get_profile", "repository.get_profile_missing"}
+        assert results["meta"]["python"]
+    
+    def test_compare_detects_regression(self):
+        """Замедление больше порога отмечается как регрессия."""
+        baseline = _results(a=100.0, b=100.0, removed=5.0)
+        current = _results(a=109.0, b=125.0, added=1.0)
+        rows = {row["name"]: row for row in compare_results(baseline, current, threshold=10.0)}
+        
+        assert set(rows) == {"a", "b"}
+        assert not rows["a"]["regression"]
+        assert rows["b"]["regression"]
+        assert rows["b"]["change"] == pytest.approx(25.0)
+        
+        with pytest.raises(ValueError):
+            compare_results(baseline, current, metric="max_ns")
@@ -0,0 +1,205 @@
+"""
+Тесты сессий пересчёта балки.
+"""
+import sys
+import os
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamCalculationRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+from app.services.calculation_session import (
+    CalculationSession,
+    CalculationSessionManager,
+    STAGE_ORDER,
+    STAGES
+)
+
+
+BASE_REQUEST = {
+    "length": 6.0,
+    "support_type": "hinged",
+    "force": 80.0,
+    "force_position": 0.5,
+    "profile_name": "I-beam_30B1",
+    "diagram_points": 21,
+}
+
+
+@pytest.fixture
+def calculator():
+    return BeamCalculator()
+
+
+@pytest.fixture
+def catalog():
+    return load_profile_catalog()
+
+
+def full_result(calculator, catalog, data):
+    """Полный расчёт для сравнения с результатом сессии."""
+    request = BeamCalculationRequest(**data)
+    return calculator.calculate(request, catalog.get(request.profile_name))
+
+
+class TestStageGraph:
+    """Граф этапов расчёта."""
+    
+    def test_order_respects_dependencies(self):
+        """Каждый этап идёт после этапов, от которых зависит."""
+        position = {name: i for i, name in enumerate(STAGE_ORDER)}
+        assert set(STAGE_ORDER) == set(STAGES)
+        for stage in STAGES.values():
+            for dep in stage.inputs:
+                if dep in STAGES:
+                    assert position[dep] < position[stage.name]
+
+
+class TestCalculationSession:
+    """Пересчёт зависящих этапов при изменении параметров."""
+    
+    def test_initial_result_matches_calculate(self, calculator, catalog):
+        """Результат новой сессии совпадает с полным расчётом."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        
+        assert session.result() == full_result(calculator, catalog, BASE_REQUEST)
+        assert all(count == 1 for count in session.evaluations.values())
+    
+    @pytest.mark.parametrize("changes", [
+        {"force_position": 0.3},
+        {"force": 120.0, "force_position": 0.7},
+        {"steel_grade": "C390"},
+        {"profile_name": "I-beam_20B1"},
+        {"diagram_points": 51, "diagram_max_points": 10},
+        {"length": 4.0, "support_type": "cantilever"},
+        {"force": None, "force_position": None, "distributed_loads": [{"q_start": 10.0}]},
+    ])
+    def test_update_matches_full_recalculation(self, calculator, catalog, changes):
+        """Состояние после изменения и дельта совпадают с полным пересчётом."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        before = session.result()
+        
+        profile = catalog.get(changes["profile_name"]) if "profile_name" in changes else None
+        version, _, delta = session.update(changes, profile)
+        expected = full_result(calculator, catalog, {**BASE_REQUEST, **changes})
+        
+        assert version == 1
+        assert session.result() == expected
+        changed = {
+            name for name in type(expected).model_fields
+            if getattr(expected, name) != getattr(before, name)
+        }
+        assert set(delta) == changed
+        for name, value in delta.items():
+            assert value == getattr(expected, name)
+    
+    def test_moving_force_skips_profile_stages(self, calculator, catalog):
+        """Перемещение силы не пересчитывает этапы профиля и марки стали."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        
+        for position in (0.1, 0.2, 0.3):
+            _, recomputed, _ = session.update({"force_position": position})
+        
+        assert "internal_forces" in recomputed
+        for name in ("moment_of_inertia", "moment_of_resistance", "design_strength", "profile_properties"):
+            assert session.evaluations[name] == 1
+        assert session.evaluations["internal_forces"] == 4
+    
+    def test_steel_grade_keeps_forces_and_diagrams(self, calculator, catalog):
+        """Смена марки стали пересчитывает только проверку прочности и отчёт."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        
+        _, recomputed, _ = session.update({"steel_grade": "C255"})
+        
+        assert recomputed == [
+            name for name in STAGE_ORDER
+            if name in ("design_strength", "is_strength_sufficient", "report_sections", "input_data")
+        ]
+    
+    def test_unchanged_stage_stops_propagation(self, calculator, catalog):
+        """Если результат этапа не изменился, зависимые этапы не пересчитываются."""
+        request = BeamCalculationRequest(**{**BASE_REQUEST, "steel_grade": "C245"})
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        
+        # Без марки действует ALLOWABLE_STRESS = 240 МПа - как у С245
+        _, recomputed, delta = session.update({"steel_grade": None})
+        
+        assert "design_strength" in recomputed
+        assert "is_strength_sufficient" not in recomputed
+        assert "is_strength_sufficient" not in delta
+    
+    def test_same_values_recompute_nothing(self, calculator, catalog):
+        """Повтор текущих значений не пересчитывает ни одного этапа."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        
+        assert session.update({"force_position": 0.5}) == (1, [], {})
+    
+    def test_sections_limit_stages(self, calculator, catalog):
+        """Не запрошенные части ответа не рассчитываются."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name), sections=())
+        _, recomputed, _ = session.update({"force_position": 0.25})
+        
+        assert session.evaluations["diagram_data"] == 0
+        assert session.evaluations["report_sections"] == 0
+        assert "diagram_data" not in recomputed
+        assert session.result().diagram_data is None
+    
+    def test_invalid_update_keeps_state(self, calculator, catalog):
+        """Ошибочное изменение отклоняется, сессия не меняется."""
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = CalculationSession(calculator, request, catalog.get(request.profile_name))
+        before = session.result()
+        
+        with pytest.raises(ValueError):
+            session.update({"unknown_field": 1})
+        with pytest.raises(ValueError):
+            session.update({"force_position": 1.5})
+        with pytest.raises(ValueError):
+            session.update({"steel_grade": "X999"})
+        with pytest.raises(ValueError):
+            session.update({"profile_name": "I-beam_20B1"})
+        
+        assert session.version == 0
+        assert session.result() == before
+
+
+class TestCalculationSessionManager:
+    """Хранилище сессий."""
+    
+    def test_lifecycle(self, calculator, catalog):
+        """Создание, обновление и удаление сессии."""
+        manager = CalculationSessionManager(calculator, max_sessions=10)
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        session = manager.create(request, catalog.get(request.profile_name))
+        
+        assert manager.get(session.session_id) is session
+        version, _, delta = manager.update(session.session_id, {"force": 100.0})
+        assert version == 1
+        assert "max_moment" in delta
+        
+        assert manager.delete(session.session_id)
+        assert manager.get(session.session_id) is None
+        assert manager.update(session.session_id, {"force": 50.0}) is None
+        assert not manager.delete(session.session_id)
+    
+    def test_evicts_oldest_sessions(self, calculator, catalog):
+        """Сверх лимита вытесняются давно не использованные сессии."""
+        manager = CalculationSessionManager(calculator, max_sessions=2)
+        request = BeamCalculationRequest(**BASE_REQUEST)
+        profile = catalog.get(request.profile_name)
+        first, second = manager.create(request, profile), manager.create(request, profile)
+        
+        manager.get(first.session_id)
+        manager.create(request, profile)
+        
+        assert manager.get(first.session_id) is first
+        assert manager.get(second.session_id) is None
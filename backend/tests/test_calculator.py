@@ -3,6 +3,8 @@
 """
 import sys
 import os
+import random
+import numpy as np
 import pytest
 
 # Добавляем папку app в Python path
@@ -145,4 +147,276 @@ class TestBeamCalculator:
         assert sections[0]["title"] == "Исходные данные"
         assert sections[1]["title"] == "Реакции опор"
         assert "Длина пролёта: 5.0 м" in sections[0]["content"]
-        assert "R_a: 50.0 кН" in sections[1]["content"]
\ No newline at end of file
+        assert "R_a: 50.0 кН" in sections[1]["content"]
+
+
+class TestBeamCalculatorBatch:
+    """Тесты пакетного расчёта балки."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.profile = MaterialProfile(
+            name="Двутавр 20Б1",
+            standard="ГОСТ 26020-83",
+            key="I-beam_20B1",
+            moment_of_inertia_ix_cm4=1840.0,
+            moment_of_resistance_wx_cm3=184.0,
+            height_mm=200.0,
+            width_mm=100.0,
+            mass_kg_m=22.7
+        )
+    
+    def test_batch_matches_scalar(self):
+        """Пакетный расчёт совпадает с поэлементным."""
+        rng = random.Random(42)
+        requests = [
+            BeamCalculationRequest(
+                length=round(rng.uniform(0.5, 12.0), rng.choice([1, 2, 3])),
+                support_type=rng.choice(["hinged", "cantilever", "fixed"]),
+                force=round(rng.uniform(0.1, 300.0), rng.choice([0, 1, 2])),
+                force_position=rng.choice([0.0, 0.25, 0.5, 1.0, round(rng.random(), 3)]),
+                profile_name="I-beam_20B1"
+            )
+            for _ in range(500)
+        ]
+        
+        columns = self.calculator.calculate_batch(
+            length=[r.length for r in requests],
+            force=[r.force for r in requests],
+            force_position=[r.force_position for r in requests],
+            support_type=[r.support_type for r in requests],
+            moment_of_inertia=[self.profile.moment_of_inertia_ix_cm4] * len(requests),
+            moment_of_resistance=[self.profile.moment_of_resistance_wx_cm3] * len(requests)
+        )
+        
+        for i, request in enumerate(requests):
+            expected = self.calculator.calculate(request, self.profile)
+            for key, value in expected.reactions.items():
+                assert columns[key][i] == value
+            assert columns["max_moment"][i] == expected.max_moment
+            assert columns["max_deflection"][i] == expected.max_deflection
+            assert columns["max_stress"][i] == expected.max_stress
+            assert columns["is_strength_sufficient"][i] == expected.is_strength_sufficient
+            assert columns["is_stiffness_sufficient"][i] == expected.is_stiffness_sufficient
+    
+    def test_diagram_data_resolution(self):
+        """Эпюры строятся с заданным разрешением и прореживаются."""
+        params = dict(
+            length=5.0,
+            support_type="hinged",
+            force=100.0,
+            force_position=0.5,
+            profile_name="I-beam_20B1",
+            diagram_points=1001
+        )
+        
+        full = self.calculator.calculate(BeamCalculationRequest(**params), self.profile)
+        reduced = self.calculator.calculate(
+            BeamCalculationRequest(**params, diagram_max_points=50),
+            self.profile
+        )
+        
+        for name in ("shear", "moments", "slopes", "positions"):
+            assert len(full.diagram_data[name]) == 1001
+            assert len(reduced.diagram_data[name]) == 50
+        peak_moment = max(value for _, value in full.diagram_data["moments"])
+        peak_deflection = max(value for _, value in full.diagram_data["positions"])
+        assert round(peak_moment, 2) == full.max_moment
+        assert round(peak_deflection, 3) == full.max_deflection
+
+
+class TestMultiLoadCalculation:
+    """Тесты расчёта балки с несколькими нагрузками."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.profile = MaterialProfile(
+            name="Двутавр 20Б1",
+            standard="ГОСТ 26020-83",
+            key="I-beam_20B1",
+            moment_of_inertia_ix_cm4=1840.0,
+            moment_of_resistance_wx_cm3=184.0,
+            height_mm=200.0,
+            width_mm=100.0,
+            mass_kg_m=22.7
+        )
+        self.ei = BeamCalculator.STEEL_ELASTIC_MODULUS * 1840.0e-8 / 1000  # кН·м²
+    
+    def _calculate(self, **loads):
+        request = BeamCalculationRequest(length=6.0, profile_name="I-beam_20B1", diagram_points=61, **loads)
+        return self.calculator.calculate(request, self.profile)
+    
+    def test_single_point_load_matches_force(self):
+        """Одна сила в списке даёт тот же результат, что и force."""
+        by_force = self._calculate(support_type="hinged", force=80.0, force_position=0.3)
+        by_list = self._calculate(support_type="hinged", point_loads=[{"force": 80.0, "position": 0.3}])
+        
+        assert by_list.reactions == by_force.reactions
+        assert by_list.max_moment == by_force.max_moment
+        assert by_list.max_deflection == by_force.max_deflection
+    
+    def test_uniform_load_hinged(self):
+        """Равномерная нагрузка на шарнирно-опёртой балке: qL²/8 и 5qL⁴/384EI."""
+        result = self._calculate(support_type="hinged", distributed_loads=[{"q_start": 10.0}])
+        
+        assert result.reactions == {"R_a": 30.0, "R_b": 30.0}
+        assert result.max_moment == pytest.approx(10.0 * 6.0 ** 2 / 8, abs=0.01)
+        assert result.max_deflection == pytest.approx(5 * 10.0 * 6.0 ** 4 / (384 * self.ei) * 1000, abs=1e-3)
+    
+    def test_uniform_load_cantilever_and_fixed(self):
+        """Равномерная нагрузка на консоли и на балке с заделками."""
+        cantilever = self._calculate(support_type="cantilever", distributed_loads=[{"q_start": 10.0}])
+        fixed = self._calculate(support_type="fixed", distributed_loads=[{"q_start": 10.0}])
+        
+        assert cantilever.reactions == {"R_a": 60.0, "M_a": 180.0}
+        assert cantilever.max_deflection == pytest.approx(10.0 * 6.0 ** 4 / (8 * self.ei) * 1000, abs=1e-3)
+        assert fixed.reactions == {"R_a": 30.0, "M_a": 30.0, "R_b": 30.0, "M_b": 30.0}
+        assert fixed.max_moment == pytest.approx(10.0 * 6.0 ** 2 / 12, abs=0.01)
+        assert fixed.max_deflection == pytest.approx(10.0 * 6.0 ** 4 / (384 * self.ei) * 1000, abs=1e-3)
+    
+    def test_triangular_load_peak(self):
+        """Треугольная нагрузка: M_max = qL²/(9√3) вне узлов сетки."""
+        result = self._calculate(support_type="hinged", distributed_loads=[{"q_start": 0.0, "q_end": 12.0}])
+        
+        assert result.reactions == {"R_a": 12.0, "R_b": 24.0}
+        assert result.max_moment == pytest.approx(12.0 * 6.0 ** 2 / (9 * 3 ** 0.5), abs=0.01)
+    
+    def test_applied_moment(self):
+        """Момент на опоре шарнирно-опёртой балки."""
+        result = self._calculate(support_type="hinged", applied_moments=[{"moment": 30.0, "position": 0.0}])
+        
+        assert result.reactions == {"R_a": -5.0, "R_b": 5.0}
+        assert result.max_moment == 30.0
+    
+    def test_superposition(self):
+        """Эпюры нескольких нагрузок равны сумме эпюр каждой нагрузки."""
+        loads = {
+            "force": 50.0,
+            "force_position": 0.2,
+            "point_loads": [{"force": 30.0, "position": 0.7}],
+            "distributed_loads": [{"q_start": 4.0, "q_end": 8.0, "start": 0.1, "end": 0.9}],
+            "applied_moments": [{"moment": -15.0, "position": 0.5}]
+        }
+        combined = self._calculate(support_type="fixed", **loads)
+        parts = [
+            self._calculate(support_type="fixed", force=50.0, force_position=0.2),
+            self._calculate(support_type="fixed", point_loads=loads["point_loads"]),
+            self._calculate(support_type="fixed", distributed_loads=loads["distributed_loads"]),
+            self._calculate(support_type="fixed", applied_moments=loads["applied_moments"])
+        ]
+        
+        for name in ("shear", "moments", "positions"):
+            total = sum(np.array(part.diagram_data[name])[:, 1] for part in parts)
+            assert np.array(combined.diagram_data[name])[:, 1] == pytest.approx(total, abs=1e-9)
+    
+    def test_no_loads_rejected(self):
+        """Запрос без нагрузок отклоняется."""
+        with pytest.raises(ValueError):
+            BeamCalculationRequest(length=6.0, support_type="hinged", profile_name="I-beam_20B1")
+
+
+class TestSupportSchemes:
+    """Замкнутые формулы для всех типов опор и произвольные опоры (МКЭ)."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.profile = MaterialProfile(
+            name="Двутавр 20Б1",
+            standard="ГОСТ 26020-83",
+            key="I-beam_20B1",
+            moment_of_inertia_ix_cm4=1840.0,
+            moment_of_resistance_wx_cm3=184.0,
+            height_mm=200.0,
+            width_mm=100.0,
+            mass_kg_m=22.7
+        )
+    
+    def _request(self, **params):
+        return BeamCalculationRequest(length=6.0, profile_name="I-beam_20B1", diagram_points=61, **params)
+    
+    @pytest.mark.parametrize("support_type", ["hinged", "cantilever", "fixed"])
+    @pytest.mark.parametrize("position", [0.0, 0.2, 0.5, 0.7, 1.0])
+    def test_closed_form_matches_fields(self, support_type, position):
+        """Замкнутые формулы одной силы совпадают с точными полями."""
+        request = self._request(support_type=support_type, force=80.0, force_position=position)
+        closed = self.calculator._calculate_internal_forces(request, 1840.0)
+        exact = self.calculator._analyze_loads(request, 1840.0)
+        
+        assert closed[0] == pytest.approx(exact[0], abs=0.011)
+        assert closed[1] == pytest.approx(exact[1], abs=0.011)
+        assert closed[2] == pytest.approx(exact[2], abs=0.0011)
+    
+    def test_fixed_and_cantilever_deflection(self):
+        """Прогиб консоли и балки с заделками больше нуля и меньше шарнирной схемы."""
+        results = {
+            support_type: self.calculator.calculate(
+                self._request(support_type=support_type, force=80.0, force_position=0.5),
+                self.profile
+            )
+            for support_type in ("hinged", "cantilever", "fixed")
+        }
+        
+        assert results["fixed"].max_deflection == pytest.approx(results["hinged"].max_deflection / 4, abs=1e-3)
+        assert results["cantilever"].max_deflection > results["hinged"].max_deflection
+        assert results["fixed"].max_moment == 60.0
+        assert results["fixed"].reactions == {"R_a": 40.0, "M_a": 60.0, "R_b": 40.0, "M_b": 60.0}
+    
+    def test_custom_supports_match_standard(self):
+        """Опоры, заданные списком, дают тот же результат, что и стандартная схема."""
+        loads = dict(force=80.0, force_position=0.3, distributed_loads=[{"q_start": 5.0}])
+        standard = self.calculator.calculate(self._request(support_type="fixed", **loads), self.profile)
+        custom = self.calculator.calculate(
+            self._request(
+                support_type="custom",
+                supports=[{"type": "fixed", "position": 0.0}, {"type": "fixed", "position": 1.0}],
+                **loads
+            ),
+            self.profile
+        )
+        
+        assert custom.reactions == standard.reactions
+        assert custom.max_moment == standard.max_moment
+        assert custom.max_deflection == standard.max_deflection
+        for name in ("moments", "positions"):
+            assert np.array(custom.diagram_data[name]) == pytest.approx(np.array(standard.diagram_data[name]), rel=1e-6, abs=1e-6)
+    
+    def test_custom_continuous_beam(self):
+        """Неразрезная балка на трёх опорах с консолью."""
+        request = self._request(
+            support_type="custom",
+            supports=[
+                {"type": "pin", "position": 0.0},
+                {"type": "roller", "position": 0.4},
+                {"type": "spring", "position": 0.8, "stiffness": 5000.0}
+            ],
+            distributed_loads=[{"q_start": 10.0}]
+        )
+        result = self.calculator.calculate(request, self.profile)
+        
+        assert set(result.reactions) == {"R_a", "R_b", "R_c"}
+        assert sum(result.reactions.values()) == pytest.approx(60.0, abs=0.02)
+        assert result.max_deflection > 0
+        assert "упругая в 80.0% длины, k = 5000.0 кН/м" in result.report_sections[0]["content"]
+        assert self.calculator.estimate_cost(request) > self.calculator.estimate_cost(
+            self._request(support_type="hinged", distributed_loads=[{"q_start": 10.0}])
+        )
+        assert self.calculator.estimate_cost(request, None, request.diagram_points) > self.calculator.estimate_cost(request)
+        assert self.calculator.estimate_cost(request, (), request.diagram_points) == self.calculator.estimate_cost(request)
+    
+    @pytest.mark.parametrize("params", [
+        {"support_type": "custom"},
+        {"support_type": "hinged", "supports": [{"type": "pin", "position": 0.0}]},
+        {"support_type": "custom", "supports": [{"type": "pin", "position": 0.5}]},
+        {"support_type": "custom", "supports": [{"type": "pin", "position": 0.0}, {"type": "free", "position": 1.0}]},
+        {"support_type": "custom", "supports": [{"type": "pin", "position": 0.0}, {"type": "pin", "position": 0.0}]},
+        {"support_type": "custom", "supports": [{"type": "spring", "position": 0.0}, {"type": "pin", "position": 1.0}]},
+        {"support_type": "custom", "supports": [{"type": "pin", "position": 0.0, "stiffness": 10.0},
+                                                {"type": "pin", "position": 1.0}]},
+    ])
+    def test_invalid_supports_rejected(self, params):
+        """Изменяемые и противоречивые схемы опор отклоняются."""
+        with pytest.raises(ValueError):
+            self._request(force=10.0, force_position=0.5, **params)
@@ -0,0 +1,177 @@
+"""
+Тесты каталога марок стали и таблицы несущей способности.
+"""
+import sys
+import os
+import numpy as np
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamCalculationRequest, BeamLoadCase
+from app.models.material_profile import MaterialProfile
+from app.repositories.profile_catalog import ProfileCatalog, load_profile_catalog
+from app.repositories.steel_grades import load_steel_grades
+from app.services.calculator import BeamCalculator
+from app.services.capacity_table import CapacityTable
+from app.services.section_selector import SectionSelector
+from app.core.config import settings
+
+
+def synthetic_catalog(size: int) -> ProfileCatalog:
+    """Сортамент со случайными Wx и Ix; округлённые Wx дают совпадающие моменты."""
+    rng = np.random.default_rng(11)
+    profiles = []
+    for i in range(size):
+        wx = round(float(rng.uniform(10, 5000)), 0)
+        profiles.append(MaterialProfile(
+            name=f"Двутавр {i}",
+            standard="ГОСТ 26020-83",
+            key=f"profile_{i}",
+            moment_of_inertia_ix_cm4=round(wx * float(rng.uniform(5, 40)), 1),
+            moment_of_resistance_wx_cm3=wx,
+            height_mm=200.0,
+            width_mm=100.0,
+            mass_kg_m=float(rng.integers(50, 3000)) / 10
+        ))
+    return ProfileCatalog(profiles)
+
+
+class TestSteelGrades:
+    """Тесты каталога марок стали."""
+    
+    def test_catalog_contains_default_grade(self):
+        """Марка С245 совпадает с сопротивлением по умолчанию."""
+        grades = load_steel_grades()
+        assert grades.design_strength("C245") == settings.ALLOWABLE_STRESS
+        assert len(grades) == len(set(grades.keys))
+    
+    def test_unknown_grade(self):
+        """Неизвестная марка - ValueError."""
+        with pytest.raises(ValueError):
+            load_steel_grades().design_strength("C999")
+
+
+class TestCapacityTable:
+    """Сравнение запросов к таблице с перебором всех пар."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.catalog = synthetic_catalog(3000)
+        self.grades = load_steel_grades()
+        self.table = CapacityTable(self.catalog, self.grades)
+    
+    def _brute_force(self, moment, grade=None, min_stiffness=None):
+        """Подходящие пары полным перебором."""
+        pairs = set()
+        for g in self.grades.grades:
+            if grade is not None and g.key != grade:
+                continue
+            for p in self.catalog.profiles:
+                stiffness = BeamCalculator.STEEL_ELASTIC_MODULUS * p.moment_of_inertia_ix_cm4 * 1e-8 / 1000
+                if g.design_strength_mpa * p.moment_of_resistance_wx_cm3 / 1000 < moment:
+                    continue
+                if min_stiffness is not None and stiffness < min_stiffness:
+                    continue
+                pairs.add((g.key, p.key))
+        return pairs
+    
+    def test_table_is_contiguous(self):
+        """Таблица моментов - непрерывный массив марки × профили."""
+        assert self.table.shape == (len(self.grades), len(self.catalog))
+        assert self.table.allowable_moment.flags["C_CONTIGUOUS"]
+    
+    def test_pairs_for_moment_match_brute_force(self):
+        """Все пары, с маркой и с ограничением жёсткости."""
+        for moment in (0.0, 100.0, 480.0, 1000.0, 2500.0):
+            for grade in (None, "C255", "C390"):
+                for min_stiffness in (None, 30_000.0):
+                    result = self.table.pairs_for_moment(moment, grade, min_stiffness)
+                    expected = self._brute_force(moment, grade, min_stiffness)
+                    assert result.total == len(expected)
+                    assert {(p.steel_grade, p.profile_name) for p in result.pairs} == expected
+                    capacities = [p.allowable_moment for p in result.pairs]
+                    assert capacities == sorted(capacities)
+    
+    def test_boundary_moment_is_included(self):
+        """Пара с M = Ry·Wx ровно на границе воспринимает момент."""
+        profile = self.catalog.profiles[7]
+        moment = float(self.table.allowable_moment[self.grades.index_of("C345"), 7])
+        keys = {p.profile_name for p in self.table.pairs_for_moment(moment, "C345").pairs}
+        assert profile.key in keys
+        assert self.table.check_strength("C345", profile.key, moment)
+        assert not self.table.check_strength("C345", profile.key, moment * (1 + 1e-9))
+    
+    def test_limit(self):
+        """limit обрезает ответ, но не общее число."""
+        result = self.table.pairs_for_moment(500.0, limit=5)
+        assert len(result.pairs) == 5
+        assert result.total == len(self._brute_force(500.0))
+    
+    def test_unknown_keys(self):
+        """Неизвестные марка и профиль - ValueError."""
+        with pytest.raises(ValueError):
+            self.table.pairs_for_moment(10.0, "C999")
+        with pytest.raises(ValueError):
+            self.table.capacity("C245", "missing")
+
+
+class TestCalculatorSteelGrade:
+    """Проверка прочности балки с маркой стали из запроса."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.catalog = load_profile_catalog()
+        self.profile = self.catalog.get("I-beam_20B1")
+    
+    def _request(self, force: float, steel_grade=None) -> BeamCalculationRequest:
+        return BeamCalculationRequest(
+            length=6.0, support_type="hinged", force=force, force_position=0.5,
+            profile_name=self.profile.key, steel_grade=steel_grade
+        )
+    
+    def test_grade_changes_strength_verdict(self):
+        """Напряжение между Ry марок С245 и С390: С245 не проходит, С390 проходит."""
+        force = 4 * 300 * self.profile.moment_of_resistance_wx_cm3 / 1000 / 6.0  # σ ≈ 300 МПа
+        assert not self.calculator.calculate(self._request(force), self.profile).is_strength_sufficient
+        assert not self.calculator.calculate(self._request(force, "C245"), self.profile).is_strength_sufficient
+        result = self.calculator.calculate(self._request(force, "C390"), self.profile)
+        assert result.is_strength_sufficient
+        assert "380.0 МПа" in result.report_sections[-1]["content"]
+    
+    def test_agrees_with_capacity_table(self):
+        """Вердикт расчёта совпадает с проверкой по таблице."""
+        table = CapacityTable(self.catalog, load_steel_grades())
+        for grade in load_steel_grades().keys:
+            for force in (10.0, 25.0, 40.0, 60.0):
+                result = self.calculator.calculate(self._request(force, grade), self.profile, sections=())
+                assert result.is_strength_sufficient == table.check_strength(
+                    grade, self.profile.key, result.max_moment
+                )
+    
+    def test_batch_uses_grade(self):
+        """Пакетный расчёт учитывает сопротивление каждой строки."""
+        force = 4 * 300 * self.profile.moment_of_resistance_wx_cm3 / 1000 / 6.0
+        columns = self.calculator.calculate_batch(
+            [6.0, 6.0], [force, force], [0.5, 0.5], ["hinged", "hinged"],
+            [self.profile.moment_of_inertia_ix_cm4] * 2,
+            [self.profile.moment_of_resistance_wx_cm3] * 2,
+            design_strength=[240.0, 380.0]
+        )
+        assert columns["is_strength_sufficient"].tolist() == [False, True]
+    
+    def test_selection_uses_grade(self):
+        """Подбор с более прочной сталью даёт профиль не тяжелее."""
+        selector = SectionSelector(self.catalog, self.calculator)
+        load_case = BeamLoadCase(length=6.0, support_type="hinged", force=100.0, force_position=0.5)
+        default = selector.select(load_case)
+        strong = selector.select(load_case.model_copy(update={"steel_grade": "C390"}))
+        assert strong.required_wx_cm3 < default.required_wx_cm3
+        assert strong.best.profile.mass_kg_m <= default.best.profile.mass_kg_m
+    
+    def test_unknown_grade(self):
+        """Неизвестная марка - ValueError (HTTP 400)."""
+        with pytest.raises(ValueError):
+            self.calculator.calculate(self._request(10.0, "C999"), self.profile)
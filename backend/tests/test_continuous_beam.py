@@ -0,0 +1,181 @@
+"""
+Тесты расчёта неразрезной многопролётной балки.
+"""
+import sys
+import os
+import numpy as np
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamCalculationRequest, DistributedLoad, PointLoad, Support
+from app.models.continuous_beam import ContinuousBeamRequest, ContinuousSpan
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+from app.services.continuous_beam import ContinuousBeamAnalyzer, solve_tridiagonal
+
+
+def uniform_span(length: float, q: float = 0.0, live: float = 0.0) -> ContinuousSpan:
+    """Пролёт с равномерной постоянной и временной нагрузкой."""
+    loads = [DistributedLoad(q_start=q)] if q else []
+    return ContinuousSpan(length=length, distributed_loads=loads, live_load=live)
+
+
+class TestTridiagonalSolver:
+    """Прогонка."""
+    
+    def test_matches_dense_solve(self):
+        """Несколько правых частей совпадают с np.linalg.solve."""
+        rng = np.random.default_rng(1)
+        n = 50
+        lower, upper = rng.uniform(0.5, 1.0, n - 1), rng.uniform(0.5, 1.0, n - 1)
+        diagonal = rng.uniform(3.0, 4.0, n)
+        rhs = rng.normal(size=(n, 3))
+        dense = np.diag(diagonal) + np.diag(lower, -1) + np.diag(upper, 1)
+        
+        assert solve_tridiagonal(lower, diagonal, upper, rhs) == pytest.approx(np.linalg.solve(dense, rhs))
+        assert solve_tridiagonal(lower, diagonal, upper, rhs[:, 0]) == pytest.approx(np.linalg.solve(dense, rhs[:, 0]))
+
+
+class TestContinuousBeamAnalyzer:
+    """Опорные моменты, реакции и огибающие."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.analyzer = ContinuousBeamAnalyzer(self.calculator)
+        self.profile = load_profile_catalog().get("I-beam_30B1")
+    
+    def test_two_equal_spans(self):
+        """Два равных пролёта под q: M₁ = -qL²/8, реакции 3qL/8, 5qL/4, 3qL/8."""
+        q, L = 10.0, 6.0
+        request = ContinuousBeamRequest(spans=[uniform_span(L, q), uniform_span(L, q)],
+                                        profile_name="I-beam_30B1")
+        
+        result = self.analyzer.analyze(request, self.profile)
+        
+        assert result.support_moments == pytest.approx([0.0, -q * L ** 2 / 8, 0.0])
+        assert result.reactions == pytest.approx([3 * q * L / 8, 5 * q * L / 4, 3 * q * L / 8])
+        assert result.max_moment == pytest.approx(q * L ** 2 / 8)
+        assert result.spans[0].max_moment == pytest.approx(9 * q * L ** 2 / 128, abs=0.05)
+    
+    def test_single_fixed_span_matches_calculate(self):
+        """Один пролёт с заделками совпадает с /calculate (support_type='fixed')."""
+        span = ContinuousSpan(length=6.0, point_loads=[PointLoad(force=50.0, position=0.3)])
+        request = ContinuousBeamRequest(spans=[span], left_end="fixed", right_end="fixed",
+                                        profile_name="I-beam_30B1")
+        
+        result = self.analyzer.analyze(request, self.profile)
+        static = self.calculator.calculate(BeamCalculationRequest(
+            length=6.0, support_type="fixed", profile_name="I-beam_30B1", force=50.0, force_position=0.3
+        ), self.profile)
+        
+        assert -result.support_moments[0] == pytest.approx(static.reactions["M_a"], abs=0.01)
+        assert -result.support_moments[1] == pytest.approx(static.reactions["M_b"], abs=0.01)
+        assert result.reactions == pytest.approx([static.reactions["R_a"], static.reactions["R_b"]], abs=0.01)
+        assert result.max_moment == pytest.approx(static.max_moment, abs=0.01)
+        assert result.max_deflection == pytest.approx(static.max_deflection, abs=0.01)
+    
+    def test_matches_fem(self):
+        """Три пролёта с заделкой справа совпадают с расчётом МКЭ произвольных опор."""
+        spans = [
+            ContinuousSpan(length=5.0, point_loads=[PointLoad(force=40.0, position=0.4)]),
+            uniform_span(7.0, 12.0),
+            ContinuousSpan(length=4.0, distributed_loads=[DistributedLoad(q_start=6.0, q_end=18.0, start=0.25)])
+        ]
+        request = ContinuousBeamRequest(spans=spans, right_end="fixed", pattern_loading=False,
+                                        profile_name="I-beam_30B1")
+        
+        result = self.analyzer.analyze(request, self.profile)
+        fem = self.calculator.calculate(BeamCalculationRequest(
+            length=16.0,
+            support_type="custom",
+            supports=[Support(type="pin", position=0.0), Support(type="roller", position=5.0 / 16),
+                      Support(type="roller", position=12.0 / 16), Support(type="fixed", position=1.0)],
+            profile_name="I-beam_30B1",
+            point_loads=[PointLoad(force=40.0, position=2.0 / 16)],
+            distributed_loads=[DistributedLoad(q_start=12.0, start=5.0 / 16, end=12.0 / 16),
+                               DistributedLoad(q_start=6.0, q_end=18.0, start=13.0 / 16, end=1.0)]
+        ), self.profile)
+        
+        assert result.reactions == pytest.approx(
+            [fem.reactions[key] for key in ("R_a", "R_b", "R_c", "R_d")], abs=0.01
+        )
+        assert -result.support_moments[-1] == pytest.approx(fem.reactions["M_d"], abs=0.01)
+        assert result.max_moment == pytest.approx(fem.max_moment, abs=0.01)
+        assert result.max_deflection == pytest.approx(fem.max_deflection, abs=0.01)
+    
+    def test_pattern_loading(self):
+        """Временная нагрузка по пролётам: в пролёте 49qL²/512, над опорой -qL²/8."""
+        q, L = 10.0, 6.0
+        request = ContinuousBeamRequest(spans=[uniform_span(L, live=q), uniform_span(L, live=q)],
+                                        profile_name="I-beam_30B1", diagram_points=17)
+        
+        result = self.analyzer.analyze(request, self.profile)
+        
+        assert result.spans[0].max_moment == pytest.approx(49 * q * L ** 2 / 512, abs=0.01)
+        assert result.spans[0].min_moment == pytest.approx(-q * L ** 2 / 8, abs=0.01)
+        assert result.support_moments[1] == pytest.approx(-q * L ** 2 / 8)
+        
+        # Без расстановок огибающая - одно загружение всех пролётов
+        full = self.analyzer.analyze(request.model_copy(update={"pattern_loading": False}), self.profile)
+        assert full.spans[0].max_moment == pytest.approx(9 * q * L ** 2 / 128, abs=0.01)
+        assert full.spans[0].max_moment < result.spans[0].max_moment
+    
+    def test_span_maxima_off_grid(self):
+        """Максимумы пролётов в нулях поперечной силы между узлами грубой сетки."""
+        q, L = 10.0, 6.0
+        request = ContinuousBeamRequest(spans=[uniform_span(L, live=q), uniform_span(L, live=q)],
+                                        profile_name="I-beam_30B1", diagram_points=5)
+        
+        result = self.analyzer.analyze(request, self.profile)
+        full = self.analyzer.analyze(request.model_copy(update={"pattern_loading": False}), self.profile)
+        
+        assert result.spans[0].max_moment == pytest.approx(49 * q * L ** 2 / 512, abs=0.005)
+        assert full.spans[0].max_moment == pytest.approx(9 * q * L ** 2 / 128, abs=0.005)
+        assert 3 * L / 8 in [x for x, _ in full.envelopes["moment_max"]]
+        
+        spans = [
+            uniform_span(6.0, 10.0, live=7.0),
+            ContinuousSpan(length=5.0, distributed_loads=[DistributedLoad(q_start=4.0, q_end=12.0)], live_load=7.0),
+            ContinuousSpan(length=4.5, point_loads=[{"force": 40.0, "position": 0.3}], live_load=2.0),
+        ]
+        coarse = self.analyzer.analyze(
+            ContinuousBeamRequest(spans=spans, profile_name="I-beam_30B1", diagram_points=6), self.profile
+        )
+        dense = self.analyzer.analyze(
+            ContinuousBeamRequest(spans=spans, profile_name="I-beam_30B1", diagram_points=1001), self.profile
+        )
+        for span, reference in zip(coarse.spans, dense.spans):
+            assert span.max_moment == pytest.approx(reference.max_moment, abs=0.01)
+            assert span.min_moment == pytest.approx(reference.min_moment, abs=0.01)
+    
+    def test_many_spans(self):
+        """Сотни пролётов: огибающие по длине и симметрия реакций."""
+        count = 400
+        request = ContinuousBeamRequest(spans=[uniform_span(3.0, 5.0, live=2.0)] * count,
+                                        profile_name="I-beam_30B1", diagram_points=11)
+        
+        result = self.analyzer.analyze(request, self.profile)
+        moment_max = np.array(result.envelopes["moment_max"])
+        
+        assert len(result.support_moments) == count + 1
+        assert sum(result.reactions) == pytest.approx(count * 3.0 * 7.0, rel=1e-6)
+        assert result.reactions == pytest.approx(result.reactions[::-1], abs=0.01)
+        assert moment_max[-1, 0] == pytest.approx(count * 3.0)
+        assert np.all(moment_max[:, 1] >= np.array(result.envelopes["moment_min"])[:, 1])
+    
+    def test_steel_grade(self):
+        """Прочность проверяется по сопротивлению марки стали; неизвестная марка - ошибка."""
+        request = ContinuousBeamRequest(spans=[uniform_span(6.0, 28.0), uniform_span(6.0, 28.0)],
+                                        profile_name="I-beam_30B1")
+        
+        default = self.analyzer.analyze(request, self.profile)
+        graded = self.analyzer.analyze(request.model_copy(update={"steel_grade": "C390"}), self.profile)
+        
+        assert 240.0 < default.max_stress <= self.calculator.design_strength("C390")
+        assert not default.is_strength_sufficient
+        assert graded.is_strength_sufficient
+        with pytest.raises(ValueError):
+            self.analyzer.analyze(request.model_copy(update={"steel_grade": "X999"}), self.profile)
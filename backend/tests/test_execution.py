@@ -0,0 +1,138 @@
+"""
+Тесты для исполнения расчётов в пуле.
+"""
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from app.core.execution import CalculationCancelled, CalculationExecutor, ClientDisconnected, check_cancelled
+from app.core.profiling import RequestTimings, _current_timings, current_timings
+from app.models.beam_calculation import BeamCalculationRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+
+
+REQUEST = BeamCalculationRequest(
+    length=6.0,
+    support_type="hinged",
+    force=80.0,
+    force_position=0.3,
+    profile_name="I-beam_20B1"
+)
+
+
+class DisconnectedRequest:
+    """Запрос, клиент которого отключается после заданного числа проверок."""
+    
+    def __init__(self, checks: int = 0):
+        self.checks = checks
+    
+    async def is_disconnected(self) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+class TestCalculationExecutor:
+    """Тесты диспетчера расчётов."""
+    
+    def test_inline_below_threshold(self):
+        """Дешёвый расчёт выполняется в вызывающем потоке."""
+        executor = CalculationExecutor("thread", inline_cost=100)
+        thread = asyncio.run(executor.run(threading.get_ident, cost=10))
+        
+        assert thread == threading.get_ident()
+        assert executor._pool is None
+    
+    def test_thread_pool_above_threshold(self):
+        """Трудоёмкий расчёт уходит в пул потоков."""
+        executor = CalculationExecutor("thread", max_workers=2, inline_cost=100)
+        try:
+            thread = asyncio.run(executor.run(threading.get_ident, cost=1000))
+            assert thread != threading.get_ident()
+        finally:
+            executor.shutdown()
+    
+    def test_process_pool_matches_inline(self):
+        """Расчёт в пуле процессов даёт тот же результат."""
+        calculator = BeamCalculator()
+        profile = load_profile_catalog().get(REQUEST.profile_name)
+        executor = CalculationExecutor("process", max_workers=1)
+        try:
+            result = asyncio.run(executor.run(calculator.calculate, REQUEST, profile))
+        finally:
+            executor.shutdown()
+        
+        assert result == calculator.calculate(REQUEST, profile)
+    
+    def test_disconnect_cancels_queued_task(self):
+        """При отключении клиента задача из очереди не выполняется."""
+        executor = CalculationExecutor("thread", max_workers=1, poll_interval=0.01)
+        started = []
+        
+        async def scenario():
+            blocker = asyncio.ensure_future(executor.run(time.sleep, 0.3))
+            await asyncio.sleep(0)
+            with pytest.raises(ClientDisconnected):
+                await executor.run(started.append, 1, request=DisconnectedRequest(checks=2))
+            await blocker
+        
+        try:
+            asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+        assert started == []
+    
+    def test_disconnect_interrupts_running_task(self):
+        """При отключении клиента начатая задача прерывается по флагу отмены."""
+        executor = CalculationExecutor("thread", max_workers=1, poll_interval=0.01)
+        chunks = []
+        finished = threading.Event()
+        
+        def calculation(cancel=None):
+            try:
+                for index in range(200):
+                    check_cancelled(cancel)
+                    chunks.append(index)
+                    time.sleep(0.01)
+            except CalculationCancelled:
+                chunks.append("cancelled")
+            finally:
+                finished.set()
+        
+        try:
+            with pytest.raises(ClientDisconnected):
+                asyncio.run(executor.run(calculation, cancellable=True, request=DisconnectedRequest(checks=3)))
+            assert finished.wait(5)
+        finally:
+            executor.shutdown()
+        assert chunks[-1] == "cancelled"
+        assert len(chunks) < 50
+    
+    def test_context_propagated_to_thread(self):
+        """Замеры этапов запроса доступны в потоке пула."""
+        executor = CalculationExecutor("thread", max_workers=1)
+        timings = RequestTimings()
+        
+        async def scenario():
+            token = _current_timings.set(timings)
+            try:
+                return await executor.run(current_timings)
+            finally:
+                _current_timings.reset(token)
+        
+        try:
+            assert asyncio.run(scenario()) is timings
+        finally:
+            executor.shutdown()
+    
+    def test_unknown_kind(self):
+        """Неизвестный вид пула отклоняется."""
+        with pytest.raises(ValueError):
+            CalculationExecutor("gpu")
@@ -0,0 +1,190 @@
+"""
+Тесты конечно-элементного расчёта балки с произвольными опорами.
+"""
+import sys
+import os
+import numpy as np
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import fem
+from app.services.fem import SupportSpec, assemble_banded, mesh_nodes, solve_banded, solve_beam, standard_supports
+from app.services.beam_fields import beam_fields, diagram_grid, load_terms
+
+
+L = 6.0
+EI = 2.1e11 * 1840.0e-8 / 1000  # кН·м²
+LOADS = dict(
+    point_forces=[50.0, 30.0],
+    point_positions=[1.2, 4.2],
+    q_start=[4.0],
+    q_end=[8.0],
+    q_from=[0.6],
+    q_to=[5.4],
+    moments=[-15.0],
+    moment_positions=[3.0]
+)
+
+
+@pytest.fixture(params=[True, False], ids=["scipy", "numpy"])
+def solver(request, monkeypatch):
+    """Оба ленточных решателя: scipy и собственное разложение Холецкого."""
+    if request.param and not fem.HAS_SCIPY:
+        pytest.skip("scipy не установлен")
+    monkeypatch.setattr(fem, "HAS_SCIPY", request.param)
+
+
+class TestBandedSolver:
+    """Ленточная сборка и решение."""
+    
+    def test_matches_dense_solve(self, solver):
+        """Решение совпадает с плотным np.linalg.solve."""
+        rng = np.random.default_rng(0)
+        ab = assemble_banded(rng.uniform(0.1, 1.0, 20), EI)
+        size = ab.shape[1]
+        # Закрепляем первый узел, чтобы матрица была невырожденной
+        ab[fem.BANDWIDTH, :2] += 1e6
+        dense = np.zeros((size, size))
+        for i in range(size):
+            for j in range(i, min(size, i + fem.BANDWIDTH + 1)):
+                dense[i, j] = dense[j, i] = ab[fem.BANDWIDTH + i - j, j]
+        rhs = rng.normal(size=size)
+        
+        assert solve_banded(ab, rhs) == pytest.approx(np.linalg.solve(dense, rhs), rel=1e-9)
+    
+    def test_singular_rejected(self, solver):
+        """Изменяемая схема (одна шарнирная опора) даёт ValueError."""
+        with pytest.raises(ValueError):
+            solve_beam(L, EI, [SupportSpec("pin", 0.0)], point_forces=[10.0], point_positions=[3.0])
+
+
+class TestBeamSolution:
+    """Сравнение МКЭ с точными полями и табличными формулами."""
+    
+    @pytest.mark.parametrize("support_type", ["hinged", "cantilever", "fixed"])
+    def test_matches_closed_form_fields(self, solver, support_type):
+        """Поля и реакции стандартных схем совпадают с beam_fields на грубой сетке."""
+        x = diagram_grid(L, 301, [1.2, 4.2, 3.0, 0.6, 5.4])
+        expected = beam_fields(L, support_type, *load_terms(**LOADS), x, EI)
+        solution = solve_beam(L, EI, standard_supports(support_type, L), elements=7, **LOADS)
+        fields = solution.fields(x)
+        
+        for name in ("shear", "moment", "slope", "deflection"):
+            assert fields[name] == pytest.approx(expected[name], rel=1e-7, abs=1e-7)
+        for name, value in solution.reactions.items():
+            assert value == pytest.approx(float(expected[name]))
+    
+    def test_mesh_independent(self):
+        """Узлы на нагрузках и опорах: результат не зависит от числа элементов."""
+        supports = standard_supports("fixed", L)
+        coarse = solve_beam(L, EI, supports, elements=1, **LOADS)
+        fine = solve_beam(L, EI, supports, elements=1000, **LOADS)
+        x = np.linspace(0.0, L, 97)
+        
+        assert coarse.elements == 6
+        assert fine.fields(x)["deflection"] == pytest.approx(coarse.fields(x)["deflection"], rel=1e-6)
+    
+    @pytest.mark.parametrize("offset", [1e-5, 1e-6, 1e-7, 1e-9, -1e-6])
+    def test_load_near_node(self, solver, offset):
+        """Сила рядом с узлом сетки: равновесие и момент в заделке как по формуле."""
+        position = 100 / 256 * L + offset
+        solution = solve_beam(L, EI, [SupportSpec("fixed", 0.0), SupportSpec("free", L)],
+                              point_forces=[10.0, 5.0], point_positions=[position, 0.8 * L])
+        fields = solution.fields(np.array([0.0, position / 2, L]))
+        moment = 10.0 * position + 5.0 * 0.8 * L
+        
+        assert solution.reactions["R_a"] == pytest.approx(15.0, rel=1e-5)
+        assert solution.reactions["M_a"] == pytest.approx(moment, rel=1e-5)
+        assert fields["moment"][0] == pytest.approx(-moment, rel=1e-5)
+        assert fields["shear"][1] == pytest.approx(15.0, rel=1e-5)
+    
+    def test_loads_near_each_other(self, solver):
+        """Близкие силы и опоры не дают коротких элементов; равновесие сохраняется."""
+        h = L / 256
+        positions = [2.0, 2.0 + 1e-4 * h, 2.0 + 0.07 * h, 3.0 + 0.5 * h]
+        supports = [SupportSpec("pin", 0.0), SupportSpec("spring", 3.0 + 0.5 * h + 1e-8, stiffness=5000.0),
+                    SupportSpec("roller", L)]
+        solution = solve_beam(L, EI, supports, point_forces=[10.0] * 4, point_positions=positions)
+        
+        assert np.diff(solution.nodes).min() >= fem.SNAP_TOLERANCE * h
+        assert sum(solution.reactions.values()) == pytest.approx(40.0, rel=1e-5)
+    
+    def test_mesh_nodes(self):
+        """Узел равномерной сетки у точки заменяется ею, точки у концов переносятся на концы."""
+        h = L / 10
+        nodes = mesh_nodes(L, 10, [3 * h + 1e-6, 5.5 * h, 1e-9, L - 1e-9])
+        
+        assert nodes[0] == 0.0 and nodes[-1] == L
+        assert 3 * h + 1e-6 in nodes and 5.5 * h in nodes
+        assert len(nodes) == 12
+        assert np.diff(nodes).min() >= fem.SNAP_TOLERANCE * h
+    
+    def test_elastic_foundation(self):
+        """10⁴ упругих опор: балка на винклеровом основании, w₀ = Pβ / 2k."""
+        length, count, force, modulus = 40.0, 10_000, 100.0, 10_000.0
+        step = length / count
+        supports = [
+            SupportSpec("spring", i * step, stiffness=modulus * step * (0.5 if i in (0, count) else 1.0))
+            for i in range(count + 1)
+        ]
+        solution = solve_beam(length, EI, supports, elements=count,
+                              point_forces=[force], point_positions=[length / 2])
+        beta = (modulus / (4 * EI)) ** 0.25
+        
+        assert solution.elements == count
+        assert solution.fields(np.array([length / 2]))["deflection"][0] == pytest.approx(
+            force * beta / (2 * modulus) * 1000, rel=1e-3
+        )
+        assert sum(solution.reactions.values()) == pytest.approx(force)
+        assert "R_aa" in solution.reactions
+    
+    def test_propped_cantilever(self):
+        """Заделка и шарнир под равномерной нагрузкой: R_b = 3qL/8, M_a = qL²/8."""
+        q = 10.0
+        solution = solve_beam(L, EI, [SupportSpec("fixed", 0.0), SupportSpec("roller", L)],
+                              q_start=[q], q_end=[q], q_from=[0.0], q_to=[L])
+        
+        assert solution.reactions["R_a"] == pytest.approx(5 * q * L / 8)
+        assert solution.reactions["R_b"] == pytest.approx(3 * q * L / 8)
+        assert solution.reactions["M_a"] == pytest.approx(q * L ** 2 / 8)
+    
+    def test_two_span_continuous(self):
+        """Двухпролётная балка: средняя реакция 5ql/4 при пролёте l."""
+        q, span = 10.0, L / 2
+        supports = [SupportSpec("pin", 0.0), SupportSpec("roller", span), SupportSpec("roller", L)]
+        solution = solve_beam(L, EI, supports, q_start=[q], q_end=[q], q_from=[0.0], q_to=[L])
+        fields = solution.fields(np.array([span]))
+        
+        assert solution.reactions["R_b"] == pytest.approx(5 * q * span / 4)
+        assert solution.reactions["R_a"] == pytest.approx(3 * q * span / 8)
+        assert fields["moment"][0] == pytest.approx(-q * span ** 2 / 8)
+        assert fields["deflection"][0] == pytest.approx(0.0, abs=1e-9)
+    
+    def test_spring_support(self):
+        """Упругая опора оседает на R/k; очень жёсткая пружина равна шарниру."""
+        k = 2000.0
+        force = 60.0
+        soft = solve_beam(L, EI, [SupportSpec("pin", 0.0), SupportSpec("spring", L, stiffness=k)],
+                          point_forces=[force], point_positions=[L / 2])
+        end = soft.fields(np.array([L]))
+        
+        assert soft.reactions["R_b"] == pytest.approx(force / 2)
+        assert end["deflection"][0] == pytest.approx(force / 2 / k * 1000)
+        
+        stiff = solve_beam(L, EI, [SupportSpec("fixed", 0.0), SupportSpec("spring", L, stiffness=1e12)],
+                           point_forces=[force], point_positions=[L / 2])
+        pinned = solve_beam(L, EI, [SupportSpec("fixed", 0.0), SupportSpec("roller", L)],
+                            point_forces=[force], point_positions=[L / 2])
+        assert stiff.reactions["R_b"] == pytest.approx(pinned.reactions["R_b"], rel=1e-6)
+    
+    def test_rotational_spring(self):
+        """Пружина на поворот между шарниром и заделкой."""
+        q = 10.0
+        loads = dict(q_start=[q], q_end=[q], q_from=[0.0], q_to=[L])
+        spring = solve_beam(L, EI, [SupportSpec("spring", 0.0, stiffness=1e12, rotational_stiffness=EI / L),
+                                    SupportSpec("roller", L)], **loads)
+        
+        assert 0 < spring.reactions["M_a"] < q * L ** 2 / 8
+        assert spring.reactions["R_a"] + spring.reactions["R_b"] == pytest.approx(q * L)
@@ -0,0 +1,327 @@
+"""
+Тесты фоновых заданий и их хранилища в SQLite.
+"""
+import sys
+import os
+import inspect
+import sqlite3
+import threading
+import time
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamLoadCase
+from app.models.jobs import CatalogCheckJob, ReliabilityJob, SweepJob
+from app.models.reliability import ReliabilityRequest
+from app.models.sweep import SweepRequest
+from app.repositories.job_store import SCHEMA, JobStore
+from app.repositories.material_repository import MaterialRepositoryStub
+from app.services.calculator import BeamCalculator
+from app.services.jobs import JobManager
+from app.services.reliability import ReliabilityAnalyzer
+from app.services.sweep import SWEEP_COLUMNS, ParameterSweep, chunk_rows
+
+
+SWEEP = SweepRequest(
+    length={"start": 3.0, "stop": 9.0, "num": 7},
+    force=[50.0, 100.0],
+    force_position={"start": 0.1, "stop": 0.9, "num": 5},
+    support_types=["hinged", "fixed"],
+    profile_names=["I-beam_20B1", "I-beam_30B1"],
+    chunk_size=37
+)
+
+
+def wait_finished(manager: JobManager, job_id: str, timeout: float = 30.0):
+    """Ожидание завершения задания."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = manager.status(job_id)
+        if status.state in ("completed", "failed", "cancelled"):
+            return status
+        time.sleep(0.01)
+    raise TimeoutError(job_id)
+
+
+def expected_sweep_rows(repository) -> list:
+    """Строки перебора, рассчитанные напрямую."""
+    profiles = [repository.get_profile(name) for name in SWEEP.profile_names]
+    sweep = ParameterSweep(SWEEP, profiles)
+    return [dict(zip(SWEEP_COLUMNS, row)) for row in chunk_rows(sweep.compute_chunk(0, sweep.total))]
+
+
+class TestJobManager:
+    """Выполнение, результаты, отмена и продолжение заданий."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.repository = MaterialRepositoryStub()
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        return JobStore(str(tmp_path / "jobs.sqlite3"))
+    
+    @pytest.fixture
+    def manager(self, store):
+        manager = JobManager(store, lambda: self.repository, max_workers=2)
+        yield manager
+        manager.shutdown()
+    
+    def test_sweep_results_paged(self, manager):
+        """Перебор: строки совпадают с прямым расчётом, страницы идут подряд."""
+        job_id = manager.submit(SweepJob(request=SWEEP)).id
+        status = wait_finished(manager, job_id)
+        expected = expected_sweep_rows(self.repository)
+        
+        assert status.state == "completed"
+        assert status.rows == status.total == len(expected)
+        assert status.progress == 1.0
+        
+        rows, offset = [], 0
+        while offset is not None:
+            page = manager.results(job_id, offset, 100)
+            rows.extend(page.rows)
+            offset = page.next_offset
+        assert rows == expected
+        
+        streamed = "".join(manager.stream_results(job_id)).splitlines()
+        assert len(streamed) == len(expected)
+    
+    def test_reliability_matches_analyzer(self, manager):
+        """Расчёт надёжности в задании совпадает с прямым расчётом с тем же зерном."""
+        request = ReliabilityRequest(
+            length=6.0,
+            support_type="hinged",
+            profile_name="I-beam_20B1",
+            force={"type": "normal", "mean": 45.0, "std": 8.0},
+            force_position={"type": "uniform", "low": 0.3, "high": 0.7},
+            samples=50_000,
+            chunk_size=7_000,
+            seed=3
+        )
+        job_id = manager.submit(ReliabilityJob(request=request)).id
+        
+        assert wait_finished(manager, job_id).state == "completed"
+        expected = ReliabilityAnalyzer().analyze(request, self.repository.get_profile("I-beam_20B1"))
+        assert manager.results(job_id).rows == [expected.model_dump(mode="json")]
+    
+    def test_catalog_check(self, manager):
+        """Проверка каталога: строка на профиль, вердикты как у calculate_summary."""
+        load_case = BeamLoadCase(length=6.0, support_type="hinged", force=60.0, force_position=0.4)
+        job_id = manager.submit(CatalogCheckJob(request=load_case)).id
+        
+        assert wait_finished(manager, job_id).state == "completed"
+        rows = manager.results(job_id, limit=1000).rows
+        profiles = self.repository.get_all_profiles()
+        assert [row["profile_name"] for row in rows] == [p.key for p in profiles]
+        
+        calculator = BeamCalculator()
+        for row, profile in zip(rows, profiles):
+            summary = calculator.calculate_summary(load_case, profile)
+            assert row["max_stress"] == summary.max_stress
+            assert row["max_deflection"] == pytest.approx(summary.max_deflection, abs=1e-3)
+            assert row["is_strength_sufficient"] == summary.is_strength_sufficient
+    
+    def test_catalog_check_elastic_supports(self, manager):
+        """Упругая опора: каждый профиль рассчитывается полностью, а не пересчётом с Ix = 1 см⁴."""
+        load_case = BeamLoadCase(
+            length=6.0,
+            support_type="custom",
+            supports=[
+                {"type": "pin", "position": 0.0},
+                {"type": "spring", "position": 0.5, "stiffness": 2000.0},
+                {"type": "roller", "position": 1.0},
+            ],
+            distributed_loads=[{"q_start": 10.0}]
+        )
+        job_id = manager.submit(CatalogCheckJob(request=load_case)).id
+        
+        assert wait_finished(manager, job_id).state == "completed"
+        rows = manager.results(job_id, limit=1000).rows
+        
+        calculator = BeamCalculator()
+        for row, profile in zip(rows, self.repository.get_all_profiles()):
+            summary = calculator.calculate_summary(load_case, profile)
+            assert row["max_moment"] == summary.max_moment
+            assert row["max_deflection"] == summary.max_deflection
+            assert row["is_stiffness_sufficient"] == summary.is_stiffness_sufficient
+    
+    def test_failed_job_reports_error(self, manager):
+        """Ошибка расчёта переводит задание в failed с текстом ошибки."""
+        job_id = manager.submit(SweepJob(request=SWEEP.model_copy(update={"profile_names": ["missing"]}))).id
+        status = wait_finished(manager, job_id)
+        
+        assert status.state == "failed"
+        assert "missing" in status.error
+    
+    def test_cancel(self, store):
+        """Отменённое задание не выполняется и не пишет строк; повторная отмена безвредна."""
+        gate = threading.Event()
+        
+        def repository():
+            gate.wait(10)
+            return self.repository
+        
+        # Первое задание ждёт gate и занимает единственный исполнитель
+        manager = JobManager(store, repository, max_workers=1)
+        first = manager.submit(SweepJob(request=SWEEP)).id
+        second = manager.submit(SweepJob(request=SWEEP)).id
+        
+        assert manager.cancel(second).state == "cancelled"
+        assert manager.cancel(second).state == "cancelled"
+        gate.set()
+        assert wait_finished(manager, first).state == "completed"
+        assert manager.status(second).rows == 0
+        assert manager.cancel("unknown") is None
+        manager.shutdown()
+    
+    def test_resume_after_restart(self, store):
+        """Прерванное задание продолжается с контрольной точки без повторов строк."""
+        job_id = store.create("sweep", SWEEP.model_dump(mode="json"))
+        self.interrupt(store, job_id)
+        
+        restarted = JobManager(store, lambda: self.repository)
+        assert restarted.resume() == 1
+        status = wait_finished(restarted, job_id)
+        restarted.shutdown()
+        
+        assert status.state == "completed"
+        assert store.results(job_id, 0, 10_000) == expected_sweep_rows(self.repository)
+    
+    def interrupt(self, store, job_id: str) -> None:
+        """«Прошлый процесс» записал два блока и аварийно остановился (аренда истекла)."""
+        crashed = JobStore(store.path, lease_seconds=0.0)
+        assert crashed.start(job_id, "crashed")
+        chunks = JobManager(crashed, lambda: self.repository)._sweep_chunks(SWEEP, None)
+        for _ in range(2):
+            assert crashed.save_chunk(job_id, "crashed", *next(chunks))
+    
+    def test_resume_from_several_processes(self, store):
+        """Задание, продолжаемое несколькими процессами сразу, выполняется один раз."""
+        queued = store.create("sweep", SWEEP.model_dump(mode="json"))
+        interrupted = store.create("sweep", SWEEP.model_dump(mode="json"))
+        self.interrupt(store, interrupted)
+        
+        managers = [JobManager(JobStore(store.path), lambda: self.repository) for _ in range(3)]
+        for manager in managers:
+            manager.resume()
+        statuses = [wait_finished(managers[0], job_id) for job_id in (queued, interrupted)]
+        for manager in managers:
+            manager.shutdown()
+        
+        expected = expected_sweep_rows(self.repository)
+        for job_id, status in zip((queued, interrupted), statuses):
+            assert status.state == "completed", status.error
+            assert status.rows == len(expected)
+            assert store.results(job_id, 0, 10_000) == expected
+    
+    def test_lease_kept_during_long_chunk(self, tmp_path):
+        """Аренда продлевается, пока блок считается дольше срока аренды: другой процесс задание не забирает."""
+        path = str(tmp_path / "jobs.sqlite3")
+        
+        def slow_repository():
+            time.sleep(1.0)
+            return self.repository
+        
+        claimed = []
+        
+        def other_repository():
+            claimed.append(True)
+            return self.repository
+        
+        first = JobManager(JobStore(path, lease_seconds=0.3), slow_repository)
+        job_id = first.submit(SweepJob(request=SWEEP)).id
+        while first.status(job_id).state == "queued":
+            time.sleep(0.01)
+        other = JobManager(JobStore(path, lease_seconds=0.3), other_repository, auto_resume=True)
+        other.resume()
+        
+        status = wait_finished(first, job_id)
+        first.shutdown()
+        other.shutdown()
+        
+        assert status.state == "completed", status.error
+        assert claimed == []
+        assert first._store.results(job_id, 0, 10_000) == expected_sweep_rows(self.repository)
+    
+    def test_auto_resume(self, tmp_path):
+        """С auto_resume задание, аренда которого истекла после старта диспетчера, продолжается."""
+        path = str(tmp_path / "jobs.sqlite3")
+        manager = JobManager(JobStore(path, lease_seconds=0.3), lambda: self.repository, auto_resume=True)
+        assert manager.resume() == 0
+        
+        store = JobStore(path, lease_seconds=0.2)
+        job_id = store.create("sweep", SWEEP.model_dump(mode="json"))
+        assert store.start(job_id, "crashed")
+        status = wait_finished(manager, job_id)
+        manager.shutdown()
+        
+        assert status.state == "completed", status.error
+        assert store.results(job_id, 0, 10_000) == expected_sweep_rows(self.repository)
+    
+    def test_resume_skips_scheduled(self, store):
+        """Поставленное в пул задание повторно не ставится."""
+        gate = threading.Event()
+        
+        def repository():
+            gate.wait(10)
+            return self.repository
+        
+        manager = JobManager(store, repository, max_workers=1)
+        first = manager.submit(SweepJob(request=SWEEP)).id
+        second = manager.submit(SweepJob(request=SWEEP)).id
+        assert manager.resume() == 0
+        gate.set()
+        
+        for job_id in (first, second):
+            assert wait_finished(manager, job_id).state == "completed"
+        manager.shutdown()
+    
+    def test_handlers_run_in_threadpool(self):
+        """Обработчики заданий синхронные: SQLite не блокирует цикл событий."""
+        from app.api.v1 import jobs
+        
+        for handler in (jobs.submit_job, jobs.get_job, jobs.get_job_results,
+                        jobs.stream_job_results, jobs.cancel_job):
+            assert not inspect.iscoroutinefunction(handler)
+    
+    def test_lease(self, tmp_path):
+        """Задание с действующей арендой не забирается; после истечения аренды прежний владелец не пишет."""
+        store = JobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=0.2)
+        job_id = store.create("sweep", SWEEP.model_dump(mode="json"))
+        chunk = ([{"row": 0}], {"offset": 1}, 1, 10)
+        
+        assert store.start(job_id, "first")
+        assert not store.start(job_id, "second")
+        assert store.claimable() == []
+        
+        time.sleep(0.3)
+        assert store.claimable() == [job_id]
+        assert store.start(job_id, "second")
+        assert not store.save_chunk(job_id, "first", *chunk)
+        assert not store.finish(job_id, "completed", owner="first")
+        assert store.save_chunk(job_id, "second", *chunk)
+        
+        store.release(job_id, "second")
+        assert store.claimable() == [job_id]
+        assert store.finish(job_id, "cancelled")
+        assert store.claimable() == []
+    
+    def test_old_schema_migrated(self, tmp_path):
+        """Файл без столбцов аренды дополняется при открытии."""
+        path = str(tmp_path / "jobs.sqlite3")
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            SCHEMA.replace(",\n    owner TEXT,\n    lease_until REAL", "")
+        )
+        connection.execute(
+            "INSERT INTO jobs (id, kind, state, request, created_at) VALUES ('old', 'sweep', 'running', '{}', 0)"
+        )
+        connection.commit()
+        connection.close()
+        
+        store = JobStore(path)
+        assert store.claimable() == ["old"]
+        assert store.start("old", "owner")
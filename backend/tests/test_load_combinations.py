@@ -0,0 +1,162 @@
+"""
+Тесты расчёта балки на сочетания нагрузок.
+"""
+import sys
+import os
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamLoadCase
+from app.models.load_combination import BasicLoadCase, LoadCombination, LoadCombinationRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+from app.services.load_combinations import LoadCombinationAnalyzer, generate_combinations
+
+
+LOAD_CASES = [
+    {"name": "dead", "category": "permanent", "distributed_loads": [{"q_start": 4.0}]},
+    {"name": "snow", "category": "snow", "distributed_loads": [{"q_start": 6.0, "start": 0.2, "end": 0.9}]},
+    {"name": "hoist", "category": "live", "point_loads": [{"force": 20.0, "position": 0.3}]},
+    {"name": "wind", "category": "wind", "distributed_loads": [{"q_start": -3.0, "q_end": -1.0}],
+     "applied_moments": [{"moment": 5.0, "position": 0.6}]},
+]
+
+CUSTOM_SUPPORTS = [
+    {"type": "fixed", "position": 0.0},
+    {"type": "spring", "position": 0.6, "stiffness": 5000.0},
+    {"type": "roller", "position": 1.0},
+]
+
+
+def combined_load_case(request: LoadCombinationRequest, factors: dict) -> BeamLoadCase:
+    """Схема с нагрузками, заранее умноженными на коэффициенты сочетания."""
+    point_loads, distributed_loads, applied_moments = [], [], []
+    for case in request.load_cases:
+        f = factors.get(case.name, 0.0)
+        if not f:
+            continue
+        point_loads += [p.model_copy(update={"force": p.force * f}) for p in case.point_loads]
+        distributed_loads += [
+            q.model_copy(update={"q_start": q.q_start * f, "q_end": None if q.q_end is None else q.q_end * f})
+            for q in case.distributed_loads
+        ]
+        applied_moments += [m.model_copy(update={"moment": m.moment * f}) for m in case.applied_moments]
+    return BeamLoadCase(
+        length=request.length, support_type=request.support_type, supports=request.supports,
+        point_loads=point_loads, distributed_loads=distributed_loads, applied_moments=applied_moments
+    )
+
+
+class TestGenerateCombinations:
+    """Построение сочетаний по видам нагрузок."""
+    
+    def test_counts_and_factors(self):
+        """Основная нагрузка с γf, сопутствующие с ψ·γf; uls с γf и 0.9 для постоянной."""
+        cases = [BasicLoadCase(**data) for data in LOAD_CASES]
+        combinations = generate_combinations(cases)
+        
+        # 3 временные нагрузки: 3 · 2² сочетаний на набор постоянных, uls - два набора
+        assert len(combinations) == 3 * 4 * 3
+        uls = [c for c in combinations if c.limit_state == "uls"]
+        assert len(uls) == 24
+        assert {"dead": 1.1, "snow": 1.4, "hoist": 1.2 * 0.9, "wind": 1.4 * 0.9} in [c.factors for c in uls]
+        assert {"dead": 0.9, "wind": 1.4} in [c.factors for c in uls]
+        assert {"dead": 1.0, "hoist": 1.0, "snow": 0.9} in [c.factors for c in combinations if c.limit_state == "sls"]
+    
+    def test_permanent_only(self):
+        """Без временных нагрузок - по одному сочетанию на предельное состояние."""
+        combinations = generate_combinations([BasicLoadCase(**LOAD_CASES[0])])
+        assert [(c.limit_state, c.factors) for c in combinations] == [("uls", {"dead": 1.1}), ("sls", {"dead": 1.0})]
+
+
+class TestLoadCombinationAnalyzer:
+    """Сравнение суперпозиции с расчётом схемы с заранее сложенными нагрузками."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.analyzer = LoadCombinationAnalyzer(self.calculator)
+        self.profile = load_profile_catalog().get("I-beam_30B1")
+    
+    def _request(self, **overrides) -> LoadCombinationRequest:
+        data = {"length": 6.0, "support_type": "hinged", "profile_name": self.profile.key,
+                "load_cases": LOAD_CASES}
+        data.update(overrides)
+        return LoadCombinationRequest(**data)
+    
+    @pytest.mark.parametrize("scheme", [
+        {"support_type": "hinged"},
+        {"support_type": "cantilever"},
+        {"support_type": "fixed"},
+        {"support_type": "custom", "supports": CUSTOM_SUPPORTS},
+    ])
+    def test_matches_presummed_loads(self, scheme):
+        """Каждое сочетание совпадает с расчётом calculate_summary."""
+        request = self._request(**scheme)
+        result = self.analyzer.analyze(request, self.profile)
+        
+        assert result.combinations == len(result.results) == 36
+        for combination in result.results:
+            load_case = combined_load_case(request, combination.factors)
+            expected = self.calculator.calculate_summary(load_case, self.profile)
+            assert combination.reactions == pytest.approx(expected.reactions, abs=0.011)
+            assert combination.max_moment == pytest.approx(expected.max_moment, abs=0.011)
+            assert combination.max_deflection == pytest.approx(expected.max_deflection, abs=0.0011)
+    
+    def test_governing_combinations(self):
+        """Определяющие сочетания - наибольший момент среди uls и прогиб среди sls."""
+        result = self.analyzer.analyze(self._request(), self.profile)
+        
+        uls = [r for r in result.results if r.limit_state == "uls"]
+        sls = [r for r in result.results if r.limit_state == "sls"]
+        assert result.governing_strength.max_moment == max(r.max_moment for r in uls)
+        assert result.governing_stiffness.max_deflection == max(r.max_deflection for r in sls)
+        assert result.governing_strength.is_stiffness_sufficient is None
+        assert result.is_strength_sufficient == all(r.is_strength_sufficient for r in uls)
+    
+    def test_explicit_combinations_and_grade(self):
+        """Явные сочетания: только uls - проверки жёсткости нет; Ry по марке стали."""
+        factors = np.random.default_rng(3).uniform(0, 1.5, size=(300, len(LOAD_CASES)))
+        combinations = [
+            LoadCombination(name=f"c{i}", limit_state="uls",
+                            factors={case["name"]: float(f) for case, f in zip(LOAD_CASES, row)})
+            for i, row in enumerate(factors)
+        ]
+        result = self.analyzer.analyze(
+            self._request(combinations=combinations, steel_grade="C345", include_results=False),
+            self.profile
+        )
+        
+        assert result.combinations == 300
+        assert result.results is None
+        assert result.design_strength == 340.0
+        assert result.governing_stiffness is None and result.is_stiffness_sufficient is None
+        best = int(np.argmax([
+            self.calculator.calculate_summary(
+                combined_load_case(self._request(), c.factors), self.profile
+            ).max_moment for c in combinations
+        ]))
+        assert result.governing_strength.name == f"c{best}"
+    
+    def test_unit_results_cached(self):
+        """Повтор с другими коэффициентами берёт поля загружений из кэша."""
+        self.analyzer.analyze(self._request(), self.profile)
+        cases = [dict(case, partial_factor=1.3) for case in LOAD_CASES]
+        self.analyzer.analyze(self._request(load_cases=cases, steel_grade="C255"), self.profile)
+        assert (self.analyzer.cache.hits, self.analyzer.cache.misses) == (1, 1)
+        
+        self.analyzer.analyze(self._request(length=7.0), self.profile)
+        assert self.analyzer.cache.misses == 2
+    
+    def test_validation(self):
+        """Повтор имени загружения и неизвестное загружение в сочетании."""
+        with pytest.raises(ValidationError):
+            self._request(load_cases=[LOAD_CASES[0], LOAD_CASES[0]])
+        with pytest.raises(ValidationError):
+            self._request(combinations=[{"name": "x", "limit_state": "uls", "factors": {"crane": 1.0}}])
+        with pytest.raises(ValidationError):
+            self._request(support_type="custom")
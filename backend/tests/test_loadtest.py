@@ -0,0 +1,60 @@
+"""
+Тесты для нагрузочного теста.
+"""
+import sys
+import os
+import asyncio
+import random
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from loadtest.harness import latency_histogram, latency_stats, run_load_test
+from loadtest.scenarios import SCENARIOS, parse_mix
+
+
+class TestLoadTest:
+    """Тесты статистики и прогона в процессе."""
+    
+    def test_stats_and_histogram(self):
+        """Перцентили и корзины гистограммы."""
+        latencies = [i / 1000 for i in range(1, 101)]  # 1..100 мс
+        stats = latency_stats(latencies)
+        histogram = latency_histogram(latencies)
+        
+        assert stats["p50"] == pytest.approx(50.5)
+        assert stats["max"] == pytest.approx(100.0)
+        assert sum(bucket["count"] for bucket in histogram) == 100
+        assert next(b for b in histogram if b["le"] == 1)["count"] == 1
+        assert histogram[-1]["le"] == float("inf")
+    
+    def test_parse_mix(self):
+        """Разбор смеси сценариев."""
+        assert parse_mix("calculate=3,profiles") == {"calculate": 3.0, "profiles": 1.0}
+        with pytest.raises(ValueError):
+            parse_mix("unknown=1")
+        with pytest.raises(ValueError):
+            parse_mix("calculate=0")
+    
+    def test_scenarios_reproducible(self):
+        """Одинаковое зерно даёт одинаковые запросы."""
+        for scenario in SCENARIOS.values():
+            assert scenario(random.Random(7), True) == scenario(random.Random(7), True)
+    
+    def test_asgi_run(self):
+        """Короткий прогон в процессе проходит без ошибок."""
+        report = asyncio.run(run_load_test(
+            mode="asgi",
+            mix={name: 1.0 for name in SCENARIOS},
+            concurrency=2,
+            duration=0.3,
+            warmup=0.0,
+            unique=True
+        ))
+        
+        assert report["requests"] > 0
+        assert report["errors"] == 0
+        assert set(report["scenarios"]) <= set(SCENARIOS)
+        assert report["latency_ms"]["p99"] >= report["latency_ms"]["p50"]
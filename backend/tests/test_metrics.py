@@ -0,0 +1,111 @@
+"""
+Тесты для метрик Prometheus.
+"""
+import sys
+import os
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import get_session_manager
+from app.core.metrics import NULL_TIMER, STAGE_SECONDS, MetricsRegistry, metrics, stage_timer, stats_collector
+
+
+REQUEST = {
+    "length": 5.0,
+    "support_type": "cantilever",
+    "force": 20.0,
+    "force_position": 1.0,
+    "profile_name": "I-beam_20B1"
+}
+
+
+class TestMetricsRegistry:
+    """Тесты реестра метрик."""
+    
+    def test_histogram_render(self):
+        """Корзины гистограммы накопительные, сумма и число согласованы."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("test_seconds", "Тест", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value, "a")
+        lines = registry.render().splitlines()
+        
+        assert "# TYPE test_seconds histogram" in lines
+        assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{stage="a",le="1"} 3' in lines
+        assert 'test_seconds_bucket{stage="a",le="+Inf"} 4' in lines
+        assert 'test_seconds_count{stage="a"} 4' in lines
+        assert 'test_seconds_sum{stage="a"} 6.05' in lines
+    
+    def test_counter_labels_escaped(self):
+        """Значения меток экранируются."""
+        registry = MetricsRegistry()
+        counter = registry.counter("test_total", "Тест", ("name",))
+        counter.inc('a"b')
+        counter.inc('a"b', amount=2)
+        
+        assert 'test_total{name="a\\"b"} 3' in registry.render().splitlines()
+    
+    def test_disabled_is_noop(self):
+        """Выключенный реестр ничего не записывает и отдаёт пустой таймер."""
+        registry = MetricsRegistry(enabled=False)
+        histogram = registry.histogram("test_seconds", "Тест")
+        counter = registry.counter("test_total", "Тест")
+        histogram.observe(1.0)
+        counter.inc()
+        
+        assert registry.timer(histogram) is NULL_TIMER
+        assert histogram.count() == 0 and counter.value() == 0
+    
+    def test_collector_replaced_by_name(self):
+        """Сборщик с тем же именем заменяет прежний, а не дублирует его."""
+        registry = MetricsRegistry()
+        registry.add_collector("test_cache", stats_collector("test_cache", "Тест", lambda: {"size": 1}))
+        registry.add_collector("test_cache", stats_collector("test_cache", "Тест", lambda: {"size": 2}))
+        lines = registry.render().splitlines()
+        
+        assert lines.count("# TYPE test_cache_size gauge") == 1
+        assert "test_cache_size 2" in lines
+    
+    def test_factory_cache_clear(self):
+        """Пересозданная фабрикой служба публикуется один раз."""
+        get_session_manager()
+        get_session_manager.cache_clear()
+        get_session_manager()
+        
+        lines = metrics.render().splitlines()
+        assert lines.count("# TYPE esc_calculation_sessions_size gauge") == 1
+
+
+class TestMetricsEndpoint:
+    """Тесты эндпоинта /metrics."""
+    
+    def test_stages_and_cache_exported(self):
+        """Этапы расчёта по типу опор, маршруты и попадания в кэш."""
+        client = TestClient(app)
+        before = STAGE_SECONDS.count("report", "cantilever")
+        client.post("/api/v1/calculate", json=REQUEST)
+        client.post("/api/v1/calculate", json=REQUEST)
+        
+        response = client.get("/metrics")
+        text = response.text
+        assert response.headers["content-type"].startswith("text/plain")
+        assert STAGE_SECONDS.count("report", "cantilever") == before + 1
+        for stage in ("reactions", "moment", "deflection", "stress", "checks", "diagrams"):
+            assert f'stage="{stage}",support_type="cantilever"' in text
+        assert 'esc_http_requests_total{method="POST",endpoint="/api/v1/calculate",status="200"}' in text
+        hits = next(l for l in text.splitlines() if l.startswith("esc_result_cache_hits_total"))
+        assert float(hits.split()[-1]) >= 1
+    
+    def test_disabled(self):
+        """При выключенных метриках /metrics недоступен, таймеры пустые."""
+        metrics.enabled = False
+        try:
+            assert stage_timer("report", "hinged") is NULL_TIMER
+            assert TestClient(app).get("/metrics").status_code == 404
+        finally:
+            metrics.enabled = True
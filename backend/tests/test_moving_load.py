@@ -0,0 +1,146 @@
+"""
+Тесты для расчёта балки на подвижную нагрузку.
+"""
+import sys
+import os
+import numpy as np
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamCalculationRequest
+from app.models.moving_load import MovingLoadRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+from app.services.moving_load import MovingLoadAnalyzer
+
+
+class TestMovingLoadAnalyzer:
+    """Тесты линий влияния и огибающих."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.analyzer = MovingLoadAnalyzer(self.calculator)
+        self.profile = load_profile_catalog().get("I-beam_30B1")
+    
+    def test_single_axle_matches_calculate(self):
+        """Одна ось: критическое положение и проверки совпадают с /calculate."""
+        request = MovingLoadRequest(
+            length=6.0,
+            support_type="hinged",
+            profile_name="I-beam_30B1",
+            axle_loads=[100.0]
+        )
+        
+        result = self.analyzer.analyze(request, self.profile)
+        
+        static = self.calculator.calculate(
+            BeamCalculationRequest(
+                length=6.0,
+                support_type="hinged",
+                force=100.0,
+                force_position=0.5,
+                profile_name="I-beam_30B1"
+            ),
+            self.profile
+        )
+        assert result.governing_position_moment == pytest.approx(3.0)
+        assert result.max_moment == static.max_moment
+        assert result.max_stress == static.max_stress
+        assert result.is_strength_sufficient == static.is_strength_sufficient
+        
+        envelope = np.array(result.envelopes["moment_max"])
+        assert envelope[:, 1] == pytest.approx(100.0 * envelope[:, 0] * (6.0 - envelope[:, 0]) / 6.0)
+    
+    def test_influence_lines_hinged(self):
+        """Линии влияния реакций и момента шарнирно-опёртой балки."""
+        request = MovingLoadRequest(
+            length=6.0,
+            support_type="hinged",
+            profile_name="I-beam_30B1",
+            axle_loads=[1.0],
+            positions=61,
+            influence_section=0.25
+        )
+        
+        lines = self.analyzer.analyze(request, self.profile).influence_lines
+        
+        a = np.array(lines["R_a"])[:, 0]
+        assert np.array(lines["R_a"])[:, 1] == pytest.approx(1 - a / 6.0)
+        assert np.array(lines["R_b"])[:, 1] == pytest.approx(a / 6.0)
+        expected_moment = np.where(a <= 1.5, a * (1 - 1.5 / 6.0), 1.5 * (1 - a / 6.0))
+        assert np.array(lines["moment"])[:, 1] == pytest.approx(expected_moment, abs=1e-12)
+    
+    def test_two_axle_train(self):
+        """Две равные оси: M_max = P(L - s/2)² / 2L."""
+        L, P, s = 10.0, 50.0, 2.0
+        request = MovingLoadRequest(
+            length=L,
+            support_type="hinged",
+            profile_name="I-beam_30B1",
+            axle_loads=[P, P],
+            axle_spacings=[s],
+            positions=2001,
+            sections=2001
+        )
+        
+        result = self.analyzer.analyze(request, self.profile)
+        
+        assert result.max_moment == pytest.approx(P * (L - s / 2) ** 2 / (2 * L), rel=1e-3)
+    
+    def test_peak_between_grid_points(self):
+        """Максимум под осью между узлами сеток сечений и положений не теряется."""
+        L, P, s = 6.0, 60.0, 1.5
+        request = MovingLoadRequest(
+            length=L,
+            support_type="hinged",
+            profile_name="I-beam_30B1",
+            axle_loads=[P, P],
+            axle_spacings=[s],
+            positions=37,
+            sections=21
+        )
+        
+        result = self.analyzer.analyze(request, self.profile)
+        
+        # Середина пролёта делит пополам расстояние между осью и равнодействующей
+        exact = 2 * P / L * (L / 2 - s / 4) ** 2
+        assert result.max_moment == pytest.approx(exact, abs=0.01)
+        assert result.critical_section in (
+            pytest.approx(L / 2 - s / 4), pytest.approx(L / 2 + s / 4)
+        )
+        assert result.max_stress == self.calculator._calculate_max_stress(
+            result.max_moment, self.profile.moment_of_resistance_wx_cm3
+        )
+    
+    def test_spacings_validated(self):
+        """Число расстояний должно соответствовать числу осей."""
+        with pytest.raises(ValueError):
+            MovingLoadRequest(
+                length=6.0,
+                support_type="hinged",
+                profile_name="I-beam_30B1",
+                axle_loads=[10.0, 10.0]
+            )
+    
+    def test_steel_grade(self):
+        """Прочность проверяется по сопротивлению марки стали; неизвестная марка - ошибка."""
+        request = MovingLoadRequest(
+            length=6.0,
+            support_type="hinged",
+            profile_name="I-beam_30B1",
+            axle_loads=[60.0, 60.0],
+            axle_spacings=[1.5]
+        )
+        
+        default = self.analyzer.analyze(request, self.profile)
+        graded = self.analyzer.analyze(request.model_copy(update={"steel_grade": "C390"}), self.profile)
+        
+        assert default.max_stress == graded.max_stress
+        assert default.max_stress > 240.0 and graded.max_stress <= self.calculator.design_strength("C390")
+        assert not default.is_strength_sufficient
+        assert graded.is_strength_sufficient
+        with pytest.raises(ValueError):
+            self.analyzer.analyze(request.model_copy(update={"steel_grade": "X999"}), self.profile)
@@ -0,0 +1,57 @@
+"""
+Тесты для каталога профилей.
+"""
+import sys
+import os
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.repositories.profile_catalog import ProfileCatalog, load_profile_catalog
+from app.repositories.material_repository import CatalogMaterialRepository
+
+
+class TestProfileCatalog:
+    """Тесты каталога профилей."""
+    
+    def test_catalog_is_shared(self):
+        """Каталог загружается один раз на процесс."""
+        assert load_profile_catalog() is load_profile_catalog()
+    
+    def test_catalog_loaded_from_file(self):
+        """Каталог содержит профили из файла данных."""
+        catalog = load_profile_catalog()
+        
+        assert catalog.version >= 2
+        assert {profile.standard for profile in catalog.profiles} == {
+            "ГОСТ 26020-83", "ГОСТ 8239-89", "ГОСТ 8240-97"
+        }
+        profile = catalog.get("I-beam_20B1")
+        assert profile.moment_of_inertia_ix_cm4 == 1943.0
+    
+    def test_columns_match_profiles(self):
+        """Колонки совпадают с полями профилей."""
+        catalog = load_profile_catalog()
+        wx = catalog.column("moment_of_resistance_wx_cm3")
+        
+        for key in catalog.keys:
+            assert wx[catalog.index_of(key)] == catalog.get(key).moment_of_resistance_wx_cm3
+        with pytest.raises(ValueError):
+            wx[0] = 1.0
+    
+    def test_duplicate_keys_rejected(self):
+        """Повторяющиеся ключи отклоняются."""
+        profile = load_profile_catalog().profiles[0]
+        
+        with pytest.raises(ValueError):
+            ProfileCatalog([profile, profile])
+    
+    def test_repository_uses_catalog(self):
+        """Репозиторий отдаёт профили каталога."""
+        catalog = load_profile_catalog()
+        repository = CatalogMaterialRepository(catalog)
+        
+        assert repository.get_profile("I-beam_20B1") is catalog.get("I-beam_20B1")
+        assert repository.get_profile("unknown") is None
+        assert len(repository.get_all_profiles()) == len(catalog)
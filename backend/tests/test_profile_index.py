@@ -0,0 +1,86 @@
+"""
+Тесты для поискового индекса профилей.
+"""
+import sys
+import os
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.material_profile import MaterialProfile, ProfileQuery
+from app.repositories.profile_catalog import ProfileCatalog
+from app.repositories.profile_index import ProfileSearchIndex
+
+
+def _profile(key: str, name: str, standard: str, wx: float, ix: float, height: float, mass: float) -> MaterialProfile:
+    return MaterialProfile(
+        name=name,
+        standard=standard,
+        key=key,
+        moment_of_inertia_ix_cm4=ix,
+        moment_of_resistance_wx_cm3=wx,
+        height_mm=height,
+        width_mm=100.0,
+        mass_kg_m=mass
+    )
+
+
+class TestProfileSearchIndex:
+    """Тесты индекса профилей."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.catalog = ProfileCatalog([
+            _profile("I-beam_20B1", "Двутавр 20Б1", "ГОСТ 26020-83", 184.0, 1840.0, 200.0, 22.7),
+            _profile("I-beam_20K1", "Двутавр 20К1", "ГОСТ 26020-83", 392.0, 3920.0, 200.0, 41.5),
+            _profile("Channel_20P", "Швеллер 20П", "ГОСТ 8240-97", 153.0, 1530.0, 200.0, 18.4),
+            _profile("I-beam_30B1", "Двутавр 30Б1", "ГОСТ 26020-83", 422.0, 6320.0, 300.0, 39.2),
+            _profile("Channel_30P", "Швеллер 30П", "ГОСТ 8240-97", 387.0, 5810.0, 300.0, 31.8),
+        ], version=3)
+        self.index = ProfileSearchIndex(self.catalog)
+    
+    def _keys(self, **params):
+        return [p.key for p in self.index.query(ProfileQuery(**params)).profiles]
+    
+    def test_search_substring(self):
+        """Поиск подстроки совпадает с полным перебором."""
+        for needle in ["", "д", "20", "0б", "Двутавр", "ДВУТАВР 20", "еллер 3", "нет такого"]:
+            expected = [p.key for p in self.catalog.profiles if needle.lower() in p.name.lower()]
+            assert [p.key for p in self.index.search(needle)] == expected
+    
+    def test_name_prefix_filter(self):
+        """Фильтр по началам слов наименования."""
+        assert self._keys(name="двут 20") == ["I-beam_20B1", "I-beam_20K1"]
+        assert self._keys(name="шв") == ["Channel_20P", "Channel_30P"]
+        assert self._keys(name="0б") == []
+    
+    def test_standard_and_range_filters(self):
+        """Фильтры по стандарту и диапазонам характеристик."""
+        assert self._keys(standard="гост 8240-97") == ["Channel_20P", "Channel_30P"]
+        assert self._keys(min_wx=380.0, max_mass=40.0) == ["I-beam_30B1", "Channel_30P"]
+        assert self._keys(min_height=300.0, max_height=300.0, min_ix=6000.0) == ["I-beam_30B1"]
+    
+    def test_sort_and_cursor_pagination(self):
+        """Сортировка и постраничный вывод без пропусков и повторов."""
+        expected = [p.key for p in sorted(self.catalog.profiles, key=lambda p: -p.mass_kg_m)]
+        
+        keys, cursor = [], None
+        while True:
+            page = self.index.query(ProfileQuery(sort="mass_kg_m", order="desc", limit=2, cursor=cursor))
+            assert page.total == 5
+            keys.extend(p.key for p in page.profiles)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert keys == expected
+    
+    def test_cursor_mismatch_rejected(self):
+        """Курсор другой сортировки отклоняется."""
+        page = self.index.query(ProfileQuery(sort="mass_kg_m", limit=2))
+        
+        with pytest.raises(ValueError):
+            self.index.query(ProfileQuery(sort="height_mm", limit=2, cursor=page.next_cursor))
+        with pytest.raises(ValueError):
+            self.index.query(ProfileQuery(cursor="not-a-cursor"))
@@ -0,0 +1,145 @@
+"""
+Тесты для отладочных замеров и профилирования запросов.
+"""
+import sys
+import os
+import asyncio
+import json
+import pstats
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.config import settings
+from app.core.profiling import RequestTimings, ServerTimingMiddleware
+
+
+REQUEST = {
+    "length": 7.0,
+    "support_type": "hinged",
+    "force": 35.0,
+    "force_position": 0.45,
+    "profile_name": "I-beam_30B1"
+}
+
+
+def _stages(header: str) -> dict:
+    """Этапы заголовка Server-Timing: имя -> длительность, мс."""
+    stages = {}
+    for part in header.split(","):
+        name, *params = part.strip().split(";")
+        stages[name] = float(next(p for p in params if p.startswith("dur="))[4:])
+    return stages
+
+
+class TestServerTiming:
+    """Тесты заголовка Server-Timing."""
+    
+    def test_request_timings(self):
+        """Повторные этапы суммируются, время до первого этапа - validation."""
+        timings = RequestTimings()
+        timings.add("diagrams", timings.started + 0.002, 0.001)
+        timings.add("diagrams", timings.started + 0.004, 0.003)
+        header = timings.server_timing(timings.started + 0.01)
+        
+        assert 'diagrams;dur=4.000;desc="x2"' in header
+        assert "validation;dur=2.000" in header
+        assert header.endswith("total;dur=10.000")
+    
+    def test_header_breakdown(self, monkeypatch):
+        """Заголовок содержит этапы расчёта только по запросу."""
+        monkeypatch.setattr(settings, "DEBUG", True)
+        client = TestClient(app)
+        plain = client.post("/api/v1/calculate", json=REQUEST)
+        timed = client.post("/api/v1/calculate", json=REQUEST, headers={"X-Debug-Timing": "1"})
+        
+        assert "server-timing" not in plain.headers
+        stages = _stages(timed.headers["server-timing"])
+        assert {"validation", "profile_lookup", "serialization", "total"} <= set(stages)
+        assert stages["total"] >= stages["serialization"]
+    
+    def test_disabled_without_debug(self, monkeypatch):
+        """Без DEBUG отладочные заголовки игнорируются."""
+        monkeypatch.setattr(settings, "DEBUG", False)
+        response = TestClient(app).post(
+            "/api/v1/calculate", json=REQUEST,
+            headers={"X-Debug-Timing": "1", "X-Debug-Profile": "pstats"}
+        )
+        assert "server-timing" not in response.headers
+        assert "x-debug-profile-file" not in response.headers
+
+
+class TestRequestProfile:
+    """Тесты сохранения профиля запроса."""
+    
+    def test_pstats_and_speedscope(self, monkeypatch, tmp_path):
+        """Профили сохраняются в стандартных форматах."""
+        monkeypatch.setattr(settings, "DEBUG", True)
+        monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+        monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+        client = TestClient(app)
+        body = {**REQUEST, "diagram_points": 20000}
+        
+        response = client.post("/api/v1/calculate", json=body, headers={"X-Debug-Profile": "pstats"})
+        path = tmp_path / response.headers["x-debug-profile-file"]
+        stats = pstats.Stats(str(path))
+        assert any(func[2] == "calculate" for func in stats.stats)
+        assert "diagrams" in _stages(response.headers["server-timing"])
+        assert response.headers["x-debug-profile-scope"] == "process"
+        
+        response = client.post(
+            "/api/v1/calculate", json={**body, "length": 8.0},
+            headers={"X-Debug-Profile": "speedscope"}
+        )
+        profile = json.loads((tmp_path / response.headers["x-debug-profile-file"]).read_text())
+        assert profile["profiles"][0]["type"] == "sampled"
+        assert len(profile["profiles"][0]["samples"]) == len(profile["profiles"][0]["weights"])
+
+    def test_disabled_by_default(self, monkeypatch, tmp_path):
+        """Одного DEBUG недостаточно: без PROFILING_ENABLED профиль не снимается."""
+        monkeypatch.setattr(settings, "DEBUG", True)
+        monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+        assert settings.PROFILING_ENABLED is False
+        response = TestClient(app).post(
+            "/api/v1/calculate", json=REQUEST,
+            headers={"X-Debug-Timing": "1", "X-Debug-Profile": "pstats"}
+        )
+        
+        assert "server-timing" in response.headers
+        assert "x-debug-profile-file" not in response.headers
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_profiled_requests_serialized(self, monkeypatch, tmp_path):
+        """Профилируемые запросы выполняются по одному, обычные - без ожидания."""
+        monkeypatch.setattr(settings, "DEBUG", True)
+        monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+        monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+        events = []
+        
+        async def endpoint(scope, receive, send):
+            events.append(("start", scope["path"]))
+            await asyncio.sleep(0.05)
+            events.append(("end", scope["path"]))
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+        
+        async def request(middleware, path, header):
+            scope = {"type": "http", "method": "GET", "path": path, "headers": [header]}
+            await middleware(scope, None, lambda message: asyncio.sleep(0))
+        
+        async def main():
+            middleware = ServerTimingMiddleware(endpoint)
+            await asyncio.gather(
+                request(middleware, "/a", (b"x-debug-profile", b"pstats")),
+                request(middleware, "/b", (b"x-debug-profile", b"pstats")),
+                request(middleware, "/c", (b"x-debug-timing", b"1")),
+            )
+        
+        asyncio.run(main())
+        profiled = [event for event in events if event[1] != "/c"]
+        assert profiled == [("start", "/a"), ("end", "/a"), ("start", "/b"), ("end", "/b")]
+        assert events.index(("start", "/c")) < events.index(("end", "/a"))
+        assert len(list(tmp_path.iterdir())) == 2
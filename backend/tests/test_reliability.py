@@ -0,0 +1,143 @@
+"""
+Тесты вероятностного расчёта надёжности (метод Монте-Карло).
+"""
+import sys
+import os
+from statistics import NormalDist
+import pytest
+from pydantic import ValidationError
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.reliability import Distribution, ReliabilityRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+from app.services.reliability import ReliabilityAnalyzer, failure_estimate
+from app.core.config import settings
+from app.core.execution import CalculationCancelled
+
+
+def make_request(**overrides) -> ReliabilityRequest:
+    """Запрос с нормальной силой в середине шарнирной балки."""
+    data = {
+        "length": 6.0,
+        "support_type": "hinged",
+        "profile_name": "I-beam_30B1",
+        "force": {"type": "normal", "mean": 120.0, "std": 20.0},
+        "force_position": {"type": "deterministic", "mean": 0.5},
+        "samples": 200_000,
+        "chunk_size": 30_000,
+        "seed": 7,
+    }
+    data.update(overrides)
+    return ReliabilityRequest(**data)
+
+
+class CountdownEvent:
+    """Флаг отмены, который устанавливается после заданного числа проверок."""
+    
+    def __init__(self, checks: int):
+        self.checks = checks
+    
+    def is_set(self) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+class TestDistribution:
+    """Проверка параметров распределений."""
+    
+    def test_invalid_parameters(self):
+        """Без среднего, с пустым интервалом и с неположительным средним логнормального - ошибка."""
+        with pytest.raises(ValidationError):
+            Distribution(type="normal", std=1.0)
+        with pytest.raises(ValidationError):
+            Distribution(type="uniform", low=1.0, high=1.0)
+        with pytest.raises(ValidationError):
+            Distribution(type="lognormal", mean=0.0, std=1.0)
+
+
+class TestReliabilityAnalyzer:
+    """Оценки вероятности отказа."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        self.analyzer = ReliabilityAnalyzer(self.calculator)
+        self.profile = load_profile_catalog().get("I-beam_30B1")
+    
+    def test_matches_normal_closed_form(self):
+        """Нормальная сила в середине пролёта: P = 1 - Φ((F* - μ) / σ), F* = 4·R·Wx / L."""
+        result = self.analyzer.analyze(make_request(), self.profile)
+        critical = 4 * settings.ALLOWABLE_STRESS * self.profile.moment_of_resistance_wx_cm3 / 1000 / 6.0
+        expected = 1 - NormalDist(120.0, 20.0).cdf(critical)
+        
+        assert result.strength.confidence_low <= expected <= result.strength.confidence_high
+        assert result.strength.reliability_index == pytest.approx(-NormalDist().inv_cdf(expected), abs=0.02)
+        assert result.combined.failures >= max(result.strength.failures, result.stiffness.failures)
+    
+    def test_deterministic_matches_calculate_verdict(self):
+        """Детерминированные параметры: вероятность 0 или 1 по вердикту calculate_batch."""
+        for force in (50.0, 400.0):
+            request = make_request(force={"type": "deterministic", "mean": force}, samples=1000)
+            result = self.analyzer.analyze(request, self.profile)
+            verdict = self.calculator.calculate_batch(
+                6.0, force, 0.5, "hinged",
+                self.profile.moment_of_inertia_ix_cm4, self.profile.moment_of_resistance_wx_cm3
+            )
+            
+            assert result.strength.probability == float(not verdict["is_strength_sufficient"])
+            assert result.stiffness.probability == float(not verdict["is_stiffness_sufficient"])
+            assert result.strength.reliability_index is None
+    
+    def test_steel_grade_sets_default_strength(self):
+        """Без yield_strength сопротивление берётся из марки стали."""
+        request = make_request(steel_grade="C390")
+        result = self.analyzer.analyze(request, self.profile)
+        critical = 4 * self.calculator.design_strength("C390") * self.profile.moment_of_resistance_wx_cm3 / 1000 / 6.0
+        expected = 1 - NormalDist(120.0, 20.0).cdf(critical)
+        
+        assert result.strength.confidence_low <= expected <= result.strength.confidence_high
+        assert result.strength.probability < self.analyzer.analyze(make_request(), self.profile).strength.probability
+        with pytest.raises(ValueError):
+            self.analyzer.analyze(make_request(steel_grade="X999"), self.profile)
+    
+    def test_reproducible_for_seed(self):
+        """Один seed - одинаковый результат; seed=None возвращает зерно для повтора."""
+        request = make_request(elastic_modulus={"type": "lognormal", "mean": 210.0, "std": 10.0},
+                               force_position={"type": "uniform", "low": 0.2, "high": 0.8})
+        
+        assert self.analyzer.analyze(request, self.profile) == self.analyzer.analyze(request, self.profile)
+        
+        first = self.analyzer.analyze(make_request(seed=None), self.profile)
+        repeat = self.analyzer.analyze(make_request(seed=first.seed), self.profile)
+        assert repeat == first
+    
+    def test_parallel_bit_for_bit(self):
+        """Блоки в пуле процессов дают тот же результат, что и в одном потоке."""
+        request = make_request(yield_strength={"type": "lognormal", "mean": 250.0, "std": 20.0})
+        
+        serial = self.analyzer.analyze(request, self.profile)
+        parallel = self.analyzer.analyze(request.model_copy(update={"workers": 2}), self.profile)
+        
+        assert parallel == serial
+    
+    def test_cancel_between_chunks(self):
+        """Флаг отмены прерывает расчёт между блоками в потоке и в пуле процессов."""
+        request = make_request(samples=300_000, chunk_size=10_000)
+        
+        for workers in (1, 2):
+            cancel = CountdownEvent(checks=3)
+            with pytest.raises(CalculationCancelled):
+                self.analyzer.analyze(request.model_copy(update={"workers": workers}), self.profile, cancel)
+            assert cancel.checks == -1
+    
+    def test_wilson_interval_without_failures(self):
+        """Ноль отказов: интервал [0, ~3/n], индекс надёжности не определён."""
+        estimate = failure_estimate(0, 1000, 0.95)
+        
+        assert estimate.probability == 0.0
+        assert estimate.confidence_low == 0.0
+        assert 0 < estimate.confidence_high < 4 / 1000
+        assert estimate.reliability_index is None
@@ -0,0 +1,101 @@
+"""
+Тесты для кэша результатов расчёта.
+"""
+import sys
+import os
+import time
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.beam_calculation import BeamCalculationRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.result_cache import ResultCache, calculation_cache_key, etag_matches
+
+
+REQUEST = {
+    "length": 5.0,
+    "support_type": "hinged",
+    "force": 100.0,
+    "force_position": 0.5,
+    "profile_name": "I-beam_20B1"
+}
+
+
+class TestResultCache:
+    """Тесты LRU-кэша."""
+    
+    def test_lru_eviction(self):
+        """Вытесняется давно не использованная запись."""
+        cache = ResultCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["hits"] == 3
+        assert cache.stats()["misses"] == 1
+    
+    def test_ttl_expiration(self):
+        """Запись истекает по времени жизни."""
+        cache = ResultCache(max_size=10, ttl_seconds=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+        
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+    
+    def test_disabled_cache(self):
+        """Кэш нулевого размера ничего не хранит."""
+        cache = ResultCache(max_size=0)
+        cache.put("a", 1)
+        
+        assert cache.get("a") is None
+    
+    def test_key_is_canonical(self):
+        """Ключ не зависит от порядка полей и меняется вместе с данными."""
+        profile = load_profile_catalog().get("I-beam_20B1")
+        first = BeamCalculationRequest(**REQUEST)
+        second = BeamCalculationRequest(**dict(reversed(list(REQUEST.items()))))
+        changed = BeamCalculationRequest(**{**REQUEST, "force": 101.0})
+        
+        assert calculation_cache_key(first, profile) == calculation_cache_key(second, profile)
+        assert calculation_cache_key(first, profile) != calculation_cache_key(changed, profile)
+    
+    def test_etag_matches(self):
+        """Разбор If-None-Match."""
+        assert etag_matches('"x", "y"', '"y"')
+        assert etag_matches("*", '"y"')
+        assert not etag_matches(None, '"y"')
+        assert not etag_matches('W/"y"', '"y"')
+
+
+class TestCalculateEtag:
+    """Тесты условных запросов к /calculate."""
+    
+    def test_not_modified(self):
+        """Повторный запрос с If-None-Match получает 304."""
+        client = TestClient(app)
+        
+        first = client.post("/api/v1/calculate", json=REQUEST)
+        etag = first.headers["ETag"]
+        second = client.post("/api/v1/calculate", json=REQUEST, headers={"If-None-Match": etag})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+    
+    def test_unknown_profile(self):
+        """Неизвестный профиль - 404."""
+        client = TestClient(app)
+        
+        result = client.post("/api/v1/calculate", json={**REQUEST, "profile_name": "unknown"})
+        
+        assert result.status_code == 404
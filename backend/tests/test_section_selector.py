@@ -0,0 +1,101 @@
+"""
+Тесты для сервиса подбора сечения.
+"""
+import sys
+import os
+import random
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.calculator import BeamCalculator
+from app.services.section_selector import SectionSelector
+from app.repositories.profile_catalog import load_profile_catalog
+from app.models.beam_calculation import BeamCalculationRequest, BeamLoadCase
+
+
+class TestSectionSelector:
+    """Тесты подбора профиля."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.calculator = BeamCalculator()
+        catalog = load_profile_catalog()
+        self.profiles = catalog.profiles
+        self.selector = SectionSelector(catalog, self.calculator)
+    
+    def _passing_by_scan(self, load_case: BeamLoadCase):
+        """Подходящие профили полным перебором расчётов, по возрастанию массы."""
+        passing = []
+        for profile in sorted(self.profiles, key=lambda p: p.mass_kg_m):
+            request = BeamCalculationRequest(**load_case.model_dump(), profile_name=profile.key)
+            result = self.calculator.calculate(request, profile)
+            if result.is_strength_sufficient and result.is_stiffness_sufficient:
+                passing.append(profile.key)
+        return passing
+    
+    def test_selects_lightest_passing_profile(self):
+        """Подобранный профиль - самый лёгкий из прошедших проверки."""
+        load_case = BeamLoadCase(length=5.0, support_type="hinged", force=100.0, force_position=0.5)
+        
+        result = self.selector.select(load_case, alternatives=2)
+        
+        expected = self._passing_by_scan(load_case)
+        assert result.best.profile.key == expected[0]
+        assert [c.profile.key for c in result.alternatives] == expected[1:3]
+        assert result.best.max_stress <= 240.0
+    
+    def test_matches_linear_scan(self):
+        """Результат совпадает с полным перебором для случайных схем."""
+        rng = random.Random(7)
+        for _ in range(200):
+            load_case = BeamLoadCase(
+                length=round(rng.uniform(1.0, 12.0), 2),
+                support_type=rng.choice(["hinged", "cantilever", "fixed"]),
+                force=round(rng.uniform(1.0, 400.0), 1),
+                force_position=round(rng.random(), 2)
+            )
+            result = self.selector.select(load_case, alternatives=len(self.profiles))
+            selected = [c.profile.key for c in ([result.best] if result.best else []) + result.alternatives]
+            assert selected == self._passing_by_scan(load_case)
+    
+    def test_elastic_supports_match_linear_scan(self):
+        """Упругие опоры: усилия зависят от EI, подбор совпадает с полным перебором."""
+        rng = random.Random(3)
+        for i in range(30):
+            if i % 2:
+                rotational = round(10 ** rng.uniform(2, 5), 1)
+                supports = [
+                    {"type": "spring", "position": position, "stiffness": 1e8, "rotational_stiffness": rotational}
+                    for position in (0.0, 1.0)
+                ]
+            else:
+                supports = [
+                    {"type": "pin", "position": 0.0},
+                    {"type": "spring", "position": round(rng.uniform(0.3, 0.7), 2),
+                     "stiffness": round(10 ** rng.uniform(2, 5), 1)},
+                    {"type": "roller", "position": 1.0},
+                ]
+            load_case = BeamLoadCase(
+                length=round(rng.uniform(2.0, 10.0), 2),
+                support_type="custom",
+                supports=supports,
+                distributed_loads=[{"q_start": round(rng.uniform(1.0, 60.0), 1)}]
+            )
+            result = self.selector.select(load_case, alternatives=len(self.profiles))
+            selected = [c.profile.key for c in ([result.best] if result.best else []) + result.alternatives]
+            
+            assert selected == self._passing_by_scan(load_case)
+            assert result.required_wx_cm3 is None and result.required_ix_cm4 is None
+            if result.best:
+                summary = self.calculator.calculate_summary(load_case, result.best.profile)
+                assert result.max_moment == summary.max_moment
+    
+    def test_no_profile_fits(self):
+        """Если ни один профиль не проходит, best = None."""
+        load_case = BeamLoadCase(length=12.0, support_type="hinged", force=5000.0, force_position=0.5)
+        
+        result = self.selector.select(load_case)
+        
+        assert result.best is None
+        assert result.alternatives == []
@@ -0,0 +1,226 @@
+"""
+Тесты для выбора формата и состава ответа.
+"""
+import sys
+import os
+import base64
+import json
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import msgpack
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core import serialization
+from app.models.beam_calculation import BeamCalculationRequest, ResponseSelection
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+
+
+REQUEST = {
+    "length": 6.0,
+    "support_type": "hinged",
+    "force": 80.0,
+    "force_position": 0.3,
+    "profile_name": "I-beam_20B1",
+    "diagram_points": 201
+}
+
+
+def _unpack(packed, text):
+    """Восстановление массива из упакованного ряда."""
+    data = base64.b64decode(packed["data"]) if text else packed["data"]
+    return np.frombuffer(data, dtype=packed["dtype"]).reshape(packed["shape"])
+
+
+class TestNegotiation:
+    """Тесты разбора заголовка Accept."""
+    
+    def test_default_is_json(self):
+        """Без Accept и для */* выбирается JSON."""
+        assert serialization.negotiate(None) == serialization.JSON
+        assert serialization.negotiate("*/*") == serialization.JSON
+    
+    def test_quality_order(self):
+        """Учитываются q-параметры и синонимы типов."""
+        accept = "application/json;q=0.5, application/x-msgpack"
+        assert serialization.negotiate(accept) == serialization.MSGPACK
+        accept = "application/msgpack;q=0.1, application/vnd.esc.packed+json;q=0.9"
+        assert serialization.negotiate(accept) == serialization.PACKED_JSON
+    
+    def test_not_acceptable(self):
+        """Неподдерживаемый формат - 406."""
+        with pytest.raises(HTTPException) as error:
+            serialization.negotiate("text/html, application/json;q=0")
+        assert error.value.status_code == 406
+
+
+class TestPackedCalculation:
+    """Тесты упакованных ответов /calculate."""
+    
+    def test_formats_carry_same_diagrams(self):
+        """Эпюры во всех форматах совпадают бит в бит."""
+        client = TestClient(app)
+        reference = client.post("/api/v1/calculate", json=REQUEST).json()
+        
+        packed = client.post(
+            "/api/v1/calculate", json=REQUEST,
+            headers={"Accept": serialization.PACKED_JSON}
+        )
+        binary = client.post(
+            "/api/v1/calculate", json=REQUEST,
+            headers={"Accept": serialization.MSGPACK}
+        )
+        assert packed.headers["content-type"] == serialization.PACKED_JSON
+        assert binary.headers["content-type"] == serialization.MSGPACK
+        assert len(binary.content) < len(json.dumps(reference))
+        
+        packed = packed.json()
+        binary = msgpack.unpackb(binary.content)
+        assert packed["max_moment"] == binary["max_moment"] == reference["max_moment"]
+        for name, series in reference["diagram_data"].items():
+            expected = np.asarray(series)
+            assert np.array_equal(_unpack(packed["diagram_data"][name], text=True), expected)
+            assert np.array_equal(_unpack(binary["diagram_data"][name], text=False), expected)
+    
+    def test_etag_per_format(self):
+        """ETag различается для представлений, ответ зависит от Accept."""
+        client = TestClient(app)
+        plain = client.post("/api/v1/calculate", json=REQUEST)
+        binary = client.post(
+            "/api/v1/calculate", json=REQUEST,
+            headers={"Accept": serialization.MSGPACK}
+        )
+        assert plain.headers["etag"] != binary.headers["etag"]
+        assert "Accept" in binary.headers["vary"]
+        
+        repeat = client.post(
+            "/api/v1/calculate", json=REQUEST,
+            headers={"Accept": serialization.MSGPACK, "If-None-Match": binary.headers["etag"]}
+        )
+        assert repeat.status_code == 304
+
+
+class TestBatchColumns:
+    """Тесты колоночного представления пакетного расчёта."""
+    
+    def test_columns_match_rows(self):
+        """Колонки совпадают с построчным ответом, ошибки дают NaN."""
+        items = [
+            REQUEST,
+            {**REQUEST, "profile_name": "missing"},
+            {**REQUEST, "support_type": "cantilever"},
+            {**REQUEST, "force": None, "force_position": None,
+             "distributed_loads": [{"q_start": 10.0}]},
+        ]
+        client = TestClient(app)
+        rows = client.post("/api/v1/calculate/batch", json={"items": items}).json()
+        columns = client.post(
+            "/api/v1/calculate/batch?layout=columns", json={"items": items}
+        ).json()
+        
+        assert columns["count"] == 4 and columns["failed"] == 1
+        assert columns["errors"][0]["index"] == 1
+        assert columns["max_moment"][1] is None
+        assert columns["is_strength_sufficient"][1] is None
+        assert columns["R_b"][2] is None
+        for item in rows["results"]:
+            if item["error"] is not None:
+                continue
+            index = item["index"]
+            assert columns["max_stress"][index] == item["result"]["max_stress"]
+            for name, value in item["result"]["reactions"].items():
+                assert columns[name][index] == value
+    
+    def test_invalid_item_reported(self):
+        """Некорректный элемент получает ошибку, остальные рассчитываются."""
+        items = [
+            REQUEST,
+            {**REQUEST, "length": -1.0},
+            {"profile_name": "I-beam_20B1"},
+            5,
+        ]
+        client = TestClient(app)
+        response = client.post("/api/v1/calculate/batch", json={"items": items})
+        columns = client.post(
+            "/api/v1/calculate/batch?layout=columns", json={"items": items}
+        ).json()
+        
+        assert response.status_code == 200
+        rows = response.json()
+        assert rows["succeeded"] == 1 and rows["failed"] == 3
+        assert rows["results"][0]["result"]["max_moment"] > 0
+        assert rows["results"][1]["error"].startswith("length:")
+        assert "support_type" in rows["results"][2]["error"]
+        assert rows["results"][3]["error"].startswith("item:")
+        assert [error["index"] for error in columns["errors"]] == [1, 2, 3]
+        assert columns["max_moment"][0] == rows["results"][0]["result"]["max_moment"]
+    
+    def test_msgpack_columns(self):
+        """В MessagePack колонки передаются двоичными массивами."""
+        client = TestClient(app)
+        response = client.post(
+            "/api/v1/calculate/batch?layout=columns",
+            json={"items": [REQUEST] * 3},
+            headers={"Accept": serialization.MSGPACK}
+        )
+        payload = msgpack.unpackb(response.content)
+        max_moment = _unpack(payload["max_moment"], text=False)
+        assert max_moment.shape == (3,)
+        assert np.isnan(_unpack(payload["M_a"], text=False)).all()
+
+
+class TestResponseSelection:
+    """Тесты отбора частей ответа (include=, fields=)."""
+    
+    def test_parse(self):
+        """Разбор параметров и вычисляемые части ответа."""
+        assert ResponseSelection.parse().is_default
+        assert ResponseSelection.parse(include="").sections == frozenset()
+        assert ResponseSelection.parse(include="none").sections == frozenset()
+        
+        selection = ResponseSelection.parse(fields="max_stress,diagram_data")
+        assert selection.sections == {"diagrams"}
+        assert selection.output_fields() == {"max_stress", "diagram_data"}
+        
+        with pytest.raises(ValueError):
+            ResponseSelection.parse(include="charts")
+        with pytest.raises(ValueError):
+            ResponseSelection.parse(fields="stress")
+    
+    def test_sections_not_computed(self, monkeypatch):
+        """Не запрошенные отчёт и эпюры не рассчитываются."""
+        def fail(*args, **kwargs):
+            raise AssertionError("Стадия не должна выполняться")
+        
+        calculator = BeamCalculator()
+        monkeypatch.setattr(calculator, "_generate_report_sections", fail)
+        monkeypatch.setattr(calculator, "_generate_diagram_data", fail)
+        profile = load_profile_catalog().get(REQUEST["profile_name"])
+        
+        result = calculator.calculate(BeamCalculationRequest(**REQUEST), profile, sections=())
+        assert result.report_sections is None and result.diagram_data is None
+        assert result.max_stress > 0
+    
+    def test_verdict_only_response(self):
+        """Минимальный ответ содержит только запрошенные поля и свой ETag."""
+        client = TestClient(app)
+        full = client.post("/api/v1/calculate", json=REQUEST)
+        fields = "max_stress,is_strength_sufficient,is_stiffness_sufficient"
+        minimal = client.post(f"/api/v1/calculate?fields={fields}", json=REQUEST)
+        
+        assert minimal.status_code == 200
+        assert minimal.json() == {name: full.json()[name] for name in fields.split(",")}
+        assert minimal.headers["etag"] != full.headers["etag"]
+        
+        summary = client.post("/api/v1/calculate?include=", json=REQUEST).json()
+        assert "diagram_data" not in summary and "report_sections" not in summary
+        assert summary["reactions"] == full.json()["reactions"]
+        
+        bad = client.post("/api/v1/calculate?fields=unknown", json=REQUEST)
+        assert bad.status_code == 400
@@ -0,0 +1,135 @@
+"""
+Тесты репозитория профилей в SQLite.
+"""
+import sys
+import os
+import sqlite3
+import numpy as np
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.material_profile import MaterialProfile, ProfileQuery
+from app.repositories.material_repository import CatalogMaterialRepository
+from app.repositories.profile_catalog import ProfileCatalog
+from app.repositories.sqlite_repository import SQLiteMaterialRepository
+from app.repositories.profile_catalog import load_profile_catalog
+from app.core.config import settings
+from app.core.dependencies import get_material_repository
+
+
+STANDARDS = {
+    "ГОСТ 26020-83": ("Двутавр", "Б"),
+    "ГОСТ 8240-97": ("Швеллер", "П"),
+    "EN 10365": ("HEA", "A"),
+}
+
+
+def synthetic_catalog(size: int) -> ProfileCatalog:
+    """Сортамент нескольких стандартов; округлённые значения дают совпадения для сортировки."""
+    rng = np.random.default_rng(5)
+    profiles = []
+    for i in range(size):
+        standard = list(STANDARDS)[i % len(STANDARDS)]
+        kind, suffix = STANDARDS[standard]
+        height = float(rng.integers(10, 100) * 10)
+        wx = round(float(rng.uniform(10, 5000)), 1)
+        profiles.append(MaterialProfile(
+            name=f"{kind} {int(height // 10)}{suffix}{i}",
+            standard=standard,
+            key=f"profile_{i}",
+            moment_of_inertia_ix_cm4=round(wx * height / 20, 1),
+            moment_of_resistance_wx_cm3=wx,
+            height_mm=height,
+            width_mm=100.0,
+            mass_kg_m=float(rng.integers(50, 3000)) / 10
+        ))
+    return ProfileCatalog(profiles, version=2)
+
+
+class TestSQLiteMaterialRepository:
+    """Сравнение с репозиторием каталога в памяти."""
+    
+    @pytest.fixture(scope="class")
+    def repositories(self, tmp_path_factory):
+        catalog = synthetic_catalog(20_000)
+        path = str(tmp_path_factory.mktemp("profiles") / "profiles.sqlite3")
+        SQLiteMaterialRepository.build(path, catalog.profiles, catalog.version)
+        repository = SQLiteMaterialRepository(path, pool_size=2)
+        yield CatalogMaterialRepository(catalog), repository
+        repository.close()
+    
+    def test_get_and_search(self, repositories):
+        """Поиск по ключу и по подстроке наименования."""
+        memory, sqlite = repositories
+        
+        assert sqlite.get_profile("profile_123") == memory.get_profile("profile_123")
+        assert sqlite.get_profile("missing") is None
+        for needle in ["", "двутавр 4", "ШВЕЛЛЕР", "0п99", "hea 9", "%", "нет такого"]:
+            assert sqlite.search_profiles(needle) == memory.search_profiles(needle)
+        assert len(sqlite.get_all_profiles()) == 20_000
+    
+    @pytest.mark.parametrize("params", [
+        dict(min_wx=2500.0, sort="mass_kg_m"),
+        dict(min_wx=1000.0, max_wx=1200.0, sort="mass_kg_m", order="desc"),
+        dict(standard="гост 8240-97", min_height=300.0, max_height=500.0, sort="height_mm"),
+        dict(name="двут 5", min_mass=100.0, sort="name"),
+        dict(min_ix=1e4, max_mass=50.0, sort="moment_of_inertia_ix_cm4", order="desc"),
+        dict(max_height=200.0),
+    ])
+    def test_query_matches_catalog(self, repositories, params):
+        """Фильтры, сортировка с равными значениями и курсорные страницы совпадают."""
+        memory, sqlite = repositories
+        expected = memory.query_profiles(ProfileQuery(**params))
+        
+        keys, cursor = [], None
+        while True:
+            page = sqlite.query_profiles(ProfileQuery(**params, limit=997, cursor=cursor))
+            assert page.total == expected.total
+            keys.extend(p.key for p in page.profiles)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert keys == [p.key for p in expected.profiles]
+    
+    def test_cursor_mismatch_rejected(self, repositories):
+        """Курсор другой сортировки отклоняется."""
+        _, sqlite = repositories
+        page = sqlite.query_profiles(ProfileQuery(sort="mass_kg_m", limit=2))
+        
+        with pytest.raises(ValueError):
+            sqlite.query_profiles(ProfileQuery(sort="height_mm", limit=2, cursor=page.next_cursor))
+        with pytest.raises(ValueError):
+            sqlite.query_profiles(ProfileQuery(cursor="not-a-cursor"))
+    
+    def test_read_only_and_duplicates(self, repositories, tmp_path):
+        """Соединения пула только для чтения; повторяющиеся ключи отклоняются при сборке."""
+        _, sqlite = repositories
+        with sqlite._connection() as connection:
+            with pytest.raises(sqlite3.OperationalError):
+                connection.execute("DELETE FROM profiles")
+        
+        profile = sqlite.get_profile("profile_1")
+        with pytest.raises(ValueError):
+            SQLiteMaterialRepository.build(str(tmp_path / "dup.sqlite3"), [profile, profile])
+    
+    def test_stale_database_rebuilt(self, repositories, tmp_path, monkeypatch):
+        """База другой версии пересобирается из каталога при создании репозитория."""
+        _, sqlite = repositories
+        path = str(tmp_path / "stale.sqlite3")
+        SQLiteMaterialRepository.build(path, [sqlite.get_profile("profile_1")], version=0)
+        monkeypatch.setattr(settings, "MATERIAL_REPOSITORY", "sqlite")
+        monkeypatch.setattr(settings, "MATERIAL_DB_PATH", path)
+        catalog = load_profile_catalog()
+        
+        get_material_repository.cache_clear()
+        try:
+            repository = get_material_repository()
+            assert repository.version == catalog.version
+            assert repository.get_profile("profile_1") is None
+            assert repository.get_profile(catalog.profiles[0].key) == catalog.profiles[0]
+            repository.close()
+        finally:
+            get_material_repository.cache_clear()
@@ -0,0 +1,68 @@
+"""
+Тесты для времени холодного старта приложения.
+"""
+import sys
+import os
+import subprocess
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Бюджет импорта app.main (создание приложения включительно), мс
+IMPORT_BUDGET_MS = float(os.environ.get("ESC_IMPORT_BUDGET_MS", "1500"))
+
+# Модули, которые не должны загружаться при импорте приложения
+DEFERRED_MODULES = (
+    "numpy",
+    "msgpack",
+    "app.services.calculator",
+    "app.services.moving_load",
+    "app.services.sweep",
+    "app.repositories.profile_catalog",
+)
+
+
+def _import_app():
+    """Импорт app.main в чистом процессе с -X importtime."""
+    code = (
+        "import app.main, sys; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.rstrip().endswith("| app.main")
+    )
+    return cumulative_us / 1000, result.stdout.strip()
+
+
+class TestColdStart:
+    """Тесты ленивой загрузки приложения."""
+    
+    def test_import_budget(self):
+        """Импорт приложения укладывается в бюджет и не тянет тяжёлые модули."""
+        elapsed_ms, loaded = _import_app()
+        
+        assert loaded == ""
+        assert elapsed_ms < IMPORT_BUDGET_MS, f"import app.main: {elapsed_ms:.0f} мс"
+    
+    def test_openapi_built_on_demand(self):
+        """Схема OpenAPI строится только при запросе документации."""
+        from app.main import create_application
+        
+        application = create_application()
+        client = TestClient(application)
+        client.get("/health")
+        assert application.openapi_schema is None
+        
+        assert client.get("/openapi.json").status_code == 200
+        assert application.openapi_schema is not None
@@ -0,0 +1,108 @@
+"""
+Тесты для параметрического перебора.
+"""
+import sys
+import os
+import itertools
+import json
+import pytest
+
+# Добавляем папку app в Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.beam_calculation import BeamCalculationRequest
+from app.models.sweep import SweepRange, SweepRequest
+from app.repositories.profile_catalog import load_profile_catalog
+from app.services.calculator import BeamCalculator
+from app.services.sweep import ParameterSweep, format_csv, format_ndjson, format_ndjson_columns
+
+
+class TestParameterSweep:
+    """Тесты перебора декартова произведения."""
+    
+    def setup_method(self):
+        """Настройка перед каждым тестом."""
+        self.catalog = load_profile_catalog()
+        self.request = SweepRequest(
+            length=SweepRange(start=2.0, stop=8.0, num=4),
+            force=[50.0, 150.0],
+            force_position=[0.0, 0.3, 0.5],
+            support_types=["hinged", "cantilever"],
+            profile_names=["I-beam_20B1", "I-beam_40B1"],
+            chunk_size=7
+        )
+        profiles = [self.catalog.get(name) for name in self.request.profile_names]
+        self.sweep = ParameterSweep(self.request, profiles)
+    
+    def test_rows_follow_cartesian_product(self):
+        """Блоки покрывают произведение в лексикографическом порядке."""
+        rows = [json.loads(line) for chunk in self.sweep.chunks() for line in format_ndjson(chunk).splitlines()]
+        expected = list(itertools.product(
+            self.request.axis_values("length"),
+            self.request.axis_values("force"),
+            self.request.axis_values("force_position"),
+            self.request.support_types,
+            self.request.profile_names
+        ))
+        
+        assert self.sweep.total == len(expected) == 96
+        assert [
+            (r["length"], r["force"], r["force_position"], r["support_type"], r["profile_name"])
+            for r in rows
+        ] == expected
+    
+    def test_rows_match_calculate(self):
+        """Значения совпадают с поэлементным расчётом."""
+        calculator = BeamCalculator()
+        for chunk in self.sweep.chunks(start=40):
+            for row in (json.loads(line) for line in format_ndjson(chunk).splitlines()):
+                result = calculator.calculate(
+                    BeamCalculationRequest(
+                        length=row["length"],
+                        support_type=row["support_type"],
+                        force=row["force"],
+                        force_position=row["force_position"],
+                        profile_name=row["profile_name"]
+                    ),
+                    self.catalog.get(row["profile_name"])
+                )
+                assert row["max_stress"] == result.max_stress
+                assert row["max_deflection"] == result.max_deflection
+                assert row["is_strength_sufficient"] == result.is_strength_sufficient
+    
+    def test_steel_grade(self):
+        """Прочность проверяется по сопротивлению марки стали; неизвестная марка - ошибка."""
+        request = self.request.model_copy(update={"steel_grade": "C390"})
+        profiles = [self.catalog.get(name) for name in request.profile_names]
+        strength = BeamCalculator().design_strength("C390")
+        
+        for chunk in ParameterSweep(request, profiles).chunks():
+            assert list(chunk["is_strength_sufficient"]) == list(chunk["max_stress"] <= strength)
+        with pytest.raises(ValueError):
+            ParameterSweep(request.model_copy(update={"steel_grade": "X999"}), profiles)
+    
+    def test_csv_header_once(self):
+        """Заголовок CSV выводится только в первом блоке."""
+        chunks = list(self.sweep.chunks())
+        text = format_csv(chunks[0], header=True) + "".join(format_csv(c) for c in chunks[1:])
+        lines = text.splitlines()
+        
+        assert lines[0].startswith("length,force,force_position")
+        assert len(lines) == self.sweep.total + 1
+    
+    def test_columns_layout_matches_rows(self):
+        """Колоночный NDJSON содержит те же значения, что и построчный."""
+        rows, blocks = [], []
+        for begin, chunk in zip(range(0, self.sweep.total, 7), self.sweep.chunks()):
+            rows += [json.loads(line) for line in format_ndjson(chunk).splitlines()]
+            blocks.append(json.loads(format_ndjson_columns(chunk, begin)))
+        
+        assert [block["offset"] for block in blocks] == list(range(0, self.sweep.total, 7))
+        assert sum(block["count"] for block in blocks) == len(rows)
+        for name in ("max_moment", "profile_name", "is_stiffness_sufficient"):
+            assert list(itertools.chain.from_iterable(b[name] for b in blocks)) == [r[name] for r in rows]
+    
+    def test_invalid_axis_rejected(self):
+        """Недопустимые значения оси отклоняются."""
+        with pytest.raises(ValueError):
+            SweepRequest(length=[5.0], force=[10.0], force_position=[1.5], profile_names=["I-beam_20B1"])
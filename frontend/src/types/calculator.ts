@@ -1,9 +1,31 @@
+export interface PointLoad {
+    force: number
+    position: number
+}
+
+export interface DistributedLoad {
+    q_start: number
+    q_end?: number | null
+    start?: number
+    end?: number
+}
+
+export interface AppliedMoment {
+    moment: number
+    position: number
+}
+
 export interface BeamCalculationRequest {
     length: number
     support_type: string
-    force: number
-    force_position: number
+    force?: number | null
+    force_position?: number | null
+    point_loads?: PointLoad[]
+    distributed_loads?: DistributedLoad[]
+    applied_moments?: AppliedMoment[]
     profile_name: string
+    diagram_points?: number
+    diagram_max_points?: number | null
 }
 
 export interface BeamCalculationResponse {
@@ -20,7 +42,9 @@ export interface BeamCalculationResponse {
         content: string
     }>
     diagram_data: {
+        shear: Array<[number, number]>
         moments: Array<[number, number]>
+        slopes: Array<[number, number]>
         positions: Array<[number, number]>
     }
 }
@@ -38,4 +62,6 @@ export interface MaterialProfile {
 
 export interface MaterialProfileList {
     profiles: MaterialProfile[]
+    total?: number | null
+    next_cursor?: string | null
 }
\ No newline at end of file